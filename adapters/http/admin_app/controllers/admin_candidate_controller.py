@@ -9,7 +9,7 @@ from src.auth_bc.user.application.commands.update_user_password_command import U
 from src.auth_bc.user.application.queries.dtos.auth_dto import CurrentUserDto
 from src.auth_bc.user.application.queries.get_user_by_email_query import GetUserByEmailQuery
 from src.auth_bc.user.application.queries.get_user_by_id_query import GetUserByIdQuery
-from src.auth_bc.user.domain.exceptions.user_exceptions import EmailAlreadyExistException
+from src.auth_bc.user.domain.exceptions.user_exceptions import EmailAlreadyExistException, PasswordHashingBusyError
 from src.auth_bc.user.domain.value_objects import UserId
 from src.candidate_bc.candidate.application.queries.get_candidate_by_id import GetCandidateByIdQuery
 from src.candidate_bc.candidate.application.queries.list_candidates import ListCandidatesQuery
@@ -216,6 +216,9 @@ class AdminCandidateController:
                     "candidate_email": candidate_dto.email,
                     "suggested_action": "check_existing_users_or_change_candidate_email"
                 }
+            except PasswordHashingBusyError:
+                # Served as 503 with Retry-After by the app exception handler
+                raise
             except Exception as e:
                 # General error
                 raise ValueError(f"Failed to create user account: {str(e)}")
@@ -18,7 +18,12 @@ from src.company_bc.job_position.application.queries.get_job_position_by_id impo
 from src.company_bc.job_position.application.queries.get_job_positions_stats import GetJobPositionsStatsQuery
 from src.company_bc.job_position.application.queries.job_position_dto import JobPositionDto
 # Job position queries
+from src.company_bc.job_position.application.queries.count_job_positions import CountJobPositionsQuery
 from src.company_bc.job_position.application.queries.list_job_positions import ListJobPositionsQuery
+from src.company_bc.job_position.application.queries.list_job_position_summaries import (
+    ListJobPositionSummariesQuery
+)
+from src.company_bc.job_position.domain.read_models.job_position_list_read_model import JobPositionListReadModel
 # Domain enums
 from src.company_bc.job_position.domain.enums import (
     JobPositionVisibilityEnum,
@@ -63,40 +68,54 @@ class JobPositionController:
             is_active: Optional[bool] = None,
             page: Optional[int] = None,
             page_size: Optional[int] = None,
-            current_user_id: Optional[str] = None
+            current_user_id: Optional[str] = None,
+            summary: bool = False
     ) -> JobPositionListResponse:
-        """List job positions with filters"""
+        """List job positions with filters
+
+        With summary=True only the columns used by list views are loaded and populated.
+        """
         try:
             page = page or 1
             page_size = page_size or 10
             offset = (page - 1) * page_size
 
-            query = ListJobPositionsQuery(
-                company_id=company_id,
-                search_term=search_term,
-                limit=page_size,
-                offset=offset,
-                current_user_id=current_user_id
-            )
-
-            positions: List[JobPositionDto] = self.query_bus.query(query)
-
-            # Get total count using the same filters
-            # We need to get the repository from the query handler
-            # For now, we'll use a simple approach: if we got fewer results than page_size,
-            # that's the total. Otherwise, we estimate.
-            # TODO: Add count_by_filters to the query handler or return total from query
-            if len(positions) < page_size:
-                # This is likely the last page or the only page
-                total = (page - 1) * page_size + len(positions)
+            if summary:
+                summary_query = ListJobPositionSummariesQuery(
+                    company_id=company_id,
+                    search_term=search_term,
+                    limit=page_size,
+                    offset=offset,
+                    current_user_id=current_user_id
+                )
+                positions: List[Any] = self.query_bus.query(summary_query)
+            else:
+                query = ListJobPositionsQuery(
+                    company_id=company_id,
+                    search_term=search_term,
+                    limit=page_size,
+                    offset=offset,
+                    current_user_id=current_user_id
+                )
+                positions = self.query_bus.query(query)
+
+            # A partial page is the last one, so its total follows from the offset;
+            # otherwise count with the same filters
+            if len(positions) < page_size and (positions or page == 1):
+                total = offset + len(positions)
             else:
-                # There might be more pages, estimate at least this many
-                total = page * page_size + 1
+                total = self.query_bus.query(CountJobPositionsQuery(
+                    company_id=company_id,
+                    search_term=search_term
+                ))
 
             # Convert DTOs to response schemas using mapper
             # TODO: Ideally we should get company names in batch for performance
             response_positions = []
             for dto in positions:
+                if isinstance(dto, JobPositionListReadModel):
+                    response_positions.append(JobPositionMapper.list_item_to_response(dto))
+                    continue
                 # For now, we don't have company name, could be improved by joining in query
                 response_positions.append(JobPositionMapper.dto_to_response(dto, company_name=None))
 
@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 
 from adapters.http.admin_app.schemas.job_position import JobPositionResponse, JobPositionPublicResponse
 from src.company_bc.job_position.application.queries.job_position_dto import JobPositionDto
+from src.company_bc.job_position.domain.read_models.job_position_list_read_model import JobPositionListReadModel
 from src.shared_bc.customization.workflow.application.dtos.workflow_dto import WorkflowDto
 from src.shared_bc.customization.workflow.application.dtos.workflow_stage_dto import WorkflowStageDto
 
@@ -15,6 +16,25 @@ class JobPositionMapper:
         """Convert JobPositionDto to JobPositionResponse"""
         return JobPositionResponse.from_dto(dto, company_name=company_name)
 
+    @staticmethod
+    def list_item_to_response(read_model: JobPositionListReadModel) -> JobPositionResponse:
+        """Convert a list read model to JobPositionResponse (only list columns are populated)"""
+        return JobPositionResponse(
+            id=read_model.id,
+            title=read_model.title,
+            company_id=read_model.company_id,
+            job_position_workflow_id=read_model.job_position_workflow_id,
+            stage_id=read_model.stage_id,
+            status=read_model.status,
+            visibility=read_model.visibility,
+            public_slug=read_model.public_slug,
+            job_category=read_model.job_category or "Other",
+            custom_fields_values=read_model.custom_fields_values,
+            created_at=read_model.created_at,
+            updated_at=read_model.updated_at,
+            pending_comments_count=read_model.pending_comments_count,
+        )
+
     @staticmethod
     def get_visible_fields_for_candidate(
             dto: JobPositionDto,
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Annotated, List, Optional
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Security, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, Security, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 
 from adapters.http.admin_app.controllers.company_controller import CompanyController
@@ -45,6 +45,7 @@ from adapters.http.admin_app.schemas.job_position_workflow import (
 )
 from adapters.http.auth.schemas.token import Token
 from adapters.http.auth.schemas.user import UserResponse
+from adapters.http.shared.http_caching import cached_json_response
 from adapters.http.shared.workflow.controllers import WorkflowController
 from adapters.http.shared.workflow.schemas import WorkflowResponse
 from adapters.http.shared.workflow.schemas.update_workflow_request import UpdateWorkflowRequest
@@ -57,6 +58,8 @@ from src.company_bc.company.domain import CompanyId
 from src.company_bc.job_position.application.queries.job_position_dto import JobPositionDto
 from src.framework.application.command_bus import CommandBus
 from src.framework.application.query_bus import QueryBus
+from src.framework.infrastructure.middleware.sql_profiler_middleware import query_performance_registry
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -1034,12 +1037,20 @@ def list_job_position_activities(
     return controller.list_activities(position_id, limit)
 
 
-# Enum metadata endpoint
+# Enum metadata endpoint; definitions only change with a deploy, clients revalidate hourly with the ETag
+ENUM_METADATA_MAX_AGE_SECONDS = 3600
+
+
 @router.get("/enums/metadata", response_model=EnumMetadataResponse)
-def get_enum_metadata() -> EnumMetadataResponse:
+def get_enum_metadata(request: Request) -> Response:
     """Get all enum definitions for frontend consumption"""
     controller = EnumController()
-    return controller.get_enum_metadata()
+    return cached_json_response(
+        request,
+        controller.get_enum_metadata,
+        max_age=ENUM_METADATA_MAX_AGE_SECONDS,
+        stale_while_revalidate=ENUM_METADATA_MAX_AGE_SECONDS
+    )
 
 
 # ====================================
@@ -1075,6 +1086,8 @@ def admin_login(
             candidate_id=None  # Admin users don't have candidate_id
         )
 
+    except PasswordHashingBusyError:
+        raise
     except Exception as e:
         logger.error(f"Admin authentication error: {e}")
         raise HTTPException(
@@ -1105,6 +1118,40 @@ def health_check() -> dict[str, str]:
     return {"status": "ok", "message": "Admin panel - Interview Templates, Companies, and Candidates"}
 
 
+# ====================================
+# PERFORMANCE ENDPOINTS
+# ====================================
+
+@router.get("/perf")
+def get_sql_performance(
+        current_admin: Annotated[CurrentAdminUser, Depends(get_current_admin_user)],
+        limit: int = Query(50, ge=1, le=500, description="Max number of routes to return"),
+        n_plus_one_only: bool = Query(False, description="Only return routes with suspected N+1 queries"),
+) -> dict:
+    """
+    Per-route SQL metrics collected by SqlProfilerMiddleware since startup (or last reset).
+
+    Routes are ordered by total database time. Metrics are kept in memory per worker process.
+    """
+    routes = query_performance_registry.snapshot()
+    if n_plus_one_only:
+        routes = [r for r in routes if r["n_plus_one_requests"]]
+    return {
+        "n_plus_one_threshold": query_performance_registry.n_plus_one_threshold,
+        "total_routes": len(routes),
+        "routes": routes[:limit],
+    }
+
+
+@router.delete("/perf")
+def reset_sql_performance(
+        current_admin: Annotated[CurrentAdminUser, Depends(get_current_admin_user)],
+) -> dict:
+    """Clear the collected per-route SQL metrics"""
+    query_performance_registry.reset()
+    return {"message": "SQL performance metrics reset"}
+
+
 # ====================================
 # MAINTENANCE ENDPOINTS
 # ====================================
@@ -1142,3 +1189,39 @@ def cleanup_expired_registrations(
         "message": f"Cleanup completed (dry_run={dry_run}, max_age_days={max_age_days})",
         "executed_by": current_admin.email
     }
+
+
+@router.post("/maintenance/aggregate-stage-dwell-times")
+@inject
+def aggregate_stage_dwell_times(
+        command_bus: Annotated[CommandBus, Depends(Provide[Container.command_bus])],
+        current_admin: Annotated[CurrentAdminUser, Depends(get_current_admin_user)],
+        batch_size: int = Query(5000, ge=100, le=50000, description="Stage visits merged per transaction"),
+        max_batches: int = Query(100, ge=1, le=1000, description="Max batches in this run"),
+) -> dict:
+    """
+    Add the stage visits completed since the last run to the stage dwell time histograms.
+
+    Workflow analytics and bottleneck detection read the time in stage from these
+    histograms. Only new transitions are processed, so it is cheap to run often.
+    Transitions are the candidate application stage moves; company candidate
+    stage changes write no visit history and are not included.
+
+    Can be called manually or scheduled via external cron (e.g., every 5 minutes).
+    """
+    from src.company_bc.candidate_application_stage.application.commands.aggregate_stage_dwell_times_command import (
+        AggregateStageDwellTimesCommand
+    )
+
+    command = AggregateStageDwellTimesCommand(
+        batch_size=batch_size,
+        max_batches=max_batches
+    )
+
+    command_bus.dispatch(command)
+
+    return {
+        "status": "success",
+        "message": f"Stage dwell time aggregation completed (batch_size={batch_size}, max_batches={max_batches})",
+        "executed_by": current_admin.email
+    }
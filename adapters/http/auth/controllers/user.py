@@ -17,6 +17,7 @@ from src.auth_bc.user.application.queries.check_user_exists_query import CheckUs
 from src.auth_bc.user.application.queries.dtos.auth_dto import UserExistsDto, CurrentUserDto
 from src.auth_bc.user.application.queries.get_user_language_query import GetUserLanguageQuery
 from src.auth_bc.user.domain.entities.user import User
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 from src.auth_bc.user.domain.services.password_service import PasswordService
 from src.auth_bc.user.domain.value_objects import UserId
 from src.framework.application.command_bus import CommandBus
@@ -97,6 +98,8 @@ class UserController:
                     password_reset_sent=True
                 )
 
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -150,6 +153,8 @@ class UserController:
                     success=False
                 )
 
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -12,6 +12,7 @@ from adapters.http.company_app.company.schemas.company_user_invitation_request i
 from adapters.http.company_app.company.schemas.company_user_invitation_response import (
     CompanyUserInvitationResponse,
 )
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 from src.auth_bc.user.domain.value_objects import UserId
 from src.company_bc.company.application.commands.accept_user_invitation_command import (
     AcceptUserInvitationCommand
@@ -82,6 +83,8 @@ class InvitationController:
 
             return {"message": "Invitation accepted successfully"}
 
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
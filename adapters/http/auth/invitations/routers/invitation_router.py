@@ -36,7 +36,7 @@ async def get_invitation_by_token(
 
 @router.post("/accept", status_code=200)
 @inject
-async def accept_invitation(
+def accept_invitation(
         request: AcceptInvitationRequest,
         controller: Annotated[
             InvitationController,
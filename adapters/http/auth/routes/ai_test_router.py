@@ -6,6 +6,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
 
+from adapters.http.shared.uploads import read_upload_capped
 from core.config import settings
 from src.auth_bc.user.infrastructure.services.pdf_processing_service import PDFProcessingService
 from src.framework.infrastructure.services.ai.ai_service_factory import get_ai_service
@@ -29,7 +30,7 @@ async def analyze_pdf_direct(file: UploadFile = File(...)) -> JSONResponse:
         logger.info(f"Starting direct AI analysis for file: {file.filename or 'unknown'}")
 
         # 1. Read PDF content
-        pdf_content = await file.read()
+        pdf_content = await read_upload_capped(file, settings.MAX_FILE_SIZE_MB * 1024 * 1024)
         logger.info(f"PDF file size: {len(pdf_content)} bytes")
 
         # 2. Extract text from PDF
@@ -80,6 +81,8 @@ async def analyze_pdf_direct(file: UploadFile = File(...)) -> JSONResponse:
         logger.info(f"Analysis completed successfully. Confidence: {analysis_result.confidence_score}")
         return JSONResponse(content=response_data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Direct AI analysis failed: {str(e)}")
         return JSONResponse(
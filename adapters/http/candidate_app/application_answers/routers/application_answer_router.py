@@ -2,7 +2,7 @@
 import logging
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from adapters.http.candidate_app.application_answers.controllers.application_answer_controller import (
     ApplicationAnswerController
@@ -12,7 +12,9 @@ from adapters.http.candidate_app.application_answers.schemas.application_answer_
     ApplicationAnswerListResponse,
     EnabledQuestionsListResponse
 )
+from adapters.http.shared.http_caching import cached_json_response
 from core.containers import Container
+from src.framework.application.public_response_cache import PUBLIC_APPLICATION_QUESTIONS
 
 log = logging.getLogger(__name__)
 
@@ -83,17 +85,24 @@ def save_answers(
 )
 @inject
 def get_enabled_questions(
+    request: Request,
     position_id: str,
     controller: ApplicationAnswerController = Depends(Provide[Container.application_answer_controller])
-) -> EnabledQuestionsListResponse:
+) -> Response:
     """
     Get all enabled questions for a job position.
 
     This endpoint is public and used by the application form to display
-    the screening questions candidates need to answer.
+    the screening questions candidates need to answer. Cacheable, with ETag.
     """
     try:
-        return controller.get_enabled_questions(position_id=position_id)
+        return cached_json_response(
+            request,
+            lambda: controller.get_enabled_questions(position_id=position_id),
+            namespace=PUBLIC_APPLICATION_QUESTIONS,
+            key=position_id,
+            scope=position_id
+        )
     except Exception as e:
         log.error(f"Error getting enabled questions: {e}")
         raise HTTPException(
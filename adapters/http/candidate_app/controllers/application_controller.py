@@ -2,7 +2,7 @@
 Application Controller for handling job application operations
 """
 import logging
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 
@@ -16,6 +16,8 @@ from src.company_bc.candidate_application.application.commands.update_applicatio
     UpdateApplicationStatusCommand
 from src.company_bc.candidate_application.application.queries.can_user_process_application_query import \
     CanUserProcessApplicationQuery
+from src.company_bc.candidate_application.application.queries.can_user_process_applications_query import \
+    CanUserProcessApplicationsQuery
 from src.company_bc.candidate_application.application.queries.get_applications_by_candidate_id import \
     GetApplicationsByCandidateIdQuery
 from src.company_bc.candidate_application.application.queries.shared.candidate_application_dto import \
@@ -196,3 +198,32 @@ class ApplicationController:
         except Exception as e:
             logger.error(f"Error checking permission for user {user_id} on application {application_id}: {e}")
             return False
+
+    def can_user_process_applications(
+            self,
+            user_id: str,
+            application_ids: List[str],
+            company_id: str
+    ) -> Dict[str, bool]:
+        """Check which applications the user can process at their current stage
+
+        Args:
+            user_id: ID of the user
+            application_ids: IDs of the applications
+            company_id: ID of the company
+
+        Returns:
+            Application ID to whether the user can process it
+        """
+        try:
+            query = CanUserProcessApplicationsQuery(
+                user_id=user_id,
+                application_ids=application_ids,
+                company_id=company_id
+            )
+            decisions: Dict[str, bool] = self._query_bus.query(query)
+            return decisions
+
+        except Exception as e:
+            logger.error(f"Error checking permissions for user {user_id} on {len(application_ids)} applications: {e}")
+            return {application_id: False for application_id in application_ids}
@@ -1,10 +1,16 @@
-from pathlib import Path
 from typing import List, Optional
 
 from fastapi import UploadFile, HTTPException
 
 from adapters.http.candidate_app.mappers.file_attachment_mapper import FileAttachmentMapper
 from adapters.http.candidate_app.schemas.file_attachment_response import FileAttachmentResponse
+from adapters.http.shared.storage.schemas.direct_upload_schemas import (
+    CompleteDirectUploadRequest,
+    DirectUploadRequest,
+    DirectUploadResponse,
+)
+from adapters.http.shared.uploads import ensure_upload_size, iter_upload_chunks
+from core.config import settings
 from src.candidate_bc.candidate.application.commands.delete_file_attachment import (
     DeleteFileAttachmentCommand,
     FileAttachmentNotFoundError,
@@ -20,14 +26,27 @@ from src.candidate_bc.candidate.domain.value_objects.file_attachment_id import F
 from src.framework.application.command_bus import CommandBus
 from src.framework.application.query_bus import QueryBus
 from src.framework.domain.entities.base import generate_id
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
+from src.framework.domain.infrastructure.storage_service_interface import (
+    FileTooLargeError,
+    StorageServiceInterface,
+)
 
 
 class FileAttachmentController:
     """Controller for file attachment operations"""
 
-    def __init__(self, command_bus: CommandBus, query_bus: QueryBus):
+    def __init__(
+            self,
+            command_bus: CommandBus,
+            query_bus: QueryBus,
+            storage_service: StorageServiceInterface,
+            blob_store: BlobStoreInterface
+    ):
         self._command_bus = command_bus
         self._query_bus = query_bus
+        self._storage_service = storage_service
+        self._blob_store = blob_store
 
     async def upload_file(
             self,
@@ -41,22 +60,30 @@ class FileAttachmentController:
             # Validate candidate_id
             candidate_id_vo = CandidateId.from_string(candidate_id)
 
-            # Read file content
-            file_content = await file.read()
+            filename = file.filename or "unknown"
+            content_type = file.content_type or "application/octet-stream"
+
+            # Stream the file to the blob store; a CV already uploaded elsewhere is stored only once
+            ensure_upload_size(file, self._storage_service.get_max_upload_size())
+            uploaded_file = await self._blob_store.store_stream(
+                chunks=iter_upload_chunks(file),
+                filename=filename,
+                content_type=content_type
+            )
 
             # Create command with a new ID
             file_attachment_id = FileAttachmentId.from_string(generate_id())
             command = UploadFileAttachmentCommand(
                 id=file_attachment_id,
                 candidate_id=candidate_id_vo,
-                file_content=file_content,
-                filename=file.filename or "unknown",
-                content_type=file.content_type or "application/octet-stream",
+                filename=filename,
+                content_type=content_type,
                 description=description,
-                company_id=company_id
+                company_id=company_id,
+                uploaded_file=uploaded_file
             )
 
-            # Execute command
+            # If this fails the blob stays unreferenced and is removed by BlobStore.collect_garbage
             self._command_bus.dispatch(command)
 
             # Query to get the created file attachment
@@ -68,11 +95,61 @@ class FileAttachmentController:
 
             return FileAttachmentMapper.dto_to_response(dto)
 
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise
             raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
 
+    def create_upload_url(self, candidate_id: str, request: DirectUploadRequest) -> DirectUploadResponse:
+        """Presign an upload so the file goes from the client straight to storage"""
+        try:
+            CandidateId.from_string(candidate_id)
+            direct_upload = self._blob_store.prepare_upload(
+                filename=request.filename,
+                content_type=request.content_type,
+                file_size=request.file_size,
+                content_hash=request.sha256
+            )
+            return DirectUploadResponse.from_direct_upload(direct_upload)
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def complete_upload(
+            self,
+            candidate_id: str,
+            request: CompleteDirectUploadRequest,
+            company_id: str | None = None
+    ) -> FileAttachmentResponse:
+        """Register a file uploaded with a presigned request as a candidate attachment"""
+        try:
+            candidate_id_vo = CandidateId.from_string(candidate_id)
+            uploaded_file = self._blob_store.complete_upload(request.upload_token)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        file_attachment_id = FileAttachmentId.from_string(generate_id())
+        command = UploadFileAttachmentCommand(
+            id=file_attachment_id,
+            candidate_id=candidate_id_vo,
+            filename=request.filename,
+            content_type=uploaded_file.content_type,
+            description=request.description,
+            company_id=company_id,
+            uploaded_file=uploaded_file
+        )
+        self._command_bus.dispatch(command)
+
+        dto: Optional[FileAttachmentDto] = self._query_bus.query(GetFileAttachmentByIdQuery(file_id=file_attachment_id))
+        if not dto:
+            raise HTTPException(status_code=500, detail="Failed to retrieve uploaded file")
+        return FileAttachmentMapper.dto_to_response(dto)
+
     async def get_candidate_files(self, candidate_id: str) -> List[FileAttachmentResponse]:
         """Get all files for a candidate"""
         try:
@@ -115,25 +192,16 @@ class FileAttachmentController:
 
         return FileAttachmentMapper.dto_to_response(dto)
 
-    async def download_file(self, file_id: str) -> bytes:
-        """Download a file"""
-        try:
-            file_id_vo = FileAttachmentId.from_string(file_id)
-            query = GetFileAttachmentByIdQuery(file_id=file_id_vo)
-            dto: Optional[FileAttachmentDto] = self._query_bus.query(query)
-
-            if not dto:
-                raise HTTPException(status_code=404, detail="File not found")
-
-            # For local storage, read the file directly
-            file_path = Path("uploads") / dto.file_path
-            if not file_path.exists():
-                raise HTTPException(status_code=404, detail=f"File not found on disk: {file_path}")
+    def get_download_url(self, candidate_id: str, file_id: str) -> str:
+        """Time-limited URL to download a file straight from storage"""
+        file_id_vo = FileAttachmentId.from_string(file_id)
+        dto: Optional[FileAttachmentDto] = self._query_bus.query(GetFileAttachmentByIdQuery(file_id=file_id_vo))
 
-            with open(file_path, 'rb') as f:
-                return f.read()
+        if not dto or dto.candidate_id.value != candidate_id:
+            raise HTTPException(status_code=404, detail="File not found")
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to download file: {str(e)}")
+        return self._storage_service.get_download_url(
+            dto.file_path,
+            expires_in=settings.DOWNLOAD_URL_EXPIRATION_SECONDS,
+            download_name=dto.original_name
+        )
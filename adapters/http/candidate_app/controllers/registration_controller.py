@@ -3,8 +3,11 @@ from typing import Optional
 
 from fastapi import UploadFile, HTTPException
 
+from adapters.http.shared.uploads import read_upload_capped
+
 from src.auth_bc.user.application import CreateAccessTokenQuery
 from src.auth_bc.user.application.queries.dtos.auth_dto import TokenDto
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 from src.auth_bc.user_registration.application.commands import (
     InitiateRegistrationCommand,
     VerifyRegistrationCommand,
@@ -57,15 +60,11 @@ class RegistrationController:
                 if resume_file.content_type != "application/pdf":
                     raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-                # Read file content
-                pdf_bytes = await resume_file.read()
+                # Read file content in chunks, stopping as soon as it exceeds 10MB
+                pdf_bytes = await read_upload_capped(resume_file, 10 * 1024 * 1024)
                 pdf_filename = resume_file.filename
                 pdf_content_type = resume_file.content_type
 
-                # Validate file size (max 10MB)
-                if len(pdf_bytes) > 10 * 1024 * 1024:
-                    raise HTTPException(status_code=400, detail="File size too large (max 10MB)")
-
             # Create and execute command
             command = InitiateRegistrationCommand(
                 email=email,
@@ -94,7 +93,7 @@ class RegistrationController:
                 detail="Internal server error. Please try again."
             )
 
-    async def verify_registration(self, token: str) -> dict:
+    def verify_registration(self, token: str) -> dict:
         """Verify registration and create user"""
         try:
             # Create and execute command
@@ -134,6 +133,8 @@ class RegistrationController:
                 "has_pdf": command.has_pdf
             }
 
+        except PasswordHashingBusyError:
+            raise
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
@@ -28,6 +28,7 @@ from src.auth_bc.user.domain.value_objects import UserId
 from src.candidate_bc.candidate.application import GetCandidateByUserIdQuery
 from src.candidate_bc.candidate.application.queries.shared.candidate_dto import CandidateDto
 from src.framework.application.query_bus import QueryBus
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 
 log = logging.getLogger(__name__)
 
@@ -406,6 +407,8 @@ def candidate_login(
             candidate_id=candidate_id
         )
 
+    except PasswordHashingBusyError:
+        raise
     except Exception as e:
         log.error(f"Candidate authentication error: {e}")
         raise HTTPException(
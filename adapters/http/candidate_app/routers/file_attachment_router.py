@@ -1,17 +1,24 @@
-import io
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import RedirectResponse
 
 from adapters.http.candidate_app.controllers.file_attachment_controller import FileAttachmentController
-from adapters.http.candidate_app.schemas.file_attachment_response import FileAttachmentResponse
+from adapters.http.candidate_app.schemas.file_attachment_response import (
+    FileAttachmentResponse,
+    FileDownloadUrlResponse,
+)
+from adapters.http.shared.storage.schemas.direct_upload_schemas import (
+    CompleteDirectUploadRequest,
+    DirectUploadRequest,
+    DirectUploadResponse,
+)
 from core.containers import Container
 
 try:
-    import jwt  # type: ignore
+    import jwt
 except ImportError:
-    jwt = None
+    jwt = None  # type: ignore[assignment]
 
 router = APIRouter(prefix="/api/candidates", tags=["file-attachments"])
 
@@ -32,19 +39,32 @@ async def upload_candidate_file(
         controller: FileAttachmentController = Depends(get_file_attachment_controller)
 ) -> FileAttachmentResponse:
     """Upload a file for a candidate"""
-    # Extract company_id from JWT token
-    company_id = None
-    if authorization and authorization.startswith("Bearer ") and jwt:
-        try:
-            token = authorization.split(" ")[1]
-            payload = jwt.decode(token, options={"verify_signature": False})
-            company_id = payload.get("company_id")
-        except Exception:
-            pass
-
+    company_id = _company_id_from_authorization(authorization)
     return await controller.upload_file(candidate_id, file, description, company_id)
 
 
+@router.post("/{candidate_id}/files/upload-url", response_model=DirectUploadResponse)
+async def create_candidate_file_upload_url(
+        candidate_id: str,
+        request: DirectUploadRequest,
+        controller: FileAttachmentController = Depends(get_file_attachment_controller)
+) -> DirectUploadResponse:
+    """Get a presigned URL to upload a file straight to storage"""
+    return controller.create_upload_url(candidate_id, request)
+
+
+@router.post("/{candidate_id}/files/complete", response_model=FileAttachmentResponse)
+async def complete_candidate_file_upload(
+        candidate_id: str,
+        request: CompleteDirectUploadRequest,
+        authorization: Optional[str] = Header(None),
+        controller: FileAttachmentController = Depends(get_file_attachment_controller)
+) -> FileAttachmentResponse:
+    """Register a file uploaded through a presigned URL"""
+    company_id = _company_id_from_authorization(authorization)
+    return await controller.complete_upload(candidate_id, request, company_id)
+
+
 @router.get("/{candidate_id}/files", response_model=List[FileAttachmentResponse])
 async def get_candidate_files(
         candidate_id: str,
@@ -70,19 +90,34 @@ async def download_file(
         candidate_id: str,
         file_id: str,
         controller: FileAttachmentController = Depends(get_file_attachment_controller)
-) -> StreamingResponse:
-    """Download a file"""
-    # Get file info first to set proper headers
-    file_response = await controller.get_file_by_id(file_id)
-
-    # Get file content
-    file_content = await controller.download_file(file_id)
-
-    # Create a streaming response
-    return StreamingResponse(
-        io.BytesIO(file_content),
-        media_type=file_response.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={file_response.original_name}"
-        }
-    )
+) -> RedirectResponse:
+    """Redirect to a short-lived URL that serves the file straight from storage"""
+    return RedirectResponse(controller.get_download_url(candidate_id, file_id), status_code=307)
+
+
+@router.get("/{candidate_id}/files/{file_id}/download-url", response_model=FileDownloadUrlResponse)
+async def get_file_download_url(
+        candidate_id: str,
+        file_id: str,
+        controller: FileAttachmentController = Depends(get_file_attachment_controller)
+) -> FileDownloadUrlResponse:
+    """Short-lived URL to download a file from, for clients that cannot follow the redirect of /download
+
+    An authenticated fetch cannot follow the redirect to a presigned storage URL
+    (the Authorization header is rejected cross-origin), so the client reads the URL
+    and navigates to it instead.
+    """
+    return FileDownloadUrlResponse(download_url=controller.get_download_url(candidate_id, file_id))
+
+
+def _company_id_from_authorization(authorization: Optional[str]) -> Optional[str]:
+    """Extract company_id from the JWT token, if any"""
+    if authorization and authorization.startswith("Bearer ") and jwt:
+        try:
+            token = authorization.split(" ")[1]
+            payload = jwt.decode(token, options={"verify_signature": False})
+            company_id: Optional[str] = payload.get("company_id")
+            return company_id
+        except Exception:
+            pass
+    return None
@@ -1,11 +1,29 @@
 import logging
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, Optional
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, Header, UploadFile, File, HTTPException
 
+from adapters.http.auth.schemas.user import UserResponse
+from adapters.http.auth.services.authentication_service import get_current_user
+from adapters.http.shared.storage.schemas.direct_upload_schemas import (
+    CompleteDirectUploadRequest,
+    DirectUploadRequest,
+    DirectUploadResponse,
+)
 from core.containers import Container
+from src.auth_bc.user.application import CreatePdfResumeAssetCommand
+from src.auth_bc.user.domain.value_objects.UserId import UserId
+from src.auth_bc.user.domain.value_objects.user_asset_id import UserAssetId
+from src.candidate_bc.candidate.application import GetCandidateByUserIdQuery
+from src.candidate_bc.candidate.application.queries.shared.candidate_dto import CandidateDto
+from src.candidate_bc.resume.application.commands.analyze_pdf_resume_command import AnalyzePDFResumeCommand
 from src.framework.application.command_bus import CommandBus
+from src.framework.application.query_bus import QueryBus
+from src.framework.domain.entities.async_job import AsyncJobId
+from src.framework.domain.entities.base import generate_id
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
+from src.framework.domain.infrastructure.storage_service_interface import FileTooLargeError
 from src.framework.infrastructure.jobs.async_job_service import AsyncJobService
 
 logger = logging.getLogger(__name__)
@@ -24,6 +42,68 @@ async def upload_pdf(
     pass
 
 
+@file_router.post("/pdf-upload-url", response_model=DirectUploadResponse)
+@inject
+def create_pdf_upload_url(
+        request: DirectUploadRequest,
+        blob_store: Annotated[BlobStoreInterface, Depends(Provide[Container.blob_store])],
+        current_user: UserResponse = Depends(get_current_user),
+) -> DirectUploadResponse:
+    """Get a presigned URL to upload a PDF resume straight to storage"""
+    if request.content_type != "application/pdf":
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    try:
+        direct_upload = blob_store.prepare_upload(
+            filename=request.filename,
+            content_type=request.content_type,
+            file_size=request.file_size,
+            content_hash=request.sha256
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return DirectUploadResponse.from_direct_upload(direct_upload)
+
+
+@file_router.post("/pdf-upload-complete")
+@inject
+def complete_pdf_upload(
+        request: CompleteDirectUploadRequest,
+        blob_store: Annotated[BlobStoreInterface, Depends(Provide[Container.blob_store])],
+        command_bus: Annotated[CommandBus, Depends(Provide[Container.command_bus])],
+        query_bus: Annotated[QueryBus, Depends(Provide[Container.query_bus])],
+        current_user: UserResponse = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """Register a PDF resume uploaded through a presigned URL and start its analysis"""
+    user_id = UserId.from_string(current_user.id)
+    candidate: Optional[CandidateDto] = query_bus.query(GetCandidateByUserIdQuery(user_id=user_id))
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate profile not found")
+
+    try:
+        uploaded_file = blob_store.complete_upload(request.upload_token)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    user_asset_id = UserAssetId(generate_id())
+    command_bus.dispatch(CreatePdfResumeAssetCommand(
+        id=user_asset_id,
+        user_id=user_id,
+        uploaded_file=uploaded_file,
+        file_name=request.filename
+    ))
+
+    job_id = AsyncJobId(generate_id())
+    command_bus.dispatch(AnalyzePDFResumeCommand(
+        job_id=job_id,
+        user_asset_id=user_asset_id,
+        candidate_id=candidate.id
+    ))
+
+    return {"job_id": job_id.value, "user_asset_id": user_asset_id.value}
+
+
 @file_router.get("/analysis-status/{job_id}")
 @inject
 async def get_analysis_status(
@@ -78,7 +78,7 @@ async def initiate_registration(
 
 @router.get("/verify/{token}", response_model=VerifyRegistrationResponse)
 @inject
-async def verify_registration(
+def verify_registration(
         token: str,
         registration_controller: Annotated[
             RegistrationController,
@@ -93,7 +93,7 @@ async def verify_registration(
     - Returns JWT token for authentication
     - Returns redirect URL (wizard or profile)
     """
-    result = await registration_controller.verify_registration(token)
+    result = registration_controller.verify_registration(token)
     return VerifyRegistrationResponse(**result)
 
 
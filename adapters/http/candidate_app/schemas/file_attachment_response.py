@@ -18,3 +18,8 @@ class FileAttachmentResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class FileDownloadUrlResponse(BaseModel):
+    """Time-limited URL the browser downloads the file from"""
+    download_url: str
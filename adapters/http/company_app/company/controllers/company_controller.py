@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 import ulid
-from fastapi import HTTPException, status
+from fastapi import HTTPException, UploadFile, status
 
 from adapters.http.company_app.company.mappers.company_mapper import CompanyResponseMapper
 from adapters.http.company_app.company.schemas.company_registration_request import (
@@ -17,7 +17,12 @@ from adapters.http.company_app.company.schemas.company_request import (
     UpdateCompanyRequest,
 )
 from adapters.http.company_app.company.schemas.company_response import CompanyResponse
-from src.auth_bc.user.domain.exceptions.user_exceptions import EmailAlreadyExistException, UserNotFoundError
+from adapters.http.shared.uploads import ensure_upload_size, iter_upload_chunks
+from src.auth_bc.user.domain.exceptions.user_exceptions import (
+    EmailAlreadyExistException,
+    PasswordHashingBusyError,
+    UserNotFoundError,
+)
 from src.auth_bc.user.domain.value_objects import UserId
 from src.company_bc.company.application import GetCompanyByIdQuery, GetCompanyBySlugQuery, GetCompanyByDomainQuery, \
     ListCompaniesQuery
@@ -45,14 +50,20 @@ from src.company_bc.company.domain.value_objects import CompanyId as CompanyIdVO
 from src.framework.application.command_bus import CommandBus
 from src.framework.application.query_bus import QueryBus
 from src.framework.domain.exceptions import InvalidCredentialsException
+from src.framework.domain.infrastructure.storage_service_interface import (
+    FileTooLargeError,
+    StorageServiceInterface,
+    StorageType,
+)
 
 
 class CompanyController:
     """Controller for Company operations"""
 
-    def __init__(self, command_bus: CommandBus, query_bus: QueryBus):
+    def __init__(self, command_bus: CommandBus, query_bus: QueryBus, storage_service: StorageServiceInterface):
         self.command_bus = command_bus
         self.query_bus = query_bus
+        self.storage_service = storage_service
 
     def create_company(self, request: CreateCompanyRequest) -> CompanyResponse:
         """Create a new company"""
@@ -331,23 +342,37 @@ class CompanyController:
                 detail=f"Failed to delete company: {str(e)}"
             )
 
-    def upload_company_logo(
+    async def upload_company_logo(
             self,
             company_id: str,
-            file_content: bytes,
-            filename: str,
-            content_type: str
+            file: UploadFile,
+            max_size_bytes: int
     ) -> CompanyResponse:
-        """Upload a company logo"""
+        """Upload a company logo, streaming it to storage"""
         try:
-            # Execute command
+            ensure_upload_size(file, max_size_bytes)
+            uploaded_file = await self.storage_service.upload_stream(
+                chunks=iter_upload_chunks(file),
+                filename=file.filename or "logo.png",
+                content_type=file.content_type or "image/png",
+                storage_type=StorageType.COMPANY_LOGO,
+                entity_id=company_id,
+                company_id=company_id,
+                max_size_bytes=max_size_bytes
+            )
+
+            # Execute command; do not leave an orphan file if it fails
             command = UploadCompanyLogoCommand(
                 company_id=company_id,
-                file_content=file_content,
-                filename=filename,
-                content_type=content_type
+                filename=file.filename or "logo.png",
+                content_type=file.content_type or "image/png",
+                uploaded_file=uploaded_file
             )
-            self.command_bus.dispatch(command)
+            try:
+                self.command_bus.dispatch(command)
+            except Exception:
+                self.storage_service.delete_file(uploaded_file.file_path)
+                raise
 
             # Query to get updated company
             query = GetCompanyByIdQuery(company_id=CompanyId.from_string(company_id))
@@ -366,11 +391,18 @@ class CompanyController:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=str(e)
             )
+        except FileTooLargeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=str(e)
+            )
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -424,6 +456,8 @@ class CompanyController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -494,6 +528,8 @@ class CompanyController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except PasswordHashingBusyError:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
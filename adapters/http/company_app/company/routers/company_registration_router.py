@@ -31,7 +31,7 @@ users_router = APIRouter(prefix="/users", tags=["users-public"])
 
 @router.post("/register", response_model=CompanyRegistrationResponse, status_code=201)
 @inject
-async def register_company_with_user(
+def register_company_with_user(
         request: CompanyRegistrationRequest,
         controller: Annotated[CompanyController, Depends(Provide[Container.company_management_controller])],
 ) -> CompanyRegistrationResponse:
@@ -50,7 +50,7 @@ async def register_company_with_user(
 
 @router.post("/register/link-user", response_model=LinkUserResponse, status_code=201)
 @inject
-async def link_user_to_company(
+def link_user_to_company(
         request: LinkUserRequest,
         controller: Annotated[CompanyController, Depends(Provide[Container.company_management_controller])],
 ) -> LinkUserResponse:
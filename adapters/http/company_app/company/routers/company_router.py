@@ -20,6 +20,7 @@ from src.company_bc.company.application.dtos.auth_dto import AuthenticatedCompan
 from src.company_bc.company.application.queries.authenticate_company_user_query import AuthenticateCompanyUserQuery
 from src.company_bc.company.domain import CompanyId
 from src.framework.application.query_bus import QueryBus
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
 
 log = logging.getLogger(__name__)
 
@@ -122,22 +123,11 @@ async def upload_company_logo(
             detail=f"Invalid file type. Allowed types: {', '.join(allowed_types)}"
         )
 
-    # Read file content
-    file_content = await file.read()
-
-    # Validate file size (max 5MB)
-    max_size = 5 * 1024 * 1024  # 5MB
-    if len(file_content) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds maximum allowed size of 5MB"
-        )
-
-    return controller.upload_company_logo(
+    # Streamed to storage in chunks; rejected as soon as it exceeds 5MB
+    return await controller.upload_company_logo(
         company_id=company_id,
-        file_content=file_content,
-        filename=file.filename or "logo.png",
-        content_type=file.content_type or "image/png"
+        file=file,
+        max_size_bytes=5 * 1024 * 1024
     )
 
 
@@ -174,7 +164,7 @@ async def delete_company(
 
 @router.post("/auth/login", response_model=Token)
 @inject
-async def company_login(
+def company_login(
         query_bus: Annotated[QueryBus, Depends(Provide[Container.query_bus])],
         form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Token:
@@ -195,6 +185,8 @@ async def company_login(
             access_token=auth_result.access_token,
             token_type=auth_result.token_type,
         )
+    except PasswordHashingBusyError:
+        raise
     except HTTPException:
         raise
     except Exception as e:
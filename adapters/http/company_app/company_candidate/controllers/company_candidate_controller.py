@@ -1,10 +1,17 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Iterator
 
 from adapters.http.company_app.company_candidate.mappers.company_candidate_mapper import CompanyCandidateResponseMapper
 from adapters.http.company_app.company_candidate.schemas.assign_workflow_request import AssignWorkflowRequest
+from adapters.http.company_app.company_candidate.schemas.bulk_change_stage_request import BulkChangeStageRequest
+from adapters.http.company_app.company_candidate.schemas.bulk_change_stage_response import (
+    BulkChangeStageItemResponse,
+    BulkChangeStageResponse,
+)
 from adapters.http.company_app.company_candidate.schemas.change_stage_request import ChangeStageRequest
 from adapters.http.company_app.company_candidate.schemas.company_candidate_response import CompanyCandidateResponse
+from adapters.http.company_app.company_candidate.schemas.company_candidates_export_job_response import \
+    CompanyCandidatesExportJobResponse
 from adapters.http.company_app.company_candidate.schemas.create_company_candidate_request import \
     CreateCompanyCandidateRequest
 from adapters.http.company_app.company_candidate.schemas.update_company_candidate_request import \
@@ -18,6 +25,7 @@ from src.company_bc.company.domain.value_objects import CompanyUserId
 from src.company_bc.company_candidate.application.commands.archive_company_candidate_command import \
     ArchiveCompanyCandidateCommand
 from src.company_bc.company_candidate.application.commands.assign_workflow_command import AssignWorkflowCommand
+from src.company_bc.company_candidate.application.commands.bulk_change_stage_command import BulkChangeStageCommand
 from src.company_bc.company_candidate.application.commands.change_stage_command import ChangeStageCommand
 from src.company_bc.company_candidate.application.commands.confirm_company_candidate_command import \
     ConfirmCompanyCandidateCommand
@@ -25,10 +33,16 @@ from src.company_bc.company_candidate.application.commands.create_company_candid
     CreateCompanyCandidateCommand
 from src.company_bc.company_candidate.application.commands.reject_company_candidate_command import \
     RejectCompanyCandidateCommand
+from src.company_bc.company_candidate.application.commands.start_company_candidates_export_command import \
+    StartCompanyCandidatesExportCommand
 from src.company_bc.company_candidate.application.commands.transfer_ownership_command import TransferOwnershipCommand
 from src.company_bc.company_candidate.application.commands.update_company_candidate_command import \
     UpdateCompanyCandidateCommand
 from src.company_bc.company_candidate.application.dtos.company_candidate_dto import CompanyCandidateDto
+from src.company_bc.company_candidate.application.queries.export_company_candidates_query import (
+    CompanyCandidatesExportDto,
+    ExportCompanyCandidatesQuery,
+)
 from src.company_bc.company_candidate.application.queries.get_company_candidate_by_company_and_candidate import \
     GetCompanyCandidateByCompanyAndCandidateQuery
 from src.company_bc.company_candidate.application.queries.get_company_candidate_by_id import \
@@ -41,6 +55,12 @@ from src.company_bc.company_candidate.domain.read_models.company_candidate_with_
 from src.company_bc.company_candidate.domain.value_objects import CompanyCandidateId
 from src.framework.application.command_bus import CommandBus
 from src.framework.application.query_bus import QueryBus
+from src.framework.domain.entities.async_job import AsyncJobId
+from src.framework.infrastructure.services.export import ExportFormat, iter_export
+from src.shared_bc.customization.entity_customization.application.queries.get_custom_field_values_by_entities_query import \
+    GetCustomFieldValuesByEntitiesQuery
+from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+    EntityCustomizationTypeEnum
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_id import WorkflowId
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
 
@@ -186,8 +206,16 @@ class CompanyCandidateController:
 
         return CompanyCandidateResponseMapper.dto_to_response(dto)
 
-    def list_company_candidates_by_company(self, company_id: str) -> List[CompanyCandidateResponse]:
-        """List all company candidates for a specific company with candidate info"""
+    def list_company_candidates_by_company(
+            self,
+            company_id: str,
+            include_custom_fields: bool = False
+    ) -> List[CompanyCandidateResponse]:
+        """List all company candidates for a specific company with candidate info
+
+        With include_custom_fields the custom field values of the whole list are
+        loaded with a single query.
+        """
         from src.company_bc.company_candidate.application.queries.list_company_candidates_with_candidate_info import (
             ListCompanyCandidatesWithCandidateInfoQuery
         )
@@ -196,12 +224,47 @@ class CompanyCandidateController:
         query = ListCompanyCandidatesWithCandidateInfoQuery(company_id=company_id)
         read_models: List[CompanyCandidateWithCandidateReadModel] = self._query_bus.query(query)
 
+        custom_field_values: Dict[str, Dict[str, Any]] = {}
+        if include_custom_fields and read_models:
+            values_query = GetCustomFieldValuesByEntitiesQuery(
+                entity_type=EntityCustomizationTypeEnum.CANDIDATE_APPLICATION,
+                entity_ids=[read_model.id for read_model in read_models]
+            )
+            custom_field_values = self._query_bus.query(values_query)
+
         # Use mapper to convert read models to responses
         return [
-            CompanyCandidateResponseMapper.read_model_to_response(read_model)
+            CompanyCandidateResponseMapper.read_model_to_response(
+                read_model, custom_field_values.get(read_model.id) if include_custom_fields else None
+            )
             for read_model in read_models
         ]
 
+    def export_company_candidates(self, company_id: str, export_format: ExportFormat,
+                                  batch_size: int = 1000) -> Iterator[bytes]:
+        """Stream all company candidates of a company as CSV/XLSX chunks"""
+        query = ExportCompanyCandidatesQuery(company_id=company_id, batch_size=batch_size)
+        export: CompanyCandidatesExportDto = self._query_bus.query(query)
+        return iter_export(export_format, export.header, export.rows)
+
+    def start_company_candidates_export(self, company_id: str, export_format: ExportFormat,
+                                        requested_by: Optional[str] = None) -> CompanyCandidatesExportJobResponse:
+        """Start a background export of all company candidates of a company"""
+        job_id = AsyncJobId.generate()
+        command = StartCompanyCandidatesExportCommand(
+            job_id=job_id,
+            company_id=CompanyId.from_string(company_id),
+            export_format=export_format,
+            requested_by=requested_by
+        )
+        self._command_bus.dispatch(command)
+
+        return CompanyCandidatesExportJobResponse(
+            job_id=job_id.value,
+            format=export_format.value,
+            status_url=f"/api/jobs/{job_id.value}/status"
+        )
+
     def list_company_candidates_by_candidate(self, candidate_id: str) -> List[CompanyCandidateResponse]:
         """List all company candidates for a specific candidate"""
         query = ListCompanyCandidatesByCandidateQuery(candidate_id=CandidateId.from_string(candidate_id))
@@ -312,3 +375,31 @@ class CompanyCandidateController:
             raise Exception("Company candidate not found")
 
         return CompanyCandidateResponseMapper.dto_to_response(dto)
+
+    def bulk_change_stage(self, company_id: str, request: BulkChangeStageRequest) -> BulkChangeStageResponse:
+        """Move many company candidates of a company to the same workflow stage"""
+        command = BulkChangeStageCommand(
+            company_id=CompanyId.from_string(company_id),
+            company_candidate_ids=[CompanyCandidateId.from_string(cc_id) for cc_id in request.company_candidate_ids],
+            new_stage_id=WorkflowStageId.from_string(request.new_stage_id)
+        )
+
+        self._command_bus.dispatch(command)
+
+        results = [
+            BulkChangeStageItemResponse(
+                company_candidate_id=result.company_candidate_id,
+                success=result.success,
+                error=result.error
+            )
+            for result in command.results
+        ]
+        succeeded = sum(1 for result in results if result.success)
+
+        return BulkChangeStageResponse(
+            new_stage_id=request.new_stage_id,
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results
+        )
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 
 from adapters.http.company_app.company_candidate.controllers.company_candidate_controller import \
@@ -13,6 +13,7 @@ from adapters.http.company_app.company_candidate.schemas.create_company_candidat
     CreateCompanyCandidateRequest
 from adapters.http.company_app.company_candidate.schemas.update_company_candidate_request import \
     UpdateCompanyCandidateRequest
+from adapters.http.shared.responses import model_json_response
 from core.containers import Container
 from src.framework.application.query_bus import QueryBus
 
@@ -86,10 +87,14 @@ def get_company_candidate_by_company_and_candidate(
 @inject
 def list_company_candidates_by_company(
         company_id: str,
+        include_custom_fields: bool = Query(False, description="Include custom field values of every candidate"),
         controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
-) -> List[CompanyCandidateResponse]:
+) -> Response:
     """List all company candidates for a specific company"""
-    return controller.list_company_candidates_by_company(company_id)
+    return model_json_response(
+        controller.list_company_candidates_by_company(company_id, include_custom_fields=include_custom_fields),
+        List[CompanyCandidateResponse]
+    )
 
 
 @router.get(
@@ -101,9 +106,11 @@ def list_company_candidates_by_company(
 def list_company_candidates_by_candidate(
         candidate_id: str,
         controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
-) -> List[CompanyCandidateResponse]:
+) -> Response:
     """List all company candidates for a specific candidate"""
-    return controller.list_company_candidates_by_candidate(candidate_id)
+    return model_json_response(
+        controller.list_company_candidates_by_candidate(candidate_id), List[CompanyCandidateResponse]
+    )
 
 
 @router.put(
@@ -221,7 +228,11 @@ def change_stage(
         request: ChangeStageRequest,
         controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
 ) -> CompanyCandidateResponse:
-    """Change the workflow stage of a company candidate"""
+    """Change the workflow stage of a company candidate
+
+    The move is not part of the stage dwell times of workflow analytics, which only
+    count candidate application stage moves.
+    """
     try:
         return controller.change_stage(company_candidate_id, request)
     except Exception as e:
@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class BulkChangeStageRequest(BaseModel):
+    """Request schema for moving many company candidates to the same workflow stage"""
+    company_candidate_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Company candidate IDs to move"
+    )
+    new_stage_id: str = Field(..., description="New stage ID")
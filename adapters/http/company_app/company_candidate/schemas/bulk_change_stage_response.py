@@ -0,0 +1,19 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkChangeStageItemResponse(BaseModel):
+    """Result of the stage change for a single company candidate"""
+    company_candidate_id: str
+    success: bool
+    error: Optional[str] = None
+
+
+class BulkChangeStageResponse(BaseModel):
+    """Response schema for a bulk stage change"""
+    new_stage_id: str
+    total: int = Field(..., description="Number of distinct candidates requested")
+    succeeded: int
+    failed: int
+    results: List[BulkChangeStageItemResponse]
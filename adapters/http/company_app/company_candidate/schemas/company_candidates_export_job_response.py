@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class CompanyCandidatesExportJobResponse(BaseModel):
+    """Response schema for a background company candidates export"""
+    job_id: str = Field(..., description="Async job ID")
+    format: str = Field(..., description="Export file format (csv or xlsx)")
+    status_url: str = Field(..., description="URL to poll for the job status and the download link")
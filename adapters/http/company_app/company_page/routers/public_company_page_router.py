@@ -4,11 +4,13 @@ Public Company Page Router - Router for public company page endpoints
 from typing import Annotated
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 
 from adapters.http.company_app.company_page.controllers.company_page_controller import CompanyPageController
 from adapters.http.company_app.company_page.schemas.company_page_response import CompanyPageResponse
+from adapters.http.shared.http_caching import cached_json_response
 from core.containers import Container
+from src.framework.application.public_response_cache import PUBLIC_COMPANY_PAGES
 
 # Crear router
 router = APIRouter(prefix="/api/public/company", tags=["Public Company Pages"])
@@ -19,12 +21,14 @@ router = APIRouter(prefix="/api/public/company", tags=["Public Company Pages"])
 @router.get("/{company_id}/pages/{page_type}", response_model=CompanyPageResponse)
 @inject
 async def get_public_company_page(
+        request: Request,
         company_id: str,
         page_type: str,
         controller: Annotated[CompanyPageController, Depends(Provide[Container.company_page_controller])]
-) -> CompanyPageResponse:
-    """Get a public company page by type"""
-    try:
+) -> Response:
+    """Get a public company page by type (pre-rendered after each publish, with ETag)"""
+
+    def build() -> CompanyPageResponse:
         page = controller.get_public_page(company_id, page_type)
 
         if not page:
@@ -34,6 +38,12 @@ async def get_public_company_page(
             )
 
         return page
+
+    try:
+        return cached_json_response(
+            request, build, namespace=PUBLIC_COMPANY_PAGES, key=f"{company_id}:{page_type}",
+            scope=company_id, prerendered=True
+        )
     except HTTPException:
         raise
     except Exception:
@@ -43,9 +53,10 @@ async def get_public_company_page(
 @router.get("/{company_id}/pages/{page_type}/default", response_model=CompanyPageResponse)
 @inject
 async def get_default_public_company_page(
+        request: Request,
         company_id: str,
         page_type: str,
         controller: Annotated[CompanyPageController, Depends(Provide[Container.company_page_controller])]
-) -> CompanyPageResponse:
+) -> Response:
     """Get the default page of a specific type (alias for get_public_company_page)"""
-    return await get_public_company_page(company_id, page_type, controller)
+    return await get_public_company_page(request, company_id, page_type, controller)
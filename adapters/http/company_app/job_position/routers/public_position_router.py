@@ -5,7 +5,7 @@ Phase 10: REST API endpoints for public job positions (no auth required for brow
 from typing import Optional
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 
 from adapters.http.company_app.job_position.controllers.public_position_controller import PublicPositionController
 from adapters.http.company_app.job_position.schemas.public_position_schemas import (
@@ -14,8 +14,10 @@ from adapters.http.company_app.job_position.schemas.public_position_schemas impo
     SubmitApplicationRequest,
     SubmitApplicationResponse
 )
+from adapters.http.shared.http_caching import cached_json_response
 from core.containers import Container
 from src.company_bc.job_position.domain.exceptions import JobPositionNotFoundError
+from src.framework.application.public_response_cache import PUBLIC_POSITION_LIST_SCOPE, PUBLIC_POSITIONS
 
 router = APIRouter(prefix="/public/positions", tags=["public-positions"])
 
@@ -28,11 +30,12 @@ router = APIRouter(prefix="/public/positions", tags=["public-positions"])
 )
 @inject
 def list_public_positions(
+        request: Request,
         search: Optional[str] = Query(None, description="Search term for title/description"),
         page: int = Query(1, ge=1, description="Page number (1-indexed)"),
         page_size: int = Query(12, ge=1, le=100, description="Items per page"),
         controller: PublicPositionController = Depends(Provide[Container.public_position_controller])
-) -> PublicPositionListResponse:
+) -> Response:
     """
     List public job positions with optional filters - simplified
 
@@ -45,13 +48,19 @@ def list_public_positions(
         page_size: Number of items per page
 
     Returns:
-        PublicPositionListResponse with positions and pagination info
+        PublicPositionListResponse with positions and pagination info (cacheable, with ETag)
     """
     try:
-        return controller.list_public_positions(
-            search=search,
-            page=page,
-            page_size=page_size
+        return cached_json_response(
+            request,
+            lambda: controller.list_public_positions(
+                search=search,
+                page=page,
+                page_size=page_size
+            ),
+            namespace=PUBLIC_POSITIONS,
+            key=f"list:{search or ''}:{page}:{page_size}",
+            scope=PUBLIC_POSITION_LIST_SCOPE
         )
     except Exception as e:
         raise HTTPException(
@@ -68,9 +77,10 @@ def list_public_positions(
 )
 @inject
 def get_public_position(
+        request: Request,
         slug_or_id: str,
         controller: PublicPositionController = Depends(Provide[Container.public_position_controller])
-) -> PublicPositionResponse:
+) -> Response:
     """
     Get a single public job position by slug or ID
 
@@ -81,13 +91,20 @@ def get_public_position(
         slug_or_id: Position public slug or ID
 
     Returns:
-        PublicPositionResponse with only visible fields for candidates
+        PublicPositionResponse with only visible fields for candidates (pre-rendered after each publish, with ETag)
 
     Raises:
         404: If position not found or not public
     """
     try:
-        return controller.get_public_position(slug_or_id)
+        return cached_json_response(
+            request,
+            lambda: controller.get_public_position(slug_or_id),
+            namespace=PUBLIC_POSITIONS,
+            key=f"detail:{slug_or_id}",
+            scope=slug_or_id,
+            prerendered=True
+        )
     except JobPositionNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
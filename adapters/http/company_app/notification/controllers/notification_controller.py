@@ -1,5 +1,9 @@
+from fastapi import HTTPException, status
+
+from core.config import settings
 from src.framework.application.query_bus import QueryBus
 from src.framework.application.command_bus import CommandBus
+from src.framework.infrastructure.storage.url_signer import InvalidSignatureError, UrlSigner
 from src.notification_bc.in_app_notification.domain.entities.in_app_notification import InAppNotificationId
 from src.notification_bc.in_app_notification.application.queries.list_user_notifications_query import (
     ListUserNotificationsQuery,
@@ -19,6 +23,7 @@ from src.notification_bc.in_app_notification.application.commands.delete_notific
 )
 from adapters.http.company_app.notification.schemas.notification_schemas import (
     NotificationListResponse,
+    StreamTokenResponse,
     UnreadCountResponse
 )
 from adapters.http.company_app.notification.mappers.notification_mapper import (
@@ -32,6 +37,7 @@ class NotificationController:
     def __init__(self, query_bus: QueryBus, command_bus: CommandBus):
         self.query_bus = query_bus
         self.command_bus = command_bus
+        self.stream_token_signer = UrlSigner(settings.auth.SECRET_KEY, purpose="notification_stream")
 
     def list_notifications(
         self,
@@ -63,6 +69,22 @@ class NotificationController:
         )
         return UnreadCountResponse(unread_count=count)
 
+    def create_stream_token(self, user_id: str, company_id: str) -> StreamTokenResponse:
+        """Short-lived token to open the notification stream (EventSource cannot send headers)"""
+        expires_in = settings.NOTIFICATION_STREAM_TOKEN_EXPIRATION_SECONDS
+        token = self.stream_token_signer.sign({"user_id": user_id, "company_id": company_id}, expires_in)
+        return StreamTokenResponse(token=token, expires_in=expires_in)
+
+    def verify_stream_token(self, token: str, company_id: str) -> str:
+        """Return the user a stream token was issued to, for the given company"""
+        try:
+            payload = self.stream_token_signer.verify(token)
+        except InvalidSignatureError as e:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Invalid stream token: {str(e)}")
+        if payload.get("company_id") != company_id or not payload.get("user_id"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid stream token")
+        return str(payload["user_id"])
+
     def mark_as_read(self, notification_id: str, user_id: str, company_id: str) -> None:
         """Mark a notification as read"""
         self.command_bus.execute(
@@ -5,18 +5,22 @@ Company-scoped routes for in-app notifications.
 URL Pattern: /{company_slug}/admin/notifications/*
 """
 import logging
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from adapters.http.company_app.notification.controllers.notification_controller import NotificationController
 from adapters.http.company_app.notification.schemas.notification_schemas import (
     NotificationListResponse,
+    StreamTokenResponse,
     UnreadCountResponse
 )
-from adapters.http.shared.dependencies.company_context import AdminCompanyContext, CurrentCompanyUser
+from adapters.http.shared.dependencies.company_context import AdminCompanyContext, CompanyContext, CurrentCompanyUser
 from core.containers import Container
+from src.notification_bc.in_app_notification.infrastructure.push import RedisInAppNotificationStream
 
 log = logging.getLogger(__name__)
 
@@ -59,16 +63,75 @@ def list_notifications(
     response_model=UnreadCountResponse,
     summary="Get unread notification count"
 )
+@inject
 def get_unread_count(
     company: AdminCompanyContext,
-    current_user: CurrentCompanyUser
+    current_user: CurrentCompanyUser,
+    controller: Annotated[NotificationController, Depends(Provide[Container.notification_controller])]
 ) -> UnreadCountResponse:
-    """Get the count of unread notifications for the current user.
+    """Get the count of unread notifications for the current user (a counter lookup, no COUNT).
+
+    Prefer the /stream endpoint to polling this one; clients poll only while it is unavailable.
+    """
+    return controller.get_unread_count(user_id=current_user.id, company_id=company.id)
+
+
+@router.post(
+    "/stream-token",
+    response_model=StreamTokenResponse,
+    summary="Get a short-lived token to open the notification stream"
+)
+@inject
+def create_stream_token(
+    company: AdminCompanyContext,
+    current_user: CurrentCompanyUser,
+    controller: Annotated[NotificationController, Depends(Provide[Container.notification_controller])]
+) -> StreamTokenResponse:
+    """EventSource cannot send the Authorization header: /stream takes this token as a query parameter.
+
+    The token is only checked when the stream is opened; reconnecting needs a new one.
+    """
+    return controller.create_stream_token(user_id=current_user.id, company_id=company.id)
 
-    TODO: Implement full notification system. Currently returns 0.
+
+@router.get(
+    "/stream",
+    summary="Stream new notifications and unread count changes (Server-Sent Events)"
+)
+@inject
+async def stream_notifications(
+    request: Request,
+    company: CompanyContext,
+    controller: Annotated[NotificationController, Depends(Provide[Container.notification_controller])],
+    stream: Annotated[RedisInAppNotificationStream, Depends(Provide[Container.in_app_notification_stream])],
+    token: str = Query(..., description="Token from POST /stream-token")
+) -> StreamingResponse:
+    """Push channel replacing the unread-count polling.
+
+    Sends the current unread count first, then one JSON event per change:
+    {"type": "notification", "unread_count": n, "notification": {...}} or
+    {"type": "unread_count", "unread_count": n}. Comment lines keep the
+    connection alive while nothing happens.
     """
-    # Stub implementation - returns 0 until notification system is fully implemented
-    return UnreadCountResponse(unread_count=0)
+    company_id = company.id
+    user_id = controller.verify_stream_token(token, company_id=company_id)
+    if not stream.enabled:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Notification push is disabled")
+
+    unread = await run_in_threadpool(controller.get_unread_count, user_id=user_id, company_id=company_id)
+
+    async def events() -> AsyncIterator[str]:
+        yield f'data: {{"type": "unread_count", "unread_count": {unread.unread_count}}}\n\n'
+        async for payload in stream.listen(user_id, company_id):
+            if await request.is_disconnected():
+                break
+            yield f"data: {payload}\n\n" if payload is not None else ": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.post(
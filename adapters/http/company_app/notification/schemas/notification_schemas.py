@@ -28,3 +28,9 @@ class NotificationListResponse(BaseModel):
 class UnreadCountResponse(BaseModel):
     """Response schema for unread notification count"""
     unread_count: int
+
+
+class StreamTokenResponse(BaseModel):
+    """Response schema for a notification stream token"""
+    token: str
+    expires_in: int
@@ -10,7 +10,8 @@ import logging
 from typing import List, Optional, Any
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from adapters.http.admin_app.controllers.job_position_controller import JobPositionController
@@ -18,8 +19,13 @@ from adapters.http.company_app.company_candidate.controllers.company_candidate_c
     CompanyCandidateController
 )
 from adapters.http.company_app.company_candidate.schemas.assign_workflow_request import AssignWorkflowRequest
+from adapters.http.company_app.company_candidate.schemas.bulk_change_stage_request import BulkChangeStageRequest
+from adapters.http.company_app.company_candidate.schemas.bulk_change_stage_response import BulkChangeStageResponse
 from adapters.http.company_app.company_candidate.schemas.change_stage_request import ChangeStageRequest
 from adapters.http.company_app.company_candidate.schemas.company_candidate_response import CompanyCandidateResponse
+from adapters.http.company_app.company_candidate.schemas.company_candidates_export_job_response import (
+    CompanyCandidatesExportJobResponse
+)
 from adapters.http.company_app.company_candidate.schemas.create_company_candidate_request import (
     CreateCompanyCandidateRequest
 )
@@ -72,9 +78,12 @@ from adapters.http.shared.dependencies.company_context import (
     AdminCompanyContext,
     CurrentCompanyUser,
 )
+from adapters.http.shared.responses import model_json_response
+from core.config import settings
 from core.containers import Container
 from src.company_bc.company.application.dtos.company_dto import CompanyDto
 from src.framework.application.query_bus import QueryBus
+from src.framework.infrastructure.services.export import ExportFormat
 
 log = logging.getLogger(__name__)
 
@@ -98,7 +107,9 @@ def list_positions(
     visibility: Optional[str] = Query(None, description="Filter by visibility"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: Optional[int] = Query(1, ge=1, description="Page number"),
-    page_size: Optional[int] = Query(10, ge=1, le=100, description="Items per page")
+    page_size: Optional[int] = Query(10, ge=1, le=100, description="Items per page"),
+    view: str = Query("full", pattern="^(full|summary)$",
+                      description="'summary' returns only the fields used by list views")
 ) -> JobPositionListResponse:
     """List job positions for the company (admin view)"""
     try:
@@ -114,7 +125,8 @@ def list_positions(
             is_active=is_active,
             page=page,
             page_size=page_size,
-            current_user_id=company_user.id
+            current_user_id=company_user.id,
+            summary=view == "summary"
         )
         log.info(f"Found {result.total} positions for company {company.slug}")
         return result
@@ -714,10 +726,58 @@ def create_inline_screening_template(
 @inject
 def list_company_candidates(
     company: AdminCompanyContext,
+    include_custom_fields: bool = Query(False, description="Include custom field values of every candidate"),
     controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
-) -> List[CompanyCandidateResponse]:
+) -> Response:
     """List all candidates for this company"""
-    return controller.list_company_candidates_by_company(company.id)
+    return model_json_response(
+        controller.list_company_candidates_by_company(company.id, include_custom_fields=include_custom_fields),
+        List[CompanyCandidateResponse]
+    )
+
+
+@router.get("/candidates/export")
+@inject
+def export_company_candidates(
+    company: AdminCompanyContext,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv or xlsx"),
+    controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
+) -> StreamingResponse:
+    """Download all candidates of this company (with custom field values) as CSV or XLSX.
+
+    The file is streamed from a server-side cursor while it is generated, so memory does
+    not grow with the number of candidates. Use POST /candidates/export-jobs for exports
+    that should be generated in the background and downloaded later.
+    """
+    chunks = controller.export_company_candidates(company.id, export_format, batch_size=settings.EXPORT_BATCH_SIZE)
+    filename = f"candidates_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{export_format.extension}"
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.content_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post(
+    "/candidates/export-jobs",
+    response_model=CompanyCandidatesExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+@inject
+def start_company_candidates_export(
+    company: AdminCompanyContext,
+    company_user: CurrentCompanyUser,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv or xlsx"),
+    controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
+) -> CompanyCandidatesExportJobResponse:
+    """Generate the candidates export in a background job.
+
+    Poll the returned status URL; once completed, the job results contain the download link.
+    """
+    try:
+        return controller.start_company_candidates_export(company.id, export_format, company_user.user_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/candidates/{company_candidate_id}", response_model=CompanyCandidateResponse)
@@ -892,6 +952,24 @@ def assign_workflow_to_candidate(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/candidates/bulk/change-stage", response_model=BulkChangeStageResponse)
+@inject
+def bulk_change_candidate_stage(
+    request: BulkChangeStageRequest,
+    company: AdminCompanyContext,
+    controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
+) -> BulkChangeStageResponse:
+    """Move many company candidates to the same workflow stage, returning a result per candidate.
+
+    Candidates that do not belong to the company are reported as failed items. The moves
+    are not part of the stage dwell times, which only count candidate application stage moves.
+    """
+    try:
+        return controller.bulk_change_stage(company.id, request)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.post("/candidates/{company_candidate_id}/change-stage", response_model=CompanyCandidateResponse)
 @inject
 def change_candidate_stage(
@@ -900,7 +978,10 @@ def change_candidate_stage(
     company: AdminCompanyContext,
     controller: CompanyCandidateController = Depends(Provide[Container.company_candidate_controller])
 ) -> CompanyCandidateResponse:
-    """Change the workflow stage of a company candidate"""
+    """Change the workflow stage of a company candidate
+
+    The move is not part of the stage dwell times, which only count candidate application stage moves.
+    """
     try:
         # Verify the candidate belongs to this company
         existing = controller.get_company_candidate_by_id(company_candidate_id)
@@ -1057,6 +1138,41 @@ def assign_candidate_to_position(
         )
 
 
+class CanProcessApplicationsRequest(BaseModel):
+    """Request to check processing permissions for several applications"""
+    application_ids: List[str] = Field(..., min_length=1, max_length=500)
+
+
+@router.post("/applications/can-process", status_code=status.HTTP_200_OK)
+@inject
+def check_user_can_process_applications(
+    request: CanProcessApplicationsRequest,
+    company: AdminCompanyContext,
+    company_user: CurrentCompanyUser,
+    controller: ApplicationController = Depends(Provide[Container.application_controller])
+) -> dict:
+    """
+    Check which of the given applications the current user can process at their current stage.
+    Answers a whole list (e.g. a kanban board) with one permission check instead of one request each.
+    """
+    try:
+        decisions = controller.can_user_process_applications(
+            user_id=company_user.user_id,
+            application_ids=request.application_ids,
+            company_id=company.id
+        )
+
+        return {
+            "can_process": decisions,
+            "user_id": company_user.user_id
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to check permissions: {str(e)}"
+        )
+
+
 @router.get("/applications/{application_id}/can-process", status_code=status.HTTP_200_OK)
 @inject
 def check_user_can_process_application(
@@ -1102,9 +1218,9 @@ def list_interviews(
     to_date: Optional[datetime] = Query(None, description="Filter to date"),
     limit: int = Query(50, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination")
-) -> InterviewListResource:
+) -> Response:
     """List interviews for this company"""
-    return controller.list_interviews(
+    return model_json_response(controller.list_interviews(
         company_id=company.id,
         candidate_id=candidate_id,
         job_position_id=job_position_id,
@@ -1113,7 +1229,7 @@ def list_interviews(
         to_date=to_date,
         limit=limit,
         offset=offset
-    )
+    ))
 
 
 @router.get("/interviews/statistics", response_model=InterviewStatsResource)
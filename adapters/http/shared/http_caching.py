@@ -0,0 +1,110 @@
+"""
+HTTP caching for public, rarely-changing resources.
+
+Responses carry a strong ETag (hash of the rendered body) and a `Cache-Control` header so
+browsers and CDNs can reuse them; a request whose `If-None-Match` matches gets an empty 304.
+Rendered bodies are also kept in the per-worker `public_response_cache`, invalidated by the
+publishing commands, so hits skip the queries and the serialization. Pre-rendered resources
+are additionally read from (and stored into) the shared rendition store with precompressed
+gzip/brotli variants, served as they are to clients that accept them.
+"""
+import logging
+from typing import Callable, Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from core.config import settings
+from src.framework.application.public_response_cache import PublicResponseCache, public_response_cache
+from src.framework.domain.entities.rendered_response import RenderedResponse
+from src.framework.domain.infrastructure.public_rendition_repository_interface import \
+    PublicRenditionRepositoryInterface
+from src.framework.infrastructure.middleware.compression_middleware import negotiate_encoding
+
+log = logging.getLogger(__name__)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in [candidate.removeprefix("W/") for candidate in candidates]
+
+
+def cache_control(max_age: int, stale_while_revalidate: int = 0) -> str:
+    value = f"public, max-age={max_age}"
+    if stale_while_revalidate:
+        value += f", stale-while-revalidate={stale_while_revalidate}"
+    return value
+
+
+def _load_prerendered(
+        store: PublicRenditionRepositoryInterface,
+        namespace: str,
+        key: str,
+        build: Callable[[], BaseModel],
+        scope: str = ""
+) -> RenderedResponse:
+    """Read a pre-rendered response from the store, rendering and storing it on a miss"""
+    generation = None
+    try:
+        rendered, generation = store.get(namespace, key, scope)
+        if rendered is not None:
+            return rendered
+    except Exception as e:
+        log.warning(f"Public rendition store unavailable, rendering {namespace}/{key}: {e}")
+
+    # Rendered on the request path: compress at the fast levels of dynamic responses
+    rendered = RenderedResponse.from_body(
+        build().model_dump_json(by_alias=True).encode("utf-8"),
+        precompress=True,
+        gzip_level=settings.RESPONSE_GZIP_LEVEL,
+        brotli_quality=settings.RESPONSE_BROTLI_QUALITY
+    )
+    if generation is not None:
+        try:
+            store.save(namespace, key, generation, rendered, scope)
+        except Exception as e:
+            log.warning(f"Could not store rendition {namespace}/{key}: {e}")
+    return rendered
+
+
+def cached_json_response(
+        request: Request,
+        build: Callable[[], BaseModel],
+        namespace: Optional[str] = None,
+        key: str = "",
+        scope: str = "",
+        max_age: int = settings.PUBLIC_HTTP_MAX_AGE_SECONDS,
+        stale_while_revalidate: int = settings.PUBLIC_HTTP_STALE_WHILE_REVALIDATE_SECONDS,
+        prerendered: bool = False,
+        cache: PublicResponseCache = public_response_cache
+) -> Response:
+    """
+    Render `build()` as JSON with ETag/Cache-Control headers, answering 304 when the client
+    already has it. With a namespace the rendered body is cached under (namespace, key),
+    and dropped when `scope` (the company or entity it is built from) is invalidated;
+    with `prerendered` it also goes through the shared rendition store. Exceptions raised by
+    `build` (e.g. 404) propagate and are not cached.
+    """
+    rendered = cache.get(namespace, key, scope) if namespace else None
+    if rendered is None:
+        version = cache.version(namespace, scope) if namespace else (0, 0)
+        if prerendered and namespace and cache.store is not None:
+            rendered = _load_prerendered(cache.store, namespace, key, build, scope)
+        else:
+            rendered = RenderedResponse.from_body(build().model_dump_json(by_alias=True).encode("utf-8"))
+        if namespace:
+            cache.put(namespace, key, rendered, version, scope)
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), rendered.encodings)
+    body, etag = rendered.variant(encoding)
+    headers = {"ETag": etag, "Cache-Control": cache_control(max_age, stale_while_revalidate)}
+    if rendered.encodings:
+        headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,34 @@
+"""Prometheus scrape endpoint
+
+Serves the CQRS handler, database pool and workflow definition cache metrics of this
+worker process in the Prometheus text exposition format. When METRICS_TOKEN is set,
+scrapers must send it as a bearer token.
+"""
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from src.framework.infrastructure.metrics import handler_metrics, pool_metrics
+from src.shared_bc.customization.workflow.infrastructure.cache import workflow_definition_cache
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(authorization: Optional[str] = Header(None)) -> PlainTextResponse:
+    """Handler latency, errors and nested dispatches; pool checkout wait and size; cache hit rates"""
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not authorization or not hmac.compare_digest(authorization, expected):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    body = (
+        handler_metrics.render_prometheus()
+        + pool_metrics.render_prometheus()
+        + workflow_definition_cache.render_prometheus()
+    )
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
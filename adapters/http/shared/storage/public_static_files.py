@@ -0,0 +1,34 @@
+"""Static serving of the public part of local storage
+
+Only company logos are public. Every other file under the uploads directory
+(resumes, attachments, exports, blobs) is served through the signed URLs of
+signed_storage_router.
+"""
+import os
+import re
+from typing import Pattern, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Relative paths, as laid out by StorageServiceInterface.generate_file_path
+PUBLIC_PATH_PATTERNS: Tuple[Pattern[str], ...] = (
+    re.compile(r"company/[^/]+/logo/[^/]+"),
+)
+
+
+def is_public_path(path: str) -> bool:
+    """Whether a normalized relative path may be served without a signed URL"""
+    posix_path = path.replace(os.sep, "/")
+    return any(pattern.fullmatch(posix_path) for pattern in PUBLIC_PATH_PATTERNS)
+
+
+class PublicStaticFiles(StaticFiles):
+    """StaticFiles restricted to PUBLIC_PATH_PATTERNS; anything else is a 404"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not is_public_path(path):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
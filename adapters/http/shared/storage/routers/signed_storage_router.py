@@ -0,0 +1,69 @@
+"""Signed URL endpoint for local storage
+
+S3 serves presigned URLs itself; with local storage, the URLs created by
+LocalStorageService.create_upload_url / get_download_url point here.
+"""
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse
+
+from core.containers import Container
+from src.framework.domain.infrastructure.storage_service_interface import FileTooLargeError
+from src.framework.infrastructure.storage.local_storage_service import LocalStorageService
+from src.framework.infrastructure.storage.url_signer import InvalidSignatureError
+
+router = APIRouter(prefix="/api/storage", tags=["storage"])
+
+
+def get_local_storage() -> LocalStorageService:
+    """Local storage service; signed URLs do not exist for other backends"""
+    storage = Container().storage_service()
+    if not isinstance(storage, LocalStorageService) or storage.signer is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return storage
+
+
+def _verify(storage: LocalStorageService, token: str, operation: str) -> Dict[str, Any]:
+    assert storage.signer is not None
+    try:
+        payload = storage.signer.verify(token)
+    except InvalidSignatureError as e:
+        raise HTTPException(status_code=403, detail=f"Invalid URL: {str(e)}")
+    if payload.get("op") != operation:
+        raise HTTPException(status_code=403, detail="Invalid URL: wrong operation")
+    return payload
+
+
+@router.get("/files")
+async def download_signed_file(
+        token: str = Query(...),
+        storage: LocalStorageService = Depends(get_local_storage)
+) -> FileResponse:
+    """Serve a file for a signed download URL (supports Range requests)"""
+    payload = _verify(storage, token, "get")
+    path = storage.get_absolute_path(payload["path"])
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # FileResponse streams from disk and uses sendfile when the server supports it
+    return FileResponse(path, filename=payload.get("name"), content_disposition_type="attachment")
+
+
+@router.put("/files", status_code=204)
+async def upload_signed_file(
+        request: Request,
+        token: str = Query(...),
+        storage: LocalStorageService = Depends(get_local_storage)
+) -> Response:
+    """Receive a file for a signed upload URL; size and SHA-256 must match the signed values"""
+    payload = _verify(storage, token, "put")
+    try:
+        size, content_hash = await storage.write_stream(payload["path"], request.stream(), payload["size"])
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if size != payload["size"] or content_hash != payload["sha256"]:
+        storage.delete_file(payload["path"])
+        raise HTTPException(status_code=400, detail="Content does not match the declared size and hash")
+    return Response(status_code=204)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from src.framework.domain.infrastructure.blob_store_interface import DirectUpload
+
+
+class DirectUploadRequest(BaseModel):
+    """Request to upload a file straight to storage"""
+    filename: str
+    content_type: str = "application/octet-stream"
+    file_size: int = Field(..., gt=0)
+    sha256: str = Field(..., min_length=64, max_length=64, description="SHA-256 hex digest of the file")
+
+
+class DirectUploadResponse(BaseModel):
+    """Presigned request the client sends the file with, and the token to complete the upload"""
+    upload_token: str
+    upload_url: str
+    method: str
+    headers: Dict[str, str]
+    expires_at: datetime
+
+    @classmethod
+    def from_direct_upload(cls, direct_upload: DirectUpload) -> "DirectUploadResponse":
+        return cls(
+            upload_token=direct_upload.upload_token,
+            upload_url=direct_upload.upload.url,
+            method=direct_upload.upload.method,
+            headers=direct_upload.upload.headers,
+            expires_at=direct_upload.upload.expires_at
+        )
+
+
+class CompleteDirectUploadRequest(BaseModel):
+    """Sent once the file has been uploaded with the presigned request"""
+    upload_token: str
+    filename: str
+    description: str | None = None
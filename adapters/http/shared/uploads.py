@@ -0,0 +1,47 @@
+"""
+Helpers to consume multipart uploads in bounded memory.
+
+Starlette spools `UploadFile` bodies to a temporary file; these helpers read it back in
+fixed-size chunks so that size limits are enforced before the whole file is in memory.
+"""
+from typing import AsyncIterator
+
+from fastapi import HTTPException, UploadFile, status
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def ensure_upload_size(file: UploadFile, max_size_bytes: int) -> None:
+    """Reject the upload early when its declared size already exceeds the limit"""
+    if file.size is not None and file.size > max_size_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size exceeds maximum allowed size of {max_size_bytes // (1024 * 1024)}MB"
+        )
+
+
+async def iter_upload_chunks(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the content of an uploaded file in chunks"""
+    await file.seek(0)
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def read_upload_capped(file: UploadFile, max_size_bytes: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> bytes:
+    """
+    Read an uploaded file that has to be processed in memory (e.g. PDF text extraction),
+    stopping as soon as it grows past `max_size_bytes`.
+    """
+    ensure_upload_size(file, max_size_bytes)
+    content = bytearray()
+    async for chunk in iter_upload_chunks(file, chunk_size):
+        content += chunk
+        if len(content) > max_size_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File size exceeds maximum allowed size of {max_size_bytes // (1024 * 1024)}MB"
+            )
+    return bytes(content)
@@ -37,6 +37,7 @@ class WorkflowAnalyticsMapper:
             median_time_hours=dto.median_time_hours,
             min_time_hours=dto.min_time_hours,
             max_time_hours=dto.max_time_hours,
+            p90_time_hours=dto.p90_time_hours,
             conversion_rate_to_next=dto.conversion_rate_to_next,
             dropout_rate=dto.dropout_rate
         )
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Annotated, List, Optional
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from adapters.http.shared.workflow_analytics.controllers.workflow_analytics_controller import \
     WorkflowAnalyticsController
@@ -15,6 +15,7 @@ from adapters.http.shared.workflow_analytics.schemas import (
     WorkflowAnalyticsResponse,
     StageBottleneckResponse
 )
+from adapters.http.shared.responses import model_json_response
 from core.containers import Container
 
 router = APIRouter(
@@ -34,7 +35,7 @@ def get_workflow_analytics(
         date_range_start: Optional[datetime] = Query(None, description="Start date for filtering applications"),
         date_range_end: Optional[datetime] = Query(None, description="End date for filtering applications"),
 
-) -> WorkflowAnalyticsResponse:
+) -> Response:
     """
     Get comprehensive analytics for a workflow.
 
@@ -47,11 +48,11 @@ def get_workflow_analytics(
 
     Optional date range filters to analyze specific time periods.
     """
-    return controller.get_workflow_analytics(
+    return model_json_response(controller.get_workflow_analytics(
         workflow_id=workflow_id,
         date_range_start=date_range_start,
         date_range_end=date_range_end
-    )
+    ))
 
 
 @router.get("/{workflow_id}/bottlenecks", response_model=List[StageBottleneckResponse])
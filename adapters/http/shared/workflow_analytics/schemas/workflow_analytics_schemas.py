@@ -22,6 +22,7 @@ class StageAnalyticsResponse(BaseModel):
     median_time_hours: Optional[float] = None
     min_time_hours: Optional[float] = None
     max_time_hours: Optional[float] = None
+    p90_time_hours: Optional[float] = None
     conversion_rate_to_next: Optional[float] = Field(None, description="Percentage (0-100)")
     dropout_rate: Optional[float] = Field(None, description="Percentage (0-100)")
 
@@ -0,0 +1,98 @@
+"""add stage dwell times
+
+Revision ID: a3e9c5f1d7b2
+Revises: f8c4d2a6b9e3
+Create Date: 2026-10-19 20:00:00.000000
+
+Daily dwell time histograms per workflow stage, aggregated incrementally from
+the candidate_application_stages history behind a watermark. The history table
+is created here when the environment does not have it yet.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e9c5f1d7b2'
+down_revision: Union[str, Sequence[str], None] = 'f8c4d2a6b9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if 'candidate_application_stages' not in inspector.get_table_names():
+        op.create_table(
+            'candidate_application_stages',
+            sa.Column('id', sa.String(26), primary_key=True),
+            sa.Column('candidate_application_id', sa.String(26),
+                      sa.ForeignKey('candidate_applications.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('phase_id', sa.String(26),
+                      sa.ForeignKey('company_phases.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('workflow_id', sa.String(26),
+                      sa.ForeignKey('workflows.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('stage_id', sa.String(26),
+                      sa.ForeignKey('workflow_stages.id', ondelete='SET NULL'), nullable=True),
+            sa.Column('started_at', sa.DateTime, nullable=False),
+            sa.Column('completed_at', sa.DateTime, nullable=True),
+            sa.Column('deadline', sa.DateTime, nullable=True),
+            sa.Column('estimated_cost', sa.Numeric(10, 2), nullable=True),
+            sa.Column('actual_cost', sa.Numeric(10, 2), nullable=True),
+            sa.Column('comments', sa.Text, nullable=True),
+            sa.Column('data', sa.JSON, nullable=True),
+            sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+            sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+        )
+        for column in ('id', 'candidate_application_id', 'phase_id', 'workflow_id', 'stage_id'):
+            op.create_index(
+                f'ix_candidate_application_stages_{column}', 'candidate_application_stages', [column]
+            )
+
+    op.create_index(
+        'ix_candidate_application_stages_stage_completed',
+        'candidate_application_stages',
+        ['stage_id', 'completed_at']
+    )
+    op.create_index(
+        'ix_candidate_application_stages_completed_id',
+        'candidate_application_stages',
+        ['completed_at', 'id']
+    )
+
+    op.create_table(
+        'stage_dwell_times_daily',
+        sa.Column('stage_id', sa.String(26), primary_key=True),
+        sa.Column('day', sa.Date, primary_key=True),
+        sa.Column('workflow_id', sa.String(26), nullable=True),
+        sa.Column('visit_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('total_hours', sa.Float, nullable=False, server_default='0'),
+        sa.Column('min_hours', sa.Float, nullable=True),
+        sa.Column('max_hours', sa.Float, nullable=True),
+        sa.Column('buckets', sa.JSON, nullable=False),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_stage_dwell_times_daily_workflow_id', 'stage_dwell_times_daily', ['workflow_id'])
+
+    watermarks = op.create_table(
+        'stage_dwell_time_watermarks',
+        sa.Column('name', sa.String(64), primary_key=True),
+        sa.Column('completed_at', sa.DateTime, nullable=True),
+        sa.Column('stage_record_id', sa.String(26), nullable=True),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+    )
+    op.bulk_insert(watermarks, [{'name': 'candidate_application_stages'}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stage_dwell_time_watermarks')
+    op.drop_index('ix_stage_dwell_times_daily_workflow_id', table_name='stage_dwell_times_daily')
+    op.drop_table('stage_dwell_times_daily')
+    op.drop_index('ix_candidate_application_stages_completed_id', table_name='candidate_application_stages')
+    op.drop_index('ix_candidate_application_stages_stage_completed', table_name='candidate_application_stages')
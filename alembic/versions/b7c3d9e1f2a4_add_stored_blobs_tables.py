@@ -0,0 +1,66 @@
+"""add stored_blobs and blob_references tables
+
+Revision ID: b7c3d9e1f2a4
+Revises: 5777g76c441b
+Create Date: 2026-10-19 10:00:00.000000
+
+Existing files are moved into the blob store by scripts/dedupe_storage_blobs.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c3d9e1f2a4'
+down_revision: Union[str, Sequence[str], None] = '5777g76c441b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'stored_blobs',
+        sa.Column('content_hash', sa.String(64), primary_key=True),
+        sa.Column('storage_path', sa.String, nullable=True),
+        sa.Column('size', sa.BigInteger, nullable=False, server_default='0'),
+        sa.Column('content_type', sa.String(255), nullable=True),
+        sa.Column('ref_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('text_content', sa.Text, nullable=True),
+        sa.Column('blob_metadata', sa.JSON, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('ix_stored_blobs_ref_count', 'stored_blobs', ['ref_count'])
+
+    op.create_table(
+        'blob_references',
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('content_hash', sa.String(64), sa.ForeignKey('stored_blobs.content_hash'), nullable=False),
+        sa.Column('owner_type', sa.String(50), nullable=False),
+        sa.Column('owner_id', sa.String, nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint('owner_type', 'owner_id', name='uq_blob_references_owner'),
+    )
+    op.create_index('ix_blob_references_content_hash', 'blob_references', ['content_hash'])
+
+    op.add_column('file_attachments', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.create_index('ix_file_attachments_content_hash', 'file_attachments', ['content_hash'])
+    op.add_column('user_assets', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.create_index('ix_user_assets_content_hash', 'user_assets', ['content_hash'])
+    op.add_column('user_registrations', sa.Column('content_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_registrations', 'content_hash')
+    op.drop_index('ix_user_assets_content_hash', 'user_assets')
+    op.drop_column('user_assets', 'content_hash')
+    op.drop_index('ix_file_attachments_content_hash', 'file_attachments')
+    op.drop_column('file_attachments', 'content_hash')
+    op.drop_index('ix_blob_references_content_hash', 'blob_references')
+    op.drop_table('blob_references')
+    op.drop_index('ix_stored_blobs_ref_count', 'stored_blobs')
+    op.drop_table('stored_blobs')
@@ -0,0 +1,49 @@
+"""scope public renditions
+
+Revision ID: b7d2e4f6a8c1
+Revises: a3e9c5f1d7b2
+Create Date: 2026-10-19 21:00:00.000000
+
+Renditions and generations are kept per scope (the company or entity a
+rendition is built from), so a publish only invalidates its own tenant. The
+tables only hold a cache, so existing rows are dropped instead of migrated.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, Sequence[str], None] = 'a3e9c5f1d7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('DELETE FROM public_renditions')
+    op.execute('DELETE FROM public_rendition_namespaces')
+    op.add_column(
+        'public_renditions',
+        sa.Column('scope', sa.String(255), nullable=False, server_default='')
+    )
+    op.create_index('ix_public_renditions_namespace_scope', 'public_renditions', ['namespace', 'scope'])
+    op.add_column(
+        'public_rendition_namespaces',
+        sa.Column('scope', sa.String(255), nullable=False, server_default='')
+    )
+    op.drop_constraint('public_rendition_namespaces_pkey', 'public_rendition_namespaces', type_='primary')
+    op.create_primary_key('public_rendition_namespaces_pkey', 'public_rendition_namespaces', ['namespace', 'scope'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM public_renditions')
+    op.execute('DELETE FROM public_rendition_namespaces')
+    op.drop_constraint('public_rendition_namespaces_pkey', 'public_rendition_namespaces', type_='primary')
+    op.create_primary_key('public_rendition_namespaces_pkey', 'public_rendition_namespaces', ['namespace'])
+    op.drop_column('public_rendition_namespaces', 'scope')
+    op.drop_index('ix_public_renditions_namespace_scope', table_name='public_renditions')
+    op.drop_column('public_renditions', 'scope')
@@ -0,0 +1,55 @@
+"""add profile_snapshots table
+
+Revision ID: c4e8a2f6b1d3
+Revises: b7c3d9e1f2a4
+Create Date: 2026-10-19 12:00:00.000000
+
+Existing applications keep their inline profile_snapshot_markdown/json columns;
+new applications reference a shared snapshot through profile_snapshot_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2f6b1d3'
+down_revision: Union[str, Sequence[str], None] = 'b7c3d9e1f2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'profile_snapshots',
+        sa.Column('id', sa.String(64), primary_key=True),
+        sa.Column('candidate_id', sa.String, sa.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('language', sa.String(10), nullable=False),
+        sa.Column('profile_markdown', sa.Text, nullable=False),
+        sa.Column('profile_json', sa.JSON, nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('ix_profile_snapshots_candidate_id', 'profile_snapshots', ['candidate_id'])
+
+    op.add_column(
+        'candidate_applications',
+        sa.Column(
+            'profile_snapshot_id',
+            sa.String(64),
+            sa.ForeignKey('profile_snapshots.id', ondelete='SET NULL'),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_candidate_applications_profile_snapshot_id', 'candidate_applications', ['profile_snapshot_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidate_applications_profile_snapshot_id', 'candidate_applications')
+    op.drop_column('candidate_applications', 'profile_snapshot_id')
+    op.drop_index('ix_profile_snapshots_candidate_id', 'profile_snapshots')
+    op.drop_table('profile_snapshots')
@@ -0,0 +1,30 @@
+"""add job_positions (company_id, status) index
+
+Revision ID: d2f7a9c3e5b1
+Revises: c4e8a2f6b1d3
+Create Date: 2026-10-19 14:00:00.000000
+
+job_positions.status is now kept in sync with the stage on every move. Run
+scripts/backfill_job_position_status.py once afterwards to derive the status
+of existing positions from their current stage.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7a9c3e5b1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2f6b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_job_positions_company_id_status', 'job_positions', ['company_id', 'status'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_positions_company_id_status', 'job_positions')
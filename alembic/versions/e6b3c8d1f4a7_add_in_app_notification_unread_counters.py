@@ -0,0 +1,45 @@
+"""add in_app_notification_unread_counters
+
+Revision ID: e6b3c8d1f4a7
+Revises: d2f7a9c3e5b1
+Create Date: 2026-10-19 16:00:00.000000
+
+Unread counts are read from this table instead of counting notifications on
+every request. Counters are backfilled from the existing notifications.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b3c8d1f4a7'
+down_revision: Union[str, Sequence[str], None] = 'd2f7a9c3e5b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'in_app_notification_unread_counters',
+        sa.Column('user_id', sa.String(26), primary_key=True),
+        sa.Column('company_id', sa.String(26), primary_key=True),
+        sa.Column('unread_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+    )
+    op.execute(
+        """
+        INSERT INTO in_app_notification_unread_counters (user_id, company_id, unread_count, updated_at)
+        SELECT user_id, company_id, count(*), now()
+        FROM in_app_notifications
+        WHERE is_read = false
+        GROUP BY user_id, company_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('in_app_notification_unread_counters')
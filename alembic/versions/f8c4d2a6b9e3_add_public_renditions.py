@@ -0,0 +1,47 @@
+"""add public_renditions
+
+Revision ID: f8c4d2a6b9e3
+Revises: e6b3c8d1f4a7
+Create Date: 2026-10-19 18:00:00.000000
+
+Pre-rendered public responses (company pages, position details) with their
+gzip/brotli variants, and the generation of each namespace that invalidates them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c4d2a6b9e3'
+down_revision: Union[str, Sequence[str], None] = 'e6b3c8d1f4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'public_renditions',
+        sa.Column('namespace', sa.String(64), primary_key=True),
+        sa.Column('key', sa.String(512), primary_key=True),
+        sa.Column('generation', sa.Integer, nullable=False),
+        sa.Column('etag', sa.String(64), nullable=False),
+        sa.Column('body', sa.LargeBinary, nullable=False),
+        sa.Column('gzip_body', sa.LargeBinary, nullable=True),
+        sa.Column('br_body', sa.LargeBinary, nullable=True),
+        sa.Column('rendered_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_table(
+        'public_rendition_namespaces',
+        sa.Column('namespace', sa.String(64), primary_key=True),
+        sa.Column('generation', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('invalidated_at', sa.DateTime, nullable=False, server_default=sa.text('now()')),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('public_rendition_namespaces')
+    op.drop_table('public_renditions')
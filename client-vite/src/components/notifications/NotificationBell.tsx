@@ -9,7 +9,16 @@ import {
   PopoverContent,
   PopoverTrigger,
 } from '@/components/ui/popover';
-import { notificationService, type InAppNotification } from '../../services/notificationService';
+import {
+  notificationService,
+  type InAppNotification,
+  type NotificationStreamEvent,
+} from '../../services/notificationService';
+
+// Polling is only the fallback while the notification stream is unavailable
+const POLLING_INTERVAL_MS = 30000;
+const STREAM_RETRY_DELAY_MS = 5000;
+const MAX_STREAM_RETRIES = 5;
 
 const priorityColors: Record<string, string> = {
   LOW: 'bg-gray-100 text-gray-600',
@@ -42,7 +51,7 @@ export const NotificationBell: React.FC = () => {
   const [unreadCount, setUnreadCount] = useState(0);
   const [loading, setLoading] = useState(false);
   const [totalCount, setTotalCount] = useState(0);
-  const pollingRef = useRef<NodeJS.Timeout | null>(null);
+  const isOpenRef = useRef(isOpen);
 
   const fetchUnreadCount = useCallback(async () => {
     try {
@@ -67,20 +76,83 @@ export const NotificationBell: React.FC = () => {
     }
   }, []);
 
-  // Poll for unread count every 30 seconds
+  // Live unread count from the notification stream; poll while it is down
   useEffect(() => {
-    fetchUnreadCount();
-    pollingRef.current = setInterval(fetchUnreadCount, 30000);
+    let cancelled = false;
+    let source: EventSource | null = null;
+    let pollingTimer: ReturnType<typeof setInterval> | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | null = null;
+    let retries = 0;
+
+    const startPolling = () => {
+      if (pollingTimer) return;
+      fetchUnreadCount();
+      pollingTimer = setInterval(fetchUnreadCount, POLLING_INTERVAL_MS);
+    };
+
+    const stopPolling = () => {
+      if (pollingTimer) {
+        clearInterval(pollingTimer);
+        pollingTimer = null;
+      }
+    };
+
+    const handleStreamFailure = () => {
+      if (cancelled) return;
+      startPolling();
+      if (retries < MAX_STREAM_RETRIES) {
+        retries += 1;
+        retryTimer = setTimeout(connect, STREAM_RETRY_DELAY_MS * retries);
+      }
+    };
+
+    const connect = async () => {
+      try {
+        source = await notificationService.openStream();
+      } catch (error) {
+        console.error('Error opening notification stream:', error);
+        handleStreamFailure();
+        return;
+      }
+      if (cancelled) {
+        source.close();
+        return;
+      }
+
+      source.onopen = () => {
+        retries = 0;
+        stopPolling();
+      };
+      source.onmessage = (event: MessageEvent<string>) => {
+        const data: NotificationStreamEvent = JSON.parse(event.data);
+        setUnreadCount(data.unread_count);
+        if (data.type === 'notification' && isOpenRef.current) {
+          fetchNotifications();
+        }
+      };
+      source.onerror = () => {
+        // The stream token is only good to open the connection: reconnect with a new one
+        source?.close();
+        source = null;
+        handleStreamFailure();
+      };
+    };
+
+    connect();
 
     return () => {
-      if (pollingRef.current) {
-        clearInterval(pollingRef.current);
+      cancelled = true;
+      source?.close();
+      stopPolling();
+      if (retryTimer) {
+        clearTimeout(retryTimer);
       }
     };
-  }, [fetchUnreadCount]);
+  }, [fetchUnreadCount, fetchNotifications]);
 
   // Fetch notifications when popover opens
   useEffect(() => {
+    isOpenRef.current = isOpen;
     if (isOpen) {
       fetchNotifications();
     }
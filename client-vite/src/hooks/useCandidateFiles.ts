@@ -70,15 +70,14 @@ export function useCandidateFiles({ candidateId }: UseCandidateFilesOptions) {
     if (!candidateId) return;
 
     try {
-      const blob = await fileUploadService.downloadFile(candidateId, file.id);
-      const url = URL.createObjectURL(blob);
+      // The URL sets Content-Disposition with the original name, so navigating downloads the file
+      const url = await fileUploadService.getDownloadUrl(candidateId, file.id);
       const a = document.createElement('a');
       a.href = url;
       a.download = file.original_name;
       document.body.appendChild(a);
       a.click();
       document.body.removeChild(a);
-      URL.revokeObjectURL(url);
     } catch (err) {
       const errorMessage = err instanceof Error ? err.message : 'Failed to download file';
       setError(errorMessage);
@@ -801,7 +801,7 @@ function PositionsListPageContent() {
       // Use the provided workflow override, or fall back to currentWorkflow
       const workflowToUse = workflowOverride || currentWorkflow;
       
-      const response = await PositionService.getPositions({ company_id: companyId });
+      const response = await PositionService.getPositions({ company_id: companyId, view: 'summary' });
       
       console.log('[PositionsList] API response:', response);
       console.log('[PositionsList] Positions count:', response.positions?.length || 0);
@@ -83,20 +83,15 @@ export const fileUploadService = {
   },
 
   /**
-   * Download a file
+   * Get a short-lived URL to download a file from.
+   * The URL points straight at storage, so the browser navigates to it
+   * instead of fetching it with the auth headers.
    */
-  async downloadFile(candidateId: string, fileId: string): Promise<Blob> {
-    const response = await fetch(
-      `${import.meta.env.VITE_API_URL || 'http://localhost:8000'}/api/candidates/${candidateId}/files/${fileId}/download`,
-      {
-        headers: getAuthHeaders(),
-      }
+  async getDownloadUrl(candidateId: string, fileId: string): Promise<string> {
+    const { download_url } = await ApiClient.get<{ download_url: string }>(
+      `/api/candidates/${candidateId}/files/${fileId}/download-url`,
+      { headers: getAuthHeaders() }
     );
-
-    if (!response.ok) {
-      throw new Error('Failed to download file');
-    }
-
-    return response.blob();
+    return download_url;
   },
 };
@@ -1,3 +1,4 @@
+import { API_BASE_URL } from '../config/api';
 import { ApiClient } from '@/lib/api';
 
 export interface InAppNotification {
@@ -25,6 +26,19 @@ export interface UnreadCountResponse {
   unread_count: number;
 }
 
+export interface StreamTokenResponse {
+  token: string;
+  expires_in: number;
+}
+
+export type NotificationStreamEvent =
+  | { type: 'unread_count'; unread_count: number }
+  | {
+      type: 'notification';
+      unread_count: number;
+      notification: Pick<InAppNotification, 'id' | 'notification_type' | 'title' | 'message' | 'priority' | 'is_read' | 'created_at' | 'link' | 'metadata'>;
+    };
+
 /**
  * Get the company slug from localStorage
  */
@@ -71,6 +85,27 @@ export const notificationService = {
     );
   },
 
+  /**
+   * Get a short-lived token to open the notification stream
+   */
+  async getStreamToken(): Promise<StreamTokenResponse> {
+    return ApiClient.authenticatedRequest<StreamTokenResponse>(
+      `${getBasePath()}/stream-token`,
+      { method: 'POST' }
+    );
+  },
+
+  /**
+   * Open the Server-Sent Events stream of new notifications and unread count changes.
+   * EventSource cannot send the Authorization header, so the token goes in the query string;
+   * it is only valid to open the connection: reconnect with a new one.
+   */
+  async openStream(): Promise<EventSource> {
+    const { token } = await notificationService.getStreamToken();
+    const params = new URLSearchParams({ token });
+    return new EventSource(`${API_BASE_URL}${getBasePath()}/stream?${params}`);
+  },
+
   /**
    * Mark a notification as read
    */
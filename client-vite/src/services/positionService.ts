@@ -50,6 +50,7 @@ export class PositionService {
     if (filters?.is_active !== undefined) queryParams.append('is_active', filters.is_active.toString());
     if (filters?.page) queryParams.append('page', filters.page.toString());
     if (filters?.page_size) queryParams.append('page_size', filters.page_size.toString());
+    if (filters?.view) queryParams.append('view', filters.view);
 
     const basePath = this.getBasePath();
     const endpoint = `${basePath}${queryParams.toString() ? `?${queryParams}` : ''}`;
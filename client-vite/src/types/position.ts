@@ -540,6 +540,8 @@ export interface PositionFilters {
   is_active?: boolean;
   page?: number;
   page_size?: number;
+  // 'summary' only returns the fields used by list views
+  view?: 'full' | 'summary';
 
   // Publishing flow filters
   status?: JobPositionStatus;
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -74,6 +76,104 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE_MB: int = 10
     ALLOWED_FILE_EXTENSIONS: str = ".pdf,.doc,.docx,.txt,.jpg,.jpeg,.png,.webp,.svg"
 
+    # Content-addressed blobs: unreferenced blobs younger than this are kept for in-flight uploads
+    BLOB_GC_GRACE_SECONDS: int = 60 * 60
+
+    # Direct-to-storage transfers (presigned upload requests and download URLs)
+    DIRECT_UPLOAD_URL_EXPIRATION_SECONDS: int = 15 * 60
+    DOWNLOAD_URL_EXPIRATION_SECONDS: int = 5 * 60
+
+    # Data exports (streamed from a server-side cursor, large ones run as background jobs)
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_MAX_FILE_SIZE_MB: int = 2048
+    EXPORT_DOWNLOAD_URL_EXPIRATION_SECONDS: int = 24 * 60 * 60
+
+    # Password hashing (bcrypt runs in a process pool; busy pools answer 503)
+    BCRYPT_ROUNDS: int = 12  # Hashes with a different cost are rehashed on the next login
+    PASSWORD_HASH_WORKERS: int = 2  # 0 hashes inline in the request worker
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 2.0
+
+    # Command/query handler registry: fail at startup when a command or query has no handler
+    STRICT_HANDLER_REGISTRY: bool = False
+
+    # CQRS handler metrics (Prometheus format at /metrics)
+    CQRS_METRICS_ENABLED: bool = True
+    CQRS_METRICS_SAMPLE_RATE: float = 1.0  # Fraction of dispatches timed; errors are always counted
+    METRICS_TOKEN: str = ""  # When set, /metrics requires "Authorization: Bearer <token>"
+
+    # Stage permission decisions cached per worker; 0 disables. Writes handled by
+    # other workers are seen once the entry expires.
+    PERMISSION_CACHE_TTL_SECONDS: float = 30.0
+    PERMISSION_CACHE_MAX_ENTRIES: int = 10000
+
+    # Custom field definitions (entity customizations) cached per worker; 0 disables.
+    # The customization commands invalidate them, other workers see changes once the entry expires.
+    CUSTOM_FIELD_DEFINITIONS_CACHE_TTL_SECONDS: float = 300.0
+    CUSTOM_FIELD_DEFINITIONS_CACHE_MAX_ENTRIES: int = 1000
+
+    # Workflow graphs (workflow + ordered stages) cached per worker; 0 disables. Writes made here
+    # invalidate at once; writes by other processes are detected by re-reading the workflow's
+    # updated_at at most every VERSION_CHECK_SECONDS.
+    WORKFLOW_DEFINITION_CACHE_TTL_SECONDS: float = 600.0
+    WORKFLOW_DEFINITION_CACHE_VERSION_CHECK_SECONDS: float = 5.0
+    WORKFLOW_DEFINITION_CACHE_MAX_ENTRIES: int = 1000
+
+    # Stage dwell times: completed stage visits are added to daily histograms by
+    # AggregateStageDwellTimesCommand (POST /admin/maintenance/aggregate-stage-dwell-times, run
+    # from cron). Visits completed in the last SETTLE_SECONDS are left for the next run, so
+    # transactions still committing are never skipped.
+    STAGE_DWELL_TIME_SETTLE_SECONDS: float = 300.0
+    STAGE_DWELL_TIME_BATCH_SIZE: int = 5000
+
+    # Public endpoints (careers pages, public positions, application questions): rendered bodies
+    # cached per worker and invalidated by the publishing commands; 0 disables. Browsers and CDNs
+    # revalidate with the ETag after max-age and may serve stale while doing so.
+    PUBLIC_RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    PUBLIC_RESPONSE_CACHE_MAX_ENTRIES: int = 2000
+    PUBLIC_HTTP_MAX_AGE_SECONDS: int = 60
+    PUBLIC_HTTP_STALE_WHILE_REVALIDATE_SECONDS: int = 300
+    # Public company pages and position details are also stored rendered (with gzip and brotli
+    # variants) in the database after each publish, shared by all workers
+    PUBLIC_PRERENDER_ENABLED: bool = True
+
+    # Response compression (brotli when accepted, gzip otherwise) for bodies of at least
+    # RESPONSE_COMPRESSION_MIN_BYTES; dynamic responses use fast levels
+    RESPONSE_COMPRESSION_ENABLED: bool = True
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024
+    RESPONSE_GZIP_LEVEL: int = 6
+    RESPONSE_BROTLI_QUALITY: int = 4
+
+    # In-app notification push (Server-Sent Events fed through Redis pub/sub); empty URL disables it
+    NOTIFICATION_PUSH_REDIS_URL: str = "redis://localhost:6379/0"
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    NOTIFICATION_STREAM_TOKEN_EXPIRATION_SECONDS: int = 60  # Only needed to open the stream
+
+    # Database connection pool per process role: "api", "worker" (Dramatiq) or "script".
+    # Empty detects "worker" under the dramatiq CLI (`dramatiq ...` or `python -m dramatiq ...`)
+    # and "api" otherwise; set DB_PROCESS_ROLE explicitly when starting workers some other way.
+    # Budget: (pool size + overflow) x processes of each role must stay below max_connections.
+    DB_PROCESS_ROLE: str = ""
+    # Sync endpoints and dependencies run in the anyio threadpool (40 threads), each holding one
+    # session: pool + overflow = 40 so no request thread waits for a connection, while only the
+    # 10 persistent connections stay open between bursts.
+    DB_POOL_SIZE_API: int = 10
+    DB_MAX_OVERFLOW_API: int = 30
+    # None = one connection per Dramatiq thread (--threads of the worker command, 8 by default)
+    DB_POOL_SIZE_WORKER: Optional[int] = None
+    DB_MAX_OVERFLOW_WORKER: int = 2
+    DB_POOL_SIZE_SCRIPT: int = 1
+    DB_MAX_OVERFLOW_SCRIPT: int = 1
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Keep below the server/PgBouncer idle timeout
+    DB_POOL_PRE_PING: bool = False  # Ping on every checkout; only for flaky networks
+    # Behind PgBouncer in transaction mode PgBouncer does the pooling: no client-side pool
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+
+    # SQL profiling (per-request query counts and N+1 detection, see /admin/perf)
+    SQL_PROFILING_ENABLED: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
     auth: AuthSettings = AuthSettings()
 
     @property
@@ -16,7 +16,7 @@ from src.auth_bc.user.application.commands.create_user_automatically_command imp
 from src.auth_bc.user.application.commands.request_password_reset_command import RequestPasswordResetCommandHandler
 from src.auth_bc.user.application import ResetPasswordWithTokenCommandHandler
 from src.auth_bc.user.application import UpdateUserPasswordCommandHandler
-from src.auth_bc.user.application import UpdateUserLanguageCommandHandler
+from src.auth_bc.user.application import CreatePdfResumeAssetCommandHandler, UpdateUserLanguageCommandHandler
 
 # User Registration Commands
 from src.auth_bc.user_registration.application.commands import (
@@ -153,6 +153,14 @@ class AuthContainer(containers.DeclarativeContainer):
     # PDF Processing Service
     pdf_processing_service = providers.Factory(PDFProcessingService)
 
+    create_pdf_resume_asset_command_handler = providers.Factory(
+        CreatePdfResumeAssetCommandHandler,
+        user_asset_repository=user_asset_repository,
+        storage_service=shared.storage_service,
+        pdf_processing_service=pdf_processing_service,
+        blob_store=shared.blob_store
+    )
+
     # User Registration Handlers
     initiate_registration_command_handler = providers.Factory(
         InitiateRegistrationCommandHandler,
@@ -165,7 +173,8 @@ class AuthContainer(containers.DeclarativeContainer):
         ProcessRegistrationPdfCommandHandler,
         user_registration_repository=user_registration_repository,
         pdf_processing_service=pdf_processing_service,
-        ai_service=shared.ai_service
+        ai_service=shared.ai_service,
+        blob_store=shared.blob_store
     )
 
     send_verification_email_command_handler = providers.Factory(
@@ -14,6 +14,8 @@ from src.candidate_bc.candidate.infrastructure.repositories.candidate_education_
 from src.candidate_bc.candidate.infrastructure.repositories.candidate_project_repository import SQLAlchemyCandidateProjectRepository
 from src.candidate_bc.candidate.infrastructure.repositories.file_attachment_repository import SQLAlchemyFileAttachmentRepository
 from src.company_bc.candidate_application.infrastructure.repositories.candidate_application_repository import SQLAlchemyCandidateApplicationRepository
+from src.company_bc.candidate_application.infrastructure.repositories.profile_snapshot_repository import SQLAlchemyProfileSnapshotRepository
+from src.company_bc.candidate_application.application.services.profile_snapshot_service import ProfileSnapshotService
 from src.company_bc.candidate_application.infrastructure.repositories.application_question_answer_repository import ApplicationQuestionAnswerRepository
 from src.company_bc.candidate_application_stage.infrastructure.repositories.candidate_application_stage_repository import CandidateApplicationStageRepository
 from src.company_bc.job_position.infrastructure.repositories.job_position_repository import JobPositionRepository
@@ -72,15 +74,15 @@ from src.company_bc.candidate_application.application.commands.question_answer.e
 # Application Question Answer Queries
 from src.company_bc.candidate_application.application.queries.question_answer.list_application_answers_query import ListApplicationAnswersQueryHandler
 
-# Resume (using string imports for lazy loading)
-RESUME_REPOSITORY_PATH = 'src.candidate_bc.resume.infrastructure.repositories.resume_repository.SQLAlchemyResumeRepository'
-RESUME_GENERATION_SERVICE_PATH = 'src.candidate_bc.resume.application.services.resume_generation_service.ResumeGenerationService'
-CREATE_GENERAL_RESUME_HANDLER_PATH = 'src.candidate_bc.resume.application.commands.create_general_resume_command.CreateGeneralResumeCommandHandler'
-UPDATE_RESUME_CONTENT_HANDLER_PATH = 'src.candidate_bc.resume.application.commands.update_resume_content_command.UpdateResumeContentCommandHandler'
-DELETE_RESUME_HANDLER_PATH = 'src.candidate_bc.resume.application.commands.delete_resume_command.DeleteResumeCommandHandler'
-GET_RESUMES_BY_CANDIDATE_HANDLER_PATH = 'src.candidate_bc.resume.application.queries.get_resumes_by_candidate_query.GetResumesByCandidateQueryHandler'
-GET_RESUME_BY_ID_HANDLER_PATH = 'src.candidate_bc.resume.application.queries.get_resume_by_id_query.GetResumeByIdQueryHandler'
-GET_RESUME_STATISTICS_HANDLER_PATH = 'src.candidate_bc.resume.application.queries.get_resume_statistics_query.GetResumeStatisticsQueryHandler'
+# Resume
+from src.candidate_bc.resume.infrastructure.repositories.resume_repository import SQLAlchemyResumeRepository
+from src.candidate_bc.resume.application.services.resume_generation_service import ResumeGenerationService
+from src.candidate_bc.resume.application.commands.create_general_resume_command import CreateGeneralResumeCommandHandler
+from src.candidate_bc.resume.application.commands.update_resume_content_command import UpdateResumeContentCommandHandler
+from src.candidate_bc.resume.application.commands.delete_resume_command import DeleteResumeCommandHandler
+from src.candidate_bc.resume.application.queries.get_resumes_by_candidate_query import GetResumesByCandidateQueryHandler
+from src.candidate_bc.resume.application.queries.get_resume_by_id_query import GetResumeByIdQueryHandler
+from src.candidate_bc.resume.application.queries.get_resume_statistics_query import GetResumeStatisticsQueryHandler
 
 # PDF Analysis
 from src.candidate_bc.resume.application.commands.analyze_pdf_resume_command import AnalyzePDFResumeCommandHandler
@@ -117,6 +119,11 @@ class CandidateContainer(containers.DeclarativeContainer):
         SQLAlchemyCandidateApplicationRepository,
         database=shared.database
     )
+
+    profile_snapshot_repository = providers.Factory(
+        SQLAlchemyProfileSnapshotRepository,
+        database=shared.database
+    )
     
     candidate_stage_repository = providers.Factory(
         CandidateApplicationStageRepository,
@@ -134,7 +141,7 @@ class CandidateContainer(containers.DeclarativeContainer):
     )
 
     resume_repository = providers.Factory(
-        RESUME_REPOSITORY_PATH,
+        SQLAlchemyResumeRepository,
         database=shared.database
     )
 
@@ -144,7 +151,16 @@ class CandidateContainer(containers.DeclarativeContainer):
     )
 
     resume_generation_service = providers.Factory(
-        RESUME_GENERATION_SERVICE_PATH
+        ResumeGenerationService
+    )
+
+    profile_snapshot_service = providers.Factory(
+        ProfileSnapshotService,
+        profile_snapshot_repository=profile_snapshot_repository,
+        candidate_repository=candidate_repository,
+        experience_repository=candidate_experience_repository,
+        education_repository=candidate_education_repository,
+        project_repository=candidate_project_repository
     )
     
     # Candidate Query Handlers
@@ -293,13 +309,14 @@ class CandidateContainer(containers.DeclarativeContainer):
     upload_file_attachment_command_handler = providers.Factory(
         UploadFileAttachmentCommandHandler,
         file_attachment_repository=file_attachment_repository,
-        storage_service=shared.storage_service
+        blob_store=shared.blob_store
     )
 
     delete_file_attachment_command_handler = providers.Factory(
         DeleteFileAttachmentCommandHandler,
         file_attachment_repository=file_attachment_repository,
-        storage_service=shared.storage_service
+        storage_service=shared.storage_service,
+        blob_store=shared.blob_store
     )
 
     populate_candidate_from_pdf_analysis_command_handler = providers.Factory(
@@ -310,7 +327,7 @@ class CandidateContainer(containers.DeclarativeContainer):
     
     # Resume Command Handlers
     create_general_resume_command_handler = providers.Factory(
-        CREATE_GENERAL_RESUME_HANDLER_PATH,
+        CreateGeneralResumeCommandHandler,
         resume_repository=resume_repository,
         candidate_repository=candidate_repository,
         generation_service=resume_generation_service,
@@ -318,28 +335,28 @@ class CandidateContainer(containers.DeclarativeContainer):
     )
     
     update_resume_content_command_handler = providers.Factory(
-        UPDATE_RESUME_CONTENT_HANDLER_PATH,
+        UpdateResumeContentCommandHandler,
         resume_repository=resume_repository
     )
     
     delete_resume_command_handler = providers.Factory(
-        DELETE_RESUME_HANDLER_PATH,
+        DeleteResumeCommandHandler,
         resume_repository=resume_repository
     )
     
     # Resume Query Handlers
     get_resumes_by_candidate_query_handler = providers.Factory(
-        GET_RESUMES_BY_CANDIDATE_HANDLER_PATH,
+        GetResumesByCandidateQueryHandler,
         resume_repository=resume_repository
     )
     
     get_resume_by_id_query_handler = providers.Factory(
-        GET_RESUME_BY_ID_HANDLER_PATH,
+        GetResumeByIdQueryHandler,
         resume_repository=resume_repository
     )
     
     get_resume_statistics_query_handler = providers.Factory(
-        GET_RESUME_STATISTICS_HANDLER_PATH,
+        GetResumeStatisticsQueryHandler,
         resume_repository=resume_repository
     )
     
@@ -353,10 +370,7 @@ class CandidateContainer(containers.DeclarativeContainer):
     create_candidate_application_command_handler = providers.Factory(
         CreateCandidateApplicationCommandHandler,
         candidate_application_repository=candidate_application_repository,
-        candidate_repository=candidate_repository,
-        experience_repository=candidate_experience_repository,
-        education_repository=candidate_education_repository,
-        project_repository=candidate_project_repository
+        profile_snapshot_service=profile_snapshot_service
     )
     
     update_application_status_command_handler = providers.Factory(
@@ -391,10 +405,7 @@ class CandidateContainer(containers.DeclarativeContainer):
     complete_application_with_generated_cv_command_handler = providers.Factory(
         CompleteApplicationWithGeneratedCVCommandHandler,
         candidate_application_repository=candidate_application_repository,
-        candidate_repository=candidate_repository,
-        experience_repository=candidate_experience_repository,
-        education_repository=candidate_education_repository,
-        project_repository=candidate_project_repository
+        profile_snapshot_service=profile_snapshot_service
     )
 
     # Candidate Application Query Handlers
@@ -437,7 +448,9 @@ class CandidateContainer(containers.DeclarativeContainer):
     file_attachment_controller = providers.Factory(
         FileAttachmentController,
         command_bus=shared.command_bus,
-        query_bus=shared.query_bus
+        query_bus=shared.query_bus,
+        storage_service=shared.storage_service,
+        blob_store=shared.blob_store
     )
 
     # Application Question Answer Query Handlers
@@ -1,5 +1,6 @@
 """Company Container - Company Management Bounded Context"""
 from dependency_injector import containers, providers
+from core.config import settings
 from adapters.http.company_app.company.controllers.company_controller import CompanyController as CompanyManagementController
 from adapters.http.company_app.company.controllers.company_user_controller import CompanyUserController
 from adapters.http.company_app.company.controllers.company_role_controller import CompanyRoleController
@@ -24,6 +25,9 @@ from src.company_bc.company_page.infrastructure.repositories.company_page_reposi
 
 # In-App Notification Infrastructure
 from src.notification_bc.in_app_notification.infrastructure.repositories.in_app_notification_repository import InAppNotificationRepository
+from src.notification_bc.in_app_notification.infrastructure.push.redis_in_app_notification_push import (
+    RedisInAppNotificationPublisher, RedisInAppNotificationStream
+)
 
 # In-App Notification Application Layer - Queries
 from src.notification_bc.in_app_notification.application.queries.list_user_notifications_query import ListUserNotificationsQueryHandler
@@ -82,7 +86,11 @@ from src.company_bc.company_candidate.application.commands.reject_company_candid
 from src.company_bc.company_candidate.application.commands.archive_company_candidate_command import ArchiveCompanyCandidateCommandHandler
 from src.company_bc.company_candidate.application.commands.transfer_ownership_command import TransferOwnershipCommandHandler
 from src.company_bc.company_candidate.application.commands.assign_workflow_command import AssignWorkflowCommandHandler
+from src.company_bc.company_candidate.application.commands.bulk_change_stage_command import \
+    BulkChangeStageCommandHandler
 from src.company_bc.company_candidate.application.commands.change_stage_command import ChangeStageCommandHandler
+from src.company_bc.company_candidate.application.commands.start_company_candidates_export_command import \
+    StartCompanyCandidatesExportCommandHandler
 from src.company_bc.company_candidate.application.commands.create_candidate_comment_command import CreateCandidateCommentCommandHandler
 from src.company_bc.company_candidate.application.commands.update_candidate_comment_command import UpdateCandidateCommentCommandHandler
 from src.company_bc.company_candidate.application.commands.delete_candidate_comment_command import DeleteCandidateCommentCommandHandler
@@ -101,6 +109,8 @@ from src.company_bc.company_candidate.application.queries.list_candidate_comment
 from src.company_bc.company_candidate.application.queries.list_candidate_comments_by_stage import ListCandidateCommentsByStageQueryHandler
 from src.company_bc.company_candidate.application.queries.count_pending_comments_query import CountPendingCommentsQueryHandler
 from src.company_bc.company_candidate.application.queries.generate_candidate_report_query import GenerateCandidateReportQueryHandler
+from src.company_bc.company_candidate.application.queries.export_company_candidates_query import \
+    ExportCompanyCandidatesQueryHandler
 
 # CandidateReview Application Layer
 from src.company_bc.candidate_review.application.commands.create_candidate_review_command import CreateCandidateReviewCommandHandler
@@ -113,6 +123,13 @@ from src.company_bc.candidate_review.application.queries.list_reviews_by_company
 from src.company_bc.candidate_review.application.queries.list_reviews_by_stage_query import ListReviewsByStageQueryHandler
 from src.company_bc.candidate_review.application.queries.list_global_reviews_query import ListGlobalReviewsQueryHandler
 
+# Candidate Application permission checks (need the candidate application repository)
+from src.company_bc.candidate_application.application.services.stage_permission_service import StagePermissionService
+from src.company_bc.candidate_application.application.queries.can_user_process_application_query import \
+    CanUserProcessApplicationQueryHandler
+from src.company_bc.candidate_application.application.queries.can_user_process_applications_query import \
+    CanUserProcessApplicationsQueryHandler
+
 
 class CompanyContainer(containers.DeclarativeContainer):
     """Container para Company Bounded Context"""
@@ -351,9 +368,8 @@ class CompanyContainer(containers.DeclarativeContainer):
     
     assign_role_to_user_command_handler = providers.Factory(
         AssignRoleToUserCommandHandler,
-        company_user_repository=company_user_repository,
-        company_role_repository=company_role_repository,
-        event_bus=shared.event_bus
+        repository=company_user_repository,
+        company_role_repository=company_role_repository
     )
     
     # CompanyRole Query Handlers
@@ -414,6 +430,11 @@ class CompanyContainer(containers.DeclarativeContainer):
         ListCompanyCandidatesWithCandidateInfoQueryHandler,
         repository=company_candidate_repository
     )
+
+    export_company_candidates_query_handler = providers.Factory(
+        ExportCompanyCandidatesQueryHandler,
+        repository=company_candidate_repository
+    )
     
     get_candidate_comment_by_id_query_handler = providers.Factory(
         GetCandidateCommentByIdQueryHandler,
@@ -498,6 +519,23 @@ class CompanyContainer(containers.DeclarativeContainer):
         interview_template_repository=shared.interview_template_repository,
         command_bus=shared.command_bus
     )
+
+    bulk_change_stage_command_handler = providers.Factory(
+        BulkChangeStageCommandHandler,
+        repository=company_candidate_repository,
+        workflow_stage_repository=shared.workflow_stage_repository,
+        workflow_repository=shared.workflow_repository,
+        validation_service=shared.stage_phase_validation_service,
+        interview_validation_service=shared.interview_validation_service,
+        candidate_application_repository=shared.candidate_application_repository,
+        interview_template_repository=shared.interview_template_repository,
+        command_bus=shared.command_bus
+    )
+
+    start_company_candidates_export_command_handler = providers.Factory(
+        StartCompanyCandidatesExportCommandHandler,
+        async_job_service=shared.async_job_service
+    )
     
     create_candidate_comment_command_handler = providers.Factory(
         CreateCandidateCommentCommandHandler,
@@ -575,12 +613,32 @@ class CompanyContainer(containers.DeclarativeContainer):
         MarkReviewAsPendingCommandHandler,
         repository=candidate_review_repository
     )
+
+    # Stage permission checks
+    stage_permission_service = providers.Factory(
+        StagePermissionService,
+        position_stage_assignment_repository=shared.position_stage_assignment_repository,
+        company_user_repository=company_user_repository
+    )
+
+    can_user_process_application_query_handler = providers.Factory(
+        CanUserProcessApplicationQueryHandler,
+        application_repository=shared.candidate_application_repository,
+        stage_permission_service=stage_permission_service
+    )
+
+    can_user_process_applications_query_handler = providers.Factory(
+        CanUserProcessApplicationsQueryHandler,
+        application_repository=shared.candidate_application_repository,
+        stage_permission_service=stage_permission_service
+    )
     
     # Controllers
     company_controller = providers.Factory(
         CompanyManagementController,
         command_bus=shared.command_bus,
-        query_bus=shared.query_bus
+        query_bus=shared.query_bus,
+        storage_service=shared.storage_service
     )
     
     company_user_controller = providers.Factory(
@@ -643,6 +701,18 @@ class CompanyContainer(containers.DeclarativeContainer):
         session=shared.database.provided.session
     )
 
+    # In-App Notification push (one Redis connection pool per process)
+    in_app_notification_publisher = providers.Singleton(
+        RedisInAppNotificationPublisher,
+        redis_url=settings.NOTIFICATION_PUSH_REDIS_URL
+    )
+
+    in_app_notification_stream = providers.Singleton(
+        RedisInAppNotificationStream,
+        redis_url=settings.NOTIFICATION_PUSH_REDIS_URL,
+        heartbeat_seconds=settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    )
+
     # In-App Notification Query Handlers
     list_user_notifications_query_handler = providers.Factory(
         ListUserNotificationsQueryHandler,
@@ -657,22 +727,26 @@ class CompanyContainer(containers.DeclarativeContainer):
     # In-App Notification Command Handlers
     create_notification_command_handler = providers.Factory(
         CreateNotificationCommandHandler,
-        repository=in_app_notification_repository
+        repository=in_app_notification_repository,
+        publisher=in_app_notification_publisher
     )
 
     mark_notification_as_read_command_handler = providers.Factory(
         MarkNotificationAsReadCommandHandler,
-        repository=in_app_notification_repository
+        repository=in_app_notification_repository,
+        publisher=in_app_notification_publisher
     )
 
     mark_all_notifications_as_read_command_handler = providers.Factory(
         MarkAllNotificationsAsReadCommandHandler,
-        repository=in_app_notification_repository
+        repository=in_app_notification_repository,
+        publisher=in_app_notification_publisher
     )
 
     delete_notification_command_handler = providers.Factory(
         DeleteNotificationCommandHandler,
-        repository=in_app_notification_repository
+        repository=in_app_notification_repository,
+        publisher=in_app_notification_publisher
     )
 
     # Notification Controller
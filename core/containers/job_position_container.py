@@ -30,7 +30,10 @@ from src.company_bc.job_position.application.commands.position_question_config.c
 from src.company_bc.job_position.application.commands.position_question_config.remove_position_question_config_command import RemovePositionQuestionConfigCommandHandler
 
 # Job Position Application Layer - Queries
+from src.company_bc.job_position.application.queries.count_job_positions import CountJobPositionsQueryHandler
 from src.company_bc.job_position.application.queries.list_job_positions import ListJobPositionsQueryHandler
+from src.company_bc.job_position.application.queries.list_job_position_summaries import \
+    ListJobPositionSummariesQueryHandler
 from src.company_bc.job_position.application.queries.get_job_position_by_id import GetJobPositionByIdQueryHandler
 from src.company_bc.job_position.application.queries.get_job_positions_stats import GetJobPositionsStatsQueryHandler
 from src.company_bc.job_position.application.queries.list_public_job_positions import ListPublicJobPositionsQueryHandler
@@ -100,6 +103,17 @@ class JobPositionContainer(containers.DeclarativeContainer):
         job_position_repository=job_position_repository,
         job_position_comment_repository=job_position_comment_repository
     )
+
+    list_job_position_summaries_query_handler = providers.Factory(
+        ListJobPositionSummariesQueryHandler,
+        job_position_repository=job_position_repository,
+        job_position_comment_repository=job_position_comment_repository
+    )
+
+    count_job_positions_query_handler = providers.Factory(
+        CountJobPositionsQueryHandler,
+        job_position_repository=job_position_repository
+    )
     
     get_job_position_by_id_query_handler = providers.Factory(
         GetJobPositionByIdQueryHandler,
@@ -154,7 +168,8 @@ class JobPositionContainer(containers.DeclarativeContainer):
     
     update_job_position_command_handler = providers.Factory(
         UpdateJobPositionCommandHandler,
-        job_position_repository=job_position_repository
+        job_position_repository=job_position_repository,
+        stage_repository=shared.workflow_stage_repository
     )
     
     delete_job_position_command_handler = providers.Factory(
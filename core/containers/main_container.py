@@ -54,6 +54,7 @@ class Container(containers.DeclarativeContainer):
     SharedDependencies.email_service = shared.email_service
     SharedDependencies.ai_service = shared.ai_service
     SharedDependencies.storage_service = shared.storage_service
+    SharedDependencies.blob_store = shared.blob_store
     SharedDependencies.async_job_service = shared.async_job_service
     SharedDependencies.send_email_command_handler = shared.send_email_command_handler
     SharedDependencies.command_bus = command_bus
@@ -129,6 +130,7 @@ class Container(containers.DeclarativeContainer):
     email_service = shared.email_service
     ai_service = shared.ai_service
     storage_service = shared.storage_service
+    blob_store = shared.blob_store
     async_job_service = shared.async_job_service
     
     # Exponer providers de containers modulares para compatibilidad
@@ -168,6 +170,7 @@ class Container(containers.DeclarativeContainer):
     talent_pool_controller = company.talent_pool_controller
     company_page_controller = company.company_page_controller
     notification_controller = company.notification_controller
+    in_app_notification_stream = company.in_app_notification_stream
 
     # In-App Notification Handlers
     list_user_notifications_query_handler = company.list_user_notifications_query_handler
@@ -246,6 +249,7 @@ class Container(containers.DeclarativeContainer):
     request_password_reset_command_handler = auth.request_password_reset_command_handler
     reset_password_with_token_command_handler = auth.reset_password_with_token_command_handler
     update_user_language_command_handler = auth.update_user_language_command_handler
+    create_pdf_resume_asset_command_handler = auth.create_pdf_resume_asset_command_handler
     update_user_password_command_handler = auth.update_user_password_command_handler
     
     # Interview Handlers
@@ -303,6 +307,8 @@ class Container(containers.DeclarativeContainer):
     archive_company_candidate_command_handler = company.archive_company_candidate_command_handler
     assign_role_to_user_command_handler = company.assign_role_to_user_command_handler
     assign_workflow_command_handler = company.assign_workflow_command_handler
+    bulk_change_stage_command_handler = company.bulk_change_stage_command_handler
+    start_company_candidates_export_command_handler = company.start_company_candidates_export_command_handler
     change_stage_command_handler = company.change_stage_command_handler
     confirm_company_candidate_command_handler = company.confirm_company_candidate_command_handler
     count_pending_comments_query_handler = company.count_pending_comments_query_handler
@@ -333,6 +339,7 @@ class Container(containers.DeclarativeContainer):
     list_company_candidates_by_candidate_query_handler = company.list_company_candidates_by_candidate_query_handler
     list_company_candidates_by_company_query_handler = company.list_company_candidates_by_company_query_handler
     list_company_candidates_with_candidate_info_query_handler = company.list_company_candidates_with_candidate_info_query_handler
+    export_company_candidates_query_handler = company.export_company_candidates_query_handler
     list_global_reviews_query_handler = company.list_global_reviews_query_handler
     list_reviews_by_company_candidate_query_handler = company.list_reviews_by_company_candidate_query_handler
     list_reviews_by_stage_query_handler = company.list_reviews_by_stage_query_handler
@@ -417,6 +424,7 @@ class Container(containers.DeclarativeContainer):
     list_all_job_position_comments_query_handler = job_position.list_all_job_position_comments_query_handler
     list_job_position_activities_query_handler = job_position.list_job_position_activities_query_handler
     list_job_position_workflows_query_handler = job_position.list_job_position_workflows_query_handler
+    list_job_position_summaries_query_handler = job_position.list_job_position_summaries_query_handler
     list_job_positions_query_handler = job_position.list_job_positions_query_handler
     list_public_job_positions_query_handler = job_position.list_public_job_positions_query_handler
     list_published_job_positions_query_handler = job_position.list_published_job_positions_query_handler
@@ -441,6 +449,7 @@ class Container(containers.DeclarativeContainer):
     activate_validation_rule_command_handler = workflow.activate_validation_rule_command_handler
     activate_workflow_command_handler = workflow.activate_workflow_command_handler
     add_custom_field_to_entity_command_handler = workflow.add_custom_field_to_entity_command_handler
+    aggregate_stage_dwell_times_command_handler = workflow.aggregate_stage_dwell_times_command_handler
     archive_phase_command_handler = workflow.archive_phase_command_handler
     archive_workflow_command_handler = workflow.archive_workflow_command_handler
     create_entity_customization_command_handler = workflow.create_entity_customization_command_handler
@@ -456,6 +465,7 @@ class Container(containers.DeclarativeContainer):
     delete_stage_command_handler = workflow.delete_stage_command_handler
     delete_validation_rule_command_handler = workflow.delete_validation_rule_command_handler
     delete_workflow_command_handler = workflow.delete_workflow_command_handler
+    get_custom_field_values_by_entities_query_handler = workflow.get_custom_field_values_by_entities_query_handler
     get_custom_field_values_by_entity_query_handler = workflow.get_custom_field_values_by_entity_query_handler
     get_entity_customization_by_id_query_handler = workflow.get_entity_customization_by_id_query_handler
     get_entity_customization_query_handler = workflow.get_entity_customization_query_handler
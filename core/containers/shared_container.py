@@ -8,6 +8,10 @@ from src.notification_bc.notification.infrastructure.services.smtp_email_service
 from src.framework.domain.infrastructure.storage_service_interface import StorageConfig
 from src.framework.infrastructure.storage.storage_factory import StorageFactory
 from src.framework.infrastructure.repositories.async_job_repository import AsyncJobRepository
+from src.framework.infrastructure.repositories.stored_blob_repository import StoredBlobRepository
+from src.framework.infrastructure.repositories.public_rendition_repository import PublicRenditionRepository
+from src.framework.infrastructure.storage.blob_store import BlobStore
+from src.framework.infrastructure.storage.url_signer import UrlSigner
 from src.framework.infrastructure.jobs.async_job_service import AsyncJobService
 from src.auth_bc.user.infrastructure.services.pdf_processing_service import PDFProcessingService
 from src.notification_bc.notification.application.handlers.send_email_command_handler import SendEmailCommandHandler
@@ -94,6 +98,33 @@ class SharedContainer(containers.DeclarativeContainer):
         allowed_file_extensions=config.allowed_file_extensions
     )
     
+    # Content-addressed blob storage (deduplicated uploads)
+    stored_blob_repository = providers.Factory(
+        StoredBlobRepository,
+        database=database
+    )
+
+    upload_token_signer = providers.Singleton(
+        UrlSigner,
+        secret=settings.auth.SECRET_KEY,
+        purpose="blob-upload"
+    )
+
+    blob_store = providers.Factory(
+        BlobStore,
+        storage_service=storage_service,
+        repository=stored_blob_repository,
+        grace_seconds=settings.BLOB_GC_GRACE_SECONDS,
+        signer=upload_token_signer,
+        upload_expiration_seconds=settings.DIRECT_UPLOAD_URL_EXPIRATION_SECONDS
+    )
+
+    # Shared store of pre-rendered public responses (see public_response_cache)
+    public_rendition_repository = providers.Singleton(
+        PublicRenditionRepository,
+        database=database
+    )
+
     # Async Job Services
     async_job_repository = providers.Factory(
         AsyncJobRepository,
@@ -15,20 +15,12 @@ from src.shared_bc.customization.entity_customization.infrastructure.repositorie
 from src.shared_bc.customization.entity_customization.infrastructure.repositories.custom_field_repository import CustomFieldRepository as NewCustomFieldRepository
 from src.shared_bc.customization.field_validation.infrastructure.repositories.validation_rule_repository import ValidationRuleRepository
 
-# Company User Repository (needed for StagePermissionService)
-from src.company_bc.company.infrastructure.repositories.company_user_repository import CompanyUserRepository
-
 # Workflow Domain Services
 from src.shared_bc.customization.workflow.domain.services.stage_phase_validation_service import StagePhaseValidationService
 from src.shared_bc.customization.field_validation.application.services.field_validation_service import FieldValidationService
 from src.shared_bc.customization.field_validation.application.services.interview_validation_service import InterviewValidationService
-from src.company_bc.candidate_application.application.services.stage_permission_service import StagePermissionService
 from src.shared_bc.customization.workflow.application.services.workflow_response_service import WorkflowResponseService
 
-# Candidate Application Query for permission checking
-from src.company_bc.candidate_application.application.queries.can_user_process_application_query import \
-    CanUserProcessApplicationQueryHandler
-
 # Workflow Application Layer - Commands
 from src.shared_bc.customization.workflow.application import CreateWorkflowCommandHandler
 from src.shared_bc.customization.workflow.application.commands.workflow.update_workflow_command import UpdateWorkflowCommandHandler
@@ -83,6 +75,7 @@ from src.shared_bc.customization.entity_customization.application.queries.get_en
 from src.shared_bc.customization.entity_customization.application.queries.get_entity_customization_by_id_query import GetEntityCustomizationByIdQueryHandler
 from src.shared_bc.customization.entity_customization.application.queries.list_custom_fields_by_entity_query import ListCustomFieldsByEntityQueryHandler
 from src.shared_bc.customization.entity_customization.application.queries.get_custom_field_values_by_entity_query import GetCustomFieldValuesByEntityQueryHandler
+from src.shared_bc.customization.entity_customization.application.queries.get_custom_field_values_by_entities_query import GetCustomFieldValuesByEntitiesQueryHandler
 
 # FieldValidation Application Layer - Commands
 from src.shared_bc.customization.field_validation.application.commands.create_validation_rule_command import CreateValidationRuleCommandHandler
@@ -110,6 +103,10 @@ from src.shared_bc.customization.workflow.application.commands.application_quest
 # ApplicationQuestion Controller
 from adapters.http.company_app.application_question.controllers.application_question_controller import ApplicationQuestionController
 
+# Stage dwell times (candidate_application_stages history)
+from src.company_bc.candidate_application_stage.infrastructure.repositories.stage_dwell_time_repository import StageDwellTimeRepository
+from src.company_bc.candidate_application_stage.application.commands.aggregate_stage_dwell_times_command import AggregateStageDwellTimesCommandHandler
+
 # WorkflowAnalytics Application Layer - Queries
 from src.shared_bc.customization.workflow_analytics.application.queries.get_workflow_analytics_query import GetWorkflowAnalyticsQueryHandler
 from src.shared_bc.customization.workflow_analytics.application.queries.get_stage_bottlenecks_query import GetStageBottlenecksQueryHandler
@@ -151,9 +148,8 @@ class WorkflowContainer(containers.DeclarativeContainer):
         ValidationRuleRepository
     )
 
-    # Company User Repository (for permission checks)
-    company_user_repository = providers.Factory(
-        CompanyUserRepository,
+    stage_dwell_time_repository = providers.Factory(
+        StageDwellTimeRepository,
         database=shared.database
     )
 
@@ -175,19 +171,6 @@ class WorkflowContainer(containers.DeclarativeContainer):
         custom_field_repository=new_custom_field_repository
     )
     
-    stage_permission_service = providers.Factory(
-        StagePermissionService,
-        position_stage_assignment_repository=shared.position_stage_assignment_repository,
-        company_user_repository=company_user_repository
-    )
-
-    # Permission Query Handler
-    can_user_process_application_query_handler = providers.Factory(
-        CanUserProcessApplicationQueryHandler,
-        application_repository=shared.candidate_application_repository,
-        stage_permission_service=stage_permission_service
-    )
-
     candidate_stage_transition_handler = providers.Factory(
         CandidateStageTransitionHandler,
         application_repository=shared.candidate_application_repository,
@@ -378,6 +361,11 @@ class WorkflowContainer(containers.DeclarativeContainer):
         GetCustomFieldValuesByEntityQueryHandler,
         database=shared.database
     )
+
+    get_custom_field_values_by_entities_query_handler = providers.Factory(
+        GetCustomFieldValuesByEntitiesQueryHandler,
+        database=shared.database
+    )
     
     # EntityCustomization Command Handlers
     create_entity_customization_command_handler = providers.Factory(
@@ -445,14 +433,24 @@ class WorkflowContainer(containers.DeclarativeContainer):
     # WorkflowAnalytics Query Handlers
     get_workflow_analytics_query_handler = providers.Factory(
         GetWorkflowAnalyticsQueryHandler,
+        database=shared.database,
         workflow_repository=workflow_repository,
-        workflow_stage_repository=workflow_stage_repository
+        stage_repository=workflow_stage_repository,
+        dwell_time_repository=stage_dwell_time_repository
     )
     
     get_stage_bottlenecks_query_handler = providers.Factory(
         GetStageBottlenecksQueryHandler,
+        database=shared.database,
         workflow_repository=workflow_repository,
-        workflow_stage_repository=workflow_stage_repository
+        stage_repository=workflow_stage_repository,
+        dwell_time_repository=stage_dwell_time_repository
+    )
+
+    # Stage dwell time Command Handlers
+    aggregate_stage_dwell_times_command_handler = providers.Factory(
+        AggregateStageDwellTimesCommandHandler,
+        dwell_time_repository=stage_dwell_time_repository
     )
     
     # Controllers
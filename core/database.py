@@ -1,24 +1,96 @@
+import os
+import sys
 from contextvars import ContextVar
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Type, Optional, List, Generator, Any
+from typing import TypeVar, Generic, Type, Optional, List, Generator, Any, Dict, Sequence
 from sqlalchemy.orm import Session  # type: ignore
-from sqlalchemy import create_engine, text  # type: ignore
+from sqlalchemy import create_engine  # type: ignore
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import OperationalError, DisconnectionError
 import logging
 
-from core.config import settings
+from core.config import Settings, settings
 from core.base import Base
+from src.framework.infrastructure.metrics.pool_metrics import (
+    InstrumentedNullPool, InstrumentedQueuePool, pool_metrics
+)
 
-# Configuración robusta de la base de datos
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=20,
-    max_overflow=30,
-    pool_timeout=30,  # Segundos para esperar por una conexión
-    pool_recycle=3600,  # Reciclar conexiones cada hora
-    pool_pre_ping=True,  # Verificar conexiones antes de usarlas
-    echo=False  # No logging SQL en producción
+PROCESS_ROLES = ("api", "worker", "script")
+DRAMATIQ_DEFAULT_THREADS = 8  # Default of the dramatiq CLI --threads option
+
+
+def resolve_process_role(configured: str, argv: Sequence[str] = ()) -> str:
+    """Rol del proceso para dimensionar el pool: el configurado o el detectado"""
+    if configured:
+        if configured not in PROCESS_ROLES:
+            raise ValueError(f"DB_PROCESS_ROLE must be one of {', '.join(PROCESS_ROLES)}, got '{configured}'")
+        return configured
+    return "worker" if _is_dramatiq_cli(argv) else "api"
+
+
+def _is_dramatiq_cli(argv: Sequence[str]) -> bool:
+    """`dramatiq ...` runs the console script; `python -m dramatiq ...` runs dramatiq/__main__.py"""
+    if not argv:
+        return False
+    path = os.path.normpath(argv[0])
+    name = os.path.basename(path)
+    if name.startswith("dramatiq"):
+        return True
+    return name == "__main__.py" and os.path.basename(os.path.dirname(path)) == "dramatiq"
+
+
+def dramatiq_threads(argv: Sequence[str]) -> int:
+    """Hilos por proceso worker, tal y como se pasan al CLI de dramatiq (--threads / -t)"""
+    for index, arg in enumerate(argv):
+        if arg in ("--threads", "-t") and index + 1 < len(argv):
+            return int(argv[index + 1])
+        if arg.startswith("--threads="):
+            return int(arg.split("=", 1)[1])
+        if arg.startswith("-t") and arg[2:].isdigit():
+            return int(arg[2:])
+    return DRAMATIQ_DEFAULT_THREADS
+
+
+def engine_options(config: Settings, role: str, worker_threads: int = DRAMATIQ_DEFAULT_THREADS) -> Dict[str, Any]:
+    """Argumentos de create_engine para el rol del proceso
+
+    Cada hilo de un worker de Dramatiq procesa un mensaje con su propia sesión,
+    así que sin DB_POOL_SIZE_WORKER explícito el pool del worker tiene una
+    conexión por hilo.
+
+    Detrás de PgBouncer en modo transacción no se mantiene pool en el cliente:
+    cada checkout abre una conexión (barata) a PgBouncer, que reparte las
+    conexiones reales a Postgres por transacción.
+    """
+    options: Dict[str, Any] = {
+        # Sin pre-ping una conexión caída falla una sola vez: SQLAlchemy invalida el pool
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "echo": False,  # No logging SQL en producción
+    }
+    if config.DB_PGBOUNCER_TRANSACTION_MODE:
+        options["poolclass"] = InstrumentedNullPool
+        return options
+
+    pool_size: Optional[int] = getattr(config, f"DB_POOL_SIZE_{role.upper()}")
+    if pool_size is None:
+        pool_size = worker_threads
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=getattr(config, f"DB_MAX_OVERFLOW_{role.upper()}"),
+        pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,  # Segundos para esperar por una conexión
+        pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        pool_use_lifo=True,  # Las conexiones sobrantes quedan ociosas y el servidor puede cerrarlas
+    )
+    return options
+
+
+process_role = resolve_process_role(settings.DB_PROCESS_ROLE, sys.argv)
+_engine_options = engine_options(settings, process_role, worker_threads=dramatiq_threads(sys.argv))
+engine = create_engine(settings.DATABASE_URL, **_engine_options)
+pool_metrics.instrument(
+    engine,
+    role=process_role,
+    max_connections=_engine_options.get("pool_size", 0) + _engine_options.get("max_overflow", 0) or None,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -63,30 +135,17 @@ class SQLAlchemyDatabase(DatabaseInterface):
             return self._create_session()
 
     def _create_session(self) -> Session:  # type: ignore
-        """Create a new session with error handling"""
-        max_retries = 3
-        retry_count = 0
-
-        while retry_count < max_retries:
-            try:
-                session = SessionLocal()
-                # Test the connection
-                session.execute(text("SELECT 1"))
-                return session
-            except (OperationalError, DisconnectionError) as e:
-                retry_count += 1
-                self.logger.warning(f"Database connection attempt {retry_count} failed: {str(e)}")
-
-                if retry_count >= max_retries:
-                    self.logger.error("Max database connection retries exceeded")
-                    raise
-
-                # Dispose engine to force new connections
-                engine.dispose()
-
-        # This should never be reached, but just in case
+        """Create a new session; the connection is checked out on first use"""
         return SessionLocal()
 
+    def new_session(self) -> Session:  # type: ignore
+        """
+        Create a session that is not bound to the request context.
+        Used for long-lived reads (streaming exports) that outlive the request scope;
+        the caller is responsible for closing it.
+        """
+        return self._create_session()
+
     @property
     def session(self) -> Session:  # type: ignore
         """Property to get session - used by DI container"""
@@ -2,18 +2,32 @@
 FastAPI app minimal - Solo admin interview templates
 """
 from pathlib import Path
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse
 
 from adapters.http.candidate_app.routers.position_stage_assignment_router import router as position_stage_assignment_router
 from adapters.http.candidate_app.routers.file_attachment_router import router as file_attachment_router
 from adapters.http.company_app.job_position.routers.public_position_router import router as public_position_router
 from adapters.http.shared.field_validation.routers.validation_rule_router import router as validation_rule_router
+from adapters.http.shared.responses import FastJSONResponse
+from adapters.http.shared.storage.public_static_files import PublicStaticFiles
 # Solo imports esenciales
+from core.config import settings
 from core.containers import Container
-from src.framework.application.command_bus import CommandBus
-from src.framework.application.query_bus import QueryBus
+from core.database import engine
+from src.framework.application.command_bus import Command, CommandBus
+from src.framework.application.handler_registry import HandlerRegistry
+from src.framework.application.public_response_cache import public_response_cache
+from src.framework.application.query_bus import Query, QueryBus
+from src.framework.infrastructure.metrics import handler_metrics
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
+from src.auth_bc.user.domain.services.password_service import PasswordService
+from src.auth_bc.user.infrastructure.services.password_hashing_pool import password_hashing_pool
+from src.framework.infrastructure.middleware.compression_middleware import CompressionMiddleware
+from src.framework.infrastructure.middleware.sql_profiler_middleware import (
+    SqlProfilerMiddleware, install_sql_profiler, query_performance_registry
+)
 
 # Initialize Dramatiq broker for web service
 from adapters.http.admin_app.routes.admin_router import router as admin_router
@@ -55,6 +69,8 @@ from adapters.http.auth.invitations.routers.invitation_router import router as i
 # Phase 10: Public Position Router
 # Phase 12: Phase Router
 from adapters.http.shared.phase.routers.phase_router import router as phase_router
+from adapters.http.shared.storage.routers.signed_storage_router import router as signed_storage_router
+from adapters.http.shared.metrics.routers.metrics_router import router as metrics_router
 
 # Crear tablas - COMENTADO temporalmente para aislamiento
 # Base.metadata.create_all(bind=engine)
@@ -63,7 +79,8 @@ from adapters.http.shared.phase.routers.phase_router import router as phase_rout
 app = FastAPI(
     title="Admin Panel - Interview Templates",
     description="Panel de administración mínimo - Solo plantillas de entrevista",
-    version="1.0.0-minimal"
+    version="1.0.0-minimal",
+    default_response_class=FastJSONResponse
 )
 
 # Configurar CORS básico
@@ -78,8 +95,63 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["Authorization", "Content-Type", "Accept", "Origin", "X-Requested-With"],
+    expose_headers=["X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-N-Plus-One"],
 )
 
+# Brotli/gzip for large responses (event streams and pre-compressed bodies are left alone)
+if settings.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES,
+        gzip_level=settings.RESPONSE_GZIP_LEVEL,
+        brotli_quality=settings.RESPONSE_BROTLI_QUALITY,
+    )
+
+# Per-request SQL metrics (aggregated in /admin/perf, exposed as headers in development)
+if settings.SQL_PROFILING_ENABLED:
+    install_sql_profiler(engine)
+    query_performance_registry.n_plus_one_threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+    app.add_middleware(
+        SqlProfilerMiddleware,
+        registry=query_performance_registry,
+        expose_headers=settings.ENVIRONMENT == "development",
+    )
+
+# bcrypt runs in the password hashing pool, outside the request workers
+PasswordService.set_executor(password_hashing_pool)
+
+# Saturated password hashing pool: ask the client to retry instead of queueing
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+# Root endpoint básico
+# Registered before the routers: /{company_slug} would otherwise capture /health
+@app.get("/", tags=["root"])
+async def root():
+    return {
+        "message": "Admin Panel - Interview Templates Only",
+        "version": "1.0.0-minimal",
+        "docs": "/docs",
+        "admin": "/admin"
+    }
+
+# Health check básico
+@app.get("/health", tags=["health"])
+async def health():
+    return {"status": "ok", "service": "admin-interview-templates"}
+
+# CORS test endpoint
+@app.get("/cors-test", tags=["test"])
+async def cors_test():
+    return {"message": "CORS is working!", "timestamp": "2025-10-10"}
+
+app.include_router(metrics_router)  # Prometheus scrape endpoint (before /{company_slug})
+
 # Incluir routers esenciales
 # IMPORTANT: Resume router must be registered BEFORE candidate router
 # to prevent the generic /{candidate_id} route from catching /resume paths
@@ -125,31 +197,13 @@ app.include_router(candidate_interview_router)  # Candidate interview access by
 app.include_router(user_router)
 app.include_router(invitation_router)  # Public invitation endpoints
 app.include_router(ai_test_router)  # Direct AI testing
+app.include_router(signed_storage_router)  # Signed upload/download URLs (local storage)
 
-# Mount static files for uploads (local storage)
+# Mount static files for uploads (local storage): only public files such as logos.
+# Private files are served through signed URLs (signed_storage_router)
 uploads_dir = Path("uploads")
 uploads_dir.mkdir(exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
-
-# Root endpoint básico
-@app.get("/", tags=["root"])
-async def root():
-    return {
-        "message": "Admin Panel - Interview Templates Only",
-        "version": "1.0.0-minimal",
-        "docs": "/docs",
-        "admin": "/admin"
-    }
-
-# Health check básico
-@app.get("/health", tags=["health"])
-async def health():
-    return {"status": "ok", "service": "admin-interview-templates"}
-
-# CORS test endpoint
-@app.get("/cors-test", tags=["test"])
-async def cors_test():
-    return {"message": "CORS is working!", "timestamp": "2025-10-10"}
+app.mount("/uploads", PublicStaticFiles(directory=str(uploads_dir)), name="uploads")
 
 # Configurar el contenedor mínimo
 container = Container()
@@ -157,8 +211,19 @@ app.container = container
 
 # Initialize the buses with the container reference
 # This must happen BEFORE wiring so the buses are available
-Container._command_bus_instance = CommandBus(container=container)
-Container._query_bus_instance = QueryBus(container=container)
+# The handler registry maps every imported command/query to its handler provider
+handler_registry = HandlerRegistry.build(container, [Command, Query])
+Container._command_bus_instance = CommandBus(container=container, registry=handler_registry)
+Container._query_bus_instance = QueryBus(container=container, registry=handler_registry)
+if settings.CQRS_METRICS_ENABLED:
+    handler_metrics.sample_rate = settings.CQRS_METRICS_SAMPLE_RATE
+    Container._command_bus_instance.add_hook(handler_metrics.hook("command"))
+    Container._query_bus_instance.add_hook(handler_metrics.hook("query"))
+# Pre-rendered public responses are shared between workers through the rendition store
+if settings.PUBLIC_PRERENDER_ENABLED:
+    public_response_cache.use_store(container.shared.public_rendition_repository())
+# Builds the reusable handlers now (they may need the buses): broken providers show up at boot
+handler_registry.validate([Command, Query], strict=settings.STRICT_HANDLER_REGISTRY)
 
 # Wire solo el admin router y onboarding
 container.wire(modules=[
@@ -28,8 +28,18 @@ from src.candidate_bc.candidate.infrastructure.models.candidate_experience impor
 from src.candidate_bc.candidate.infrastructure.models.candidate_project import CandidateProjectModel
 from src.candidate_bc.candidate.infrastructure.models.file_attachment_model import FileAttachmentModel
 from src.company_bc.candidate_application.infrastructure.models.candidate_application_model import CandidateApplicationModel
+from src.company_bc.candidate_application.infrastructure.models.profile_snapshot_model import ProfileSnapshotModel
+from src.company_bc.candidate_application_stage.infrastructure.models.candidate_stage_model import \
+    CandidateApplicationStageModel
+from src.company_bc.candidate_application_stage.infrastructure.models.stage_dwell_time_model import (
+    StageDwellTimeDailyModel, StageDwellTimeWatermarkModel
+)
 from src.candidate_bc.resume.infrastructure.models.resume_model import ResumeModel
 from src.company_bc.talent_pool.infrastructure.models.talent_pool_entry_model import TalentPoolEntryModel
+from src.framework.infrastructure.models.stored_blob_model import StoredBlobModel, BlobReferenceModel
+from src.framework.infrastructure.models.public_rendition_model import (
+    PublicRenditionModel, PublicRenditionNamespaceModel
+)
 
 # Make sure models are available for Alembic
 __all__ = [
@@ -62,6 +72,14 @@ __all__ = [
     "CandidateProjectModel",
     "FileAttachmentModel",
     "CandidateApplicationModel",
+    "ProfileSnapshotModel",
+    "CandidateApplicationStageModel",
+    "StageDwellTimeDailyModel",
+    "StageDwellTimeWatermarkModel",
     "ResumeModel",
     "TalentPoolEntryModel",
+    "StoredBlobModel",
+    "BlobReferenceModel",
+    "PublicRenditionModel",
+    "PublicRenditionNamespaceModel",
 ]
\ No newline at end of file
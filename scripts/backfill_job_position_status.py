@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Derive job_positions.status from the current stage of every position
+
+Run once after the d2f7a9c3e5b1 migration. Stage moves keep the status in sync
+from then on; positions moved before only had their status set by the publishing
+commands, so filters and GetJobPositionsStatsQuery would count them wrongly.
+
+Only positions whose status is NULL or inconsistent with their stage are touched:
+live and archived positions (JobPosition.STAGE_KEPT_STATUSES) are skipped, and
+the status only moves along the valid transitions (see status_for_stage_type).
+Each row is updated only if its status is still the one read, so a concurrent
+publish is never overwritten.
+
+Positions are read in keyset batches, one transaction per batch, so the script
+can be interrupted and re-run.
+
+Usage:
+    python scripts/backfill_job_position_status.py --dry-run
+    python scripts/backfill_job_position_status.py [--company-id ID] [--batch-size 1000]
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+# Size the connection pool for a one-off script, not for an API worker
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from sqlalchemy import bindparam, or_, select, update
+
+from core.database import engine
+from src.company_bc.job_position.domain.entities.job_position import JobPosition
+from src.company_bc.job_position.domain.enums import JobPositionStatusEnum
+from src.company_bc.job_position.infrastructure.models.job_position_model import JobPositionModel
+from src.shared_bc.customization.workflow.infrastructure.models import WorkflowStageModel
+
+
+def _current_status(value: Optional[str]) -> JobPositionStatusEnum:
+    try:
+        return JobPositionStatusEnum(value) if value else JobPositionStatusEnum.DRAFT
+    except ValueError:
+        return JobPositionStatusEnum.DRAFT
+
+
+def backfill(company_id: Optional[str], batch_size: int, dry_run: bool) -> Counter:
+    stats: Counter = Counter()
+    table = JobPositionModel.__table__
+    update_statement = (
+        update(table)
+        .where(table.c.id == bindparam("position_id"))
+        .where(table.c.status.is_not_distinct_from(bindparam("old_status")))
+        .values(status=bindparam("new_status"))
+    )
+    last_id = ""
+    while True:
+        query = (
+            select(JobPositionModel.id, JobPositionModel.status, WorkflowStageModel.stage_type)
+            .join(WorkflowStageModel, WorkflowStageModel.id == JobPositionModel.stage_id)
+            .where(JobPositionModel.id > last_id)
+            .where(or_(
+                JobPositionModel.status.is_(None),
+                JobPositionModel.status.notin_([status.value for status in JobPosition.STAGE_KEPT_STATUSES])
+            ))
+            .order_by(JobPositionModel.id)
+            .limit(batch_size)
+        )
+        if company_id:
+            query = query.where(JobPositionModel.company_id == company_id)
+
+        with engine.begin() as conn:
+            rows = conn.execute(query).all()
+            if not rows:
+                return stats
+
+            changes = []
+            for row in rows:
+                current = _current_status(row.status)
+                derived = JobPosition.status_for_stage_type(row.stage_type, current)
+                if derived.value != row.status:
+                    changes.append({"position_id": row.id, "old_status": row.status, "new_status": derived.value})
+                    stats[f"{row.status} -> {derived.value}"] += 1
+                else:
+                    stats["unchanged"] += 1
+
+            if changes and not dry_run:
+                conn.execute(update_statement, changes)
+
+        last_id = rows[-1].id
+        print(f"  {sum(stats.values())} positions checked")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill job position status from the current stage")
+    parser.add_argument("--company-id", help="Only positions of this company")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Report the changes without writing them")
+    args = parser.parse_args()
+
+    print("🔄 Backfilling job position status" + (" (dry run)" if args.dry_run else ""))
+    stats = backfill(args.company_id, args.batch_size, args.dry_run)
+    for change, count in sorted(stats.items()):
+        print(f"  {change}: {count}")
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    main()
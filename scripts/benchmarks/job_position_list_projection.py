@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the job position list projection
+
+Compares, for the same set of rows, the full list path (entity hydration +
+JobPositionDto + response mapping) with the slim summary path
+(JobPositionListReadModel + response mapping). No database is required: rows
+are built in memory, so the numbers only cover the Python-side mapping cost.
+
+Usage:
+    python scripts/benchmarks/job_position_list_projection.py [--rows 10000]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import core.containers.main_container  # noqa: F401 - imports every model so mapper relationships resolve
+from adapters.http.admin_app.mappers.job_position_mapper import JobPositionMapper
+from src.company_bc.job_position.application.queries.job_position_dto import JobPositionDto
+from src.company_bc.job_position.domain.enums import JobPositionVisibilityEnum
+from src.company_bc.job_position.infrastructure.models.job_position_model import JobPositionModel
+from src.company_bc.job_position.infrastructure.repositories.job_position_repository import JobPositionRepository
+from src.framework.domain.enums.job_category import JobCategoryEnum
+
+LIST_COLUMNS = [
+    "id", "title", "company_id", "job_position_workflow_id", "stage_id", "status", "visibility",
+    "public_slug", "job_category", "custom_fields_values", "created_at", "updated_at",
+]
+ListRow = namedtuple("ListRow", LIST_COLUMNS)
+
+
+def build_models(rows: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        JobPositionModel(
+            id=f"01JP{i:022d}",
+            company_id="01COMPANY0000000000000000",
+            title=f"Senior Engineer {i}",
+            job_position_workflow_id="01WORKFLOW000000000000000",
+            stage_id="01STAGE000000000000000000",
+            description="Lorem ipsum dolor sit amet " * 40,
+            job_category=JobCategoryEnum.TECHNOLOGY,
+            skills=["python", "sql", "docker"],
+            languages=[{"language": "en", "level": "C1"}],
+            number_of_openings=1,
+            show_salary=False,
+            status="active",
+            visibility=JobPositionVisibilityEnum.PUBLIC.value,
+            public_slug=f"senior-engineer-{i}",
+            application_mode="short",
+            custom_fields_values={"location": "Remote", "seniority": "Senior"},
+            killer_questions=[],
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def full_path(repository: JobPositionRepository, models: list) -> list:
+    return [
+        JobPositionMapper.dto_to_response(JobPositionDto.from_entity(repository._create_entity_from_model(model)))
+        for model in models
+    ]
+
+
+def summary_path(rows: list) -> list:
+    return [
+        JobPositionMapper.list_item_to_response(JobPositionRepository._create_list_item_from_row(row))
+        for row in rows
+    ]
+
+
+def measure(label: str, fn, arg, rows: int) -> None:
+    start = time.perf_counter()
+    fn(arg)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    per_10k = peak / rows * 10_000 / (1024 * 1024)
+    print(f"{label:<10} {rows / elapsed:>12,.0f} rows/s {per_10k:>10.1f} MiB peak per 10k rows")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    models = build_models(args.rows)
+    rows = [ListRow(*(getattr(model, column) for column in LIST_COLUMNS)) for model in models]
+    repository = JobPositionRepository(database=None)  # type: ignore[arg-type]
+
+    measure("full", lambda m: full_path(repository, m), models, args.rows)
+    measure("summary", summary_path, rows, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Login throughput benchmark for password hashing
+
+Simulates a login burst: --concurrency request threads each verify --logins
+passwords, hashing inline (in the request worker, as before) or through the
+bounded PasswordHashingPool. Reports logins/sec, p95 latency, rejected (503)
+logins, and how long a trivial request waited for the worker meanwhile.
+
+Usage:
+    python scripts/benchmarks/password_hashing.py [--rounds 12] [--workers 2] [--concurrency 16]
+"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
+from src.auth_bc.user.domain.services.password_service import _check_password, _hash_password
+from src.auth_bc.user.infrastructure.services.password_hashing_pool import PasswordHashingPool
+
+
+def run(pool: PasswordHashingPool, hashed: bytes, concurrency: int, logins: int) -> dict:
+    latencies = []
+    rejected = 0
+    lock = threading.Lock()
+
+    def login() -> None:
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            assert pool.run(_check_password, b"correct horse", hashed)
+        except PasswordHashingBusyError:
+            with lock:
+                rejected += 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+    # A cheap request sharing the worker: how long does it wait for the GIL?
+    probe_delays = []
+    stop = threading.Event()
+
+    def probe() -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            time.sleep(0.005)
+            probe_delays.append(time.perf_counter() - start - 0.005)
+
+    probe_thread = threading.Thread(target=probe)
+    probe_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency * logins):
+            executor.submit(login)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    probe_thread.join()
+
+    latencies.sort()
+    return {
+        "logins_per_sec": len(latencies) / elapsed,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+        "rejected": rejected,
+        "probe_delay_ms": statistics.mean(probe_delays) * 1000 if probe_delays else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=2, help="Hashing worker processes")
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--queue-timeout", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent login requests")
+    parser.add_argument("--logins", type=int, default=4, help="Logins per request thread")
+    args = parser.parse_args()
+
+    hashed = _hash_password(b"correct horse", args.rounds)
+    modes = {
+        "inline": PasswordHashingPool(0, args.max_pending, args.queue_timeout),
+        f"pool ({args.workers} workers)": PasswordHashingPool(args.workers, args.max_pending, args.queue_timeout),
+    }
+    pool = modes[f"pool ({args.workers} workers)"]
+    pool.run(_check_password, b"warm up", hashed)  # start the worker processes
+
+    print(f"bcrypt cost {args.rounds}, {args.concurrency} concurrent logins x {args.logins}")
+    for name, mode in modes.items():
+        result = run(mode, hashed, args.concurrency, args.logins)
+        print(
+            f"{name:<20} {result['logins_per_sec']:7.1f} logins/s  p95 {result['p95_ms']:7.1f}ms  "
+            f"rejected {result['rejected']:3d}  other requests delayed {result['probe_delay_ms']:6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
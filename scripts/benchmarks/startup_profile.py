@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Startup profile of the API process
+
+Boots the application in fresh interpreters and reports:
+- time to first request: interpreter start until GET /health answers
+- RSS after boot
+- the modules with the highest import time (python -X importtime), self and
+  cumulative, grouped by top-level package
+
+With --max-seconds / --max-rss-mb the script exits with status 1 when the
+median boot exceeds a target, so it can guard startup regressions in CI.
+
+Usage:
+    python scripts/benchmarks/startup_profile.py [--runs 3] [--top 15] [--max-seconds 2.5] [--max-rss-mb 220]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+BOOT_SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+import main
+from fastapi.testclient import TestClient
+imported = time.perf_counter()
+TestClient(main.app).get("/health").raise_for_status()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "first_request_seconds": time.perf_counter() - start,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def boot_once() -> Dict[str, float]:
+    """Boot the app in a new interpreter; time includes interpreter startup"""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", BOOT_SCRIPT], cwd=PROJECT_ROOT, env=os.environ,
+        capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_seconds"] = time.perf_counter() - start
+    return result
+
+
+def import_times() -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for every module imported by main"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=PROJECT_ROOT, env=os.environ,
+        capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Boots to take the median of")
+    parser.add_argument("--top", type=int, default=15, help="Modules to list")
+    parser.add_argument("--max-seconds", type=float, help="Target for time to first request")
+    parser.add_argument("--max-rss-mb", type=float, help="Target for RSS after boot")
+    args = parser.parse_args()
+
+    boots = [boot_once() for _ in range(args.runs)]
+    first_request = statistics.median(boot["process_seconds"] for boot in boots)
+    app_import = statistics.median(boot["import_seconds"] for boot in boots)
+    rss = statistics.median(boot["rss_mb"] for boot in boots)
+    print(f"time to first request {first_request:6.2f}s (import main {app_import:.2f}s), RSS {rss:.0f} MB")
+
+    rows = import_times()
+    print(f"\nTop {args.top} modules by self import time")
+    for module, self_us, cumulative_us in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms cumulative  {module}")
+
+    packages: Dict[str, int] = defaultdict(int)
+    for module, self_us, _ in rows:
+        packages[module.split(".")[0]] += self_us
+    print(f"\nTop {args.top} packages by total self import time")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {package}")
+
+    failures = []
+    if args.max_seconds is not None and first_request > args.max_seconds:
+        failures.append(f"time to first request {first_request:.2f}s > {args.max_seconds}s")
+    if args.max_rss_mb is not None and rss > args.max_rss_mb:
+        failures.append(f"RSS {rss:.0f} MB > {args.max_rss_mb} MB")
+    if failures:
+        print("\nStartup targets missed: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
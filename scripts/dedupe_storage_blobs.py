@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Move existing files into the content-addressed blob store
+
+Run once after the b7c3d9e1f2a4 migration. For every candidate file attachment and
+company candidate resume still stored under a per-company path:
+- hash the stored file (streamed, never loaded whole)
+- if a blob with that SHA-256 exists, point the record at it and delete the copy
+- otherwise move the file to blobs/<aa>/<bb>/<sha256> and register the blob
+- register the record as a reference of the blob
+
+Records are processed in batches and committed one by one, so the script can be
+interrupted and re-run; records already pointing at a blob are skipped.
+
+Usage:
+    python scripts/dedupe_storage_blobs.py --dry-run
+    python scripts/dedupe_storage_blobs.py
+    python scripts/dedupe_storage_blobs.py --gc      # delete unreferenced blobs only
+"""
+import argparse
+import hashlib
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import update
+
+from core.containers import Container
+from src.candidate_bc.candidate.infrastructure.models.file_attachment_model import FileAttachmentModel
+from src.company_bc.company_candidate.infrastructure.models.company_candidate_model import CompanyCandidateModel
+from src.framework.domain.entities.stored_blob import StoredBlob
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.storage_service_interface import StorageServiceInterface, StorageType
+from src.framework.infrastructure.repositories.stored_blob_repository import StoredBlobRepository
+
+
+class BlobDeduplicator:
+    """Moves stored files into blobs and counts what was saved"""
+
+    def __init__(self, storage: StorageServiceInterface, repository: StoredBlobRepository, dry_run: bool):
+        self.storage = storage
+        self.repository = repository
+        self.dry_run = dry_run
+        self.stats: Counter = Counter()
+        self.seen_hashes: set[str] = set()
+
+    def hash_file(self, file_path: str) -> Optional[Tuple[str, int]]:
+        """SHA-256 and size of a stored file, or None if it is missing"""
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            for chunk in self.storage.iter_file(file_path):
+                digest.update(chunk)
+                size += len(chunk)
+        except FileNotFoundError:
+            print(f"  ⚠️  Missing file, skipped: {file_path}")
+            self.stats["missing"] += 1
+            return None
+        return digest.hexdigest(), size
+
+    def to_blob(self, file_path: str, content_type: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+        """Make sure the content of file_path is stored as a blob.
+
+        Returns:
+            (content_hash, blob_path, is_duplicate); when is_duplicate the original
+            file must be deleted once the record points at the blob
+        """
+        hashed = self.hash_file(file_path)
+        if not hashed:
+            return None
+        content_hash, size = hashed
+        blob_path = self.storage.generate_file_path(StorageType.BLOB, "", content_hash, "")
+
+        existing = self.repository.get(content_hash)
+        duplicate = content_hash in self.seen_hashes or bool(existing and existing.has_file)
+        self.seen_hashes.add(content_hash)
+        self.stats["files"] += 1
+        if duplicate:
+            self.stats["duplicates"] += 1
+            self.stats["bytes_saved"] += size
+
+        if self.dry_run or duplicate:
+            return content_hash, blob_path, duplicate
+
+        self.storage.move_file(file_path, blob_path)
+        blob = StoredBlob(content_hash=content_hash, storage_path=blob_path, size=size, content_type=content_type)
+        if not self.repository.create_if_absent(blob):
+            self.repository.attach_file(content_hash, blob_path, size, content_type)
+        return content_hash, blob_path, False
+
+    def finish(self, file_path: str, content_hash: str, owner_type: BlobOwnerType, owner_id: str,
+               duplicate: bool) -> None:
+        """Reference the blob from the record, then drop the now redundant copy"""
+        self.repository.add_reference(content_hash, owner_type, owner_id)
+        if duplicate:
+            self.storage.delete_file(file_path)
+
+
+def dedupe_file_attachments(container: Container, deduplicator: BlobDeduplicator, batch_size: int) -> None:
+    """Point candidate file attachments at blobs"""
+    print("\n📎 Candidate file attachments")
+    database = container.database()
+    last_id = ""
+    while True:
+        with database.get_session() as session:
+            rows = session.query(
+                FileAttachmentModel.id, FileAttachmentModel.file_path, FileAttachmentModel.content_type
+            ).filter(
+                FileAttachmentModel.content_hash.is_(None),
+                FileAttachmentModel.id > last_id
+            ).order_by(FileAttachmentModel.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        for attachment_id, file_path, content_type in rows:
+            last_id = attachment_id
+            result = deduplicator.to_blob(file_path, content_type)
+            if not result or deduplicator.dry_run:
+                continue
+            content_hash, blob_path, duplicate = result
+            with database.get_session() as session:
+                session.execute(
+                    update(FileAttachmentModel)
+                    .where(FileAttachmentModel.id == attachment_id)
+                    .values(
+                        file_path=blob_path,
+                        file_url=deduplicator.storage.get_file_url(blob_path),
+                        content_hash=content_hash
+                    )
+                )
+                session.commit()
+            deduplicator.finish(file_path, content_hash, BlobOwnerType.FILE_ATTACHMENT, attachment_id, duplicate)
+        print(f"  ...{deduplicator.stats['files']} files hashed")
+
+
+def dedupe_company_candidate_resumes(container: Container, deduplicator: BlobDeduplicator, batch_size: int) -> None:
+    """Point company candidate resumes stored by path (not external URLs) at blobs"""
+    print("\n📄 Company candidate resumes")
+    database = container.database()
+    last_id = ""
+    while True:
+        with database.get_session() as session:
+            rows = session.query(
+                CompanyCandidateModel.id, CompanyCandidateModel.resume_url
+            ).filter(
+                CompanyCandidateModel.resume_url.isnot(None),
+                CompanyCandidateModel.resume_url.like("company/%"),
+                CompanyCandidateModel.id > last_id
+            ).order_by(CompanyCandidateModel.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        for company_candidate_id, resume_path in rows:
+            last_id = company_candidate_id
+            result = deduplicator.to_blob(resume_path, None)
+            if not result or deduplicator.dry_run:
+                continue
+            content_hash, blob_path, duplicate = result
+            with database.get_session() as session:
+                session.execute(
+                    update(CompanyCandidateModel)
+                    .where(CompanyCandidateModel.id == company_candidate_id)
+                    .values(resume_url=blob_path)
+                )
+                session.commit()
+            deduplicator.finish(
+                resume_path, content_hash, BlobOwnerType.COMPANY_CANDIDATE_RESUME, company_candidate_id, duplicate
+            )
+        print(f"  ...{deduplicator.stats['files']} files hashed")
+
+
+def collect_garbage(container: Container) -> None:
+    """Delete blobs nothing references anymore"""
+    blob_store = container.blob_store()
+    total = 0
+    while deleted := blob_store.collect_garbage():
+        total += deleted
+    print(f"\n🗑️  Deleted {total} unreferenced blobs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move existing files into the deduplicated blob store")
+    parser.add_argument("--dry-run", action="store_true", help="Only hash files and report the savings")
+    parser.add_argument("--gc", action="store_true", help="Only delete unreferenced blobs")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    container = Container()
+    if args.gc:
+        collect_garbage(container)
+        return
+
+    deduplicator = BlobDeduplicator(
+        storage=container.storage_service(),
+        repository=StoredBlobRepository(container.database()),
+        dry_run=args.dry_run
+    )
+    dedupe_file_attachments(container, deduplicator, args.batch_size)
+    dedupe_company_candidate_resumes(container, deduplicator, args.batch_size)
+
+    stats = deduplicator.stats
+    print(f"\n✅ {'Would save' if args.dry_run else 'Saved'} {stats['bytes_saved'] / 1024 / 1024:.1f}MB: "
+          f"{stats['duplicates']} duplicates out of {stats['files']} files ({stats['missing']} missing)")
+    if not args.dry_run:
+        collect_garbage(container)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic large tenant for performance testing
+
+Creates, per company:
+- 1 Company with admin user, roles, pages and phases/workflows (via the same commands as seed_dev_data.py)
+- N Job positions (published + public, spread over the job position workflow stages)
+- N Candidates (with their users), company-candidate relationships and applications
+- Interviews for a fraction of the applications
+- Job position comments (some pending review) and candidate comments
+- Position-stage assignments for the admin user, so the task inbox has work
+
+Entities are bulk-loaded with multi-row INSERTs through SQLAlchemy Core (no domain
+entities, no events), in batches of --batch-size rows, so 1M candidates load in minutes.
+
+Usage:
+    python scripts/generate_large_tenant.py --candidates 1000000
+    python scripts/generate_large_tenant.py --companies 3 --candidates 50000 --positions 100
+
+Login for company N: admin@bench-N.example.com / Admin123!
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+# Size the connection pool for a one-off script, not for an API worker
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from faker import Faker
+from sqlalchemy import insert, text
+
+from core.containers import Container
+from core.database import engine
+from src.auth_bc.user.application.commands.create_user_command import CreateUserCommand
+from src.auth_bc.user.domain.services.password_service import PasswordService
+from src.auth_bc.user.domain.value_objects import UserId
+from src.auth_bc.user.infrastructure.models.user_model import UserModel
+from src.candidate_bc.candidate.domain.enums.candidate_enums import CandidateStatusEnum, CandidateTypeEnum
+from src.candidate_bc.candidate.infrastructure.models.candidate_model import CandidateModel
+from src.company_bc.candidate_application.domain.enums.application_status import ApplicationStatusEnum
+from src.company_bc.candidate_application.domain.enums.task_status import TaskStatus
+from src.company_bc.candidate_application.infrastructure.models.candidate_application_model import \
+    CandidateApplicationModel
+from src.company_bc.company.application.commands.add_company_user_command import AddCompanyUserCommand
+from src.company_bc.company.application.commands.create_company_command import CreateCompanyCommand
+from src.company_bc.company.application.commands.initialize_onboarding_command import InitializeOnboardingCommand
+from src.company_bc.company.domain.enums.company_user_role import CompanyUserRole
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.company.domain.value_objects.company_user_id import CompanyUserId
+from src.company_bc.company_candidate.infrastructure.models.candidate_comment_model import CandidateCommentModel
+from src.company_bc.company_candidate.infrastructure.models.company_candidate_model import CompanyCandidateModel
+from src.company_bc.job_position.infrastructure.models.job_position_comment_model import JobPositionCommentModel
+from src.company_bc.job_position.infrastructure.models.job_position_model import JobPositionModel
+from src.company_bc.position_stage_assignment.infrastructure.models.position_stage_assignment_model import \
+    PositionStageAssignmentModel
+from src.framework.application.command_bus import CommandBus
+from src.framework.application.query_bus import QueryBus
+from src.framework.domain.enums.job_category import JobCategoryEnum
+from src.interview_bc.interview.Infrastructure.models.interview_model import InterviewModel
+from src.shared_bc.customization.phase.application.commands.initialize_company_phases_command import \
+    InitializeCompanyPhasesCommand
+
+ADMIN_PASSWORD = "Admin123!"
+CANDIDATE_PASSWORD = "Candidate123!"
+
+# Name/city pools are generated once: Faker is far too slow to call per row at this volume
+POOL_SIZE = 2000
+
+
+class Pools:
+    """Pre-generated realistic values sampled for every row"""
+
+    def __init__(self, seed: int):
+        fake = Faker(["es_ES", "en_US"])
+        Faker.seed(seed)
+        self.first_names = [fake.first_name() for _ in range(POOL_SIZE)]
+        self.last_names = [fake.last_name() for _ in range(POOL_SIZE)]
+        self.cities = [(fake.city(), fake.country()) for _ in range(POOL_SIZE // 10)]
+        self.job_titles = [fake.job() for _ in range(POOL_SIZE // 4)]
+        self.sentences = [fake.sentence(nb_words=12) for _ in range(POOL_SIZE // 4)]
+        self.skills = ["python", "java", "sql", "react", "aws", "docker", "kubernetes", "go", "excel", "sales",
+                       "negotiation", "figma", "marketing", "seo", "accounting", "leadership"]
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def batched(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_insert(model: Any, rows: Iterator[Dict[str, Any]], batch_size: int) -> int:
+    """Insert rows with multi-row INSERT statements, committing every batch"""
+    start = time.perf_counter()
+    total = 0
+    statement = insert(model.__table__)
+    for batch in batched(rows, batch_size):
+        with engine.begin() as conn:
+            conn.execute(statement, batch)
+        total += len(batch)
+        elapsed = time.perf_counter() - start
+        print(f"\r    {model.__tablename__}: {total:,} rows ({total / elapsed:,.0f} rows/s)", end="", flush=True)
+    if total:
+        print()
+    return total
+
+
+# ==================== TENANT BOOTSTRAP ====================
+
+def create_company(container: Container, index: int) -> Tuple[str, str, str]:
+    """Create the company, its admin and default configuration through the command bus"""
+    command_bus = container.command_bus()
+    company_id = CompanyId.generate()
+    user_id = UserId.generate()
+    company_user_id = CompanyUserId.generate()
+
+    command_bus.dispatch(CreateCompanyCommand(
+        id=company_id.value,
+        name=f"Bench Company {index}",
+        domain=f"bench-{index}.example.com",
+        settings={"industry": "Technology", "size": "1000+"}
+    ))
+    command_bus.dispatch(CreateUserCommand(
+        id=user_id,
+        email=f"admin@bench-{index}.example.com",
+        password=ADMIN_PASSWORD,
+        is_active=True
+    ))
+    command_bus.dispatch(AddCompanyUserCommand(
+        id=company_user_id,
+        company_id=company_id,
+        user_id=user_id,
+        role=CompanyUserRole.ADMIN,
+        permissions={}
+    ))
+    command_bus.dispatch(InitializeOnboardingCommand(company_id=company_id, create_roles=True, create_pages=True))
+    command_bus.dispatch(InitializeCompanyPhasesCommand(company_id=company_id))
+    return company_id.value, user_id.value, company_user_id.value
+
+
+def load_workflows(company_id: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the company workflows by type ('PO' / 'CA') with their stages ordered"""
+    with engine.connect() as conn:
+        workflows = conn.execute(
+            text("SELECT id, phase_id, workflow_type, is_default FROM workflows WHERE company_id = :company_id"),
+            {"company_id": company_id}
+        ).mappings().all()
+        stages = conn.execute(
+            text(
+                'SELECT id, workflow_id, stage_type FROM workflow_stages '
+                'WHERE workflow_id IN (SELECT id FROM workflows WHERE company_id = :company_id) '
+                'ORDER BY workflow_id, "order"'
+            ),
+            {"company_id": company_id}
+        ).mappings().all()
+
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for workflow in workflows:
+        workflow_stages = [dict(stage) for stage in stages if stage["workflow_id"] == workflow["id"]]
+        if not workflow_stages:
+            continue
+        result.setdefault(workflow["workflow_type"], []).append({**workflow, "stages": workflow_stages})
+    return result
+
+
+# ==================== ROW GENERATORS ====================
+
+def job_position_rows(company_id: str, position_workflow: Dict[str, Any], count: int, pools: Pools,
+                      now: datetime) -> Iterator[Dict[str, Any]]:
+    categories = list(JobCategoryEnum)
+    for i in range(count):
+        title = random.choice(pools.job_titles)
+        stage = random.choice(position_workflow["stages"])
+        yield {
+            "id": new_id(),
+            "company_id": company_id,
+            "title": title,
+            "job_position_workflow_id": position_workflow["id"],
+            "stage_id": stage["id"],
+            "description": " ".join(random.sample(pools.sentences, 8)),
+            "job_category": random.choice(categories),
+            "skills": random.sample(pools.skills, 4),
+            "number_of_openings": random.randint(1, 5),
+            "show_salary": False,
+            "status": "published",
+            "visibility": "public",
+            "public_slug": f"{title.lower().replace(' ', '-').replace('/', '-')[:200]}-{company_id[:8]}-{i}",
+            "application_mode": "short",
+            "custom_fields_values": {"seniority": random.choice(["junior", "mid", "senior"])},
+            "published_at": now - timedelta(days=random.randint(0, 180)),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def candidate_rows(index: int, offset: int, user_ids: List[str], candidate_ids: List[str], pools: Pools,
+                   hashed_password: str, now: datetime) -> Tuple[Iterator[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    categories = list(JobCategoryEnum)
+
+    def users() -> Iterator[Dict[str, Any]]:
+        for i, user_id in enumerate(user_ids, start=offset):
+            yield {
+                "id": user_id,
+                "email": f"candidate{i}@bench-{index}.example.com",
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "subscription_tier": "FREE",
+                "preferred_language": "es",
+                "created_at": now,
+            }
+
+    def candidates() -> Iterator[Dict[str, Any]]:
+        today = now.date()
+        for i, (candidate_id, user_id) in enumerate(zip(candidate_ids, user_ids), start=offset):
+            city, country = random.choice(pools.cities)
+            yield {
+                "id": candidate_id,
+                "name": f"{random.choice(pools.first_names)} {random.choice(pools.last_names)}",
+                "date_of_birth": date(random.randint(1960, 2002), random.randint(1, 12), random.randint(1, 28)),
+                "city": city,
+                "country": country,
+                "phone": f"+34 6{random.randint(10000000, 99999999)}",
+                "email": f"candidate{i}@bench-{index}.example.com",
+                "user_id": user_id,
+                "status": CandidateStatusEnum.COMPLETE,
+                "job_category": random.choice(categories),
+                "candidate_type": CandidateTypeEnum.BASIC,
+                "expected_annual_salary": random.randrange(20000, 120000, 1000),
+                "skills": random.sample(pools.skills, 5),
+                "created_on": today,
+                "updated_on": today,
+                "created_at": now,
+                "updated_at": now,
+            }
+
+    return users(), candidates()
+
+
+def pipeline_rows(company_id: str, company_user_id: str, candidate_ids: List[str], position_ids: List[str],
+                  application_workflow: Dict[str, Any], interview_ratio: float, comment_ratio: float,
+                  pools: Pools, now: datetime) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]],
+                                                        List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Company candidates, applications, interviews and candidate comments for one batch of candidates"""
+    stages = application_workflow["stages"]
+    company_candidates: List[Dict[str, Any]] = []
+    applications: List[Dict[str, Any]] = []
+    interviews: List[Dict[str, Any]] = []
+    comments: List[Dict[str, Any]] = []
+
+    for candidate_id in candidate_ids:
+        stage = random.choice(stages)
+        applied_at = now - timedelta(days=random.randint(0, 365), minutes=random.randint(0, 1440))
+        stage_entered_at = applied_at + timedelta(days=random.randint(0, 20))
+        company_candidate_id = new_id()
+        application_id = new_id()
+        position_id = random.choice(position_ids)
+
+        company_candidates.append({
+            "id": company_candidate_id,
+            "company_id": company_id,
+            "candidate_id": candidate_id,
+            "status": "active",
+            "ownership_status": "company_owned",
+            "created_by_user_id": company_user_id,
+            "workflow_id": application_workflow["id"],
+            "current_stage_id": stage["id"],
+            "phase_id": application_workflow["phase_id"],
+            "invited_at": applied_at,
+            "visibility_settings": {},
+            "tags": random.sample(pools.skills, 2),
+            "priority": random.choice(["LOW", "MEDIUM", "HIGH"]),
+            "source": random.choice(["job_board", "referral", "linkedin", "career_page"]),
+            "created_at": applied_at,
+            "updated_at": stage_entered_at,
+        })
+        applications.append({
+            "id": application_id,
+            "candidate_id": candidate_id,
+            "job_position_id": position_id,
+            "application_status": random.choice([
+                ApplicationStatusEnum.APPLIED, ApplicationStatusEnum.REVIEWING, ApplicationStatusEnum.INTERVIEWED,
+                ApplicationStatusEnum.REJECTED
+            ]),
+            "applied_at": applied_at,
+            "updated_at": stage_entered_at,
+            "current_stage_id": stage["id"],
+            "current_phase_id": application_workflow["phase_id"],
+            "stage_entered_at": stage_entered_at,
+            "stage_deadline": stage_entered_at + timedelta(days=14),
+            "task_status": TaskStatus.PENDING,
+            "wants_cv_help": False,
+        })
+        if random.random() < interview_ratio:
+            finished = random.random() < 0.6
+            interviews.append({
+                "id": new_id(),
+                "candidate_id": candidate_id,
+                "job_position_id": position_id,
+                "application_id": application_id,
+                "workflow_stage_id": stage["id"],
+                "interview_type": "CUSTOM",
+                "interview_mode": "MANUAL",
+                "status": "COMPLETED" if finished else "PENDING",
+                "title": "Technical interview",
+                "scheduled_at": stage_entered_at + timedelta(days=3),
+                "finished_at": stage_entered_at + timedelta(days=3, hours=1) if finished else None,
+                "score": round(random.uniform(30, 100), 1) if finished else None,
+                "created_by": company_user_id,
+                "created_at": stage_entered_at,
+                "updated_at": stage_entered_at,
+            })
+        if random.random() < comment_ratio:
+            comments.append({
+                "id": new_id(),
+                "company_candidate_id": company_candidate_id,
+                "comment": random.choice(pools.sentences),
+                "workflow_id": application_workflow["id"],
+                "stage_id": stage["id"],
+                "created_by_user_id": company_user_id,
+                "review_status": random.choice(["reviewed", "pending"]),
+                "visibility": "private",
+                "created_at": stage_entered_at,
+                "updated_at": stage_entered_at,
+            })
+
+    return company_candidates, applications, interviews, comments
+
+
+def position_comment_rows(position_ids: List[str], company_user_id: str, per_position: int, pools: Pools,
+                          now: datetime) -> Iterator[Dict[str, Any]]:
+    for position_id in position_ids:
+        for _ in range(per_position):
+            yield {
+                "id": new_id(),
+                "job_position_id": position_id,
+                "comment": random.choice(pools.sentences),
+                "created_by_user_id": company_user_id,
+                "review_status": random.choice(["reviewed", "pending"]),
+                "visibility": "shared",
+                "created_at": now,
+                "updated_at": now,
+            }
+
+
+def stage_assignment_rows(position_ids: List[str], application_workflow: Dict[str, Any],
+                          company_user_id: str) -> Iterator[Dict[str, Any]]:
+    for position_id in position_ids:
+        for stage in application_workflow["stages"]:
+            yield {
+                "id": new_id(),
+                "position_id": position_id,
+                "stage_id": stage["id"],
+                "assigned_user_ids": [company_user_id],
+            }
+
+
+# ==================== MAIN ====================
+
+def generate_company(container: Container, index: int, args: argparse.Namespace, pools: Pools,
+                     hashed_password: str) -> None:
+    now = datetime.utcnow()
+    print(f"🏢 Company {index}: bootstrapping via command bus...")
+    company_id, _, company_user_id = create_company(container, index)
+
+    workflows = load_workflows(company_id)
+    position_workflow = workflows["PO"][0]
+    application_workflow = next(
+        (w for w in workflows["CA"] if w["is_default"] and w["phase_id"]), workflows["CA"][0]
+    )
+
+    print("📦 Bulk loading...")
+    positions = list(job_position_rows(company_id, position_workflow, args.positions, pools, now))
+    bulk_insert(JobPositionModel, iter(positions), args.batch_size)
+    position_ids = [p["id"] for p in positions]
+
+    bulk_insert(
+        PositionStageAssignmentModel,
+        stage_assignment_rows(position_ids[:args.assigned_positions], application_workflow, company_user_id),
+        args.batch_size
+    )
+    bulk_insert(
+        JobPositionCommentModel,
+        position_comment_rows(position_ids, company_user_id, args.comments_per_position, pools, now),
+        args.batch_size
+    )
+
+    # Candidates are generated and loaded chunk by chunk to keep memory flat
+    loaded = 0
+    while loaded < args.candidates:
+        chunk = min(args.batch_size * 10, args.candidates - loaded)
+        user_ids = [new_id() for _ in range(chunk)]
+        candidate_ids = [new_id() for _ in range(chunk)]
+        users, candidates = candidate_rows(index, loaded, user_ids, candidate_ids, pools, hashed_password, now)
+        bulk_insert(UserModel, users, args.batch_size)
+        bulk_insert(CandidateModel, candidates, args.batch_size)
+
+        company_candidates, applications, interviews, comments = pipeline_rows(
+            company_id, company_user_id, candidate_ids, position_ids, application_workflow,
+            args.interview_ratio, args.comment_ratio, pools, now
+        )
+        bulk_insert(CompanyCandidateModel, iter(company_candidates), args.batch_size)
+        bulk_insert(CandidateApplicationModel, iter(applications), args.batch_size)
+        bulk_insert(InterviewModel, iter(interviews), args.batch_size)
+        bulk_insert(CandidateCommentModel, iter(comments), args.batch_size)
+        loaded += chunk
+        print(f"  ✓ {loaded:,}/{args.candidates:,} candidates")
+
+    print(f"  ✓ Company {index} ready: admin@bench-{index}.example.com / {ADMIN_PASSWORD}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=1)
+    parser.add_argument("--candidates", type=int, default=1_000_000, help="Candidates per company")
+    parser.add_argument("--positions", type=int, default=200, help="Job positions per company")
+    parser.add_argument("--assigned-positions", type=int, default=20,
+                        help="Positions whose stages are assigned to the admin (task inbox)")
+    parser.add_argument("--interview-ratio", type=float, default=0.3)
+    parser.add_argument("--comment-ratio", type=float, default=0.2, help="Candidate comments per candidate")
+    parser.add_argument("--comments-per-position", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--start-index", type=int, default=1, help="Index of the first company (bench-N)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pools = Pools(args.seed)
+    # One hash shared by every synthetic candidate: bcrypt per row would dominate the load time
+    hashed_password = PasswordService.hash_password(CANDIDATE_PASSWORD)
+
+    container = Container()
+    Container._command_bus_instance = CommandBus(container=container)
+    Container._query_bus_instance = QueryBus(container=container)
+
+    start = time.perf_counter()
+    for index in range(args.start_index, args.start_index + args.companies):
+        generate_company(container, index, args, pools, hashed_password)
+    print(f"✅ Done in {time.perf_counter() - start:,.0f}s")
+
+
+if __name__ == "__main__":
+    main()
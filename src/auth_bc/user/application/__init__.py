@@ -1,6 +1,8 @@
 """User application module - exports queries and commands"""
 
 # Commands
+from .commands.create_pdf_resume_asset_command import CreatePdfResumeAssetCommand, \
+    CreatePdfResumeAssetCommandHandler
 from .commands.reset_password_with_token_command import ResetPasswordWithTokenCommand, \
     ResetPasswordWithTokenCommandHandler
 from .commands.update_user_language_command import UpdateUserLanguageCommand, UpdateUserLanguageCommandHandler
@@ -19,6 +21,8 @@ __all__ = [
     "GetUserByEmailQuery",
     "GetUserByEmailQueryHandler",
     # Commands
+    "CreatePdfResumeAssetCommand",
+    "CreatePdfResumeAssetCommandHandler",
     "ResetPasswordWithTokenCommand",
     "ResetPasswordWithTokenCommandHandler",
     "UpdateUserPasswordCommand",
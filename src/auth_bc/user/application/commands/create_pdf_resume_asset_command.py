@@ -0,0 +1,73 @@
+import logging
+from dataclasses import dataclass
+
+from src.auth_bc.user.domain.entities.user_asset import UserAsset
+from src.auth_bc.user.domain.enums.asset_enums import AssetTypeEnum, ProcessingStatusEnum
+from src.auth_bc.user.domain.repositories.user_asset_repository_interface import UserAssetRepositoryInterface
+from src.auth_bc.user.domain.value_objects.UserId import UserId
+from src.auth_bc.user.domain.value_objects.user_asset_id import UserAssetId
+from src.auth_bc.user.infrastructure.services.pdf_processing_service import PDFProcessingService
+from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
+from src.framework.domain.infrastructure.storage_service_interface import StorageServiceInterface, UploadedFile
+
+
+@dataclass
+class CreatePdfResumeAssetCommand(Command):
+    """Command to register a PDF resume already stored as a blob as a user asset"""
+    id: UserAssetId
+    user_id: UserId
+    uploaded_file: UploadedFile
+    file_name: str
+    source: str = "direct_upload"
+
+
+class CreatePdfResumeAssetCommandHandler(CommandHandler[CreatePdfResumeAssetCommand]):
+    """Handler to create a PDF resume asset, extracting its text once per distinct file"""
+
+    def __init__(
+            self,
+            user_asset_repository: UserAssetRepositoryInterface,
+            storage_service: StorageServiceInterface,
+            pdf_processing_service: PDFProcessingService,
+            blob_store: BlobStoreInterface
+    ):
+        self.user_asset_repository = user_asset_repository
+        self.storage_service = storage_service
+        self.pdf_processing_service = pdf_processing_service
+        self.blob_store = blob_store
+        self.logger = logging.getLogger(__name__)
+
+    def execute(self, command: CreatePdfResumeAssetCommand) -> None:
+        """Execute the create PDF resume asset command"""
+        uploaded_file = command.uploaded_file
+        if not uploaded_file.content_hash:
+            raise ValueError("Uploaded file is not stored as a blob")
+
+        user_asset = UserAsset.create(
+            id=command.id,
+            user_id=command.user_id,
+            asset_type=AssetTypeEnum.PDF_RESUME,
+            content={"original_filename": command.file_name, "source": command.source},
+            file_name=command.file_name,
+            file_size=uploaded_file.file_size,
+            content_type=uploaded_file.content_type,
+            content_hash=uploaded_file.content_hash
+        )
+
+        # Reuse the text of an identical PDF (same CV uploaded before)
+        blob = self.blob_store.get_blob(uploaded_file.content_hash)
+        if blob and blob.text_content is not None:
+            user_asset.set_extracted_text(blob.text_content)
+            for key, value in blob.metadata.items():
+                user_asset.add_metadata(key, value)
+        else:
+            pdf_bytes = b"".join(self.storage_service.iter_file(uploaded_file.file_path))
+            extraction_result = self.pdf_processing_service.extract_text_from_pdf(pdf_bytes)
+            if extraction_result["status"] == ProcessingStatusEnum.COMPLETED:
+                user_asset.set_extracted_text(extraction_result["text"])
+            else:
+                self.logger.warning(f"PDF extraction failed for asset {command.id}: {extraction_result['error']}")
+                user_asset.set_processing_status(ProcessingStatusEnum.FAILED, extraction_result["error"])
+
+        self.user_asset_repository.save(user_asset)
@@ -37,6 +37,12 @@ class AuthenticateUserQueryHandler(QueryHandler[AuthenticateUserQuery, Optional[
         if not PasswordService.verify_password(query.password, user.hashed_password):
             return None
 
+        # Upgrade hashes made with an outdated cost while the plain password is at hand
+        if PasswordService.needs_rehash(user.hashed_password):
+            self.user_repository.update(user.id, {
+                "hashed_password": PasswordService.hash_password(query.password)
+            })
+
         # Create access token
         access_token = TokenService.create_access_token(data={"sub": user.email})
 
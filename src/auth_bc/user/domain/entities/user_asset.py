@@ -24,6 +24,7 @@ class UserAsset:
     processing_error: Optional[str] = None
     text_content: Optional[str] = None
     file_metadata: Optional[Dict[str, Any]] = None
+    content_hash: Optional[str] = None  # SHA-256 of the file; text and extracted data live on the shared blob
 
     def __post_init__(self) -> None:
         """Initialize defaults after construction"""
@@ -239,7 +240,8 @@ class UserAsset:
             content: Dict[str, Any],
             file_name: Optional[str] = None,
             file_size: Optional[int] = None,
-            content_type: Optional[str] = None
+            content_type: Optional[str] = None,
+            content_hash: Optional[str] = None
     ) -> 'UserAsset':
         """Factory method para crear un nuevo asset"""
         return UserAsset(
@@ -255,5 +257,6 @@ class UserAsset:
             processing_status=ProcessingStatusEnum.PENDING,
             processing_error=None,
             text_content=None,
-            file_metadata={}
+            file_metadata={},
+            content_hash=content_hash
         )
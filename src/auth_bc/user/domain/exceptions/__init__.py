@@ -1,3 +1,3 @@
-from .user_exceptions import UserException, EmailAlreadyExistException, UserNotFoundError
+from .user_exceptions import UserException, EmailAlreadyExistException, UserNotFoundError, PasswordHashingBusyError
 
-__all__ = ["UserException", "EmailAlreadyExistException", "UserNotFoundError"]
+__all__ = ["UserException", "EmailAlreadyExistException", "UserNotFoundError", "PasswordHashingBusyError"]
@@ -30,3 +30,8 @@ class UserNotFoundError(UserException):
     ):
         message = f"User not found: {user_id}"
         super().__init__(message, **kwargs)
+
+
+class PasswordHashingBusyError(UserException):
+    """Raised when no password hashing slot frees up in time; callers should retry shortly"""
+    pass
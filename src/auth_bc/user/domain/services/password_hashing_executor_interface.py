@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class PasswordHashingExecutorInterface(ABC):
+    """Runs the CPU-bound bcrypt calls of PasswordService"""
+
+    @abstractmethod
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) and return its result.
+
+        fn is a module-level function, so implementations may send it to another process.
+
+        Raises:
+            PasswordHashingBusyError: If the executor is saturated
+        """
+        pass
+
+
+class InlinePasswordHashingExecutor(PasswordHashingExecutorInterface):
+    """Runs hashing in the calling thread (tests, scripts, workers)"""
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return fn(*args)
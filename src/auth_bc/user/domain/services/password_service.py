@@ -1,23 +1,62 @@
 import bcrypt
 
+from core.config import settings
+from src.auth_bc.user.domain.services.password_hashing_executor_interface import (
+    InlinePasswordHashingExecutor,
+    PasswordHashingExecutorInterface,
+)
+
+
+def _hash_password(plain_password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(plain_password, bcrypt.gensalt(rounds))
+
+
+def _check_password(plain_password: bytes, hashed_password: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(plain_password, hashed_password)
+    except ValueError:
+        return False
+
 
 class PasswordService:
-    """Domain service for password operations"""
+    """Domain service for password operations
+
+    bcrypt runs in the configured executor: inline by default, the password
+    hashing pool in the API (see set_executor). Calls raise
+    PasswordHashingBusyError when the executor stays saturated.
+    """
+
+    _executor: PasswordHashingExecutorInterface = InlinePasswordHashingExecutor()
+
+    @classmethod
+    def set_executor(cls, executor: PasswordHashingExecutorInterface) -> None:
+        """Set the executor bcrypt calls run in"""
+        cls._executor = executor
 
     @classmethod
     def hash_password(cls, plain_password: str) -> str:
         """Hash a plain password using bcrypt"""
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
+        hashed_password = cls._executor.run(
+            _hash_password, plain_password.encode('utf-8'), settings.BCRYPT_ROUNDS
+        )
         return hashed_password.decode('utf-8')
 
     @classmethod
     def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against a bcrypt hashed password"""
-        try:
-            return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-        except Exception:
+        if not hashed_password:
             return False
+        return cls._executor.run(
+            _check_password, plain_password.encode('utf-8'), hashed_password.encode('utf-8')
+        )
+
+    @classmethod
+    def needs_rehash(cls, hashed_password: str) -> bool:
+        """Whether a hash was made with a different cost than the configured one"""
+        parts = hashed_password.split('$')  # $2b$<cost>$<salt+hash>
+        if len(parts) != 4 or not parts[2].isdigit():
+            return True
+        return int(parts[2]) != settings.BCRYPT_ROUNDS
 
     @classmethod
     def generate_random_password(cls, length: int = 12) -> str:
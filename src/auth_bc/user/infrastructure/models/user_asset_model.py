@@ -33,6 +33,7 @@ class UserAssetModel(Base):
     processing_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     text_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     file_metadata: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
 
     # Relationships - DISABLED
     # user: Mapped["UserModel"] = relationship("UserModel", back_populates="assets")
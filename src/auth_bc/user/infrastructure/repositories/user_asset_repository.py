@@ -1,6 +1,6 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from core.database import DatabaseInterface
 from src.auth_bc.user.domain.entities.user_asset import UserAsset
@@ -9,7 +9,13 @@ from src.auth_bc.user.domain.repositories.user_asset_repository_interface import
 from src.auth_bc.user.domain.value_objects.UserId import UserId
 from src.auth_bc.user.domain.value_objects.user_asset_id import UserAssetId
 from src.auth_bc.user.infrastructure.models.user_asset_model import UserAssetModel
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.infrastructure.models.stored_blob_model import StoredBlobModel
 from src.framework.infrastructure.repositories.base import BaseRepository
+from src.framework.infrastructure.repositories.stored_blob_repository import StoredBlobRepository
+
+# file_metadata keys derived from the file itself, stored once on the shared blob
+SHARED_METADATA_KEYS = ("extracted_data",)
 
 
 class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
@@ -18,9 +24,16 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
     def __init__(self, database: DatabaseInterface):
         self.database = database
         self.base_repo = BaseRepository(database, UserAssetModel)
+        self.blob_repo = StoredBlobRepository(database)
 
-    def _to_domain(self, model: UserAssetModel) -> UserAsset:
+    def _to_domain(
+            self,
+            model: UserAssetModel,
+            blob_text: Optional[str] = None,
+            blob_metadata: Optional[Dict[str, Any]] = None
+    ) -> UserAsset:
         """Convierte modelo de SQLAlchemy a entidad de dominio"""
+        file_metadata = {**(blob_metadata or {}), **(model.file_metadata or {})}
         return UserAsset(
             id=UserAssetId(model.id),
             user_id=UserId(model.user_id),
@@ -33,8 +46,9 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
             content_type=model.content_type,
             processing_status=ProcessingStatusEnum(model.processing_status),
             processing_error=model.processing_error,
-            text_content=model.text_content,
-            file_metadata=model.file_metadata or {}
+            text_content=model.text_content if model.text_content is not None else blob_text,
+            file_metadata=file_metadata,
+            content_hash=model.content_hash
         )
 
     def _to_model(self, entity: UserAsset) -> UserAssetModel:
@@ -51,12 +65,41 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
             content_type=entity.content_type,
             processing_status=entity.processing_status,
             processing_error=entity.processing_error,
-            text_content=entity.text_content,
-            file_metadata=entity.file_metadata or {}
+            text_content=None if entity.content_hash else entity.text_content,
+            file_metadata=self._own_metadata(entity),
+            content_hash=entity.content_hash
         )
 
+    @staticmethod
+    def _own_metadata(entity: UserAsset) -> Dict[str, Any]:
+        """Metadata stored on the asset row; shared keys go to the blob when there is one"""
+        metadata = entity.file_metadata or {}
+        if not entity.content_hash:
+            return metadata
+        return {k: v for k, v in metadata.items() if k not in SHARED_METADATA_KEYS}
+
+    def _share_with_blob(self, user_asset: UserAsset) -> None:
+        """Store text and shared metadata once on the blob for this file content"""
+        assert user_asset.content_hash is not None
+        if user_asset.text_content is None:
+            return
+        shared = {k: v for k, v in (user_asset.file_metadata or {}).items() if k in SHARED_METADATA_KEYS}
+        blob = self.blob_repo.get(user_asset.content_hash)
+        if blob is None or blob.text_content != user_asset.text_content or blob.metadata != shared:
+            self.blob_repo.save_text(user_asset.content_hash, user_asset.text_content, shared)
+
+    def _query_with_blob(self, session: Session) -> Query[Tuple[UserAssetModel, Optional[str], Any]]:
+        """Assets joined with the text and metadata of their blob, if any"""
+        query = session.query(
+            UserAssetModel, StoredBlobModel.text_content, StoredBlobModel.blob_metadata
+        ).outerjoin(StoredBlobModel, StoredBlobModel.content_hash == UserAssetModel.content_hash)
+        return cast(Query[Tuple[UserAssetModel, Optional[str], Any]], query)
+
     def save(self, user_asset: UserAsset) -> None:
         """Guardar un asset de usuario"""
+        if user_asset.content_hash:
+            self._share_with_blob(user_asset)
+
         session: Session = self.database.get_session()
         try:
             existing_model = session.query(UserAssetModel).filter_by(
@@ -74,8 +117,9 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
                 existing_model.content_type = user_asset.content_type
                 existing_model.processing_status = user_asset.processing_status
                 existing_model.processing_error = user_asset.processing_error
-                existing_model.text_content = user_asset.text_content
-                existing_model.file_metadata = user_asset.file_metadata or {}
+                existing_model.text_content = None if user_asset.content_hash else user_asset.text_content
+                existing_model.file_metadata = self._own_metadata(user_asset)
+                existing_model.content_hash = user_asset.content_hash
             else:
                 # Create new
                 model = self._to_model(user_asset)
@@ -88,19 +132,28 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
         finally:
             session.close()
 
+        if user_asset.content_hash:
+            self.blob_repo.add_reference(user_asset.content_hash, BlobOwnerType.USER_ASSET, user_asset.id.value)
+
     def get_by_id(self, asset_id: UserAssetId) -> Optional[UserAsset]:
         """Obtener asset por ID"""
-        model = self.base_repo.get_by_id(asset_id)
-        return self._to_domain(model) if model else None
+        session: Session = self.database.get_session()
+        try:
+            row = self._query_with_blob(session).filter(
+                UserAssetModel.id == asset_id.value
+            ).first()
+            return self._to_domain(*row) if row else None
+        finally:
+            session.close()
 
     def get_by_user_id(self, user_id: UserId) -> List[UserAsset]:
         """Obtener todos los assets de un usuario"""
         session: Session = self.database.get_session()
         try:
-            models = session.query(UserAssetModel).filter_by(
-                user_id=user_id.value
+            rows = self._query_with_blob(session).filter(
+                UserAssetModel.user_id == user_id.value
             ).all()
-            return [self._to_domain(model) for model in models]
+            return [self._to_domain(*row) for row in rows]
         finally:
             session.close()
 
@@ -108,11 +161,11 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
         """Obtener assets de un usuario por tipo"""
         session: Session = self.database.get_session()
         try:
-            models = session.query(UserAssetModel).filter_by(
-                user_id=user_id.value,
-                asset_type=asset_type
+            rows = self._query_with_blob(session).filter(
+                UserAssetModel.user_id == user_id.value,
+                UserAssetModel.asset_type == asset_type
             ).all()
-            return [self._to_domain(model) for model in models]
+            return [self._to_domain(*row) for row in rows]
         finally:
             session.close()
 
@@ -124,8 +177,11 @@ class SQLAlchemyUserAssetRepository(UserAssetRepositoryInterface):
                 id=asset_id.value
             ).first()
             if model:
+                content_hash = model.content_hash
                 session.delete(model)
                 session.commit()
+                if content_hash:
+                    self.blob_repo.release_reference(BlobOwnerType.USER_ASSET, asset_id.value)
         except Exception as e:
             session.rollback()
             raise e
@@ -0,0 +1,89 @@
+"""Bounded process pool for password hashing.
+
+bcrypt burns 100-250ms of CPU per call at the default cost; running it in the
+request worker stalls every other request on that worker during login bursts.
+Hashes run in a small process pool instead. At most max_pending calls are in
+flight per API process; callers beyond that wait up to queue_timeout_seconds
+for a slot and then get PasswordHashingBusyError (served as 503) instead of
+piling up.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from core.config import settings
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
+from src.auth_bc.user.domain.services.password_hashing_executor_interface import PasswordHashingExecutorInterface
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashingPool(PasswordHashingExecutorInterface):
+    """Runs CPU-bound hashing calls in worker processes with a concurrency limit."""
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout_seconds: float):
+        """Initialize the pool.
+
+        Args:
+            workers: Worker processes; 0 runs hashing inline (tests, scripts)
+            max_pending: Calls running or queued in the pool at once
+            queue_timeout_seconds: How long a call waits for a slot before failing
+        """
+        self._workers = workers
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) in the pool and wait for its result.
+
+        fn must be a module-level function so it can be sent to a worker process.
+
+        Raises:
+            PasswordHashingBusyError: If every slot stays busy for the queue timeout
+        """
+        if self._workers <= 0:
+            return fn(*args)
+
+        if not self._slots.acquire(timeout=self._queue_timeout_seconds):
+            raise PasswordHashingBusyError("Too many concurrent password operations, retry shortly")
+        try:
+            try:
+                return self._get_executor().submit(fn, *args).result()
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed): start a fresh pool and retry once
+                logger.warning("Password hashing pool broken, restarting it")
+                self._reset_executor()
+                return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hashing_pool = PasswordHashingPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout_seconds=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+)
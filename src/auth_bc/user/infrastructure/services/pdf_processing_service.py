@@ -1,16 +1,13 @@
 import io
 import logging
+from importlib.util import find_spec
 from typing import Dict, Any
 
-try:
-    import pypdf
-
-    PYPDF_AVAILABLE = True
-except ImportError:
-    PYPDF_AVAILABLE = False
-
 from src.auth_bc.user.domain.enums.asset_enums import ProcessingStatusEnum
 
+# pypdf is imported on first use: most API processes never read a PDF
+PYPDF_AVAILABLE = find_spec("pypdf") is not None
+
 
 class PDFProcessingService:
     """Servicio para procesar archivos PDF"""
@@ -38,6 +35,7 @@ class PDFProcessingService:
             pdf_file = io.BytesIO(pdf_bytes)
 
             # Create PDF reader
+            import pypdf
             pdf_reader = pypdf.PdfReader(pdf_file)
 
             # Get metadata
@@ -121,6 +119,7 @@ class PDFProcessingService:
 
         try:
             pdf_file = io.BytesIO(pdf_bytes)
+            import pypdf
             pdf_reader = pypdf.PdfReader(pdf_file)
 
             # Try to read metadata and first page to ensure it's valid
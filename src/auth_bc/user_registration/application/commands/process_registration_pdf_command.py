@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
@@ -7,6 +8,7 @@ from src.auth_bc.user_registration.domain.enums import ProcessingStatusEnum
 from src.auth_bc.user_registration.domain.repositories import UserRegistrationRepositoryInterface
 from src.auth_bc.user_registration.domain.value_objects import UserRegistrationId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
 from src.framework.domain.interfaces.ai_service_interface import AIServiceInterface
 
 
@@ -24,11 +26,13 @@ class ProcessRegistrationPdfCommandHandler(CommandHandler[ProcessRegistrationPdf
             self,
             user_registration_repository: UserRegistrationRepositoryInterface,
             pdf_processing_service: PDFProcessingService,
-            ai_service: AIServiceInterface
+            ai_service: AIServiceInterface,
+            blob_store: BlobStoreInterface
     ):
         self.user_registration_repository = user_registration_repository
         self.pdf_processing_service = pdf_processing_service
         self.ai_service = ai_service
+        self.blob_store = blob_store
         self.logger = logging.getLogger(__name__)
 
     def execute(self, command: ProcessRegistrationPdfCommand) -> None:
@@ -46,14 +50,23 @@ class ProcessRegistrationPdfCommandHandler(CommandHandler[ProcessRegistrationPdf
             registration.set_processing_status(ProcessingStatusEnum.PROCESSING)
             self.user_registration_repository.update(registration)
 
-            # 3. Validate PDF
+            # 3. Reuse the extraction of an identical PDF (same CV sent to several companies)
+            content_hash = hashlib.sha256(command.pdf_bytes).hexdigest()
+            blob = self.blob_store.get_blob(content_hash)
+            if blob and blob.text_content is not None and "extracted_data" in blob.metadata:
+                registration.set_extracted_content(blob.text_content, blob.metadata["extracted_data"], content_hash)
+                self.user_registration_repository.update(registration)
+                self.logger.info(f"Reused extracted content of blob {content_hash} for registration {registration_id}")
+                return
+
+            # 4. Validate PDF
             if not self.pdf_processing_service.validate_pdf_file(command.pdf_bytes):
                 self.logger.warning(f"Invalid PDF file for registration {registration_id}")
                 registration.set_processing_status(ProcessingStatusEnum.FAILED)
                 self.user_registration_repository.update(registration)
                 return
 
-            # 4. Extract text from PDF
+            # 5. Extract text from PDF
             extraction_result = self.pdf_processing_service.extract_text_from_pdf(command.pdf_bytes)
 
             if extraction_result["status"] != "completed":
@@ -64,11 +77,12 @@ class ProcessRegistrationPdfCommandHandler(CommandHandler[ProcessRegistrationPdf
 
             text_content = extraction_result["text"]
 
-            # 5. Run AI analysis to extract structured data
+            # 6. Run AI analysis to extract structured data
             extracted_data = self._extract_structured_data(text_content)
 
-            # 6. Update registration with extracted content
-            registration.set_extracted_content(text_content, extracted_data)
+            # 7. Update registration with extracted content, kept once per distinct PDF
+            self.blob_store.save_text(content_hash, text_content, {"extracted_data": extracted_data})
+            registration.set_extracted_content(text_content, extracted_data, content_hash)
             self.user_registration_repository.update(registration)
 
             self.logger.info(f"PDF processing completed for registration {registration_id}")
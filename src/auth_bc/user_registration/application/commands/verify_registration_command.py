@@ -273,7 +273,8 @@ class VerifyRegistrationCommandHandler(CommandHandler[VerifyRegistrationCommand]
                 content=content_dict,
                 file_name=registration.file_name,
                 file_size=registration.file_size,
-                content_type=registration.content_type or "application/pdf"
+                content_type=registration.content_type or "application/pdf",
+                content_hash=registration.content_hash
             )
 
             # Copy extracted text
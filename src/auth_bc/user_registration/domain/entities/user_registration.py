@@ -29,6 +29,7 @@ class UserRegistration:
     file_name: Optional[str] = None
     file_size: Optional[int] = None
     content_type: Optional[str] = None
+    content_hash: Optional[str] = None  # SHA-256 of the PDF, shared with the user asset
 
     # Extracted content
     text_content: Optional[str] = None
@@ -68,8 +69,15 @@ class UserRegistration:
         self.processing_status = status
         self.updated_at = datetime.utcnow()
 
-    def set_extracted_content(self, text_content: str, extracted_data: Dict[str, Any]) -> None:
+    def set_extracted_content(
+            self,
+            text_content: str,
+            extracted_data: Dict[str, Any],
+            content_hash: Optional[str] = None
+    ) -> None:
         """Set extracted PDF content"""
+        if content_hash:
+            self.content_hash = content_hash
         self.text_content = text_content
         self.extracted_data = extracted_data
         self.processing_status = ProcessingStatusEnum.COMPLETED
@@ -144,6 +152,7 @@ class UserRegistration:
             file_name: Optional[str] = None,
             file_size: Optional[int] = None,
             content_type: Optional[str] = None,
+            content_hash: Optional[str] = None,
             text_content: Optional[str] = None,
             extracted_data: Optional[Dict[str, Any]] = None,
             wants_cv_help: bool = False
@@ -164,6 +173,7 @@ class UserRegistration:
             file_name=file_name,
             file_size=file_size,
             content_type=content_type,
+            content_hash=content_hash,
             text_content=text_content,
             extracted_data=extracted_data,
             wants_cv_help=wants_cv_help
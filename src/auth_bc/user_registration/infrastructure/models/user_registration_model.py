@@ -41,6 +41,7 @@ class UserRegistrationModel(Base):
     file_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     content_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Extracted content
     text_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -129,6 +129,7 @@ class UserRegistrationRepository(UserRegistrationRepositoryInterface):
             file_name=model.file_name,
             file_size=model.file_size,
             content_type=model.content_type,
+            content_hash=model.content_hash,
             text_content=model.text_content,
             extracted_data=model.extracted_data,
             wants_cv_help=model.wants_cv_help
@@ -151,6 +152,7 @@ class UserRegistrationRepository(UserRegistrationRepositoryInterface):
             file_name=entity.file_name,
             file_size=entity.file_size,
             content_type=entity.content_type,
+            content_hash=entity.content_hash,
             text_content=entity.text_content,
             extracted_data=entity.extracted_data,
             wants_cv_help=entity.wants_cv_help
@@ -170,6 +172,7 @@ class UserRegistrationRepository(UserRegistrationRepositoryInterface):
         existing.file_name = new.file_name
         existing.file_size = new.file_size
         existing.content_type = new.content_type
+        existing.content_hash = new.content_hash
         existing.text_content = new.text_content
         existing.extracted_data = new.extracted_data
         existing.wants_cv_help = new.wants_cv_help
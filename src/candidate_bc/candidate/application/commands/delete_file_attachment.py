@@ -5,6 +5,8 @@ from src.candidate_bc.candidate.domain.repositories.file_attachment_repository_i
 from src.candidate_bc.candidate.domain.value_objects.file_attachment_id import FileAttachmentId
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
 from src.framework.domain.infrastructure.storage_service_interface import StorageServiceInterface
 
 
@@ -28,10 +30,12 @@ class DeleteFileAttachmentCommandHandler(CommandHandler[DeleteFileAttachmentComm
     def __init__(
             self,
             file_attachment_repository: FileAttachmentRepositoryInterface,
-            storage_service: StorageServiceInterface
+            storage_service: StorageServiceInterface,
+            blob_store: BlobStoreInterface
     ):
         self.file_attachment_repository = file_attachment_repository
         self.storage_service = storage_service
+        self.blob_store = blob_store
 
     def execute(self, command: DeleteFileAttachmentCommand) -> None:
         # Get file attachment from repository
@@ -43,8 +47,11 @@ class DeleteFileAttachmentCommandHandler(CommandHandler[DeleteFileAttachmentComm
         if file_attachment.candidate_id != command.candidate_id:
             raise FileAttachmentAccessDeniedError("File does not belong to this candidate")
 
-        # Delete from storage
-        self.storage_service.delete_file(file_attachment.file_path)
-
         # Delete from database
         self.file_attachment_repository.delete(command.file_id)
+
+        # Shared blobs are only removed from storage once nothing references them
+        if file_attachment.content_hash:
+            self.blob_store.release_reference(BlobOwnerType.FILE_ATTACHMENT, command.file_id.value)
+        else:
+            self.storage_service.delete_file(file_attachment.file_path)
@@ -7,42 +7,44 @@ from src.candidate_bc.candidate.domain.repositories.file_attachment_repository_i
 from src.candidate_bc.candidate.domain.value_objects.file_attachment_id import FileAttachmentId
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
 from src.framework.application.command_bus import Command, CommandHandler
-from src.framework.domain.infrastructure.storage_service_interface import (
-    StorageServiceInterface,
-    StorageType
-)
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
+from src.framework.domain.infrastructure.storage_service_interface import UploadedFile
 
 
 @dataclass
 class UploadFileAttachmentCommand(Command):
     id: FileAttachmentId
     candidate_id: CandidateId
-    file_content: bytes
     filename: str
     content_type: str
     description: Optional[str]
     company_id: Optional[str]
+    file_content: Optional[bytes] = None
+    # Set when the HTTP layer already streamed the file to the blob store (see BlobStoreInterface.store_stream)
+    uploaded_file: Optional[UploadedFile] = None
 
 
 class UploadFileAttachmentCommandHandler(CommandHandler[UploadFileAttachmentCommand]):
     def __init__(
             self,
             file_attachment_repository: FileAttachmentRepositoryInterface,
-            storage_service: StorageServiceInterface
+            blob_store: BlobStoreInterface
     ):
         self.file_attachment_repository = file_attachment_repository
-        self.storage_service = storage_service
+        self.blob_store = blob_store
 
     def execute(self, command: UploadFileAttachmentCommand) -> None:
-        # Upload file to storage
-        uploaded_file = self.storage_service.upload_file(
-            file_content=command.file_content,
-            filename=command.filename,
-            content_type=command.content_type,
-            storage_type=StorageType.INTERVIEW_ATTACHMENT,
-            entity_id=command.candidate_id.value,
-            company_id=command.company_id or "default"
-        )
+        uploaded_file = command.uploaded_file
+        if uploaded_file is None:
+            if command.file_content is None:
+                raise ValueError("Either file_content or uploaded_file is required")
+            # Store the file once per distinct content
+            uploaded_file = self.blob_store.store_bytes(
+                file_content=command.file_content,
+                filename=command.filename,
+                content_type=command.content_type
+            )
 
         # Create domain entity
         file_attachment = FileAttachment.create(
@@ -53,10 +55,18 @@ class UploadFileAttachmentCommandHandler(CommandHandler[UploadFileAttachmentComm
             file_path=uploaded_file.file_path or "",
             file_url=uploaded_file.file_url or "",
             content_type=command.content_type,
-            file_size=len(command.file_content),
+            file_size=uploaded_file.file_size,
             uploaded_at=uploaded_file.uploaded_at,
-            description=command.description
+            description=command.description,
+            content_hash=uploaded_file.content_hash
         )
 
         # Save to database
         self.file_attachment_repository.save(file_attachment)
+
+        if uploaded_file.content_hash:
+            self.blob_store.add_reference(
+                uploaded_file.content_hash,
+                BlobOwnerType.FILE_ATTACHMENT,
+                command.id.value
+            )
@@ -21,6 +21,7 @@ class FileAttachment:
     uploaded_at: datetime
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    content_hash: Optional[str] = None  # Set when the file is a shared, content-addressed blob
 
     @staticmethod
     def create(
@@ -33,7 +34,8 @@ class FileAttachment:
             content_type: str,
             file_size: int,
             uploaded_at: datetime,
-            description: Optional[str] = None
+            description: Optional[str] = None,
+            content_hash: Optional[str] = None
     ) -> 'FileAttachment':
         """Factory method to create a new FileAttachment"""
         return FileAttachment(
@@ -46,7 +48,8 @@ class FileAttachment:
             content_type=content_type,
             file_size=file_size,
             description=description,
-            uploaded_at=uploaded_at
+            uploaded_at=uploaded_at,
+            content_hash=content_hash
         )
 
     def update_description(self, description: Optional[str]) -> None:
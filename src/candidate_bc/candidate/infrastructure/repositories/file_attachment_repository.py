@@ -29,7 +29,8 @@ class SQLAlchemyFileAttachmentRepository(FileAttachmentRepositoryInterface):
             description=model.description,
             uploaded_at=model.uploaded_at,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            content_hash=model.content_hash
         )
 
     def _to_model(self, entity: FileAttachment) -> FileAttachmentModel:
@@ -46,7 +47,8 @@ class SQLAlchemyFileAttachmentRepository(FileAttachmentRepositoryInterface):
             description=entity.description,
             uploaded_at=entity.uploaded_at,
             created_at=entity.created_at,
-            updated_at=entity.updated_at
+            updated_at=entity.updated_at,
+            content_hash=entity.content_hash
         )
 
     def save(self, file_attachment: FileAttachment) -> FileAttachment:
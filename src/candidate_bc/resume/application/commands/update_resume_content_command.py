@@ -93,18 +93,16 @@ class UpdateResumeContentCommandHandler(CommandHandler[UpdateResumeContentComman
         if command.datos_personales:
             resume.content.general_data = GeneralData.from_dict(command.datos_personales)
 
-        # Update variable sections from legacy fields
-        if command.experiencia_profesional is not None:
-            resume.update_variable_section('experience', command.experiencia_profesional)
-
-        if command.educacion is not None:
-            resume.update_variable_section('education', command.educacion)
-
-        if command.proyectos is not None:
-            resume.update_variable_section('projects', command.proyectos)
-
-        if command.habilidades is not None:
-            resume.update_variable_section('skills', command.habilidades)
+        # Update variable sections from legacy fields (markdown)
+        legacy_sections = {
+            'experience': command.experiencia_profesional,
+            'education': command.educacion,
+            'projects': command.proyectos,
+            'skills': command.habilidades,
+        }
+        for key, markdown_content in legacy_sections.items():
+            if markdown_content is not None:
+                self._update_section_from_markdown(resume, key, markdown_content)
 
         # Update custom content
         resume.update_content(
@@ -112,3 +110,11 @@ class UpdateResumeContentCommandHandler(CommandHandler[UpdateResumeContentComman
             custom_content=command.custom_content,
             preserve_ai_content=command.preserve_ai_content
         )
+
+    def _update_section_from_markdown(self, resume: Resume, key: str, markdown_content: str) -> None:
+        """Store a legacy markdown section as is, leaving it untouched if it did not change"""
+        # The markdown source is what the editor shows back: it is not rendered to HTML here
+        section = resume.get_variable_section(key)
+        if section and section.content == markdown_content:
+            return
+        resume.update_variable_section(key, markdown_content)
@@ -0,0 +1,148 @@
+"""
+Markdown Renderer
+
+Single-pass Markdown to HTML renderer for resume sections. Lines are tokenized
+once into blocks (headers, paragraphs, lists, rules) and each block's inline
+markup (bold, italic, code, links) is matched by one combined regular
+expression, so the document is never re-scanned per construct. All text is
+HTML-escaped.
+
+Rendered sections are memoized by the SHA-256 of their markdown, so updating a
+resume only renders the sections whose content changed.
+"""
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# A closing run of '#' only counts after whitespace, so "C#" keeps its '#'
+_HEADER = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+_UNORDERED_ITEM = re.compile(r'^\s*[-*+]\s+(.*)$')
+_ORDERED_ITEM = re.compile(r'^\s*\d{1,9}[.)]\s+(.*)$')
+_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+
+_INLINE = re.compile(
+    r'(?P<code>`+)(?P<code_text>.+?)(?P=code)'
+    r'|\*\*(?P<strong>(?=\S).+?(?<=\S))\*\*'
+    r'|__(?P<strong_u>(?=\S).+?(?<=\S))__'
+    r'|\*(?P<em>(?=\S)[^*]+?(?<=\S))\*'
+    r'|(?<!\w)_(?P<em_u>(?=\S)[^_]+?(?<=\S))_(?!\w)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_url>(?:[^()\s]|\([^()\s]*\))+)\)'
+)
+_SAFE_URL = re.compile(r'^(https?://|mailto:|/|#)', re.IGNORECASE)
+
+_PARAGRAPH = "p"
+_UNORDERED = "ul"
+_ORDERED = "ol"
+
+
+class MarkdownRenderer:
+    """Renders Markdown to HTML in one pass, memoizing rendered sections"""
+
+    def __init__(self, cache_size: int = 1024):
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def render(self, markdown_content: Optional[str]) -> str:
+        """Render a section, reusing the HTML of identical content rendered before"""
+        if not markdown_content:
+            return ""
+
+        key = hashlib.sha256(markdown_content.encode()).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        rendered = "\n".join(self.iter_html(markdown_content.splitlines()))
+
+        with self._lock:
+            self._cache[key] = rendered
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return rendered
+
+    def iter_html(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield one HTML block per Markdown block, consuming the lines once"""
+        block: Optional[str] = None
+        items: List[str] = []
+
+        for line in lines:
+            kind, text = self._classify(line)
+
+            if block and kind != block:
+                yield self._close(block, items)
+                block, items = None, []
+
+            if kind in (_PARAGRAPH, _UNORDERED, _ORDERED):
+                block = kind
+                items.append(text)
+            elif kind == "blank":
+                continue
+            elif kind == "hr":
+                yield "<hr>"
+            else:
+                yield f"<{kind}>{self.render_inline(text)}</{kind}>"
+
+        if block:
+            yield self._close(block, items)
+
+    def render_inline(self, text: str) -> str:
+        """Render inline markup, escaping everything else"""
+        parts: List[str] = []
+        position = 0
+        for match in _INLINE.finditer(text):
+            parts.append(html.escape(text[position:match.start()], quote=False))
+            parts.append(self._render_match(match))
+            position = match.end()
+        parts.append(html.escape(text[position:], quote=False))
+        return "".join(parts)
+
+    def _render_match(self, match: "re.Match[str]") -> str:
+        if match.group("code") is not None:
+            return f"<code>{html.escape(match.group('code_text').strip(), quote=False)}</code>"
+        strong = match.group("strong") or match.group("strong_u")
+        if strong is not None:
+            return f"<strong>{self.render_inline(strong)}</strong>"
+        em = match.group("em") or match.group("em_u")
+        if em is not None:
+            return f"<em>{self.render_inline(em)}</em>"
+
+        link_text = self.render_inline(match.group("link_text"))
+        url = match.group("link_url")
+        if not _SAFE_URL.match(url):
+            return link_text
+        return f'<a href="{html.escape(url, quote=True)}" target="_blank" rel="noopener">{link_text}</a>'
+
+    @staticmethod
+    def _classify(line: str) -> Tuple[str, str]:
+        """Block kind of a line and its text without the block marker"""
+        if not line.strip():
+            return "blank", ""
+        if _RULE.match(line):
+            return "hr", ""
+        header = _HEADER.match(line)
+        if header:
+            return f"h{len(header.group(1))}", header.group(2)
+        item = _UNORDERED_ITEM.match(line)
+        if item:
+            return _UNORDERED, item.group(1)
+        item = _ORDERED_ITEM.match(line)
+        if item:
+            return _ORDERED, item.group(1)
+        return _PARAGRAPH, line.strip()
+
+    def _close(self, block: str, items: List[str]) -> str:
+        """HTML of a finished paragraph or list"""
+        if block == _PARAGRAPH:
+            # Resume lines (company, dates...) are kept on their own line
+            return "<p>" + "<br>\n".join(self.render_inline(item) for item in items) + "</p>"
+        rendered_items = "\n".join(f"<li>{self.render_inline(item)}</li>" for item in items)
+        return f"<{block}>\n{rendered_items}\n</{block}>"
+
+
+markdown_renderer = MarkdownRenderer()
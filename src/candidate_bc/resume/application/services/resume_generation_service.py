@@ -1,6 +1,7 @@
 from typing import Dict, Any, List, Optional
 
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.candidate_bc.resume.application.services.markdown_renderer import markdown_renderer
 from src.candidate_bc.resume.domain.enums.resume_type import ResumeType
 from src.candidate_bc.resume.domain.value_objects.general_data import GeneralData
 from src.candidate_bc.resume.domain.value_objects.resume_content import ResumeContent, AIGeneratedContent
@@ -554,40 +555,5 @@ class ResumeGenerationService:
         return '\n'.join(html_parts)
 
     def _markdown_to_html(self, markdown_content: str) -> str:
-        """Convert simple markdown to HTML (for legacy compatibility)"""
-        if not markdown_content:
-            return ""
-
-        html = markdown_content
-
-        # Convert headers
-        html = html.replace('### ', '<h3>').replace('\n\n', '</h3>\n')
-        html = html.replace('## ', '<h2>').replace('\n\n', '</h2>\n')
-        html = html.replace('# ', '<h1>').replace('\n\n', '</h1>\n')
-
-        # Convert bold and italic
-        html = html.replace('**', '<strong>').replace('**', '</strong>')
-        html = html.replace('*', '<em>').replace('*', '</em>')
-
-        # Convert bullet points
-        lines = html.split('\n')
-        processed_lines = []
-        in_list = False
-
-        for line in lines:
-            if line.strip().startswith('- '):
-                if not in_list:
-                    processed_lines.append('<ul>')
-                    in_list = True
-                processed_lines.append(f'<li>{line.strip()[2:]}</li>')
-            else:
-                if in_list:
-                    processed_lines.append('</ul>')
-                    in_list = False
-                if line.strip():
-                    processed_lines.append(f'<p>{line}</p>')
-
-        if in_list:
-            processed_lines.append('</ul>')
-
-        return '\n'.join(processed_lines)
+        """Convert markdown to HTML (for legacy compatibility)"""
+        return markdown_renderer.render(markdown_content)
@@ -6,16 +6,10 @@ and attaching the generated CV. Transitions the application from
 PENDING_CV to APPLIED status.
 """
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-from src.candidate_bc.candidate.application.services.profile_markdown_service import ProfileMarkdownService
-from src.candidate_bc.candidate.domain.repositories.candiadate_experience_repository_interface import \
-    CandidateExperienceRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candidate_education_repository_interface import \
-    CandidateEducationRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candidate_project_repository_interface import \
-    CandidateProjectRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candidate_repository_interface import CandidateRepositoryInterface
+from typing import Optional
+
+from src.company_bc.candidate_application.application.services.profile_snapshot_service import \
+    ProfileSnapshotService
 from src.company_bc.candidate_application.domain.enums.application_status import ApplicationStatusEnum
 from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
     CandidateApplicationRepositoryInterface
@@ -49,16 +43,10 @@ class CompleteApplicationWithGeneratedCVCommandHandler(CommandHandler[CompleteAp
     def __init__(
             self,
             candidate_application_repository: CandidateApplicationRepositoryInterface,
-            candidate_repository: CandidateRepositoryInterface,
-            experience_repository: CandidateExperienceRepositoryInterface,
-            education_repository: CandidateEducationRepositoryInterface,
-            project_repository: CandidateProjectRepositoryInterface
+            profile_snapshot_service: ProfileSnapshotService
     ):
         self.candidate_application_repository = candidate_application_repository
-        self.candidate_repository = candidate_repository
-        self.experience_repository = experience_repository
-        self.education_repository = education_repository
-        self.project_repository = project_repository
+        self.profile_snapshot_service = profile_snapshot_service
 
     def execute(self, command: CompleteApplicationWithGeneratedCVCommand) -> None:
         """Execute the command to complete CV builder application.
@@ -80,35 +68,16 @@ class CompleteApplicationWithGeneratedCVCommandHandler(CommandHandler[CompleteAp
                 f"Expected: {ApplicationStatusEnum.PENDING_CV.value} or {ApplicationStatusEnum.DRAFT.value}"
             )
 
-        # Fetch candidate data
-        candidate = self.candidate_repository.get_by_id(application.candidate_id)
-        if not candidate:
-            raise ValueError(f"Candidate not found for application: {command.application_id}")
-
-        # Fetch related profile data
-        experiences = self.experience_repository.get_by_candidate_id(application.candidate_id)
-        education = self.education_repository.get_by_candidate_id(application.candidate_id)
-        projects = self.project_repository.get_by_candidate_id(application.candidate_id)
-
-        # Generate profile snapshots
-        profile_markdown = ProfileMarkdownService.render(
-            candidate=candidate,
-            experiences=experiences,
-            education=education,
-            projects=projects,
-            language=command.language
-        )
-
-        profile_json = ProfileMarkdownService.render_json_snapshot(
-            candidate=candidate,
-            experiences=experiences,
-            education=education,
-            projects=projects
+        # Point at the snapshot of the current profile, rendered only if the profile changed
+        profile_snapshot_id = self.profile_snapshot_service.get_or_create_snapshot_id(
+            application.candidate_id,
+            command.language
         )
+        if not profile_snapshot_id:
+            raise ValueError(f"Candidate not found for application: {command.application_id}")
 
         # Update application with snapshot and CV
-        application.profile_snapshot_markdown = profile_markdown
-        application.profile_snapshot_json = profile_json
+        application.profile_snapshot_id = profile_snapshot_id
 
         if command.cv_file_id:
             application.cv_file_id = command.cv_file_id
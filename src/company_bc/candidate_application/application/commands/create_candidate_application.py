@@ -1,15 +1,9 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from src.candidate_bc.candidate.application.services.profile_markdown_service import ProfileMarkdownService
-from src.candidate_bc.candidate.domain.repositories.candidate_education_repository_interface import \
-    CandidateEducationRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candiadate_experience_repository_interface import \
-    CandidateExperienceRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candidate_project_repository_interface import \
-    CandidateProjectRepositoryInterface
-from src.candidate_bc.candidate.domain.repositories.candidate_repository_interface import CandidateRepositoryInterface
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.company_bc.candidate_application.application.services.profile_snapshot_service import \
+    ProfileSnapshotService
 from src.company_bc.candidate_application.domain.entities.candidate_application import CandidateApplication
 from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
     CandidateApplicationRepositoryInterface
@@ -45,16 +39,10 @@ class CreateCandidateApplicationCommandHandler(CommandHandler[CreateCandidateApp
     def __init__(
             self,
             candidate_application_repository: CandidateApplicationRepositoryInterface,
-            candidate_repository: Optional[CandidateRepositoryInterface] = None,
-            experience_repository: Optional[CandidateExperienceRepositoryInterface] = None,
-            education_repository: Optional[CandidateEducationRepositoryInterface] = None,
-            project_repository: Optional[CandidateProjectRepositoryInterface] = None
+            profile_snapshot_service: Optional[ProfileSnapshotService] = None
     ):
         self.candidate_application_repository = candidate_application_repository
-        self.candidate_repository = candidate_repository
-        self.experience_repository = experience_repository
-        self.education_repository = education_repository
-        self.project_repository = project_repository
+        self.profile_snapshot_service = profile_snapshot_service
 
     def execute(self, command: CreateCandidateApplicationCommand) -> None:
         """Ejecutar comando de crear aplicación"""
@@ -73,49 +61,13 @@ class CreateCandidateApplicationCommandHandler(CommandHandler[CreateCandidateApp
             command.application_id if command.application_id else generate_id()
         )
 
-        # Generate profile snapshots if repositories are available
-        profile_markdown: Optional[str] = None
-        profile_json: Optional[Dict[str, Any]] = None
-
-        if self.candidate_repository:
-            candidate = self.candidate_repository.get_by_id(command.get_candidate_id())
-            if candidate:
-                # Fetch related data
-                experiences = []
-                education = []
-                projects = []
-
-                if self.experience_repository:
-                    experiences = self.experience_repository.get_by_candidate_id(
-                        command.get_candidate_id()
-                    )
-
-                if self.education_repository:
-                    education = self.education_repository.get_by_candidate_id(
-                        command.get_candidate_id()
-                    )
-
-                if self.project_repository:
-                    projects = self.project_repository.get_by_candidate_id(
-                        command.get_candidate_id()
-                    )
-
-                # Generate markdown snapshot
-                profile_markdown = ProfileMarkdownService.render(
-                    candidate=candidate,
-                    experiences=experiences,
-                    education=education,
-                    projects=projects,
-                    language=command.language
-                )
-
-                # Generate JSON snapshot
-                profile_json = ProfileMarkdownService.render_json_snapshot(
-                    candidate=candidate,
-                    experiences=experiences,
-                    education=education,
-                    projects=projects
-                )
+        # Point at the snapshot of the current profile, rendered only if the profile changed
+        profile_snapshot_id: Optional[str] = None
+        if self.profile_snapshot_service:
+            profile_snapshot_id = self.profile_snapshot_service.get_or_create_snapshot_id(
+                command.get_candidate_id(),
+                command.language
+            )
 
         # Create new application using factory method
         new_application = CandidateApplication.create(
@@ -123,8 +75,7 @@ class CreateCandidateApplicationCommandHandler(CommandHandler[CreateCandidateApp
             candidate_id=command.get_candidate_id(),
             job_position_id=command.get_job_position_id(),
             notes=command.notes,
-            profile_snapshot_markdown=profile_markdown,
-            profile_snapshot_json=profile_json,
+            profile_snapshot_id=profile_snapshot_id,
             cv_file_id=command.cv_file_id,
             wants_cv_help=command.wants_cv_help
         )
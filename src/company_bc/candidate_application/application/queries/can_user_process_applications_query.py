@@ -0,0 +1,58 @@
+"""Query to check which of several applications a user can process at their current stage"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from src.company_bc.candidate_application.application.services.stage_permission_service import StagePermissionService
+from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
+    CandidateApplicationRepositoryInterface
+from src.framework.application.query_bus import Query, QueryHandler
+
+
+@dataclass
+class CanUserProcessApplicationsQuery(Query):
+    """Query to check if user can process each of a list of applications"""
+    user_id: str
+    application_ids: List[str]
+    company_id: str
+
+
+class CanUserProcessApplicationsQueryHandler(QueryHandler[CanUserProcessApplicationsQuery, Dict[str, bool]]):
+    """Handler for CanUserProcessApplicationsQuery
+
+    Loads the position and stage of all applications in one query and checks the
+    permissions of all their (position, stage) pairs at once.
+    """
+
+    def __init__(
+            self,
+            application_repository: CandidateApplicationRepositoryInterface,
+            stage_permission_service: StagePermissionService
+    ):
+        self.application_repository = application_repository
+        self.stage_permission_service = stage_permission_service
+
+    def handle(self, query: CanUserProcessApplicationsQuery) -> Dict[str, bool]:
+        """Map every requested application ID to whether the user can process it"""
+        decisions = {application_id: False for application_id in query.application_ids}
+        try:
+            position_stages = self.application_repository.get_position_stages(
+                list(decisions), query.company_id
+            )
+            # Applications outside a workflow stage (or another company) stay denied
+            in_stage: Dict[str, Tuple[str, str]] = {
+                application_id: (position_id, stage_id)
+                for application_id, (position_id, stage_id) in position_stages.items()
+                if stage_id
+            }
+            allowed = self.stage_permission_service.processable_position_stages(
+                user_id=query.user_id,
+                company_id=query.company_id,
+                position_stages=in_stage.values()
+            )
+        except Exception:
+            # On any error, deny everything for security
+            return decisions
+
+        for application_id, pair in in_stage.items():
+            decisions[application_id] = pair in allowed
+        return decisions
@@ -0,0 +1,102 @@
+"""Cache of stage permission decisions
+
+Decisions are keyed by (company, user, position, stage) and stamped with the
+version of the company (roles and membership) and of the position (stage
+assignments) they were computed from. The role and assignment commands bump
+those versions, so every decision depending on the changed data becomes a miss
+at once without scanning the cache.
+
+The cache lives in the process: a write handled by another worker is picked up
+when the entry expires, so the TTL bounds how long a stale decision can be
+served there.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from core.config import settings
+
+DecisionKey = Tuple[str, str, Optional[str], Optional[str]]
+Versions = Tuple[int, int]
+
+
+class PermissionDecisionCache:
+    """LRU of permission decisions with TTL and version-stamp invalidation"""
+
+    def __init__(
+            self,
+            max_entries: int = 10000,
+            ttl_seconds: float = 30.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[DecisionKey, Tuple[bool, Versions, float]]" = OrderedDict()
+        self._company_versions: Dict[str, int] = {}
+        self._position_versions: Dict[str, int] = {}
+        self._stamps = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def versions(self, company_id: str, position_id: Optional[str] = None) -> Versions:
+        """Current versions; read them before loading the data a decision is computed from"""
+        with self._lock:
+            return self._versions(company_id, position_id)
+
+    def get(self, key: DecisionKey) -> Optional[bool]:
+        """Cached decision, or None when missing, expired or invalidated since it was stored"""
+        if not self.enabled:
+            return None
+        company_id, _, position_id, _ = key
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            decision, versions, expires_at = entry
+            if expires_at <= self._clock() or versions != self._versions(company_id, position_id):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return decision
+
+    def put(self, key: DecisionKey, decision: bool, versions: Versions) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (decision, versions, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_company(self, company_id: str) -> None:
+        """Roles or membership of the company changed"""
+        with self._lock:
+            self._company_versions[str(company_id)] = next(self._stamps)
+
+    def invalidate_position(self, position_id: str) -> None:
+        """Stage assignments of the position changed"""
+        with self._lock:
+            self._position_versions[str(position_id)] = next(self._stamps)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _versions(self, company_id: str, position_id: Optional[str]) -> Versions:
+        return (
+            self._company_versions.get(str(company_id), 0),
+            self._position_versions.get(str(position_id), 0) if position_id else 0,
+        )
+
+
+permission_decision_cache = PermissionDecisionCache(
+    max_entries=settings.PERMISSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PERMISSION_CACHE_TTL_SECONDS
+)
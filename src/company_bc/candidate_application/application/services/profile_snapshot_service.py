@@ -0,0 +1,89 @@
+"""Service for getting the profile snapshot an application points at"""
+
+import hashlib
+import json
+from typing import Optional
+
+from src.candidate_bc.candidate.application.services.profile_markdown_service import ProfileMarkdownService
+from src.candidate_bc.candidate.domain.repositories.candiadate_experience_repository_interface import \
+    CandidateExperienceRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_education_repository_interface import \
+    CandidateEducationRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_project_repository_interface import \
+    CandidateProjectRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_repository_interface import CandidateRepositoryInterface
+from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.company_bc.candidate_application.domain.entities.profile_snapshot import ProfileSnapshot
+from src.company_bc.candidate_application.domain.repositories.profile_snapshot_repository_interface import \
+    ProfileSnapshotRepositoryInterface
+
+
+class ProfileSnapshotService:
+    """Service for sharing one profile snapshot between applications sent with the same profile"""
+
+    def __init__(
+            self,
+            profile_snapshot_repository: ProfileSnapshotRepositoryInterface,
+            candidate_repository: CandidateRepositoryInterface,
+            experience_repository: CandidateExperienceRepositoryInterface,
+            education_repository: CandidateEducationRepositoryInterface,
+            project_repository: CandidateProjectRepositoryInterface
+    ):
+        self.profile_snapshot_repository = profile_snapshot_repository
+        self.candidate_repository = candidate_repository
+        self.experience_repository = experience_repository
+        self.education_repository = education_repository
+        self.project_repository = project_repository
+
+    def get_or_create_snapshot_id(self, candidate_id: CandidateId, language: str = "es") -> Optional[str]:
+        """Get the ID of the snapshot of the candidate's current profile
+
+        The JSON snapshot is cheap to build and identifies the profile content;
+        the markdown is only rendered when no snapshot exists for that content yet.
+
+        Args:
+            candidate_id: ID of the candidate
+            language: Language for the markdown section headers (es/en)
+
+        Returns:
+            Snapshot ID, or None if the candidate does not exist
+        """
+        candidate = self.candidate_repository.get_by_id(candidate_id)
+        if not candidate:
+            return None
+
+        experiences = self.experience_repository.get_by_candidate_id(candidate_id)
+        education = self.education_repository.get_by_candidate_id(candidate_id)
+        projects = self.project_repository.get_by_candidate_id(candidate_id)
+
+        profile_json = ProfileMarkdownService.render_json_snapshot(
+            candidate=candidate,
+            experiences=experiences,
+            education=education,
+            projects=projects
+        )
+        snapshot_id = self.snapshot_id(candidate_id.value, language, profile_json)
+        if self.profile_snapshot_repository.exists(snapshot_id):
+            return snapshot_id
+
+        profile_markdown = ProfileMarkdownService.render(
+            candidate=candidate,
+            experiences=experiences,
+            education=education,
+            projects=projects,
+            language=language
+        )
+        self.profile_snapshot_repository.create_if_absent(ProfileSnapshot(
+            id=snapshot_id,
+            candidate_id=candidate_id.value,
+            language=language,
+            profile_markdown=profile_markdown,
+            profile_json=profile_json
+        ))
+        return snapshot_id
+
+    @staticmethod
+    def snapshot_id(candidate_id: str, language: str, profile_json: dict) -> str:
+        """SHA-256 of the candidate, the language and the canonical JSON of the profile"""
+        content = json.dumps(profile_json, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(f"{candidate_id}\n{language}\n{content}".encode()).hexdigest()
@@ -1,7 +1,10 @@
 """Service for checking user permissions to process applications at specific workflow stages"""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.candidate_application.domain.entities.candidate_application import CandidateApplication
 from src.company_bc.company.domain.enums import CompanyUserRole, CompanyUserStatus
 from src.company_bc.company.domain.infrastructure.company_user_repository_interface import (
@@ -20,10 +23,12 @@ class StagePermissionService:
     def __init__(
             self,
             position_stage_assignment_repository: PositionStageAssignmentRepositoryInterface,
-            company_user_repository: Optional[CompanyUserRepositoryInterface] = None
+            company_user_repository: Optional[CompanyUserRepositoryInterface] = None,
+            decision_cache: PermissionDecisionCache = permission_decision_cache
     ):
         self.position_stage_assignment_repository = position_stage_assignment_repository
         self.company_user_repository = company_user_repository
+        self.decision_cache = decision_cache
 
     def can_user_process_stage(
             self,
@@ -45,17 +50,71 @@ class StagePermissionService:
         if not application.current_stage_id:
             return False
 
-        # Check if user is company admin (admins can process any stage)
-        if self.is_user_company_admin(user_id, company_id):
-            return True
+        return self.can_user_process_position_stage(
+            user_id, company_id, application.job_position_id.value, application.current_stage_id
+        )
 
-        # Check if user is assigned to this stage
-        assigned_users = self.get_assigned_users_for_stage(
-            application.job_position_id.value,
-            application.current_stage_id
+    def can_user_process_position_stage(
+            self,
+            user_id: str,
+            company_id: str,
+            position_id: str,
+            stage_id: str
+    ) -> bool:
+        """Check if a user can process applications of a position at a stage (cached)"""
+        key = (company_id, user_id, position_id, stage_id)
+        cached = self.decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        versions = self.decision_cache.versions(company_id, position_id)
+        # Admins can process any stage; everyone else must be assigned to it
+        decision = (
+            self.is_user_company_admin(user_id, company_id)
+            or user_id in self.get_assigned_users_for_stage(position_id, stage_id)
         )
+        self.decision_cache.put(key, decision, versions)
+        return decision
 
-        return user_id in assigned_users
+    def processable_position_stages(
+            self,
+            user_id: str,
+            company_id: str,
+            position_stages: Iterable[Tuple[str, str]]
+    ) -> Set[Tuple[str, str]]:
+        """Which of the (position_id, stage_id) pairs the user can process
+
+        Answers for a whole list with at most one admin check and one assignment
+        query, however many pairs are asked; cached decisions are reused.
+        """
+        decisions: Dict[Tuple[str, str], bool] = {}
+        pending: List[Tuple[str, str]] = []
+        for position_id, stage_id in set(position_stages):
+            cached = self.decision_cache.get((company_id, user_id, position_id, stage_id))
+            if cached is None:
+                pending.append((position_id, stage_id))
+            else:
+                decisions[(position_id, stage_id)] = cached
+
+        if pending:
+            versions = {
+                position_id: self.decision_cache.versions(company_id, position_id)
+                for position_id, _ in pending
+            }
+            if self.is_user_company_admin(user_id, company_id):
+                assigned = set(pending)
+            else:
+                assigned = self.position_stage_assignment_repository.list_assigned_position_stages(
+                    user_id, list(versions)
+                )
+            for position_id, stage_id in pending:
+                decision = (position_id, stage_id) in assigned
+                decisions[(position_id, stage_id)] = decision
+                self.decision_cache.put(
+                    (company_id, user_id, position_id, stage_id), decision, versions[position_id]
+                )
+
+        return {pair for pair, decision in decisions.items() if decision}
 
     def get_assigned_users_for_stage(
             self,
@@ -96,6 +155,19 @@ class StagePermissionService:
         if self.company_user_repository is None:
             return False
 
+        key = (company_id, user_id, None, None)
+        cached = self.decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        versions = self.decision_cache.versions(company_id)
+        is_admin = self._load_is_user_company_admin(user_id, company_id)
+        self.decision_cache.put(key, is_admin, versions)
+        return is_admin
+
+    def _load_is_user_company_admin(self, user_id: str, company_id: str) -> bool:
+        if self.company_user_repository is None:
+            return False
         try:
             # Query the company_users table
             company_user = self.company_user_repository.get_by_company_and_user(
@@ -29,6 +29,7 @@ class CandidateApplication:
     # Phase 12: Phase tracking field
     current_phase_id: Optional[str] = None
     # Phase 8: Profile snapshot fields
+    profile_snapshot_id: Optional[str] = None  # Shared ProfileSnapshot; markdown and JSON are loaded from it
     profile_snapshot_markdown: Optional[str] = None  # Full profile as markdown for recruiter view
     profile_snapshot_json: Dict[str, Any] = field(default_factory=dict)  # Structured data at application time
     cv_file_id: Optional[str] = None  # Reference to attached CV (uploaded or generated)
@@ -160,6 +161,7 @@ class CandidateApplication:
             initial_stage_id: Optional[str] = None,
             stage_time_limit_hours: Optional[int] = None,
             initial_phase_id: Optional[str] = None,
+            profile_snapshot_id: Optional[str] = None,
             profile_snapshot_markdown: Optional[str] = None,
             profile_snapshot_json: Optional[Dict[str, Any]] = None,
             cv_file_id: Optional[str] = None,
@@ -175,6 +177,7 @@ class CandidateApplication:
             initial_stage_id: Optional ID of initial workflow stage
             stage_time_limit_hours: Optional time limit for initial stage in hours
             initial_phase_id: Optional ID of initial phase (Phase 12)
+            profile_snapshot_id: Optional ID of the shared profile snapshot
             profile_snapshot_markdown: Optional markdown snapshot of candidate profile
             profile_snapshot_json: Optional JSON snapshot of candidate profile
             cv_file_id: Optional reference to attached CV file
@@ -203,6 +206,7 @@ class CandidateApplication:
             # Phase 12: Phase field
             current_phase_id=initial_phase_id,
             # Phase 8: Profile snapshot fields
+            profile_snapshot_id=profile_snapshot_id,
             profile_snapshot_markdown=profile_snapshot_markdown,
             profile_snapshot_json=profile_snapshot_json or {},
             cv_file_id=cv_file_id,
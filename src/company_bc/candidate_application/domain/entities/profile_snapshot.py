@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+
+
+@dataclass
+class ProfileSnapshot:
+    """Perfil del candidato tal como estaba al aplicar, compartido por sus aplicaciones.
+
+    The id is a hash of the candidate, the language and the profile content, so
+    every application sent while the profile did not change points at the same
+    snapshot and the markdown is only rendered once.
+    """
+    id: str
+    candidate_id: str
+    language: str
+    profile_markdown: str
+    profile_json: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.utcnow)
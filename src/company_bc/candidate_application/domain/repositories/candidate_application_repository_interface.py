@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
 
@@ -52,6 +52,15 @@ class CandidateApplicationRepositoryInterface(ABC):
         """Obtener todas las aplicaciones para una posición"""
         pass
 
+    @abstractmethod
+    def get_position_stages(
+            self,
+            application_ids: List[str],
+            company_id: str
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Obtener (job_position_id, current_stage_id) de las aplicaciones de una empresa, por ID"""
+        pass
+
     @abstractmethod
     def delete(self, application_id: CandidateApplicationId) -> None:
         """Eliminar aplicación"""
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.company_bc.candidate_application.domain.entities.profile_snapshot import ProfileSnapshot
+
+
+class ProfileSnapshotRepositoryInterface(ABC):
+    """Interface para el repositorio de snapshots de perfil"""
+
+    @abstractmethod
+    def get_by_id(self, snapshot_id: str) -> Optional[ProfileSnapshot]:
+        """Obtener snapshot por ID"""
+        pass
+
+    @abstractmethod
+    def exists(self, snapshot_id: str) -> bool:
+        """Comprobar si existe un snapshot, sin cargar su contenido"""
+        pass
+
+    @abstractmethod
+    def create_if_absent(self, snapshot: ProfileSnapshot) -> None:
+        """Guardar un snapshot salvo que ya exista uno con el mismo ID"""
+        pass
@@ -59,6 +59,13 @@ class CandidateApplicationModel(Base):
     )
 
     # Phase 8: Profile snapshot fields
+    profile_snapshot_id: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        ForeignKey("profile_snapshots.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True
+    )
+    # Inline copies, only kept for applications created before profile_snapshots existed
     profile_snapshot_markdown: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     profile_snapshot_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     cv_file_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
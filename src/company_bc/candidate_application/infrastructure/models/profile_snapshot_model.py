@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Text, ForeignKey, func, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.base import Base
+
+
+@dataclass
+class ProfileSnapshotModel(Base):
+    """Modelo de SQLAlchemy para snapshots de perfil compartidos por aplicaciones"""
+    __tablename__ = "profile_snapshots"
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)  # Hash of candidate, language and content
+    candidate_id: Mapped[str] = mapped_column(
+        String, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    language: Mapped[str] = mapped_column(String(10), nullable=False)
+    profile_markdown: Mapped[str] = mapped_column(Text, nullable=False)
+    profile_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
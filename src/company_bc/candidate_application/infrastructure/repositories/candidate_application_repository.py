@@ -1,6 +1,6 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from core.database import DatabaseInterface
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
@@ -12,7 +12,9 @@ from src.company_bc.candidate_application.domain.repositories.candidate_applicat
 from src.company_bc.candidate_application.domain.value_objects.candidate_application_id import CandidateApplicationId
 from src.company_bc.candidate_application.infrastructure.models.candidate_application_model import \
     CandidateApplicationModel
+from src.company_bc.candidate_application.infrastructure.models.profile_snapshot_model import ProfileSnapshotModel
 from src.company_bc.job_position.domain.value_objects.job_position_id import JobPositionId
+from src.company_bc.job_position.infrastructure.models.job_position_model import JobPositionModel
 from src.framework.infrastructure.repositories.base import BaseRepository
 
 
@@ -23,6 +25,22 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
         self.database = database
         self.base_repo = BaseRepository(database, CandidateApplicationModel)
 
+    def _query_with_snapshot(self, session: Session) -> Query[Tuple[CandidateApplicationModel, Optional[str], Any]]:
+        """Applications joined with the markdown and JSON of their profile snapshot, if any"""
+        query = session.query(
+            CandidateApplicationModel, ProfileSnapshotModel.profile_markdown, ProfileSnapshotModel.profile_json
+        ).outerjoin(ProfileSnapshotModel, ProfileSnapshotModel.id == CandidateApplicationModel.profile_snapshot_id)
+        return cast(Query[Tuple[CandidateApplicationModel, Optional[str], Any]], query)
+
+    def _row_to_domain(self, row: Tuple[CandidateApplicationModel, Optional[str], Any]) -> CandidateApplication:
+        """Convierte una fila con su snapshot a entidad de dominio"""
+        model, snapshot_markdown, snapshot_json = row
+        application = self._to_domain(model)
+        if model.profile_snapshot_id:
+            application.profile_snapshot_markdown = snapshot_markdown
+            application.profile_snapshot_json = snapshot_json or {}
+        return application
+
     def _to_domain(self, model: CandidateApplicationModel) -> CandidateApplication:
         """Convierte modelo de SQLAlchemy a entidad de dominio"""
         return CandidateApplication(
@@ -41,6 +59,7 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
             # Phase 12: Phase tracking field
             current_phase_id=model.current_phase_id,
             # Phase 8: Profile snapshot fields
+            profile_snapshot_id=model.profile_snapshot_id,
             profile_snapshot_markdown=model.profile_snapshot_markdown,
             profile_snapshot_json=model.profile_snapshot_json or {},
             cv_file_id=model.cv_file_id,
@@ -65,9 +84,10 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
             task_status=entity.task_status,  # SQLAlchemy will handle enum conversion
             # Phase 12: Phase tracking field
             current_phase_id=entity.current_phase_id,
-            # Phase 8: Profile snapshot fields
-            profile_snapshot_markdown=entity.profile_snapshot_markdown,
-            profile_snapshot_json=entity.profile_snapshot_json,
+            # Phase 8: Profile snapshot fields, stored once in profile_snapshots when shared
+            profile_snapshot_id=entity.profile_snapshot_id,
+            profile_snapshot_markdown=None if entity.profile_snapshot_id else entity.profile_snapshot_markdown,
+            profile_snapshot_json=None if entity.profile_snapshot_id else entity.profile_snapshot_json,
             cv_file_id=entity.cv_file_id,
             wants_cv_help=entity.wants_cv_help
         )
@@ -97,8 +117,13 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
                 # Phase 12: Update phase tracking field
                 existing_model.current_phase_id = candidate_application.current_phase_id
                 # Phase 8: Update profile snapshot fields
-                existing_model.profile_snapshot_markdown = candidate_application.profile_snapshot_markdown
-                existing_model.profile_snapshot_json = candidate_application.profile_snapshot_json
+                existing_model.profile_snapshot_id = candidate_application.profile_snapshot_id
+                if candidate_application.profile_snapshot_id:
+                    existing_model.profile_snapshot_markdown = None
+                    existing_model.profile_snapshot_json = None
+                else:
+                    existing_model.profile_snapshot_markdown = candidate_application.profile_snapshot_markdown
+                    existing_model.profile_snapshot_json = candidate_application.profile_snapshot_json
                 existing_model.cv_file_id = candidate_application.cv_file_id
                 existing_model.wants_cv_help = candidate_application.wants_cv_help
             else:
@@ -115,8 +140,14 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
 
     def get_by_id(self, application_id: CandidateApplicationId) -> Optional[CandidateApplication]:
         """Obtener aplicación por ID"""
-        model = self.base_repo.get_by_id(application_id)
-        return self._to_domain(model) if model else None
+        session: Session = self.database.get_session()
+        try:
+            row = self._query_with_snapshot(session).filter(
+                CandidateApplicationModel.id == application_id.value
+            ).first()
+            return self._row_to_domain(row) if row else None
+        finally:
+            session.close()
 
     def get_by_candidate_and_position(
             self,
@@ -126,11 +157,11 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
         """Obtener aplicación por candidato y posición"""
         session: Session = self.database.get_session()
         try:
-            model = session.query(CandidateApplicationModel).filter_by(
-                candidate_id=candidate_id.value,
-                job_position_id=job_position_id.value
+            row = self._query_with_snapshot(session).filter(
+                CandidateApplicationModel.candidate_id == candidate_id.value,
+                CandidateApplicationModel.job_position_id == job_position_id.value
             ).first()
-            return self._to_domain(model) if model else None
+            return self._row_to_domain(row) if row else None
         finally:
             session.close()
 
@@ -138,10 +169,10 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
         """Obtener todas las aplicaciones de un candidato"""
         session: Session = self.database.get_session()
         try:
-            models = session.query(CandidateApplicationModel).filter_by(
-                candidate_id=candidate_id.value
+            rows = self._query_with_snapshot(session).filter(
+                CandidateApplicationModel.candidate_id == candidate_id.value
             ).all()
-            return [self._to_domain(model) for model in models]
+            return [self._row_to_domain(row) for row in rows]
         finally:
             session.close()
 
@@ -154,8 +185,8 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
         """Obtener aplicaciones de un candidato con filtros"""
         session: Session = self.database.get_session()
         try:
-            query = session.query(CandidateApplicationModel).filter_by(
-                candidate_id=candidate_id.value
+            query = self._query_with_snapshot(session).filter(
+                CandidateApplicationModel.candidate_id == candidate_id.value
             )
 
             if status_filter:
@@ -164,8 +195,8 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
             if limit:
                 query = query.limit(limit)
 
-            models = query.all()
-            return [self._to_domain(model) for model in models]
+            rows = query.all()
+            return [self._row_to_domain(row) for row in rows]
         finally:
             session.close()
 
@@ -173,10 +204,34 @@ class SQLAlchemyCandidateApplicationRepository(CandidateApplicationRepositoryInt
         """Obtener todas las aplicaciones para una posición"""
         session: Session = self.database.get_session()
         try:
-            models = session.query(CandidateApplicationModel).filter_by(
-                job_position_id=job_position_id.value
+            rows = self._query_with_snapshot(session).filter(
+                CandidateApplicationModel.job_position_id == job_position_id.value
+            ).all()
+            return [self._row_to_domain(row) for row in rows]
+        finally:
+            session.close()
+
+    def get_position_stages(
+            self,
+            application_ids: List[str],
+            company_id: str
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Obtener (job_position_id, current_stage_id) de las aplicaciones de una empresa, por ID"""
+        if not application_ids:
+            return {}
+        session: Session = self.database.get_session()
+        try:
+            rows = session.query(
+                CandidateApplicationModel.id,
+                CandidateApplicationModel.job_position_id,
+                CandidateApplicationModel.current_stage_id
+            ).join(
+                JobPositionModel, JobPositionModel.id == CandidateApplicationModel.job_position_id
+            ).filter(
+                CandidateApplicationModel.id.in_(application_ids),
+                JobPositionModel.company_id == company_id
             ).all()
-            return [self._to_domain(model) for model in models]
+            return {row.id: (row.job_position_id, row.current_stage_id) for row in rows}
         finally:
             session.close()
 
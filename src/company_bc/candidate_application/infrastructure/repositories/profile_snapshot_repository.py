@@ -0,0 +1,67 @@
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from core.database import DatabaseInterface
+from src.company_bc.candidate_application.domain.entities.profile_snapshot import ProfileSnapshot
+from src.company_bc.candidate_application.domain.repositories.profile_snapshot_repository_interface import \
+    ProfileSnapshotRepositoryInterface
+from src.company_bc.candidate_application.infrastructure.models.profile_snapshot_model import ProfileSnapshotModel
+
+
+class SQLAlchemyProfileSnapshotRepository(ProfileSnapshotRepositoryInterface):
+    """Implementación de repositorio de snapshots de perfil con SQLAlchemy"""
+
+    def __init__(self, database: DatabaseInterface):
+        self.database = database
+
+    def _to_domain(self, model: ProfileSnapshotModel) -> ProfileSnapshot:
+        """Convierte modelo de SQLAlchemy a entidad de dominio"""
+        return ProfileSnapshot(
+            id=model.id,
+            candidate_id=model.candidate_id,
+            language=model.language,
+            profile_markdown=model.profile_markdown,
+            profile_json=model.profile_json or {},
+            created_at=model.created_at
+        )
+
+    def get_by_id(self, snapshot_id: str) -> Optional[ProfileSnapshot]:
+        """Obtener snapshot por ID"""
+        session: Session = self.database.get_session()
+        try:
+            model = session.get(ProfileSnapshotModel, snapshot_id)
+            return self._to_domain(model) if model else None
+        finally:
+            session.close()
+
+    def exists(self, snapshot_id: str) -> bool:
+        """Comprobar si existe un snapshot, sin cargar su contenido"""
+        session: Session = self.database.get_session()
+        try:
+            return session.query(ProfileSnapshotModel.id).filter_by(id=snapshot_id).first() is not None
+        finally:
+            session.close()
+
+    def create_if_absent(self, snapshot: ProfileSnapshot) -> None:
+        """Guardar un snapshot salvo que ya exista uno con el mismo ID"""
+        session: Session = self.database.get_session()
+        try:
+            # Two applications sent at once may render the same snapshot
+            session.execute(
+                insert(ProfileSnapshotModel).values(
+                    id=snapshot.id,
+                    candidate_id=snapshot.candidate_id,
+                    language=snapshot.language,
+                    profile_markdown=snapshot.profile_markdown,
+                    profile_json=snapshot.profile_json,
+                    created_at=snapshot.created_at
+                ).on_conflict_do_nothing(index_elements=[ProfileSnapshotModel.id])
+            )
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
@@ -0,0 +1,61 @@
+"""
+Command to add newly completed stage visits to the stage dwell time histograms.
+
+This command should be run periodically (e.g., every few minutes via cron). Each
+run only reads the visits completed since the previous one, in batches, so its
+cost depends on the new transitions and not on the size of the history.
+
+The history is written by MoveCandidateToStageCommand only: stage changes of
+company candidates (single or bulk) are not candidate application visits and
+are not counted.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from core.config import settings
+from src.company_bc.candidate_application_stage.domain.infrastructure.stage_dwell_time_repository_interface import \
+    StageDwellTimeRepositoryInterface
+from src.framework.application.command_bus import Command, CommandHandler
+
+
+@dataclass
+class AggregateStageDwellTimesCommand(Command):
+    """
+    Command to aggregate completed stage visits.
+
+    Args:
+        batch_size: Visits read and merged per transaction.
+        max_batches: Upper bound of batches in one run; the rest is left for the next run.
+    """
+    batch_size: int = settings.STAGE_DWELL_TIME_BATCH_SIZE
+    max_batches: int = 100
+
+
+class AggregateStageDwellTimesCommandHandler(CommandHandler[AggregateStageDwellTimesCommand]):
+    """Handler for aggregating completed stage visits into daily dwell time histograms"""
+
+    def __init__(
+            self,
+            dwell_time_repository: StageDwellTimeRepositoryInterface,
+            settle_seconds: float = settings.STAGE_DWELL_TIME_SETTLE_SECONDS
+    ):
+        self.dwell_time_repository = dwell_time_repository
+        self.settle_seconds = settle_seconds
+        self.logger = logging.getLogger(__name__)
+
+    def execute(self, command: AggregateStageDwellTimesCommand) -> None:
+        """Execute the aggregation until caught up or max_batches is reached"""
+        completed_before = datetime.utcnow() - timedelta(seconds=self.settle_seconds)
+        aggregated = 0
+        for _ in range(command.max_batches):
+            added = self.dwell_time_repository.aggregate_completed_visits(completed_before, command.batch_size)
+            aggregated += added
+            if added < command.batch_size:
+                break
+        else:
+            self.logger.warning(
+                f"Stage dwell time aggregation stopped after {command.max_batches} batches, "
+                f"the remaining visits will be added by the next run"
+            )
+        self.logger.info(f"Added {aggregated} completed stage visits to the dwell time histograms")
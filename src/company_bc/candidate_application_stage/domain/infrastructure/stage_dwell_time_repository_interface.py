@@ -0,0 +1,42 @@
+"""Stage dwell time repository interface"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from src.company_bc.candidate_application_stage.domain.value_objects.dwell_time_histogram import DwellTimeHistogram
+
+
+@dataclass(frozen=True)
+class OpenStageVisits:
+    """Applications currently in a stage"""
+    count: int
+    oldest_started_at: datetime
+
+
+class StageDwellTimeRepositoryInterface(ABC):
+    """Repository interface for the time spent by applications in each stage"""
+
+    @abstractmethod
+    def aggregate_completed_visits(self, completed_before: datetime, batch_size: int) -> int:
+        """
+        Add the next batch of stage visits completed before `completed_before` to the
+        daily histograms and move the watermark past them, in one transaction.
+        Returns the number of visits added (0 when caught up).
+        """
+        pass
+
+    @abstractmethod
+    def get_histograms(
+            self,
+            stage_ids: List[str],
+            completed_from: Optional[date] = None,
+            completed_to: Optional[date] = None
+    ) -> Dict[str, DwellTimeHistogram]:
+        """Dwell time histogram of each stage over the visits completed in the period"""
+        pass
+
+    @abstractmethod
+    def get_open_visits(self, stage_ids: List[str]) -> Dict[str, OpenStageVisits]:
+        """Applications still in each stage (stages without any are left out)"""
+        pass
@@ -0,0 +1,80 @@
+"""Dwell time histogram - distribution of the time spent in a stage"""
+import bisect
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+def _bucket_bounds() -> Tuple[float, ...]:
+    # Geometric upper bounds from 15 minutes to two years: any percentile read
+    # from the histogram is within ~10% of the exact value
+    bounds = [0.25]
+    while bounds[-1] < 2 * 365 * 24:
+        bounds.append(round(bounds[-1] * 1.2, 4))
+    return tuple(bounds)
+
+
+# Upper bound (hours) of each bucket; the last bucket takes everything above
+BUCKET_BOUNDS_HOURS: Tuple[float, ...] = _bucket_bounds()
+
+
+@dataclass
+class DwellTimeHistogram:
+    """Mergeable summary of the dwell times (hours) of completed stage visits
+
+    Stage visits are added one by one as they complete and histograms of
+    different days or workers are merged, so p50/p90 over any period are read
+    from a few fixed-size histograms instead of scanning the visits.
+    """
+
+    count: int = 0
+    total_hours: float = 0.0
+    min_hours: Optional[float] = None
+    max_hours: Optional[float] = None
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKET_BOUNDS_HOURS) + 1))
+
+    def add(self, hours: float) -> None:
+        hours = max(hours, 0.0)
+        self.count += 1
+        self.total_hours += hours
+        self.min_hours = hours if self.min_hours is None else min(self.min_hours, hours)
+        self.max_hours = hours if self.max_hours is None else max(self.max_hours, hours)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_HOURS, hours)] += 1
+
+    def merge(self, other: "DwellTimeHistogram") -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.total_hours += other.total_hours
+        self.min_hours = other.min_hours if self.min_hours is None else min(self.min_hours, other.min_hours or 0.0)
+        self.max_hours = other.max_hours if self.max_hours is None else max(self.max_hours, other.max_hours or 0.0)
+        self.buckets = [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)]
+
+    @property
+    def mean_hours(self) -> Optional[float]:
+        return self.total_hours / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 < q <= 1), interpolated within its bucket"""
+        if not self.count or self.min_hours is None or self.max_hours is None:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if not bucket_count:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = BUCKET_BOUNDS_HOURS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS_HOURS[index] if index < len(BUCKET_BOUNDS_HOURS) else self.max_hours
+                lower, upper = max(lower, self.min_hours), min(upper, self.max_hours)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max_hours
+
+    @property
+    def p50_hours(self) -> Optional[float]:
+        return self.percentile(0.5)
+
+    @property
+    def p90_hours(self) -> Optional[float]:
+        return self.percentile(0.9)
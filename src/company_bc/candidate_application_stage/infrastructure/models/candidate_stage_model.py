@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, Dict, Any
 
-from sqlalchemy import String, DateTime, Text, JSON, Numeric, func, ForeignKey
+from sqlalchemy import String, DateTime, Text, JSON, Numeric, func, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.base import Base
@@ -13,8 +13,18 @@ from src.framework.domain.entities.base import generate_id
 
 @dataclass
 class CandidateApplicationStageModel(Base):
-    """SQLAlchemy model for candidate stage tracking"""
+    """SQLAlchemy model for candidate stage tracking
+
+    One row per stage visit: entered at started_at, left at completed_at (NULL
+    while the application is still in the stage).
+    """
     __tablename__ = "candidate_application_stages"
+    __table_args__ = (
+        # Applications currently in a stage and their dwell so far
+        Index('ix_candidate_application_stages_stage_completed', 'stage_id', 'completed_at'),
+        # Completed visits in completion order, read by the dwell time aggregation
+        Index('ix_candidate_application_stages_completed_id', 'completed_at', 'id'),
+    )
 
     id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True, default=generate_id)
     candidate_application_id: Mapped[str] = mapped_column(
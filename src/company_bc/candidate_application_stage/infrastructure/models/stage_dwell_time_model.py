@@ -0,0 +1,36 @@
+"""Stage dwell time SQLAlchemy models"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import String, Date, DateTime, Integer, Float, JSON, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.base import Base
+
+
+@dataclass
+class StageDwellTimeDailyModel(Base):
+    """Dwell time histogram of the visits to a stage completed on one day (UTC)"""
+    __tablename__ = "stage_dwell_times_daily"
+
+    stage_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    workflow_id: Mapped[Optional[str]] = mapped_column(String(26), nullable=True, index=True)
+    visit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_hours: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    buckets: Mapped[List[int]] = mapped_column(JSON, nullable=False, default=list)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
+@dataclass
+class StageDwellTimeWatermarkModel(Base):
+    """Last stage visit (by completion order) added to the daily histograms"""
+    __tablename__ = "stage_dwell_time_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    stage_record_id: Mapped[Optional[str]] = mapped_column(String(26), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
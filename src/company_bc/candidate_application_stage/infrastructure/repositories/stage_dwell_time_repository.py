@@ -0,0 +1,150 @@
+"""Stage dwell time repository implementation"""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, tuple_
+
+from src.company_bc.candidate_application_stage.domain.infrastructure.stage_dwell_time_repository_interface import (
+    OpenStageVisits, StageDwellTimeRepositoryInterface
+)
+from src.company_bc.candidate_application_stage.domain.value_objects.dwell_time_histogram import DwellTimeHistogram
+from src.company_bc.candidate_application_stage.infrastructure.models.candidate_stage_model import \
+    CandidateApplicationStageModel
+from src.company_bc.candidate_application_stage.infrastructure.models.stage_dwell_time_model import (
+    StageDwellTimeDailyModel, StageDwellTimeWatermarkModel
+)
+
+WATERMARK_NAME = "candidate_application_stages"
+
+
+class StageDwellTimeRepository(StageDwellTimeRepositoryInterface):
+    """SQLAlchemy implementation of StageDwellTimeRepository
+
+    Completed stage visits are read in (completed_at, id) order after a
+    watermark, so each visit is added exactly once. The watermark row is locked
+    for the whole batch, which keeps concurrent runs from double counting.
+    """
+
+    def __init__(self, database: Any) -> None:
+        self._database = database
+
+    def aggregate_completed_visits(self, completed_before: datetime, batch_size: int) -> int:
+        """Add the next batch of completed visits to the daily histograms"""
+        visit = CandidateApplicationStageModel
+        with self._database.get_session() as session:
+            watermark = session.query(StageDwellTimeWatermarkModel).filter_by(
+                name=WATERMARK_NAME
+            ).with_for_update().first()
+            if watermark is None:
+                watermark = StageDwellTimeWatermarkModel(name=WATERMARK_NAME, completed_at=None, stage_record_id=None)
+                session.add(watermark)
+
+            query = session.query(
+                visit.id, visit.stage_id, visit.workflow_id, visit.started_at, visit.completed_at
+            ).filter(
+                visit.completed_at.isnot(None),
+                visit.completed_at < completed_before
+            )
+            if watermark.completed_at is not None:
+                query = query.filter(
+                    tuple_(visit.completed_at, visit.id) > tuple_(watermark.completed_at, watermark.stage_record_id)
+                )
+            visits = query.order_by(visit.completed_at, visit.id).limit(batch_size).all()
+
+            histograms: Dict[Tuple[str, date], DwellTimeHistogram] = defaultdict(DwellTimeHistogram)
+            workflow_ids: Dict[str, Optional[str]] = {}
+            for row in visits:
+                if row.stage_id is None:
+                    continue
+                hours = (row.completed_at - row.started_at).total_seconds() / 3600
+                histograms[(row.stage_id, row.completed_at.date())].add(hours)
+                workflow_ids[row.stage_id] = row.workflow_id
+
+            if histograms:
+                self._merge_daily(session, histograms, workflow_ids)
+            if visits:
+                watermark.completed_at = visits[-1].completed_at
+                watermark.stage_record_id = visits[-1].id
+            session.commit()
+            return len(visits)
+
+    def get_histograms(
+            self,
+            stage_ids: List[str],
+            completed_from: Optional[date] = None,
+            completed_to: Optional[date] = None
+    ) -> Dict[str, DwellTimeHistogram]:
+        """Merge the daily histograms of each stage over the period"""
+        if not stage_ids:
+            return {}
+        with self._database.get_session() as session:
+            query = session.query(StageDwellTimeDailyModel).filter(StageDwellTimeDailyModel.stage_id.in_(stage_ids))
+            if completed_from:
+                query = query.filter(StageDwellTimeDailyModel.day >= completed_from)
+            if completed_to:
+                query = query.filter(StageDwellTimeDailyModel.day <= completed_to)
+
+            histograms: Dict[str, DwellTimeHistogram] = defaultdict(DwellTimeHistogram)
+            for model in query.all():
+                histograms[model.stage_id].merge(self._to_histogram(model))
+            return dict(histograms)
+
+    def get_open_visits(self, stage_ids: List[str]) -> Dict[str, OpenStageVisits]:
+        """Count the uncompleted visits of each stage and find the oldest one"""
+        if not stage_ids:
+            return {}
+        visit = CandidateApplicationStageModel
+        with self._database.get_session() as session:
+            rows = session.query(
+                visit.stage_id, func.count(visit.id), func.min(visit.started_at)
+            ).filter(
+                visit.stage_id.in_(stage_ids),
+                visit.completed_at.is_(None)
+            ).group_by(visit.stage_id).all()
+            return {
+                stage_id: OpenStageVisits(count=count, oldest_started_at=oldest_started_at)
+                for stage_id, count, oldest_started_at in rows
+            }
+
+    def _merge_daily(
+            self,
+            session: Any,
+            histograms: Dict[Tuple[str, date], DwellTimeHistogram],
+            workflow_ids: Dict[str, Optional[str]]
+    ) -> None:
+        """Merge a batch into the existing daily rows, creating the missing ones"""
+        days = [day for _, day in histograms]
+        existing = {
+            (model.stage_id, model.day): model
+            for model in session.query(StageDwellTimeDailyModel).filter(
+                StageDwellTimeDailyModel.stage_id.in_({stage_id for stage_id, _ in histograms}),
+                StageDwellTimeDailyModel.day >= min(days),
+                StageDwellTimeDailyModel.day <= max(days)
+            ).all()
+        }
+        for (stage_id, day), histogram in histograms.items():
+            model = existing.get((stage_id, day))
+            if model is None:
+                model = StageDwellTimeDailyModel(stage_id=stage_id, day=day, workflow_id=workflow_ids.get(stage_id))
+                session.add(model)
+            else:
+                histogram.merge(self._to_histogram(model))
+            model.visit_count = histogram.count
+            model.total_hours = histogram.total_hours
+            model.min_hours = histogram.min_hours
+            model.max_hours = histogram.max_hours
+            model.buckets = list(histogram.buckets)
+
+    @staticmethod
+    def _to_histogram(model: StageDwellTimeDailyModel) -> DwellTimeHistogram:
+        histogram = DwellTimeHistogram(
+            count=model.visit_count,
+            total_hours=model.total_hours,
+            min_hours=model.min_hours,
+            max_hours=model.max_hours
+        )
+        # Rows written with another bucket layout keep their count, mean and range
+        if len(model.buckets or []) == len(histogram.buckets):
+            histogram.buckets = list(model.buckets)
+        return histogram
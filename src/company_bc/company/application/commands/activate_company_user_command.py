@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.company.domain.exceptions.company_exceptions import CompanyNotFoundError
 from src.company_bc.company.domain.infrastructure.company_user_repository_interface import \
     CompanyUserRepositoryInterface
@@ -16,8 +19,13 @@ class ActivateCompanyUserCommand(Command):
 class ActivateCompanyUserCommandHandler(CommandHandler):
     """Handler for activating a company user"""
 
-    def __init__(self, repository: CompanyUserRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyUserRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: ActivateCompanyUserCommand) -> None:
         """Execute the command - NO return value"""
@@ -32,3 +40,4 @@ class ActivateCompanyUserCommandHandler(CommandHandler):
 
         # Persist
         self.repository.save(company_user)
+        self.permission_cache.invalidate_company(str(company_user.company_id))
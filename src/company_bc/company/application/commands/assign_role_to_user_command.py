@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import Optional, Dict, List
 
 from src.auth_bc.user.domain.value_objects.UserId import UserId
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.company.domain.enums import CompanyUserRole
 from src.company_bc.company.domain.exceptions.company_exceptions import CompanyValidationError, CompanyNotFoundError
 from src.company_bc.company.domain.infrastructure.company_user_repository_interface import (
@@ -31,10 +34,12 @@ class AssignRoleToUserCommandHandler(CommandHandler):
     def __init__(
             self,
             repository: CompanyUserRepositoryInterface,
-            company_role_repository: CompanyRoleRepositoryInterface
+            company_role_repository: CompanyRoleRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
     ):
         self.repository = repository
         self.company_role_repository = company_role_repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: AssignRoleToUserCommand) -> None:
         """Execute the command - NO return value"""
@@ -78,3 +83,4 @@ class AssignRoleToUserCommandHandler(CommandHandler):
 
         # Save updated entity
         self.repository.save(company_user)
+        self.permission_cache.invalidate_company(str(company_id))
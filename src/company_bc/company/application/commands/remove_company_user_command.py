@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.auth_bc.user.domain.value_objects.UserId import UserId
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.company.domain.exceptions.company_exceptions import CompanyValidationError, CompanyNotFoundError
 from src.company_bc.company.domain.infrastructure.company_user_repository_interface import \
     CompanyUserRepositoryInterface
@@ -19,8 +22,13 @@ class RemoveCompanyUserCommand(Command):
 class RemoveCompanyUserCommandHandler(CommandHandler):
     """Handler for removing a user from a company"""
 
-    def __init__(self, repository: CompanyUserRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyUserRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: RemoveCompanyUserCommand) -> None:
         """Execute the command - NO return value"""
@@ -47,3 +55,4 @@ class RemoveCompanyUserCommandHandler(CommandHandler):
 
         # Delete from repository
         self.repository.delete(company_user.id)
+        self.permission_cache.invalidate_company(str(company_id))
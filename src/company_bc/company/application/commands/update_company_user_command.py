@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Dict
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.company.domain.enums import CompanyUserRole
 from src.company_bc.company.domain.exceptions.company_exceptions import CompanyNotFoundError, CompanyValidationError
 from src.company_bc.company.domain.infrastructure.company_user_repository_interface import \
@@ -21,8 +24,13 @@ class UpdateCompanyUserCommand(Command):
 class UpdateCompanyUserCommandHandler(CommandHandler):
     """Handler for updating a company user"""
 
-    def __init__(self, repository: CompanyUserRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyUserRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: UpdateCompanyUserCommand) -> None:
         """Execute the command - NO return value"""
@@ -45,3 +53,4 @@ class UpdateCompanyUserCommandHandler(CommandHandler):
 
         # Persist
         self.repository.save(company_user)
+        self.permission_cache.invalidate_company(str(company_user.company_id))
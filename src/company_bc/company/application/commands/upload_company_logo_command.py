@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.company_bc.company.domain.exceptions.company_exceptions import CompanyNotFoundError
 from src.company_bc.company.domain.infrastructure.company_repository_interface import CompanyRepositoryInterface
@@ -7,6 +8,7 @@ from src.framework.application.command_bus import Command, CommandHandler
 from src.framework.domain.infrastructure.storage_service_interface import (
     StorageServiceInterface,
     StorageType,
+    UploadedFile,
 )
 
 
@@ -14,9 +16,11 @@ from src.framework.domain.infrastructure.storage_service_interface import (
 class UploadCompanyLogoCommand(Command):
     """Command to upload a logo for a company"""
     company_id: str
-    file_content: bytes
     filename: str
     content_type: str
+    file_content: Optional[bytes] = None
+    # Set when the HTTP layer already streamed the file to storage (see StorageServiceInterface.upload_stream)
+    uploaded_file: Optional[UploadedFile] = None
 
 
 class UploadCompanyLogoCommandHandler(CommandHandler[UploadCompanyLogoCommand]):
@@ -39,15 +43,19 @@ class UploadCompanyLogoCommandHandler(CommandHandler[UploadCompanyLogoCommand]):
         if not company:
             raise CompanyNotFoundError(f"Company with id {command.company_id} not found")
 
-        # Upload file to storage
-        uploaded_file = self._storage_service.upload_file(
-            file_content=command.file_content,
-            filename=command.filename,
-            content_type=command.content_type,
-            storage_type=StorageType.COMPANY_LOGO,
-            entity_id=str(company.id),
-            company_id=str(company.id)
-        )
+        uploaded_file = command.uploaded_file
+        if uploaded_file is None:
+            if command.file_content is None:
+                raise ValueError("Either file_content or uploaded_file is required")
+            # Upload file to storage
+            uploaded_file = self._storage_service.upload_file(
+                file_content=command.file_content,
+                filename=command.filename,
+                content_type=command.content_type,
+                storage_type=StorageType.COMPANY_LOGO,
+                entity_id=str(company.id),
+                company_id=str(company.id)
+            )
 
         # Update the company with the logo URL
         updated_company = company.update(
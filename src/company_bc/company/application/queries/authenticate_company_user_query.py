@@ -50,6 +50,12 @@ class AuthenticateCompanyUserQueryHandler(
         if not PasswordService.verify_password(query.password, user.hashed_password):
             return None
 
+        # Upgrade hashes made with an outdated cost while the plain password is at hand
+        if PasswordService.needs_rehash(user.hashed_password):
+            self.user_repository.update(user.id, {
+                "hashed_password": PasswordService.hash_password(query.password)
+            })
+
         # Check if user is active
         if not user.is_active:
             return None
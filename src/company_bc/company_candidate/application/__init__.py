@@ -6,6 +6,11 @@ from .commands.archive_company_candidate_command import (
     ArchiveCompanyCandidateCommandHandler,
 )
 from .commands.assign_workflow_command import AssignWorkflowCommand, AssignWorkflowCommandHandler
+from .commands.bulk_change_stage_command import (
+    BulkChangeStageCommand,
+    BulkChangeStageCommandHandler,
+    BulkChangeStageItemResult,
+)
 from .commands.change_stage_command import ChangeStageCommand, ChangeStageCommandHandler
 from .commands.confirm_company_candidate_command import (
     ConfirmCompanyCandidateCommand,
@@ -105,6 +110,9 @@ __all__ = [
     "ArchiveCompanyCandidateCommandHandler",
     "AssignWorkflowCommand",
     "AssignWorkflowCommandHandler",
+    "BulkChangeStageCommand",
+    "BulkChangeStageCommandHandler",
+    "BulkChangeStageItemResult",
     "ChangeStageCommand",
     "ChangeStageCommandHandler",
     "ConfirmCompanyCandidateCommand",
@@ -0,0 +1,228 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict
+
+from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
+    CandidateApplicationRepositoryInterface
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.company_candidate.domain.entities.company_candidate import CompanyCandidate
+from src.company_bc.company_candidate.domain.infrastructure.company_candidate_repository_interface import \
+    CompanyCandidateRepositoryInterface
+from src.company_bc.company_candidate.domain.value_objects.company_candidate_id import CompanyCandidateId
+from src.framework.application.command_bus import Command, CommandHandler, CommandBus
+from src.interview_bc.interview.application.commands.create_interview import CreateInterviewCommand
+from src.interview_bc.interview.domain.enums.interview_enums import InterviewModeEnum
+from src.interview_bc.interview_template.domain.infrastructure.interview_template_repository_interface import \
+    InterviewTemplateRepositoryInterface
+from src.interview_bc.interview_template.domain.value_objects.interview_template_id import InterviewTemplateId
+from src.shared_bc.customization.field_validation.application.services.interview_validation_service import \
+    InterviewValidationService
+from src.shared_bc.customization.workflow.domain.entities.workflow_stage import WorkflowStage
+from src.shared_bc.customization.workflow.domain.enums.workflow_stage_type_enum import WorkflowStageTypeEnum
+from src.shared_bc.customization.workflow.domain.enums.workflow_type import WorkflowTypeEnum
+from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
+    WorkflowRepositoryInterface
+from src.shared_bc.customization.workflow.domain.interfaces.workflow_stage_repository_interface import \
+    WorkflowStageRepositoryInterface
+from src.shared_bc.customization.workflow.domain.services.stage_phase_validation_service import \
+    StagePhaseValidationService
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkChangeStageItemResult:
+    """Outcome of the stage change for a single company candidate"""
+    company_candidate_id: str
+    success: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkChangeStageCommand(Command):
+    """Command to move many company candidates of a company to the same workflow stage
+
+    As with ChangeStageCommand, the moves are not recorded in the stage visit history,
+    so they are not part of the stage dwell times.
+    """
+    company_id: CompanyId
+    company_candidate_ids: List[CompanyCandidateId]
+    new_stage_id: WorkflowStageId
+
+    # Output fields - populated during execution
+    results: List[BulkChangeStageItemResult] = field(default_factory=list)
+
+
+class BulkChangeStageCommandHandler(CommandHandler[BulkChangeStageCommand]):
+    """
+    Handler for bulk stage changes.
+
+    Applies the same rules as ChangeStageCommandHandler, but resolves the target stage,
+    phase and next-phase workflow once for the whole batch, checks pending interviews
+    with a single grouped query and moves every eligible candidate with one UPDATE.
+    """
+
+    def __init__(
+            self,
+            repository: CompanyCandidateRepositoryInterface,
+            workflow_stage_repository: WorkflowStageRepositoryInterface,
+            workflow_repository: WorkflowRepositoryInterface,
+            validation_service: StagePhaseValidationService,
+            interview_validation_service: InterviewValidationService,
+            candidate_application_repository: CandidateApplicationRepositoryInterface,
+            interview_template_repository: InterviewTemplateRepositoryInterface,
+            command_bus: CommandBus
+    ):
+        self._repository = repository
+        self._workflow_stage_repository = workflow_stage_repository
+        self._workflow_repository = workflow_repository
+        self._validation_service = validation_service
+        self._interview_validation_service = interview_validation_service
+        self._candidate_application_repository = candidate_application_repository
+        self._interview_template_repository = interview_template_repository
+        self._command_bus = command_bus
+
+    def execute(self, command: BulkChangeStageCommand) -> None:
+        """Validate the target stage once and move all eligible candidates in a single batch"""
+        target_stage = self._workflow_stage_repository.get_by_id(command.new_stage_id)
+        if not target_stage:
+            raise ValueError(f"Stage {command.new_stage_id.value} not found")
+
+        try:
+            target_phase_id = self._validation_service.validate_workflow_has_phase(target_stage.workflow_id)
+        except ValueError as e:
+            raise ValueError(f"Cannot change stage: {e}")
+
+        # Resolve where the batch ends up: the target stage, or the initial stage of the
+        # next phase when the target is a SUCCESS stage with a next phase configured
+        final_workflow_id = target_stage.workflow_id
+        final_stage_id = command.new_stage_id
+        final_phase_id = target_phase_id.value if target_phase_id else None
+        if target_stage.stage_type == WorkflowStageTypeEnum.SUCCESS and target_stage.next_phase_id:
+            next_phase_workflows = self._workflow_repository.list_by_phase_id(
+                target_stage.next_phase_id,
+                workflow_type=WorkflowTypeEnum.CANDIDATE_APPLICATION
+            )
+            if next_phase_workflows:
+                next_phase_workflow = next((w for w in next_phase_workflows if w.is_default), None) or \
+                    next_phase_workflows[0]
+                initial_stage = self._workflow_stage_repository.get_initial_stage(next_phase_workflow.id)
+                if initial_stage:
+                    final_workflow_id = next_phase_workflow.id
+                    final_stage_id = initial_stage.id
+                    final_phase_id = target_stage.next_phase_id.value
+
+        # Preserve request order and drop duplicates
+        requested_ids = list(dict.fromkeys(str(cc_id) for cc_id in command.company_candidate_ids))
+        company_candidates = {
+            str(cc.id): cc for cc in self._repository.list_by_ids(
+                command.company_id,
+                [CompanyCandidateId.from_string(cc_id) for cc_id in requested_ids]
+            )
+        }
+
+        pending_counts = self._interview_validation_service.get_pending_interviews_counts([
+            (cc.candidate_id, cc.current_stage_id)
+            for cc in company_candidates.values()
+            if cc.current_stage_id
+        ])
+
+        errors: Dict[str, str] = {}
+        eligible: List[CompanyCandidate] = []
+        for cc_id in requested_ids:
+            company_candidate = company_candidates.get(cc_id)
+            if not company_candidate:
+                errors[cc_id] = f"Company candidate with id {cc_id} not found"
+                continue
+
+            pending_count = pending_counts.get(str(company_candidate.candidate_id), 0)
+            if pending_count:
+                errors[cc_id] = (
+                    f"Cannot change stage: There are {pending_count} pending interview(s) in the current stage. "
+                    "Please complete or cancel all pending interviews before changing stages."
+                )
+                continue
+
+            # Within the same phase the candidate needs a workflow to move between stages
+            same_phase = bool(target_phase_id) and company_candidate.phase_id == target_phase_id.value
+            if same_phase and not company_candidate.workflow_id:
+                errors[cc_id] = "Cannot change stage without an assigned workflow"
+                continue
+
+            eligible.append(company_candidate)
+
+        if eligible:
+            self._repository.bulk_change_stage(
+                company_id=command.company_id,
+                company_candidate_ids=[cc.id for cc in eligible],
+                workflow_id=final_workflow_id,
+                stage_id=final_stage_id,
+                phase_id=final_phase_id
+            )
+            self._create_interviews_for_stage(eligible, target_stage)
+
+        command.results = [
+            BulkChangeStageItemResult(company_candidate_id=cc_id, success=False, error=errors[cc_id])
+            if cc_id in errors else
+            BulkChangeStageItemResult(company_candidate_id=cc_id, success=True)
+            for cc_id in requested_ids
+        ]
+
+    def _create_interviews_for_stage(
+            self,
+            company_candidates: List[CompanyCandidate],
+            stage: WorkflowStage
+    ) -> None:
+        """
+        Create the AUTOMATIC interviews configured on the stage for every moved candidate.
+
+        Templates are loaded once for the batch instead of once per candidate.
+        """
+        configs = [
+            config for config in (stage.interview_configurations or [])
+            if config.mode == InterviewModeEnum.AUTOMATIC
+        ]
+        required_roles = stage.default_role_ids if stage.default_role_ids else []
+        if not configs or not required_roles:
+            return
+
+        templates = []
+        for config in configs:
+            template = self._interview_template_repository.get_by_id(
+                InterviewTemplateId.from_string(config.template_id)
+            )
+            if not template:
+                logger.warning(f"[AUTO INTERVIEW] Template {config.template_id} not found")
+                continue
+            templates.append((config, template))
+
+        if not templates:
+            return
+
+        for company_candidate in company_candidates:
+            candidate_id = CandidateId.from_string(company_candidate.candidate_id.value)
+            applications = self._candidate_application_repository.get_applications_by_candidate(candidate_id)
+            if not applications:
+                logger.warning(f"[AUTO INTERVIEW] No applications found for candidate {candidate_id.value}")
+                continue
+
+            job_position_id = applications[0].job_position_id
+            for config, template in templates:
+                create_interview_command = CreateInterviewCommand(
+                    candidate_id=candidate_id.value,
+                    job_position_id=job_position_id.value,
+                    workflow_stage_id=stage.id.value,
+                    interview_template_id=config.template_id,
+                    interview_mode=config.mode.value,
+                    required_roles=required_roles,
+                    title=template.name,
+                    description=template.intro,
+                    interview_type="CUSTOM",
+                    created_by=company_candidate.company_id.value
+                )
+                try:
+                    self._command_bus.execute(create_interview_command)
+                except Exception as e:
+                    logger.error(f"[AUTO INTERVIEW] Error creating interview: {e}", exc_info=True)
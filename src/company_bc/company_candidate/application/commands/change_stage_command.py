@@ -31,7 +31,13 @@ from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id
 
 @dataclass(frozen=True)
 class ChangeStageCommand(Command):
-    """Command to change the workflow stage of a company candidate"""
+    """Command to change the workflow stage of a company candidate
+
+    The move is not recorded in the stage visit history (candidate_application_stages):
+    that history belongs to candidate applications and is only written by
+    MoveCandidateToStageCommand, so stage dwell times and bottleneck detection do
+    not include company candidate moves.
+    """
     id: CompanyCandidateId
     new_stage_id: WorkflowStageId
 
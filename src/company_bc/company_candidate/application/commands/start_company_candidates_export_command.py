@@ -0,0 +1,50 @@
+"""Command for exporting company candidates asynchronously."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.domain.entities.async_job import AsyncJobId
+from src.framework.domain.enums.async_job import AsyncJobType
+from src.framework.infrastructure.actors.company_candidate_export_actor import export_company_candidates
+from src.framework.infrastructure.jobs.async_job_service import AsyncJobService
+from src.framework.infrastructure.services.export import ExportFormat
+
+
+@dataclass
+class StartCompanyCandidatesExportCommand(Command):
+    """Command to export all company candidates of a company to a file in a background job"""
+    job_id: AsyncJobId
+    company_id: CompanyId
+    export_format: ExportFormat = ExportFormat.CSV
+    requested_by: Optional[str] = None
+    timeout_seconds: int = 60 * 60
+
+
+class StartCompanyCandidatesExportCommandHandler(CommandHandler[StartCompanyCandidatesExportCommand]):
+    """Handler for StartCompanyCandidatesExportCommand."""
+
+    def __init__(self, async_job_service: AsyncJobService):
+        self.async_job_service = async_job_service
+
+    def execute(self, command: StartCompanyCandidatesExportCommand) -> None:
+        """Create the async job and hand the export over to the Dramatiq worker"""
+        self.async_job_service.create_job(
+            id=command.job_id,
+            job_type=AsyncJobType.REPORT_GENERATION,
+            entity_type="company",
+            entity_id=str(command.company_id),
+            metadata={
+                "export": "company_candidates",
+                "format": command.export_format.value,
+                "requested_by": command.requested_by,
+            },
+            timeout_seconds=command.timeout_seconds
+        )
+
+        export_company_candidates.send(
+            job_id=command.job_id.value,
+            company_id=str(command.company_id),
+            export_format=command.export_format.value
+        )
@@ -5,7 +5,8 @@ from src.company_bc.company_candidate.domain.infrastructure.company_candidate_re
     CompanyCandidateRepositoryInterface
 from src.company_bc.company_candidate.domain.value_objects.company_candidate_id import CompanyCandidateId
 from src.framework.application.command_bus import Command, CommandHandler
-from src.framework.domain.infrastructure.storage_service_interface import StorageServiceInterface, StorageType
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface
 
 
 @dataclass(frozen=True)
@@ -24,10 +25,10 @@ class UploadCandidateResumeCommandHandler(CommandHandler):
     def __init__(
             self,
             repository: CompanyCandidateRepositoryInterface,
-            storage_service: StorageServiceInterface
+            blob_store: BlobStoreInterface
     ):
         self._repository = repository
-        self._storage_service = storage_service
+        self._blob_store = blob_store
 
     def execute(self, command: UploadCandidateResumeCommand) -> None:
         """Handle the upload resume command"""
@@ -36,14 +37,11 @@ class UploadCandidateResumeCommandHandler(CommandHandler):
         if not company_candidate:
             raise ValueError(f"CompanyCandidate with id {command.company_candidate_id} not found")
 
-        # Upload file to storage
-        uploaded_file = self._storage_service.upload_file(
+        # Store the file once per distinct content: the same CV sent to many companies is kept once
+        uploaded_file = self._blob_store.store_bytes(
             file_content=command.file_content,
             filename=command.filename,
-            content_type=command.content_type,
-            storage_type=StorageType.CANDIDATE_RESUME,
-            entity_id=str(company_candidate.candidate_id),
-            company_id=str(company_candidate.company_id)
+            content_type=command.content_type
         )
 
         # Update the company candidate with the resume URL
@@ -54,3 +52,11 @@ class UploadCandidateResumeCommandHandler(CommandHandler):
 
         # Save to repository
         self._repository.save(updated_candidate)
+
+        # Replaces the reference to a previous resume, which is deleted if nothing else uses it
+        if uploaded_file.content_hash:
+            self._blob_store.add_reference(
+                uploaded_file.content_hash,
+                BlobOwnerType.COMPANY_CANDIDATE_RESUME,
+                str(command.company_candidate_id)
+            )
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.company_candidate.domain.infrastructure.company_candidate_repository_interface import (
+    CompanyCandidateRepositoryInterface
+)
+from src.company_bc.company_candidate.domain.read_models.company_candidate_export_read_model import (
+    CompanyCandidateExportReadModel
+)
+from src.framework.application.query_bus import Query, QueryHandler
+
+# Fixed export columns, in file order; custom field columns are appended after them
+EXPORT_COLUMNS: List[str] = [
+    "id",
+    "candidate_id",
+    "candidate_name",
+    "candidate_email",
+    "candidate_phone",
+    "status",
+    "priority",
+    "source",
+    "tags",
+    "position",
+    "department",
+    "workflow_name",
+    "stage_name",
+    "job_position_id",
+    "job_position_title",
+    "application_status",
+    "invited_at",
+    "created_at",
+    "updated_at",
+]
+
+
+@dataclass
+class CompanyCandidatesExportDto:
+    """Header and lazily evaluated rows of a company candidates export"""
+    header: List[str]
+    rows: Iterator[List[Any]]
+
+
+@dataclass(frozen=True)
+class ExportCompanyCandidatesQuery(Query):
+    """Query to stream all company candidates of a company as export rows"""
+    company_id: str
+    batch_size: int = 1000
+
+
+class ExportCompanyCandidatesQueryHandler(
+    QueryHandler[ExportCompanyCandidatesQuery, CompanyCandidatesExportDto]
+):
+    """
+    Handler for company candidate exports.
+
+    Rows are produced by a generator over the repository's server-side cursor, so
+    nothing is fetched until the caller starts consuming them.
+    """
+
+    def __init__(self, repository: CompanyCandidateRepositoryInterface):
+        self._repository = repository
+
+    def handle(self, query: ExportCompanyCandidatesQuery) -> CompanyCandidatesExportDto:
+        company_id = CompanyId.from_string(query.company_id)
+        custom_field_keys = self._repository.list_export_custom_field_keys(company_id)
+
+        header = EXPORT_COLUMNS + [
+            f"custom_field.{key}" if key in EXPORT_COLUMNS else key
+            for key in custom_field_keys
+        ]
+        rows = self._iter_rows(company_id, custom_field_keys, query.batch_size)
+        return CompanyCandidatesExportDto(header=header, rows=rows)
+
+    def _iter_rows(
+            self,
+            company_id: CompanyId,
+            custom_field_keys: List[str],
+            batch_size: int
+    ) -> Iterator[List[Any]]:
+        for item in self._repository.iter_for_export(company_id, batch_size=batch_size):
+            yield self._to_row(item, custom_field_keys)
+
+    @staticmethod
+    def _to_row(item: CompanyCandidateExportReadModel, custom_field_keys: List[str]) -> List[Any]:
+        row: List[Any] = [getattr(item, column) for column in EXPORT_COLUMNS]
+        row.extend(item.custom_field_values.get(key) for key in custom_field_keys)
+        return row
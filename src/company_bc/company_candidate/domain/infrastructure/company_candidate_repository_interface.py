@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
 from src.company_bc.company.domain.value_objects import CompanyId
 from ..entities.company_candidate import CompanyCandidate
+from ..read_models.company_candidate_export_read_model import CompanyCandidateExportReadModel
 from ..read_models.company_candidate_with_candidate_read_model import CompanyCandidateWithCandidateReadModel
 from ..value_objects import CompanyCandidateId
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_id import WorkflowId
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
 
 
 class CompanyCandidateRepositoryInterface(ABC):
@@ -44,6 +47,30 @@ class CompanyCandidateRepositoryInterface(ABC):
         """List all company candidates for a company"""
         pass
 
+    @abstractmethod
+    def list_by_ids(
+            self,
+            company_id: CompanyId,
+            company_candidate_ids: List[CompanyCandidateId]
+    ) -> List[CompanyCandidate]:
+        """List the company candidates of a company matching the given IDs in a single query"""
+        pass
+
+    @abstractmethod
+    def bulk_change_stage(
+            self,
+            company_id: CompanyId,
+            company_candidate_ids: List[CompanyCandidateId],
+            workflow_id: WorkflowId,
+            stage_id: WorkflowStageId,
+            phase_id: Optional[str]
+    ) -> int:
+        """
+        Move many company candidates to the same stage with a single UPDATE.
+        Returns the number of rows updated.
+        """
+        pass
+
     @abstractmethod
     def list_by_candidate(self, candidate_id: CandidateId) -> List[CompanyCandidate]:
         """List all company candidates for a candidate"""
@@ -67,3 +94,20 @@ class CompanyCandidateRepositoryInterface(ABC):
         Returns read models (not entities) with data from both tables via JOIN.
         """
         pass
+
+    @abstractmethod
+    def iter_for_export(
+            self,
+            company_id: CompanyId,
+            batch_size: int = 1000
+    ) -> Iterator[CompanyCandidateExportReadModel]:
+        """
+        Stream the company candidates of a company as flat export rows.
+        Rows are fetched in batches of `batch_size` so memory stays flat for any export size.
+        """
+        pass
+
+    @abstractmethod
+    def list_export_custom_field_keys(self, company_id: CompanyId) -> List[str]:
+        """List the custom field keys that have values on any company candidate of the company"""
+        pass
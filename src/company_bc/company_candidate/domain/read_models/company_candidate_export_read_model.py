@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+
+@dataclass(slots=True)
+class CompanyCandidateExportReadModel:
+    """
+    Flat row for company candidate exports.
+    Only the columns written to the export file are loaded, so rows can be streamed
+    from a server-side cursor without hydrating ORM entities.
+    """
+    id: str
+    candidate_id: str
+    candidate_name: Optional[str]
+    candidate_email: Optional[str]
+    candidate_phone: Optional[str]
+    status: str
+    priority: Optional[str]
+    source: Optional[str]
+    tags: List[str]
+    position: Optional[str]
+    department: Optional[str]
+    workflow_name: Optional[str]
+    stage_name: Optional[str]
+    job_position_id: Optional[str]
+    job_position_title: Optional[str]
+    application_status: Optional[str]
+    invited_at: Optional[datetime]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    custom_field_values: Dict[str, Any] = field(default_factory=dict)
@@ -1,4 +1,5 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Iterator
 
 from sqlalchemy.orm import Session
 
@@ -18,6 +19,9 @@ from src.company_bc.company_candidate.domain.enums import (
 from src.company_bc.company_candidate.domain.infrastructure.company_candidate_repository_interface import (
     CompanyCandidateRepositoryInterface
 )
+from src.company_bc.company_candidate.domain.read_models.company_candidate_export_read_model import (
+    CompanyCandidateExportReadModel
+)
 from src.company_bc.company_candidate.domain.read_models.company_candidate_with_candidate_read_model import (
     CompanyCandidateWithCandidateReadModel
 )
@@ -261,6 +265,50 @@ class CompanyCandidateRepository(CompanyCandidateRepositoryInterface):
         ).all()
         return [self._to_domain(model) for model in models]
 
+    def list_by_ids(
+            self,
+            company_id: CompanyId,
+            company_candidate_ids: List[CompanyCandidateId]
+    ) -> List[CompanyCandidate]:
+        """List the company candidates of a company matching the given IDs in a single query"""
+        if not company_candidate_ids:
+            return []
+
+        session = self._get_session()
+        models = session.query(CompanyCandidateModel).filter(
+            CompanyCandidateModel.company_id == str(company_id),
+            CompanyCandidateModel.id.in_([str(cc_id) for cc_id in company_candidate_ids])
+        ).all()
+        return [self._to_domain(model) for model in models]
+
+    def bulk_change_stage(
+            self,
+            company_id: CompanyId,
+            company_candidate_ids: List[CompanyCandidateId],
+            workflow_id: WorkflowId,
+            stage_id: WorkflowStageId,
+            phase_id: Optional[str]
+    ) -> int:
+        """Move many company candidates to the same stage with a single UPDATE"""
+        if not company_candidate_ids:
+            return 0
+
+        session = self._get_session()
+        values: Dict[Any, Any] = {
+            CompanyCandidateModel.workflow_id: str(workflow_id),
+            CompanyCandidateModel.current_stage_id: str(stage_id),
+            CompanyCandidateModel.updated_at: datetime.utcnow(),
+        }
+        if phase_id:
+            values[CompanyCandidateModel.phase_id] = phase_id
+
+        updated = session.query(CompanyCandidateModel).filter(
+            CompanyCandidateModel.company_id == str(company_id),
+            CompanyCandidateModel.id.in_([str(cc_id) for cc_id in company_candidate_ids])
+        ).update(values, synchronize_session=False)
+        session.commit()
+        return updated
+
     def list_by_candidate(self, candidate_id: CandidateId) -> List[CompanyCandidate]:
         """List all company candidates for a candidate"""
         session = self._get_session()
@@ -396,3 +444,140 @@ class CompanyCandidateRepository(CompanyCandidateRepositoryInterface):
             read_models.append(read_model)
 
         return read_models
+
+    def iter_for_export(
+            self,
+            company_id: CompanyId,
+            batch_size: int = 1000
+    ) -> Iterator[CompanyCandidateExportReadModel]:
+        """
+        Stream the company candidates of a company as flat export rows.
+
+        Runs on its own session with a server-side cursor (yield_per), so only
+        `batch_size` rows are held in memory at a time regardless of the export size.
+        The session is independent from the request scope because the generator is
+        consumed after the endpoint has returned (StreamingResponse) or in a worker.
+        """
+        from sqlalchemy import func
+        from src.shared_bc.customization.workflow.infrastructure.models import WorkflowModel
+        from src.shared_bc.customization.workflow.infrastructure.models import WorkflowStageModel
+        from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+            EntityCustomizationTypeEnum
+        from src.shared_bc.customization.entity_customization.infrastructure.models.custom_field_value_model import \
+            CustomFieldValueModel
+
+        session = self.database.new_session()
+        try:
+            # One application per candidate: the latest one to a position of this company,
+            # so candidates with several applications (or applications elsewhere) stay one row
+            latest_application = session.query(
+                CandidateApplicationModel.candidate_id.label('candidate_id'),
+                CandidateApplicationModel.job_position_id.label('job_position_id'),
+                CandidateApplicationModel.application_status.label('application_status'),
+                JobPositionModel.title.label('job_position_title'),
+                func.row_number().over(
+                    partition_by=CandidateApplicationModel.candidate_id,
+                    order_by=(CandidateApplicationModel.applied_at.desc(), CandidateApplicationModel.id.desc())
+                ).label('rank')
+            ).join(
+                JobPositionModel,
+                CandidateApplicationModel.job_position_id == JobPositionModel.id
+            ).filter(
+                JobPositionModel.company_id == str(company_id)
+            ).subquery()
+
+            query = session.query(
+                CompanyCandidateModel.id,
+                CompanyCandidateModel.candidate_id,
+                CandidateModel.name,
+                CandidateModel.email,
+                CandidateModel.phone,
+                CompanyCandidateModel.status,
+                CompanyCandidateModel.priority,
+                CompanyCandidateModel.source,
+                CompanyCandidateModel.tags,
+                CompanyCandidateModel.position,
+                CompanyCandidateModel.department,
+                WorkflowModel.name,
+                WorkflowStageModel.name,
+                latest_application.c.job_position_id,
+                latest_application.c.job_position_title,
+                latest_application.c.application_status,
+                CompanyCandidateModel.invited_at,
+                CompanyCandidateModel.created_at,
+                CompanyCandidateModel.updated_at,
+                CustomFieldValueModel.values
+            ).join(
+                CandidateModel,
+                CompanyCandidateModel.candidate_id == CandidateModel.id
+            ).outerjoin(
+                latest_application,
+                (latest_application.c.candidate_id == CompanyCandidateModel.candidate_id)
+                & (latest_application.c.rank == 1)
+            ).outerjoin(
+                WorkflowModel,
+                CompanyCandidateModel.workflow_id == WorkflowModel.id
+            ).outerjoin(
+                WorkflowStageModel,
+                CompanyCandidateModel.current_stage_id == WorkflowStageModel.id
+            ).outerjoin(
+                CustomFieldValueModel,
+                (CustomFieldValueModel.entity_type == EntityCustomizationTypeEnum.CANDIDATE_APPLICATION.value)
+                & (CustomFieldValueModel.entity_id == CompanyCandidateModel.id)
+            ).filter(
+                CompanyCandidateModel.company_id == str(company_id)
+            ).order_by(
+                CompanyCandidateModel.created_at,
+                CompanyCandidateModel.id
+            ).yield_per(batch_size)
+
+            for (
+                cc_id, candidate_id, candidate_name, candidate_email, candidate_phone,
+                status, priority, source, tags, position, department,
+                workflow_name, stage_name, job_position_id, job_position_title,
+                application_status, invited_at, created_at, updated_at, custom_field_values
+            ) in query:
+                yield CompanyCandidateExportReadModel(
+                    id=cc_id,
+                    candidate_id=candidate_id,
+                    candidate_name=candidate_name,
+                    candidate_email=candidate_email,
+                    candidate_phone=candidate_phone,
+                    status=status,
+                    priority=priority,
+                    source=source,
+                    tags=tags or [],
+                    position=position,
+                    department=department,
+                    workflow_name=workflow_name,
+                    stage_name=stage_name,
+                    job_position_id=job_position_id,
+                    job_position_title=job_position_title,
+                    application_status=application_status.value if application_status else None,
+                    invited_at=invited_at,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    custom_field_values=custom_field_values or {},
+                )
+        finally:
+            session.close()
+
+    def list_export_custom_field_keys(self, company_id: CompanyId) -> List[str]:
+        """List the custom field keys that have values on any company candidate of the company"""
+        from sqlalchemy import func
+        from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+            EntityCustomizationTypeEnum
+        from src.shared_bc.customization.entity_customization.infrastructure.models.custom_field_value_model import \
+            CustomFieldValueModel
+
+        session = self._get_session()
+        rows = session.query(
+            func.json_object_keys(CustomFieldValueModel.values).label('field_key')
+        ).join(
+            CompanyCandidateModel,
+            CustomFieldValueModel.entity_id == CompanyCandidateModel.id
+        ).filter(
+            CustomFieldValueModel.entity_type == EntityCustomizationTypeEnum.CANDIDATE_APPLICATION.value,
+            CompanyCandidateModel.company_id == str(company_id)
+        ).distinct().all()
+        return sorted(row.field_key for row in rows)
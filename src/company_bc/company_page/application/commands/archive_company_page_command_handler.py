@@ -7,13 +7,21 @@ from src.company_bc.company_page.domain.infrastructure.company_page_repository_i
     CompanyPageRepositoryInterface
 from src.company_bc.company_page.domain.value_objects.page_id import PageId
 from src.framework.application.command_bus import CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PublicResponseCache, public_response_cache
+)
 
 
 class ArchiveCompanyPageCommandHandler(CommandHandler[ArchiveCompanyPageCommand]):
     """Handler para archivar una página de empresa"""
 
-    def __init__(self, repository: CompanyPageRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyPageRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: ArchiveCompanyPageCommand) -> None:
         """Ejecutar comando de archivado de página"""
@@ -30,3 +38,4 @@ class ArchiveCompanyPageCommandHandler(CommandHandler[ArchiveCompanyPageCommand]
 
         # Guardar página archivada
         self.repository.save(archived_page)
+        self.response_cache.invalidate(PUBLIC_COMPANY_PAGES, page.company_id.value)
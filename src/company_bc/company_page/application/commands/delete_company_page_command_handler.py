@@ -6,17 +6,28 @@ from src.company_bc.company_page.domain.infrastructure.company_page_repository_i
     CompanyPageRepositoryInterface
 from src.company_bc.company_page.domain.value_objects.page_id import PageId
 from src.framework.application.command_bus import CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PublicResponseCache, public_response_cache
+)
 
 
 class DeleteCompanyPageCommandHandler(CommandHandler[DeleteCompanyPageCommand]):
     """Handler para eliminar una página de empresa"""
 
-    def __init__(self, repository: CompanyPageRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyPageRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: DeleteCompanyPageCommand) -> None:
         """Ejecutar comando de eliminación de página"""
 
         # Eliminar página
         page_id = PageId(command.page_id)
+        page = self.repository.get_by_id(page_id)
         self.repository.delete(page_id)
+        if page:
+            self.response_cache.invalidate(PUBLIC_COMPANY_PAGES, page.company_id.value)
@@ -7,13 +7,21 @@ from src.company_bc.company_page.domain.infrastructure.company_page_repository_i
     CompanyPageRepositoryInterface
 from src.company_bc.company_page.domain.value_objects.page_id import PageId
 from src.framework.application.command_bus import CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PublicResponseCache, public_response_cache
+)
 
 
 class PublishCompanyPageCommandHandler(CommandHandler[PublishCompanyPageCommand]):
     """Handler para publicar una página de empresa"""
 
-    def __init__(self, repository: CompanyPageRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyPageRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: PublishCompanyPageCommand) -> None:
         """Ejecutar comando de publicación de página"""
@@ -30,3 +38,4 @@ class PublishCompanyPageCommandHandler(CommandHandler[PublishCompanyPageCommand]
 
         # Guardar página publicada
         self.repository.save(published_page)
+        self.response_cache.invalidate(PUBLIC_COMPANY_PAGES, page.company_id.value)
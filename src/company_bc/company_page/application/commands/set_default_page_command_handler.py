@@ -9,13 +9,21 @@ from src.company_bc.company_page.domain.infrastructure.company_page_repository_i
     CompanyPageRepositoryInterface
 from src.company_bc.company_page.domain.value_objects.page_id import PageId
 from src.framework.application.command_bus import CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PublicResponseCache, public_response_cache
+)
 
 
 class SetDefaultPageCommandHandler(CommandHandler[SetDefaultPageCommand]):
     """Handler para marcar una página como página por defecto"""
 
-    def __init__(self, repository: CompanyPageRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyPageRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: SetDefaultPageCommand) -> None:
         """Ejecutar comando de marcar como página por defecto"""
@@ -35,6 +43,7 @@ class SetDefaultPageCommandHandler(CommandHandler[SetDefaultPageCommand]):
 
         # Guardar página marcada como default
         self.repository.save(default_page)
+        self.response_cache.invalidate(PUBLIC_COMPANY_PAGES, page.company_id.value)
 
     def _unset_other_default_pages(self, company_id: CompanyId, page_type: PageType) -> None:
         """Desmarcar otras páginas del mismo tipo como default"""
@@ -7,13 +7,21 @@ from src.company_bc.company_page.domain.infrastructure.company_page_repository_i
     CompanyPageRepositoryInterface
 from src.company_bc.company_page.domain.value_objects.page_id import PageId
 from src.framework.application.command_bus import CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PublicResponseCache, public_response_cache
+)
 
 
 class UpdateCompanyPageCommandHandler(CommandHandler[UpdateCompanyPageCommand]):
     """Handler para actualizar una página de empresa existente"""
 
-    def __init__(self, repository: CompanyPageRepositoryInterface):
+    def __init__(
+            self,
+            repository: CompanyPageRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: UpdateCompanyPageCommand) -> None:
         """Ejecutar comando de actualización de página"""
@@ -41,3 +49,4 @@ class UpdateCompanyPageCommandHandler(CommandHandler[UpdateCompanyPageCommand]):
 
         # Guardar página actualizada
         self.repository.save(updated_page)
+        self.response_cache.invalidate(PUBLIC_COMPANY_PAGES, page.company_id.value)
@@ -1,18 +1,32 @@
 """
 Page Content Value Object - Contenido de una página
 """
+import re
 from dataclasses import dataclass
 
+_SCRIPT_OR_STYLE = re.compile(r'<(script|style)[^>]*>.*?</\1>', flags=re.DOTALL | re.IGNORECASE)
+# Las etiquetas de bloque separan palabras; las de línea (strong, a, span...) no
+_BLOCK_TAG = re.compile(
+    r'</?(?:p|div|h[1-6]|br|hr|li|ul|ol|tr|td|th|table|section|article|header|footer|blockquote|pre)\b[^>]*>',
+    flags=re.IGNORECASE
+)
+_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+
 
 @dataclass(frozen=True)
 class PageContent:
-    """Value Object para el contenido de una página"""
+    """Value Object para el contenido de una página
+
+    Se valida al escribir (create/update_content). Al hidratar desde la base de
+    datos los valores ya fueron validados, así que construirlo no recorre el HTML.
+    """
 
     html_content: str
     plain_text: str  # Para SEO y búsquedas
     word_count: int
 
-    def __post_init__(self) -> None:
+    def validate(self) -> None:
         """Validar el contenido de la página"""
         if not self.html_content.strip():
             raise ValueError("HTML content cannot be empty")
@@ -23,11 +37,6 @@ class PageContent:
         if self.word_count < 0:
             raise ValueError("Word count cannot be negative")
 
-        # Validar que el word_count coincida aproximadamente con el contenido
-        actual_word_count = len(self.plain_text.split())
-        if abs(actual_word_count - self.word_count) > 5:  # Tolerancia de 5 palabras
-            raise ValueError(f"Word count mismatch: expected {self.word_count}, actual {actual_word_count}")
-
     @classmethod
     def create(cls, html_content: str) -> "PageContent":
         """Crear PageContent a partir de HTML"""
@@ -38,25 +47,24 @@ class PageContent:
         plain_text = cls._extract_plain_text(html_content)
         word_count = len(plain_text.split())
 
-        return cls(
+        content = cls(
             html_content=html_content,
             plain_text=plain_text,
             word_count=word_count
         )
+        content.validate()
+        return content
 
     @staticmethod
     def _extract_plain_text(html_content: str) -> str:
         """Extraer texto plano del HTML (implementación básica)"""
-        # Remover tags HTML básicos
-        import re
         # Remover scripts y styles
-        text = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        # Remover todos los tags HTML
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _SCRIPT_OR_STYLE.sub('', html_content)
+        # Remover tags HTML
+        text = _BLOCK_TAG.sub(' ', text)
+        text = _TAG.sub('', text)
         # Limpiar espacios en blanco
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return _WHITESPACE.sub(' ', text).strip()
 
     def update_content(self, html_content: str) -> "PageContent":
         """Crear nueva instancia con contenido actualizado"""
@@ -33,6 +33,7 @@ from .commands.update_job_position_custom_fields import (
     UpdateJobPositionCustomFieldsCommandHandler,
 )
 # Queries
+from .queries.count_job_positions import CountJobPositionsQuery, CountJobPositionsQueryHandler
 from .queries.get_job_position_by_id import GetJobPositionByIdQuery, GetJobPositionByIdQueryHandler
 from .queries.get_job_position_workflow import GetJobPositionWorkflowQuery, GetJobPositionWorkflowQueryHandler
 from .queries.get_job_positions_stats import GetJobPositionsStatsQuery, GetJobPositionsStatsQueryHandler
@@ -53,6 +54,10 @@ from .queries.list_job_position_workflows import (
     ListJobPositionWorkflowsQuery,
     ListJobPositionWorkflowsQueryHandler,
 )
+from .queries.list_job_position_summaries import (
+    ListJobPositionSummariesQuery,
+    ListJobPositionSummariesQueryHandler,
+)
 from .queries.list_job_positions import ListJobPositionsQuery, ListJobPositionsQueryHandler
 from .queries.list_public_job_positions import (
     ListPublicJobPositionsQuery,
@@ -61,6 +66,8 @@ from .queries.list_public_job_positions import (
 
 __all__ = [
     # Queries
+    "CountJobPositionsQuery",
+    "CountJobPositionsQueryHandler",
     "GetJobPositionByIdQuery",
     "GetJobPositionByIdQueryHandler",
     "GetJobPositionWorkflowQuery",
@@ -77,6 +84,8 @@ __all__ = [
     "ListJobPositionCommentsQueryHandler",
     "ListJobPositionWorkflowsQuery",
     "ListJobPositionWorkflowsQueryHandler",
+    "ListJobPositionSummariesQuery",
+    "ListJobPositionSummariesQueryHandler",
     "ListJobPositionsQuery",
     "ListJobPositionsQueryHandler",
     "ListPublicJobPositionsQuery",
@@ -2,12 +2,16 @@ from dataclasses import dataclass
 
 from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
     CandidateApplicationRepositoryInterface
+from src.company_bc.job_position.application.public_position_scopes import public_position_scopes
 from src.company_bc.job_position.domain.enums.job_position_visibility import JobPositionVisibilityEnum
 from src.company_bc.job_position.domain.exceptions import JobPositionNotFoundException
 from src.company_bc.job_position.domain.value_objects import JobPositionId
 from src.company_bc.job_position.infrastructure.repositories.job_position_repository import \
     JobPositionRepositoryInterface
 from src.framework.application.command_bus import Command
+from src.framework.application.public_response_cache import (
+    PUBLIC_POSITIONS, PublicResponseCache, public_response_cache
+)
 
 
 @dataclass
@@ -18,9 +22,11 @@ class DeleteJobPositionCommand(Command):
 class DeleteJobPositionCommandHandler:
     def __init__(self,
                  job_position_repository: JobPositionRepositoryInterface,
-                 candidate_application_repository: CandidateApplicationRepositoryInterface, ):
+                 candidate_application_repository: CandidateApplicationRepositoryInterface,
+                 response_cache: PublicResponseCache = public_response_cache):
         self.job_position_repository = job_position_repository
         self.candidate_application_repository = candidate_application_repository
+        self.response_cache = response_cache
 
     def execute(self, command: DeleteJobPositionCommand) -> None:
         job_position = self.job_position_repository.get_by_id(command.id)
@@ -37,3 +43,4 @@ class DeleteJobPositionCommandHandler:
             self.job_position_repository.save(job_position)
         else:
             self.job_position_repository.delete(command.id)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.company_bc.company.domain.value_objects.company_user_id import CompanyUserId
+from src.company_bc.job_position.application.public_position_scopes import public_position_scopes
 from src.company_bc.job_position.domain.entities.job_position import JobPosition
 from src.company_bc.job_position.domain.enums import ClosedReasonEnum
 from src.company_bc.job_position.domain.exceptions.job_position_exceptions import (
@@ -26,6 +27,9 @@ from src.company_bc.job_position.domain.repositories.job_position_repository_int
 )
 from src.company_bc.job_position.domain.value_objects import JobPositionId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_POSITIONS, PublicResponseCache, public_response_cache
+)
 
 
 # ==================== REQUEST APPROVAL ====================
@@ -134,8 +138,13 @@ class PublishJobPositionCommand(Command):
 class PublishJobPositionCommandHandler(CommandHandler[PublishJobPositionCommand]):
     """Handler for PublishJobPositionCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: PublishJobPositionCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -153,6 +162,7 @@ class PublishJobPositionCommandHandler(CommandHandler[PublishJobPositionCommand]
         job_position.publish()
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== HOLD ====================
@@ -167,8 +177,13 @@ class HoldJobPositionCommand(Command):
 class HoldJobPositionCommandHandler(CommandHandler[HoldJobPositionCommand]):
     """Handler for HoldJobPositionCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: HoldJobPositionCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -182,6 +197,7 @@ class HoldJobPositionCommandHandler(CommandHandler[HoldJobPositionCommand]):
         job_position.put_on_hold()
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== RESUME ====================
@@ -196,8 +212,13 @@ class ResumeJobPositionCommand(Command):
 class ResumeJobPositionCommandHandler(CommandHandler[ResumeJobPositionCommand]):
     """Handler for ResumeJobPositionCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: ResumeJobPositionCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -211,6 +232,7 @@ class ResumeJobPositionCommandHandler(CommandHandler[ResumeJobPositionCommand]):
         job_position.resume()
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== CLOSE ====================
@@ -226,8 +248,13 @@ class CloseJobPositionCommand(Command):
 class CloseJobPositionCommandHandler(CommandHandler[CloseJobPositionCommand]):
     """Handler for CloseJobPositionCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: CloseJobPositionCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -242,6 +269,7 @@ class CloseJobPositionCommandHandler(CommandHandler[CloseJobPositionCommand]):
         job_position.close(reason)
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== ARCHIVE ====================
@@ -256,8 +284,13 @@ class ArchiveJobPositionCommand(Command):
 class ArchiveJobPositionCommandHandler(CommandHandler[ArchiveJobPositionCommand]):
     """Handler for ArchiveJobPositionCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: ArchiveJobPositionCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -271,6 +304,7 @@ class ArchiveJobPositionCommandHandler(CommandHandler[ArchiveJobPositionCommand]
         job_position.archive()
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== REVERT TO DRAFT ====================
@@ -285,8 +319,13 @@ class RevertJobPositionToDraftCommand(Command):
 class RevertJobPositionToDraftCommandHandler(CommandHandler[RevertJobPositionToDraftCommand]):
     """Handler for RevertJobPositionToDraftCommand"""
 
-    def __init__(self, repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: RevertJobPositionToDraftCommand) -> None:
         job_position = self.repository.get_by_id(
@@ -300,6 +339,7 @@ class RevertJobPositionToDraftCommandHandler(CommandHandler[RevertJobPositionToD
         job_position.revert_to_draft()
 
         self.repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
 
 # ==================== CLONE ====================
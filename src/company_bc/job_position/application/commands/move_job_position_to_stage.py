@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 from src.company_bc.company.domain.value_objects.company_user_id import CompanyUserId
+from src.company_bc.job_position.application.public_position_scopes import public_position_scopes
 from src.company_bc.job_position.domain.entities.job_position_activity import JobPositionActivity
 from src.company_bc.job_position.domain.entities.job_position_stage import JobPositionStage
 from src.company_bc.job_position.domain.exceptions import JobPositionNotFoundException
@@ -19,6 +20,9 @@ from src.company_bc.job_position.domain.value_objects.job_position_id import Job
 from src.company_bc.job_position.domain.value_objects.job_position_stage_id import JobPositionStageId
 from src.company_bc.job_position.domain.value_objects.stage_id import StageId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_POSITIONS, PublicResponseCache, public_response_cache
+)
 from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
     WorkflowRepositoryInterface
 from src.shared_bc.customization.workflow.domain.interfaces.workflow_stage_repository_interface import \
@@ -56,7 +60,8 @@ class MoveJobPositionToStageCommandHandler(CommandHandler[MoveJobPositionToStage
             stage_repository: WorkflowStageRepositoryInterface,
             job_position_stage_repository: JobPositionStageRepositoryInterface,
             activity_repository: JobPositionActivityRepositoryInterface,
-            validation_service: StagePhaseValidationService
+            validation_service: StagePhaseValidationService,
+            response_cache: PublicResponseCache = public_response_cache
     ):
         self.job_position_repository = job_position_repository
         self.workflow_repository = workflow_repository
@@ -64,6 +69,7 @@ class MoveJobPositionToStageCommandHandler(CommandHandler[MoveJobPositionToStage
         self.job_position_stage_repository = job_position_stage_repository
         self.activity_repository = activity_repository
         self.validation_service = validation_service
+        self.response_cache = response_cache
 
     def execute(self, command: MoveJobPositionToStageCommand) -> None:
         """Execute the command - moves job position to new stage"""
@@ -169,10 +175,11 @@ class MoveJobPositionToStageCommandHandler(CommandHandler[MoveJobPositionToStage
         )
         self.job_position_stage_repository.save(new_stage_record)
 
-        # Move job position to new stage
-        job_position.move_to_stage(command.stage_id)
+        # Move job position to new stage (its status follows the stage type)
+        job_position.move_to_stage(command.stage_id, stage_type=target_stage.stage_type)
 
         self.job_position_repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
 
         # Create activity log for stage move
         if command.user_id:
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_APPLICATION_QUESTIONS, PublicResponseCache, public_response_cache
+)
 from src.company_bc.job_position.domain.entities.position_question_config import (
     PositionQuestionConfig
 )
@@ -36,8 +39,13 @@ class ConfigurePositionQuestionCommand(Command):
 class ConfigurePositionQuestionCommandHandler(CommandHandler[ConfigurePositionQuestionCommand]):
     """Handler for ConfigurePositionQuestionCommand."""
 
-    def __init__(self, repository: PositionQuestionConfigRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionQuestionConfigRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: ConfigurePositionQuestionCommand) -> None:
         """Execute the command - creates or updates the config."""
@@ -67,3 +75,5 @@ class ConfigurePositionQuestionCommandHandler(CommandHandler[ConfigurePositionQu
                 sort_order_override=command.sort_order_override
             )
             self.repository.save(config)
+
+        self.response_cache.invalidate(PUBLIC_APPLICATION_QUESTIONS, position_id.value)
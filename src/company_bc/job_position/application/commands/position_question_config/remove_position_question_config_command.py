@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_APPLICATION_QUESTIONS, PublicResponseCache, public_response_cache
+)
 from src.company_bc.job_position.domain.repositories.position_question_config_repository_interface import (
     PositionQuestionConfigRepositoryInterface
 )
@@ -24,8 +27,13 @@ class RemovePositionQuestionConfigCommand(Command):
 class RemovePositionQuestionConfigCommandHandler(CommandHandler[RemovePositionQuestionConfigCommand]):
     """Handler for RemovePositionQuestionConfigCommand."""
 
-    def __init__(self, repository: PositionQuestionConfigRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionQuestionConfigRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: RemovePositionQuestionConfigCommand) -> None:
         """Execute the command - removes the config if it exists."""
@@ -37,3 +45,4 @@ class RemovePositionQuestionConfigCommandHandler(CommandHandler[RemovePositionQu
 
         if existing:
             self.repository.delete(existing.id)
+            self.response_cache.invalidate(PUBLIC_APPLICATION_QUESTIONS, position_id.value)
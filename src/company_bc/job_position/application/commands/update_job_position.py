@@ -3,6 +3,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
+from src.company_bc.job_position.application.public_position_scopes import public_position_scopes
 from src.company_bc.job_position.domain.enums import (
     JobPositionVisibilityEnum,
     EmploymentTypeEnum,
@@ -22,11 +23,17 @@ from src.company_bc.job_position.domain.value_objects.custom_field_definition im
 from src.company_bc.job_position.infrastructure.repositories.job_position_repository import \
     JobPositionRepositoryInterface
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_POSITIONS, PublicResponseCache, public_response_cache
+)
 from src.framework.domain.enums.job_category import JobCategoryEnum
 from src.interview_bc.interview_template.domain.enums import InterviewTemplateScopeEnum
 from src.interview_bc.interview_template.domain.infrastructure.interview_template_repository_interface import \
     InterviewTemplateRepositoryInterface
 from src.interview_bc.interview_template.domain.value_objects import InterviewTemplateId
+from src.shared_bc.customization.workflow.domain.interfaces.workflow_stage_repository_interface import \
+    WorkflowStageRepositoryInterface
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
 
 
 @dataclass
@@ -75,10 +82,14 @@ class UpdateJobPositionCommandHandler(CommandHandler[UpdateJobPositionCommand]):
     def __init__(
         self,
         job_position_repository: JobPositionRepositoryInterface,
-        interview_template_repository: Optional[InterviewTemplateRepositoryInterface] = None
+        interview_template_repository: Optional[InterviewTemplateRepositoryInterface] = None,
+        response_cache: PublicResponseCache = public_response_cache,
+        stage_repository: Optional[WorkflowStageRepositoryInterface] = None
     ):
         self.job_position_repository = job_position_repository
         self.interview_template_repository = interview_template_repository
+        self.stage_repository = stage_repository
+        self.response_cache = response_cache
 
     def _validate_screening_template(self, template_id: str) -> None:
         """Validate that screening template exists and has scope=APPLICATION"""
@@ -98,6 +109,13 @@ class UpdateJobPositionCommandHandler(CommandHandler[UpdateJobPositionCommand]):
                 f"Template scope must be APPLICATION, got {template.scope.value}"
             )
 
+    def _stage_type(self, stage_id: Optional[StageId], current_stage_id: Optional[StageId]) -> Optional[str]:
+        """Type of the stage the position is moved to, so its status follows it"""
+        if not stage_id or stage_id == current_stage_id or not self.stage_repository:
+            return None
+        stage = self.stage_repository.get_by_id(WorkflowStageId.from_string(stage_id.value))
+        return stage.stage_type if stage else None
+
     def execute(self, command: UpdateJobPositionCommand) -> None:
         job_position = self.job_position_repository.get_by_id(command.id)
         if not job_position:
@@ -107,6 +125,7 @@ class UpdateJobPositionCommandHandler(CommandHandler[UpdateJobPositionCommand]):
         if command.screening_template_id and command.screening_template_id != job_position.screening_template_id:
             self._validate_screening_template(command.screening_template_id)
 
+        previous_slug = job_position.public_slug
         job_position.update_details(
             title=command.title,
             description=command.description,
@@ -115,6 +134,7 @@ class UpdateJobPositionCommandHandler(CommandHandler[UpdateJobPositionCommand]):
             application_deadline=command.application_deadline,
             job_position_workflow_id=command.job_position_workflow_id,
             stage_id=command.stage_id,
+            stage_type=self._stage_type(command.stage_id, job_position.stage_id),
             phase_workflows=command.phase_workflows,
             custom_fields_values=command.custom_fields_values,
             visibility=command.visibility,
@@ -145,3 +165,4 @@ class UpdateJobPositionCommandHandler(CommandHandler[UpdateJobPositionCommand]):
         )
 
         self.job_position_repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position, previous_slug))
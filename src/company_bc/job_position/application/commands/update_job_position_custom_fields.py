@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from typing import Dict, Any
 
+from src.company_bc.job_position.application.public_position_scopes import public_position_scopes
 from src.company_bc.job_position.domain.exceptions import JobPositionNotFoundException
 from src.company_bc.job_position.domain.repositories.job_position_repository_interface import \
     JobPositionRepositoryInterface
 from src.company_bc.job_position.domain.value_objects.job_position_id import JobPositionId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_POSITIONS, PublicResponseCache, public_response_cache
+)
 
 
 @dataclass
@@ -18,8 +22,13 @@ class UpdateJobPositionCustomFieldsCommand(Command):
 class UpdateJobPositionCustomFieldsCommandHandler(CommandHandler[UpdateJobPositionCustomFieldsCommand]):
     """Handler for updating custom fields values"""
 
-    def __init__(self, job_position_repository: JobPositionRepositoryInterface):
+    def __init__(
+            self,
+            job_position_repository: JobPositionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.job_position_repository = job_position_repository
+        self.response_cache = response_cache
 
     def execute(self, command: UpdateJobPositionCustomFieldsCommand) -> None:
         """Execute the command - updates custom fields values"""
@@ -32,3 +41,4 @@ class UpdateJobPositionCustomFieldsCommandHandler(CommandHandler[UpdateJobPositi
         job_position.updated_at = job_position.updated_at or None  # Will be updated by repository
 
         self.job_position_repository.save(job_position)
+        self.response_cache.invalidate(PUBLIC_POSITIONS, *public_position_scopes(job_position))
@@ -0,0 +1,10 @@
+"""Scopes of the public response cache a job position is served under"""
+from typing import Optional, Tuple
+
+from src.company_bc.job_position.domain.entities.job_position import JobPosition
+from src.framework.application.public_response_cache import PUBLIC_POSITION_LIST_SCOPE
+
+
+def public_position_scopes(job_position: JobPosition, *previous_slugs: Optional[str]) -> Tuple[Optional[str], ...]:
+    """The public list and the detail of the position, reachable by id and by (previous) slug"""
+    return (PUBLIC_POSITION_LIST_SCOPE, job_position.id.value, job_position.public_slug, *previous_slugs)
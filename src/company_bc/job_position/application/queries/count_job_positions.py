@@ -0,0 +1,33 @@
+"""Count job positions query"""
+from dataclasses import dataclass
+from typing import Optional
+
+from src.company_bc.job_position.domain.enums import JobPositionStatusEnum, JobPositionVisibilityEnum
+from src.company_bc.job_position.domain.repositories.job_position_repository_interface import \
+    JobPositionRepositoryInterface
+from src.framework.application.query_bus import Query, QueryHandler
+from src.framework.domain.enums.job_category import JobCategoryEnum
+
+
+@dataclass
+class CountJobPositionsQuery(Query):
+    """Query to count job positions with the filters of ListJobPositionsQuery"""
+    company_id: Optional[str] = None
+    status: Optional[JobPositionStatusEnum] = None
+    job_category: Optional[JobCategoryEnum] = None
+    search_term: Optional[str] = None
+    visibility: Optional[JobPositionVisibilityEnum] = None
+
+
+class CountJobPositionsQueryHandler(QueryHandler[CountJobPositionsQuery, int]):
+    def __init__(self, job_position_repository: JobPositionRepositoryInterface):
+        self.job_position_repository = job_position_repository
+
+    def handle(self, query: CountJobPositionsQuery) -> int:
+        return self.job_position_repository.count_by_filters(
+            company_id=query.company_id,
+            job_category=query.job_category,
+            search_term=query.search_term,
+            visibility=query.visibility,
+            status=query.status
+        )
@@ -19,9 +19,10 @@ class GetJobPositionsStatsQueryHandler(QueryHandler[GetJobPositionsStatsQuery, D
     def handle(self, query: GetJobPositionsStatsQuery) -> Dict[str, Any]:
         stats = {}
 
-        # Count by status
+        # Count by status (one grouped query over the indexed status column)
+        counts_by_status = self.job_position_repository.count_grouped_by_status()
         for status in JobPositionStatusEnum:
-            stats[f"{status.value.lower()}_count"] = self.job_position_repository.count_by_status(status)
+            stats[f"{status.value.lower()}_count"] = counts_by_status.get(status.value, 0)
 
         # Total job positions
         stats["total_count"] = self.job_position_repository.count_total()
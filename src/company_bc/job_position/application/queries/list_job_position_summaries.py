@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import Optional, List
+
+from src.company_bc.job_position.domain.enums import JobPositionVisibilityEnum
+from src.company_bc.job_position.domain.infrastructure.job_position_comment_repository_interface import (
+    JobPositionCommentRepositoryInterface
+)
+from src.company_bc.job_position.domain.read_models.job_position_list_read_model import JobPositionListReadModel
+from src.company_bc.job_position.domain.repositories.job_position_repository_interface import \
+    JobPositionRepositoryInterface
+from src.company_bc.job_position.domain.value_objects import JobPositionId
+from src.framework.application.query_bus import Query, QueryHandler
+from src.framework.domain.enums.job_category import JobCategoryEnum
+
+
+@dataclass
+class ListJobPositionSummariesQuery(Query):
+    """Query to list job positions as slim read models for list views"""
+    company_id: Optional[str] = None
+    job_category: Optional[JobCategoryEnum] = None
+    search_term: Optional[str] = None
+    visibility: Optional[JobPositionVisibilityEnum] = None
+    limit: int = 50
+    offset: int = 0
+    current_user_id: Optional[str] = None  # For pending comments count with visibility filtering
+
+
+class ListJobPositionSummariesQueryHandler(
+    QueryHandler[ListJobPositionSummariesQuery, List[JobPositionListReadModel]]):
+    """Handler returning list read models instead of fully hydrated JobPosition aggregates"""
+
+    def __init__(
+            self,
+            job_position_repository: JobPositionRepositoryInterface,
+            job_position_comment_repository: JobPositionCommentRepositoryInterface
+    ):
+        self.job_position_repository = job_position_repository
+        self.job_position_comment_repository = job_position_comment_repository
+
+    def handle(self, query: ListJobPositionSummariesQuery) -> List[JobPositionListReadModel]:
+        positions = self.job_position_repository.find_list_items_by_filters(
+            company_id=query.company_id,
+            job_category=query.job_category,
+            search_term=query.search_term,
+            visibility=query.visibility,
+            limit=query.limit,
+            offset=query.offset
+        )
+
+        if query.current_user_id and positions:
+            pending_counts = self.job_position_comment_repository.count_pending_by_job_positions(
+                job_position_ids=[JobPositionId.from_string(position.id) for position in positions],
+                current_user_id=query.current_user_id
+            )
+            for position in positions:
+                position.pending_comments_count = pending_counts.get(position.id, 0)
+
+        return positions
@@ -16,7 +16,7 @@ from src.framework.domain.enums.job_category import JobCategoryEnum
 class ListJobPositionsQuery(Query):
     """Query to list job positions - simplified (removed fields are in custom_fields_values)"""
     company_id: Optional[str] = None
-    status: Optional[JobPositionStatusEnum] = None  # TODO: Filtering by status now requires workflow repository
+    status: Optional[JobPositionStatusEnum] = None
     job_category: Optional[JobCategoryEnum] = None
     search_term: Optional[str] = None
     visibility: Optional[JobPositionVisibilityEnum] = None  # New filter for visibility
@@ -42,20 +42,14 @@ class ListJobPositionsQueryHandler:
         self.job_position_comment_repository = job_position_comment_repository
 
     def handle(self, query: ListJobPositionsQuery) -> List[JobPositionDto]:
-        """Handle query - simplified filters"""
-        # Get total count with same filters (not used currently, but kept for future pagination)
-        # total = self.job_position_repository.count_by_filters(
-        #     company_id=query.company_id,
-        #     status=query.status,
-        #     job_category=query.job_category,
-        #     search_term=query.search_term,
-        #     visibility=query.visibility
-        # )
+        """Handle query - simplified filters
 
+        The total for pagination is counted separately with CountJobPositionsQuery.
+        """
         # Get paginated results
         jobPositions = self.job_position_repository.find_by_filters(
             company_id=query.company_id,
-            status=query.status,  # TODO: This will require workflow repository to map stage to status
+            status=query.status,
             job_category=query.job_category,
             search_term=query.search_term,
             visibility=query.visibility,
@@ -63,27 +57,15 @@ class ListJobPositionsQueryHandler:
             offset=query.offset
         )
 
-        # Convert to DTOs and add pending comments count
-        dtos = []
-        for jp in jobPositions:
-            dto = JobPositionDto.from_entity(jp)
+        dtos = [JobPositionDto.from_entity(jp) for jp in jobPositions]
 
-            # Count pending comments (with visibility filtering if current_user_id provided)
-            if query.current_user_id:
-                # Get all comments for this position that the user can see
-                from src.company_bc.job_position.domain.enums import CommentReviewStatusEnum
-
-                all_comments = self.job_position_comment_repository.list_by_job_position(
-                    job_position_id=dto.id,
-                    current_user_id=query.current_user_id
-                )
-
-                # Count how many are pending
-                dto.pending_comments_count = sum(
-                    1 for comment in all_comments
-                    if comment.review_status == CommentReviewStatusEnum.PENDING
-                )
-
-            dtos.append(dto)
+        # Pending comments count (with visibility filtering), one grouped query for the whole page
+        if query.current_user_id and dtos:
+            pending_counts = self.job_position_comment_repository.count_pending_by_job_positions(
+                job_position_ids=[dto.id for dto in dtos],
+                current_user_id=query.current_user_id
+            )
+            for dto in dtos:
+                dto.pending_comments_count = pending_counts.get(str(dto.id), 0)
 
         return dtos
@@ -114,12 +114,17 @@ class JobPosition:
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
 
-    def move_to_stage(self, stage_id: StageId) -> None:
+    def move_to_stage(self, stage_id: StageId, stage_type: Optional[str] = None) -> None:
         """
         Move the job position to a new stage.
 
+        When the stage type is given, the status is derived from it (see
+        status_for_stage_type) so the persisted, indexed status column stays in
+        sync with the workflow and status filters need no join.
+
         Args:
             stage_id: The new stage ID
+            stage_type: Type of the new stage (WorkflowStageTypeEnum value)
 
         Raises:
             JobPositionValidationError: If no workflow is assigned
@@ -128,8 +133,38 @@ class JobPosition:
             raise JobPositionValidationError("Cannot move to stage without an assigned workflow")
 
         self.stage_id = stage_id
+        if stage_type is not None:
+            self.status = self.status_for_stage_type(stage_type, self.status)
         self.updated_at = datetime.utcnow()
 
+    @classmethod
+    def status_for_stage_type(
+            cls,
+            stage_type: str,
+            current_status: JobPositionStatusEnum
+    ) -> JobPositionStatusEnum:
+        """Status of a position in a stage of the given type
+
+        PROGRESS stages are the review steps before publishing: a position already
+        in review keeps its review status, any other becomes PENDING_APPROVAL.
+
+        The derived status only replaces the current one along VALID_TRANSITIONS,
+        and never for a live or archived position (STAGE_KEPT_STATUSES): moving it
+        between stages must not unpublish it. Those statuses only change through
+        the explicit transitions (put_on_hold, resume, close, archive).
+        """
+        if current_status in cls.STAGE_KEPT_STATUSES:
+            return current_status
+        if stage_type == "progress":
+            if current_status in cls.REVIEW_STATUSES:
+                return current_status
+            derived = JobPositionStatusEnum.PENDING_APPROVAL
+        else:
+            derived = cls.STATUS_BY_STAGE_TYPE.get(stage_type, current_status)
+        if derived == current_status or derived in cls.VALID_TRANSITIONS.get(current_status, []):
+            return derived
+        return current_status
+
     def can_receive_applications(
             self,
             stage_type: Optional[str] = None
@@ -287,6 +322,7 @@ class JobPosition:
             application_deadline: Optional[date],
             job_position_workflow_id: Optional[JobPositionWorkflowId] = None,
             stage_id: Optional[StageId] = None,
+            stage_type: Optional[str] = None,
             phase_workflows: Optional[Dict[str, str]] = None,
             custom_fields_values: Optional[Dict[str, Any]] = None,
             visibility: Optional[JobPositionVisibilityEnum] = None,
@@ -315,7 +351,11 @@ class JobPosition:
             custom_fields_config: Optional[List[CustomFieldDefinition]] = None,
             killer_questions: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
-        """Update job position details with all attributes"""
+        """Update job position details with all attributes
+
+        stage_type is the type of the stage given in stage_id; when present the
+        status follows it with the same rule as move_to_stage.
+        """
         # Validate required fields
         if not title or title.strip() == "":
             raise JobPositionValidationError("Title is required")
@@ -324,6 +364,8 @@ class JobPosition:
             self.job_position_workflow_id = job_position_workflow_id
         if stage_id is not None:
             self.stage_id = stage_id
+            if stage_type is not None:
+                self.status = self.status_for_stage_type(stage_type, self.status)
         if phase_workflows is not None:
             self.phase_workflows = phase_workflows
         if custom_fields_values is not None:
@@ -680,6 +722,27 @@ class JobPosition:
         JobPositionStatusEnum.ARCHIVED: [],  # Terminal state - no transitions allowed
     }
 
+    # Status derived from the type of the publication workflow stage
+    # Format: {WorkflowStageTypeEnum value: status}; PROGRESS is resolved in status_for_stage_type
+    STATUS_BY_STAGE_TYPE = {
+        "initial": JobPositionStatusEnum.DRAFT,
+        "success": JobPositionStatusEnum.PUBLISHED,
+        "hold": JobPositionStatusEnum.ON_HOLD,
+        "fail": JobPositionStatusEnum.CLOSED,
+        "archived": JobPositionStatusEnum.CLOSED,
+    }
+    REVIEW_STATUSES = (
+        JobPositionStatusEnum.PENDING_APPROVAL,
+        JobPositionStatusEnum.APPROVED,
+        JobPositionStatusEnum.REJECTED,
+    )
+    # Statuses a stage move never overwrites
+    STAGE_KEPT_STATUSES = (
+        JobPositionStatusEnum.PUBLISHED,
+        JobPositionStatusEnum.ON_HOLD,
+        JobPositionStatusEnum.ARCHIVED,
+    )
+
     # Fields that are locked (cannot be modified) based on status
     # After approval/publish, financial fields are frozen
     LOCKED_FIELDS_BY_STATUS = {
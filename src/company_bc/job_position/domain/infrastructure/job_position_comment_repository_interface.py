@@ -1,6 +1,6 @@
 """Job Position Comment Repository Interface."""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from src.company_bc.job_position.domain.entities.job_position_comment import JobPositionComment
 from src.company_bc.job_position.domain.value_objects import JobPositionCommentId, JobPositionId
@@ -126,3 +126,23 @@ class JobPositionCommentRepositoryInterface(ABC):
             int: Number of pending comments
         """
         pass
+
+    @abstractmethod
+    def count_pending_by_job_positions(
+            self,
+            job_position_ids: List[JobPositionId],
+            current_user_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Count pending comments of several job positions in one grouped query
+
+        Applies the same visibility filtering as list_by_job_position.
+
+        Args:
+            job_position_ids: IDs of the job positions (e.g. one listing page)
+            current_user_id: ID of the current user (for filtering PRIVATE comments)
+
+        Returns:
+            Dict[str, int]: Pending comments by job position ID; positions without any are omitted
+        """
+        pass
@@ -0,0 +1,3 @@
+from .job_position_list_read_model import JobPositionListReadModel
+
+__all__ = ["JobPositionListReadModel"]
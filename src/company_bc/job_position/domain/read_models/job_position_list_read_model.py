@@ -0,0 +1,29 @@
+"""Read model for job position list views"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+@dataclass(slots=True)
+class JobPositionListReadModel:
+    """
+    Slim read model for job position list views (table and kanban).
+    Loaded from a column-only SELECT, so no aggregate hydration, enum parsing or
+    value object construction happens per row.
+    This is NOT a domain entity - it's a read-only data structure for queries.
+    """
+    id: str
+    title: str
+    company_id: str
+    job_position_workflow_id: Optional[str]
+    stage_id: Optional[str]
+    status: str
+    visibility: str
+    public_slug: Optional[str]
+    job_category: Optional[str]
+    custom_fields_values: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    # Computed fields
+    pending_comments_count: int = 0
@@ -1,9 +1,10 @@
 from abc import abstractmethod, ABC
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 
 from src.company_bc.company.domain import CompanyId
 from src.company_bc.job_position.domain import JobPosition, JobPositionStatusEnum
 from src.company_bc.job_position.domain.enums.job_position_visibility import JobPositionVisibilityEnum
+from src.company_bc.job_position.domain.read_models.job_position_list_read_model import JobPositionListReadModel
 from src.company_bc.job_position.domain.value_objects import JobPositionId
 from src.framework.domain.enums.job_category import JobCategoryEnum
 
@@ -36,6 +37,25 @@ class JobPositionRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_list_items_by_filters(self, company_id: Optional[str] = None,
+                                   job_category: Optional[JobCategoryEnum] = None,
+                                   search_term: Optional[str] = None,
+                                   limit: int = 50, offset: int = 0,
+                                   visibility: Optional[JobPositionVisibilityEnum] = None
+                                   ) -> List[JobPositionListReadModel]:
+        """Find job positions by filters as slim list read models (column-only SELECT)"""
+        pass
+
+    @abstractmethod
+    def count_by_filters(self, company_id: Optional[str] = None,
+                         job_category: Optional[JobCategoryEnum] = None,
+                         search_term: Optional[str] = None,
+                         visibility: Optional[JobPositionVisibilityEnum] = None,
+                         status: Optional[Union[JobPositionStatusEnum, List[JobPositionStatusEnum]]] = None) -> int:
+        """Count job positions matching the same filters as find_by_filters"""
+        pass
+
     @abstractmethod
     def find_by_public_slug(self, public_slug: str) -> Optional[JobPosition]:
         """Phase 10: Find job position by public slug"""
@@ -45,6 +65,11 @@ class JobPositionRepositoryInterface(ABC):
     def count_by_status(self, status: JobPositionStatusEnum) -> int:
         pass
 
+    @abstractmethod
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Number of job positions per status value, in one query"""
+        pass
+
     @abstractmethod
     def count_total(self) -> int:
         pass
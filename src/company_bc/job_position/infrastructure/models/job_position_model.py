@@ -3,7 +3,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
-from sqlalchemy import String, JSON, Enum, DateTime, Date, Text, func, Numeric, Boolean, Integer
+from sqlalchemy import String, JSON, Enum, DateTime, Date, Text, func, Numeric, Boolean, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.base import Base
@@ -27,6 +27,10 @@ from src.framework.domain.enums.job_category import JobCategoryEnum
 class JobPositionModel(Base):
     """SQLAlchemy model for job positions with publishing flow support"""
     __tablename__ = "job_positions"
+    __table_args__ = (
+        # Per-company status filters and dashboards
+        Index('ix_job_positions_company_id_status', 'company_id', 'status'),
+    )
 
     # Core identification
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=generate_id)
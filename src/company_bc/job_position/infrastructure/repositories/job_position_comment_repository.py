@@ -1,7 +1,7 @@
 """Job Position Comment Repository Implementation."""
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from core.database import SQLAlchemyDatabase
@@ -103,21 +103,24 @@ class JobPositionCommentRepository(JobPositionCommentRepositoryInterface):
 
         # Apply visibility filtering if current_user_id is provided
         if current_user_id:
-            query = query.filter(
-                or_(
-                    # Show SHARED comments to everyone
-                    JobPositionCommentModel.visibility == CommentVisibilityEnum.SHARED.value,
-                    # Show PRIVATE comments only to their creator
-                    (
-                            (JobPositionCommentModel.visibility == CommentVisibilityEnum.PRIVATE.value) &
-                            (JobPositionCommentModel.created_by_user_id == current_user_id)
-                    )
-                )
-            )
+            query = query.filter(self._visible_to(current_user_id))
 
         models = query.order_by(JobPositionCommentModel.created_at.desc()).all()
         return [self._to_domain(model) for model in models]
 
+    @staticmethod
+    def _visible_to(current_user_id: str) -> Any:
+        """SHARED comments, plus the PRIVATE comments created by the user"""
+        return or_(
+            # Show SHARED comments to everyone
+            JobPositionCommentModel.visibility == CommentVisibilityEnum.SHARED.value,
+            # Show PRIVATE comments only to their creator
+            (
+                    (JobPositionCommentModel.visibility == CommentVisibilityEnum.PRIVATE.value) &
+                    (JobPositionCommentModel.created_by_user_id == current_user_id)
+            )
+        )
+
     def list_by_stage_and_global(
             self,
             job_position_id: JobPositionId,
@@ -168,17 +171,7 @@ class JobPositionCommentRepository(JobPositionCommentRepositoryInterface):
 
         # Visibility filtering
         if current_user_id:
-            query = query.filter(
-                or_(
-                    # Show SHARED comments to everyone
-                    JobPositionCommentModel.visibility == CommentVisibilityEnum.SHARED.value,
-                    # Show PRIVATE comments only to their creator
-                    (
-                            (JobPositionCommentModel.visibility == CommentVisibilityEnum.PRIVATE.value) &
-                            (JobPositionCommentModel.created_by_user_id == current_user_id)
-                    )
-                )
-            )
+            query = query.filter(self._visible_to(current_user_id))
 
         models = query.order_by(JobPositionCommentModel.created_at.desc()).all()
 
@@ -217,3 +210,26 @@ class JobPositionCommentRepository(JobPositionCommentRepositoryInterface):
         ).count()
 
         return count
+
+    def count_pending_by_job_positions(
+            self,
+            job_position_ids: List[JobPositionId],
+            current_user_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Count pending comments of several job positions with a single GROUP BY"""
+        if not job_position_ids:
+            return {}
+
+        session = self._get_session()
+        query = session.query(
+            JobPositionCommentModel.job_position_id,
+            func.count(JobPositionCommentModel.id)
+        ).filter(
+            JobPositionCommentModel.job_position_id.in_([str(job_position_id) for job_position_id in job_position_ids]),
+            JobPositionCommentModel.review_status == CommentReviewStatusEnum.PENDING.value
+        )
+        if current_user_id:
+            query = query.filter(self._visible_to(current_user_id))
+
+        rows = query.group_by(JobPositionCommentModel.job_position_id).all()
+        return {job_position_id: count for job_position_id, count in rows}
@@ -1,8 +1,8 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Dict
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from core.database import DatabaseInterface
@@ -19,6 +19,7 @@ from src.company_bc.job_position.domain.enums import (
     SalaryPeriodEnum,
     ApplicationModeEnum,
 )
+from src.company_bc.job_position.domain.read_models.job_position_list_read_model import JobPositionListReadModel
 from src.company_bc.job_position.domain.repositories.job_position_repository_interface import \
     JobPositionRepositoryInterface
 from src.company_bc.job_position.domain.value_objects import JobPositionId
@@ -87,18 +88,23 @@ class JobPositionRepository(JobPositionRepositoryInterface):
                           search_term: Optional[str] = None,
                           visibility: Optional[JobPositionVisibilityEnum] = None) -> Any:
         """Build base query with filters (without pagination)"""
-        query = session.query(JobPositionModel)
-
+        return self._apply_filters(session.query(JobPositionModel), company_id, status, job_category,
+                                   search_term, visibility)
+
+    def _apply_filters(self, query: Any, company_id: Optional[str] = None,
+                       status: Optional[Union[JobPositionStatusEnum, List[JobPositionStatusEnum]]] = None,
+                       job_category: Optional[JobCategoryEnum] = None,
+                       search_term: Optional[str] = None,
+                       visibility: Optional[JobPositionVisibilityEnum] = None) -> Any:
+        """Apply list filters to a query over job_positions"""
         # Apply filters
         if company_id:
             query = query.filter(JobPositionModel.company_id == company_id)
 
-        # TODO: Filtering by status now requires access to workflow repository
-        # to get the stage's status_mapping. This will be implemented in Phase 3.
-        # if status:
-        #     # Filter by status would require joining with workflow_stages table
-        #     # or filtering by stage_id and checking stage.status_mapping
-        #     pass
+        # status is kept in sync with the stage on every move (indexed column)
+        if status:
+            statuses = status if isinstance(status, list) else [status]
+            query = query.filter(JobPositionModel.status.in_([item.value for item in statuses]))
 
         if job_category:
             query = query.filter(JobPositionModel.job_category == job_category)
@@ -140,16 +146,92 @@ class JobPositionRepository(JobPositionRepositoryInterface):
             job_position_models = query.all()
             return [self._create_entity_from_model(model) for model in job_position_models]
 
-    def count_by_status(self, status: JobPositionStatusEnum) -> int:
-        """
-        Count job positions by status.
+    def find_list_items_by_filters(self, company_id: Optional[str] = None,
+                                   job_category: Optional[JobCategoryEnum] = None,
+                                   search_term: Optional[str] = None,
+                                   limit: int = 50, offset: int = 0,
+                                   visibility: Optional[JobPositionVisibilityEnum] = None
+                                   ) -> List[JobPositionListReadModel]:
+        """Find job positions by filters as slim list read models.
 
-        TODO: This now requires access to workflow repository to check stage.status_mapping.
-        This will be implemented in Phase 3 when we have workflow repository access.
+        Only the columns needed by list views are selected, and rows are returned as
+        plain tuples, so no ORM identity map entries or aggregates are built.
         """
-        # For now, return 0 as status is no longer a direct field
-        # This will be properly implemented in Phase 3
-        return 0
+        with self.database.get_session() as session:
+            query = session.query(
+                JobPositionModel.id,
+                JobPositionModel.title,
+                JobPositionModel.company_id,
+                JobPositionModel.job_position_workflow_id,
+                JobPositionModel.stage_id,
+                JobPositionModel.status,
+                JobPositionModel.visibility,
+                JobPositionModel.public_slug,
+                JobPositionModel.job_category,
+                JobPositionModel.custom_fields_values,
+                JobPositionModel.created_at,
+                JobPositionModel.updated_at,
+            )
+            query = self._apply_filters(query, company_id, None, job_category, search_term, visibility)
+            query = query.order_by(JobPositionModel.created_at.desc()).offset(offset).limit(limit)
+
+            return [self._create_list_item_from_row(row) for row in query.all()]
+
+    def count_by_filters(self, company_id: Optional[str] = None,
+                         job_category: Optional[JobCategoryEnum] = None,
+                         search_term: Optional[str] = None,
+                         visibility: Optional[JobPositionVisibilityEnum] = None,
+                         status: Optional[Union[JobPositionStatusEnum, List[JobPositionStatusEnum]]] = None) -> int:
+        """Count job positions by filters with a single SELECT count(id)"""
+        with self.database.get_session() as session:
+            query = self._apply_filters(session.query(func.count(JobPositionModel.id)), company_id, status,
+                                        job_category, search_term, visibility)
+            return MixedHelper.get_int(query.scalar())
+
+    @staticmethod
+    def _create_list_item_from_row(row: Any) -> JobPositionListReadModel:
+        """Convert a column-only row to a JobPositionListReadModel"""
+        visibility = row.visibility
+        if isinstance(visibility, JobPositionVisibilityEnum):
+            visibility = visibility.value
+        elif visibility:
+            visibility = str(visibility).lower()
+        else:
+            visibility = JobPositionVisibilityEnum.HIDDEN.value
+
+        job_category = row.job_category
+        if isinstance(job_category, JobCategoryEnum):
+            job_category = job_category.value
+
+        return JobPositionListReadModel(
+            id=row.id,
+            title=row.title,
+            company_id=row.company_id,
+            job_position_workflow_id=row.job_position_workflow_id,
+            stage_id=row.stage_id,
+            status=row.status or JobPositionStatusEnum.DRAFT.value,
+            visibility=visibility,
+            public_slug=row.public_slug,
+            job_category=job_category,
+            custom_fields_values=row.custom_fields_values or {},
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def count_by_status(self, status: JobPositionStatusEnum) -> int:
+        """Count job positions by status"""
+        with self.database.get_session() as session:
+            return MixedHelper.get_int(session.query(func.count(JobPositionModel.id)).filter(
+                JobPositionModel.status == status.value
+            ).scalar())
+
+    def count_grouped_by_status(self) -> Dict[str, int]:
+        """Count job positions of every status with a single GROUP BY over the status index"""
+        with self.database.get_session() as session:
+            rows = session.query(JobPositionModel.status, func.count(JobPositionModel.id)).group_by(
+                JobPositionModel.status
+            ).all()
+            return {status: count for status, count in rows if status}
 
     def count_total(self) -> int:
         """Count total job positions"""
@@ -1,6 +1,9 @@
 """Add user to stage command"""
 from dataclasses import dataclass
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.position_stage_assignment.domain import (
     PositionStageAssignment,
     PositionStageAssignmentId,
@@ -20,8 +23,13 @@ class AddUserToStageCommand(Command):
 class AddUserToStageCommandHandler(CommandHandler[AddUserToStageCommand]):
     """Handler for adding a user to stage"""
 
-    def __init__(self, repository: PositionStageAssignmentRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionStageAssignmentRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: AddUserToStageCommand) -> None:
         """Execute the command"""
@@ -44,3 +52,4 @@ class AddUserToStageCommandHandler(CommandHandler[AddUserToStageCommand]):
             assignment.add_user(command.user_id)
 
         self.repository.save(assignment)
+        self.permission_cache.invalidate_position(command.position_id)
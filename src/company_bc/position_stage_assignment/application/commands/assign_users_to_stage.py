@@ -2,6 +2,9 @@
 from dataclasses import dataclass
 from typing import List
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.position_stage_assignment.domain import (
     PositionStageAssignment,
     PositionStageAssignmentId,
@@ -21,8 +24,13 @@ class AssignUsersToStageCommand(Command):
 class AssignUsersToStageCommandHandler(CommandHandler[AssignUsersToStageCommand]):
     """Handler for assigning users to stage"""
 
-    def __init__(self, repository: PositionStageAssignmentRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionStageAssignmentRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: AssignUsersToStageCommand) -> None:
         """Execute the command"""
@@ -45,3 +53,5 @@ class AssignUsersToStageCommandHandler(CommandHandler[AssignUsersToStageCommand]
                 assigned_user_ids=command.user_ids
             )
             self.repository.save(assignment)
+
+        self.permission_cache.invalidate_position(command.position_id)
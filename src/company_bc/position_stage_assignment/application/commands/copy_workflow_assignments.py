@@ -2,6 +2,9 @@
 from dataclasses import dataclass
 from typing import List
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.position_stage_assignment.domain import (
     PositionStageAssignment,
     PositionStageAssignmentId,
@@ -27,8 +30,13 @@ class CopyWorkflowAssignmentsCommand(Command):
 class CopyWorkflowAssignmentsCommandHandler(CommandHandler[CopyWorkflowAssignmentsCommand]):
     """Handler for copying workflow assignments to position"""
 
-    def __init__(self, repository: PositionStageAssignmentRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionStageAssignmentRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: CopyWorkflowAssignmentsCommand) -> None:
         """Execute the command"""
@@ -56,3 +64,5 @@ class CopyWorkflowAssignmentsCommandHandler(CommandHandler[CopyWorkflowAssignmen
                     assigned_user_ids=stage_assignment.default_user_ids
                 )
                 self.repository.save(assignment)
+
+        self.permission_cache.invalidate_position(command.position_id)
@@ -1,6 +1,9 @@
 """Remove user from stage command"""
 from dataclasses import dataclass
 
+from src.company_bc.candidate_application.application.services.permission_decision_cache import (
+    PermissionDecisionCache, permission_decision_cache
+)
 from src.company_bc.position_stage_assignment.domain import (
     PositionStageAssignmentRepositoryInterface,
     PositionStageAssignmentNotFoundException
@@ -19,8 +22,13 @@ class RemoveUserFromStageCommand(Command):
 class RemoveUserFromStageCommandHandler(CommandHandler[RemoveUserFromStageCommand]):
     """Handler for removing a user from stage"""
 
-    def __init__(self, repository: PositionStageAssignmentRepositoryInterface):
+    def __init__(
+            self,
+            repository: PositionStageAssignmentRepositoryInterface,
+            permission_cache: PermissionDecisionCache = permission_decision_cache
+    ):
         self.repository = repository
+        self.permission_cache = permission_cache
 
     def execute(self, command: RemoveUserFromStageCommand) -> None:
         """Execute the command"""
@@ -38,3 +46,4 @@ class RemoveUserFromStageCommandHandler(CommandHandler[RemoveUserFromStageComman
         # Remove user
         assignment.remove_user(command.user_id)
         self.repository.save(assignment)
+        self.permission_cache.invalidate_position(command.position_id)
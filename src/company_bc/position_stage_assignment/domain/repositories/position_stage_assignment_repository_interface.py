@@ -1,6 +1,6 @@
 """Position stage assignment repository interface"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from src.company_bc.position_stage_assignment.domain.entities import PositionStageAssignment
 from src.company_bc.position_stage_assignment.domain.value_objects import PositionStageAssignmentId
@@ -44,6 +44,11 @@ class PositionStageAssignmentRepositoryInterface(ABC):
         """Get all assignments where a user is assigned"""
         pass
 
+    @abstractmethod
+    def list_assigned_position_stages(self, user_id: str, position_ids: List[str]) -> Set[Tuple[str, str]]:
+        """Get the (position_id, stage_id) pairs of the given positions the user is assigned to"""
+        pass
+
     @abstractmethod
     def delete(self, id: PositionStageAssignmentId) -> bool:
         """Delete an assignment"""
@@ -1,5 +1,5 @@
 """Position stage assignment repository implementation"""
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from core.database import DatabaseInterface
 from src.company_bc.position_stage_assignment.domain import (
@@ -96,6 +96,21 @@ class PositionStageAssignmentRepository(PositionStageAssignmentRepositoryInterfa
 
             return [self._create_entity_from_model(model) for model in models]
 
+    def list_assigned_position_stages(self, user_id: str, position_ids: List[str]) -> Set[Tuple[str, str]]:
+        """Get the (position_id, stage_id) pairs of the given positions the user is assigned to"""
+        if not position_ids:
+            return set()
+        with self.database.get_session() as session:
+            rows = session.query(
+                PositionStageAssignmentModel.position_id,
+                PositionStageAssignmentModel.stage_id
+            ).filter(
+                PositionStageAssignmentModel.position_id.in_(position_ids),
+                PositionStageAssignmentModel.assigned_user_ids.contains([user_id])
+            ).all()
+
+            return {(row.position_id, row.stage_id) for row in rows}
+
     def delete(self, id: PositionStageAssignmentId) -> bool:
         """Delete an assignment"""
         with self.database.get_session() as session:
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Dict, Type, Any
+from typing import TypeVar, Generic, List, Any, Optional
+
+from src.framework.application.handler_registry import DispatchHook, HandlerRegistry, run_hooked
 
 
 class Command(ABC):
@@ -17,40 +19,31 @@ class CommandHandler(ABC, Generic[TCommand]):
 
 
 class CommandBus:
-    def __init__(self, container: Any) -> None:
+    def __init__(self, container: Any, registry: Optional[HandlerRegistry] = None) -> None:
         """Initialize CommandBus with container dependency
 
         Args:
             container: Container instance for resolving handlers.
+            registry: Handler registry built at startup; one resolving handlers
+                on first dispatch is created if not given.
         """
         self.container = container
-        self._handlers_cache: Dict[Type[Command], Any] = {}
+        self.registry = registry or HandlerRegistry(container)
+        self._hooks: List[DispatchHook] = []
+
+    def add_hook(self, hook: DispatchHook) -> None:
+        """Register a hook called after every dispatch (timing, metrics)"""
+        self._hooks.append(hook)
 
     def dispatch(self, command: Command) -> None:
         command_type = type(command)
-
-        # Cache del handler para evitar búsquedas repetitivas
-        if command_type in self._handlers_cache:
-            handler_instance = self._handlers_cache[command_type]()
+        handler_instance = self.registry.resolve(command_type)
+        if not self._hooks:
             handler_instance.execute(command)
             return
 
-        # Buscar el handler por convención: GetUserCommand -> GetUserCommandHandler
-        handler_name = f"{command_type.__name__}Handler"
-        handler_provider_name = self._camel_to_snake(handler_name)
-
-        handler_provider = getattr(self.container, handler_provider_name)
-        self._handlers_cache[command_type] = handler_provider
-        handler_instance = handler_provider()
-        handler_instance.execute(command)
+        run_hooked(self._hooks, command_type, lambda: handler_instance.execute(command))
 
     def execute(self, command: Command) -> None:
         """Alias for dispatch method for backward compatibility"""
         self.dispatch(command)
-
-    @staticmethod
-    def _camel_to_snake(name: str) -> str:
-        """Convierte CamelCase a snake_case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
@@ -0,0 +1,218 @@
+"""Registry of command and query handlers.
+
+Maps each Command/Query type to the container provider of its handler once, at
+startup, instead of deriving the provider name on the first dispatch of every
+type. Handlers are found by convention (GetUserQuery -> get_user_query_handler)
+on the main container and, failing that, on the bounded context containers.
+
+Handlers whose dependency graph is stateless are built once, at startup, and reused:
+repositories open a session per call through the database, so reusing them is
+safe. Handlers depending on a value captured at construction
+(`database.provided.session`) are still built per dispatch.
+"""
+
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from dependency_injector import providers
+
+logger = logging.getLogger(__name__)
+
+# Providers that read a value when the handler is built (e.g. the current session)
+_CONSTRUCTION_TIME_VALUES = (providers.ProvidedInstance, providers.AttributeGetter,
+                             providers.ItemGetter, providers.MethodCaller)
+
+
+# Called after every dispatch with the message type, the seconds spent in the
+# handler and the exception it raised, if any
+DispatchHook = Callable[[Type[Any], float, Optional[BaseException]], None]
+
+# Message types being dispatched in the current context, outermost first. Only
+# tracked while hooks are registered; inside a hook it holds the parent dispatches.
+_dispatch_path: ContextVar[Tuple[Type[Any], ...]] = ContextVar("cqrs_dispatch_path", default=())
+
+
+class MissingHandlerError(LookupError):
+    """Raised when no handler provider exists for a command or query type"""
+    pass
+
+
+@dataclass
+class HandlerRegistration:
+    """Provider of the handler of a message type"""
+    message_type: Type[Any]
+    provider_name: str
+    provider: Any
+    reusable: bool
+    instance: Optional[Any] = None
+
+
+def handler_provider_name(message_type: Type[Any]) -> str:
+    """Provider name of a message type's handler: GetUserQuery -> get_user_query_handler"""
+    name = f"{message_type.__name__}Handler"
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+class HandlerRegistry:
+    """Resolves handler instances for command and query types"""
+
+    def __init__(self, container: Any):
+        self.container = container
+        self._registrations: Dict[Type[Any], HandlerRegistration] = {}
+        self._lock = threading.Lock()
+        self._providers = self._collect_providers(container)
+
+    @classmethod
+    def build(cls, container: Any, message_bases: Iterable[Type[Any]]) -> "HandlerRegistry":
+        """Register every imported subclass of the given message base classes"""
+        registry = cls(container)
+        for base in message_bases:
+            for message_type in _subclasses(base):
+                registry._register(message_type)
+        return registry
+
+    def resolve(self, message_type: Type[Any]) -> Any:
+        """Handler instance for a message type
+
+        Raises:
+            MissingHandlerError: If no handler provider exists for the type
+        """
+        registration = self._registrations.get(message_type)
+        if registration is None:
+            # Types imported after startup (scripts, lazily imported modules)
+            with self._lock:
+                registration = self._register(message_type)
+            if registration is None:
+                raise MissingHandlerError(
+                    f"No handler registered for {message_type.__name__} "
+                    f"(expected provider '{handler_provider_name(message_type)}')"
+                )
+
+        if not registration.reusable:
+            return registration.provider()
+        if registration.instance is None:
+            registration.instance = registration.provider()
+        return registration.instance
+
+    def missing(self, message_bases: Iterable[Type[Any]]) -> List[Type[Any]]:
+        """Imported message types that have no handler provider"""
+        return sorted(
+            (message_type for base in message_bases for message_type in _subclasses(base)
+             if message_type not in self._registrations),
+            key=lambda message_type: f"{message_type.__module__}.{message_type.__name__}"
+        )
+
+    def validate(self, message_bases: Iterable[Type[Any]], strict: bool = False) -> None:
+        """Check that every message type has a handler that can be built
+
+        Reusable handlers are built here, so a misconfigured provider shows up
+        at startup instead of on the first dispatch of its command or query.
+
+        Raises:
+            MissingHandlerError: If strict and any handler is missing or cannot be built
+        """
+        problems = [
+            f"{message_type.__module__}.{message_type.__name__}: no handler provider"
+            for message_type in self.missing(message_bases)
+        ]
+        for registration in self._registrations.values():
+            if registration.reusable and registration.instance is None:
+                try:
+                    registration.instance = registration.provider()
+                except Exception as e:
+                    problems.append(f"{registration.provider_name}: {e}")
+        if not problems:
+            return
+        message = f"{len(problems)} commands/queries cannot be dispatched:\n  " + "\n  ".join(problems)
+        if strict:
+            raise MissingHandlerError(message)
+        logger.warning(message)
+
+    @property
+    def registrations(self) -> Dict[Type[Any], HandlerRegistration]:
+        return dict(self._registrations)
+
+    def _register(self, message_type: Type[Any]) -> Optional[HandlerRegistration]:
+        if message_type in self._registrations:
+            return self._registrations[message_type]
+        provider_name = handler_provider_name(message_type)
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            return None
+        registration = HandlerRegistration(
+            message_type=message_type,
+            provider_name=provider_name,
+            provider=provider,
+            reusable=self._is_reusable(provider)
+        )
+        self._registrations[message_type] = registration
+        return registration
+
+    @staticmethod
+    def _collect_providers(container: Any) -> Dict[str, Any]:
+        """Handler providers of the container, then of its sub-containers"""
+        collected: Dict[str, Any] = {}
+        sub_containers = []
+        for name, provider in container.providers.items():
+            if isinstance(provider, providers.Container):
+                sub_containers.append(getattr(container, name))
+            elif name.endswith("_handler"):
+                collected[name] = getattr(container, name)
+        for sub_container in sub_containers:
+            for name, provider in sub_container.providers.items():
+                if name.endswith("_handler") and name not in collected:
+                    collected[name] = provider
+        return collected
+
+    @staticmethod
+    def _is_reusable(provider: Any) -> bool:
+        return not any(isinstance(dependency, _CONSTRUCTION_TIME_VALUES) for dependency in provider.traverse())
+
+
+def current_dispatch_path() -> Tuple[Type[Any], ...]:
+    """Commands/queries whose handlers are running in this context, outermost first"""
+    return _dispatch_path.get()
+
+
+def run_hooked(hooks: List[DispatchHook], message_type: Type[Any], call: Callable[[], Any]) -> Any:
+    """Run a handler call, tracking nesting and reporting its timing to the hooks"""
+    error: Optional[BaseException] = None
+    token = _dispatch_path.set(_dispatch_path.get() + (message_type,))
+    start = time.perf_counter()
+    try:
+        return call()
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        _dispatch_path.reset(token)
+        run_dispatch_hooks(hooks, message_type, elapsed, error)
+
+
+def run_dispatch_hooks(
+        hooks: List[DispatchHook], message_type: Type[Any], elapsed: float, error: Optional[BaseException]
+) -> None:
+    """Call the dispatch hooks; a failing hook never fails the dispatch"""
+    for hook in hooks:
+        try:
+            hook(message_type, elapsed, error)
+        except Exception:
+            logger.exception(f"Dispatch hook {hook!r} failed")
+
+
+def _subclasses(base: Type[Any]) -> Set[Type[Any]]:
+    found: Set[Type[Any]] = set()
+    pending = [base]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in found:
+                found.add(subclass)
+                pending.append(subclass)
+    return found
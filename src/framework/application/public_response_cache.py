@@ -0,0 +1,144 @@
+"""Cache of rendered public responses
+
+Public read models (careers pages, public positions, application forms) are
+rebuilt from several tables on every hit but change only when a company
+publishes something. Rendered bodies are kept per worker, grouped in
+namespaces (one per kind of resource) and, within a namespace, in scopes (the
+company or entity the body was built from). The publishing commands invalidate
+the scopes they change by bumping their version, so every cached body of those
+scopes becomes a miss at once without scanning the cache, and the other
+tenants keep their entries. Invalidating a namespace without scopes is the
+fallback for writes that cannot name the entries they affect.
+
+A write handled by another worker is picked up when the entry expires, so the
+TTL bounds how long a stale body can be served there.
+
+Pre-rendered pages (public company pages and position details) are also kept
+precompressed in the public rendition store, shared by all workers and
+surviving restarts: they are rendered once after each publish instead of once
+per worker. The store is injected at startup (see use_store); invalidating
+starts a new generation of the same scopes there.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from core.config import settings
+from src.framework.domain.entities.rendered_response import RenderedResponse
+from src.framework.domain.infrastructure.public_rendition_repository_interface import \
+    PublicRenditionRepositoryInterface
+
+log = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+# (namespace version, scope version) a response was built at
+Version = Tuple[int, int]
+
+PUBLIC_POSITIONS = "public_positions"
+PUBLIC_COMPANY_PAGES = "public_company_pages"
+PUBLIC_APPLICATION_QUESTIONS = "public_application_questions"
+
+# Scope of the public position list, which mixes positions of every company
+PUBLIC_POSITION_LIST_SCOPE = "list"
+
+
+class PublicResponseCache:
+    """LRU of rendered responses with TTL and per-scope invalidation"""
+
+    def __init__(
+            self,
+            max_entries: int = 2000,
+            ttl_seconds: float = 60.0,
+            clock: Callable[[], float] = time.monotonic,
+            store: Optional[PublicRenditionRepositoryInterface] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[RenderedResponse, str, Version, float]]" = OrderedDict()
+        self._namespace_versions: Dict[str, int] = {}
+        self._scope_versions: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def use_store(self, store: Optional[PublicRenditionRepositoryInterface]) -> None:
+        """Set the shared rendition store pre-rendered responses go through"""
+        self.store = store
+
+    def get(self, namespace: str, key: str, scope: str = "") -> Optional[RenderedResponse]:
+        if not self.enabled:
+            return None
+        cache_key = (namespace, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            rendered, entry_scope, version, expires_at = entry
+            if (entry_scope != scope or version != self._version(namespace, scope)
+                    or expires_at <= self._clock()):
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return rendered
+
+    def version(self, namespace: str, scope: str = "") -> Version:
+        """Current version of a scope; read it before building the response to cache"""
+        with self._lock:
+            return self._version(namespace, scope)
+
+    def put(self, namespace: str, key: str, rendered: RenderedResponse, version: Version, scope: str = "") -> None:
+        """Cache a response of `scope` built from data read at `version`
+
+        A response built while its scope was invalidated is stored with the old
+        version, so it is a miss instead of being served until the TTL.
+        """
+        if not self.enabled:
+            return
+        cache_key = (namespace, key)
+        with self._lock:
+            self._entries[cache_key] = (rendered, scope, version, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(cache_key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: str, *scopes: Optional[str]) -> None:
+        """Drop the cached responses and the stored renditions of the given scopes
+
+        Without scopes the whole namespace is dropped. Empty scopes (e.g. a position
+        without a public slug) are ignored.
+        """
+        named_scopes = [scope for scope in dict.fromkeys(scopes) if scope]
+        if scopes and not named_scopes:
+            return
+        with self._lock:
+            if named_scopes:
+                for scope in named_scopes:
+                    self._scope_versions[(namespace, scope)] = self._scope_versions.get((namespace, scope), 0) + 1
+            else:
+                self._namespace_versions[namespace] = self._namespace_versions.get(namespace, 0) + 1
+        if self.store is not None:
+            try:
+                self.store.invalidate(namespace, *named_scopes)
+            except Exception as e:
+                # The command already committed its write: report instead of failing it
+                log.error(f"Could not invalidate public renditions of {namespace}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _version(self, namespace: str, scope: str) -> Version:
+        return self._namespace_versions.get(namespace, 0), self._scope_versions.get((namespace, scope), 0)
+
+
+public_response_cache = PublicResponseCache(
+    max_entries=settings.PUBLIC_RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PUBLIC_RESPONSE_CACHE_TTL_SECONDS
+)
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Any, Dict, Type, Optional
+from typing import TypeVar, Generic, Any, List, Optional
+
+from src.framework.application.handler_registry import DispatchHook, HandlerRegistry, run_hooked
 
 
 class Query(ABC):
@@ -20,38 +22,28 @@ class QueryHandler(ABC, Generic[TQuery, TResult]):
 
 
 class QueryBus:
-    def __init__(self, container: Any) -> None:
+    def __init__(self, container: Any, registry: Optional[HandlerRegistry] = None) -> None:
         """Initialize QueryBus with container dependency
 
         Args:
             container: Container instance for resolving handlers.
+            registry: Handler registry built at startup; one resolving handlers
+                on first query is created if not given.
         """
         self.container = container
-        self._handlers_cache: Dict[Type[Query], Any] = {}
+        self.registry = registry or HandlerRegistry(container)
+        self._hooks: List[DispatchHook] = []
+
+    def add_hook(self, hook: DispatchHook) -> None:
+        """Register a hook called after every query (timing, metrics)"""
+        self._hooks.append(hook)
 
     def query(self, query: Query) -> TResult:  # type: ignore
         """
-        Ejecuta una query buscando automáticamente el handler por convención de nombres
+        Ejecuta una query con el handler registrado para su tipo
         """
         query_type = type(query)
-
-        # Cache del handler para evitar búsquedas repetitivas
-        if query_type in self._handlers_cache:
-            handler_instance = self._handlers_cache[query_type]()
+        handler_instance = self.registry.resolve(query_type)
+        if not self._hooks:
             return handler_instance.handle(query)  # type: ignore
-
-        # Buscar el handler por convención: GetUserQuery -> GetUserQueryHandler
-        handler_name = f"{query_type.__name__}Handler"
-        handler_provider_name = self._camel_to_snake(handler_name)
-
-        handler_provider = getattr(self.container, handler_provider_name)
-        self._handlers_cache[query_type] = handler_provider
-        handler_instance = handler_provider()
-        return handler_instance.handle(query)  # type: ignore
-
-    @staticmethod
-    def _camel_to_snake(name: str) -> str:
-        """Convierte CamelCase a snake_case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return run_hooked(self._hooks, query_type, lambda: handler_instance.handle(query))  # type: ignore
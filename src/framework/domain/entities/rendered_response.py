@@ -0,0 +1,62 @@
+"""RenderedResponse domain entity."""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import brotli
+
+# Bodies below this size are not worth a compressed variant
+PRECOMPRESS_MIN_BYTES = 512
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    """Serialized response body, its strong ETag and optional precompressed variants.
+
+    Pre-rendered public pages are compressed once when they are rendered, so
+    serving them costs no CPU beyond copying the bytes. That render happens on
+    the first request after a publish, so the levels are the fast ones used for
+    dynamic responses rather than the maximum ones.
+    """
+
+    body: bytes
+    etag: str
+    gzip_body: Optional[bytes] = None
+    br_body: Optional[bytes] = None
+
+    @classmethod
+    def from_body(
+            cls,
+            body: bytes,
+            precompress: bool = False,
+            gzip_level: int = 6,
+            brotli_quality: int = 4
+    ) -> "RenderedResponse":
+        compress = precompress and len(body) >= PRECOMPRESS_MIN_BYTES
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            gzip_body=gzip.compress(body, compresslevel=gzip_level, mtime=0) if compress else None,
+            br_body=brotli.compress(body, quality=brotli_quality) if compress else None
+        )
+
+    def variant(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """Body and ETag of an encoding ("br", "gzip" or None for identity).
+
+        Each encoding is a different representation, so it gets its own strong ETag.
+        """
+        if encoding == "br" and self.br_body is not None:
+            return self.br_body, f'{self.etag[:-1]}-br"'
+        if encoding == "gzip" and self.gzip_body is not None:
+            return self.gzip_body, f'{self.etag[:-1]}-gzip"'
+        return self.body, self.etag
+
+    @property
+    def encodings(self) -> Tuple[str, ...]:
+        """Precompressed encodings available, preferred first."""
+        return tuple(
+            encoding for encoding, variant in (("br", self.br_body), ("gzip", self.gzip_body))
+            if variant is not None
+        )
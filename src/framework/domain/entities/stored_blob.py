@@ -0,0 +1,31 @@
+"""StoredBlob domain entity."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class StoredBlob:
+    """Content stored once and shared by every record that references it.
+
+    A blob is identified by the SHA-256 of its bytes. Records (attachments,
+    resumes, user assets) point at it through references; ref_count tracks how
+    many there are so the content can be removed when the last one goes away.
+    Extracted text and metadata are kept here once instead of on every record.
+    """
+
+    content_hash: str
+    storage_path: Optional[str]  # None when only the extracted text is kept
+    size: int
+    content_type: Optional[str]
+    ref_count: int = 0
+    text_content: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def has_file(self) -> bool:
+        """Whether the blob content itself is in storage."""
+        return self.storage_path is not None
@@ -0,0 +1,10 @@
+"""Enums for content-addressed blob storage."""
+
+from enum import Enum
+
+
+class BlobOwnerType(Enum):
+    """Kind of record that holds a reference to a stored blob."""
+    FILE_ATTACHMENT = "file_attachment"
+    COMPANY_CANDIDATE_RESUME = "company_candidate_resume"
+    USER_ASSET = "user_asset"
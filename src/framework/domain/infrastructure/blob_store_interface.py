@@ -0,0 +1,143 @@
+"""Blob Store Interface - Domain Layer
+
+Content-addressed storage on top of StorageServiceInterface: identical files
+are stored once under their SHA-256 and shared through reference counting.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..entities.stored_blob import StoredBlob
+from ..enums.stored_blob import BlobOwnerType
+from .storage_service_interface import PresignedUpload, UploadedFile
+
+
+@dataclass
+class DirectUpload:
+    """A prepared client-to-storage upload."""
+    upload_token: str  # Signed; passed back to complete_upload
+    upload: PresignedUpload
+
+
+class BlobStoreInterface(ABC):
+    """Abstract interface for deduplicated file storage.
+
+    Storing content returns an UploadedFile pointing at the shared blob. The
+    caller then registers the record that uses it with add_reference; blobs
+    left without references are removed by release_reference or, for uploads
+    that were never referenced, by collect_garbage.
+    """
+
+    @abstractmethod
+    async def store_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            filename: str,
+            content_type: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> UploadedFile:
+        """Store streamed content, reusing the existing blob if the content is already known.
+
+        Args:
+            chunks: Async iterator yielding the file content
+            filename: Original filename with extension (used for validation)
+            content_type: MIME type (e.g., 'application/pdf')
+            max_size_bytes: Stricter size limit for this upload
+
+        Returns:
+            UploadedFile with the blob's file_path, file_url and content_hash
+
+        Raises:
+            FileTooLargeError: If the content exceeds the size limit
+            ValueError: If file validation fails
+        """
+        pass
+
+    @abstractmethod
+    def store_bytes(self, file_content: bytes, filename: str, content_type: str) -> UploadedFile:
+        """Store in-memory content; nothing is written if the blob already exists.
+
+        Args:
+            file_content: The binary content of the file
+            filename: Original filename with extension (used for validation)
+            content_type: MIME type (e.g., 'application/pdf')
+
+        Returns:
+            UploadedFile with the blob's file_path, file_url and content_hash
+
+        Raises:
+            ValueError: If file validation fails
+        """
+        pass
+
+    @abstractmethod
+    def prepare_upload(
+            self,
+            filename: str,
+            content_type: str,
+            file_size: int,
+            content_hash: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> DirectUpload:
+        """Prepare an upload that goes from the client straight to storage.
+
+        Args:
+            filename: Original filename with extension (used for validation)
+            content_type: MIME type (e.g., 'application/pdf')
+            file_size: Declared size in bytes
+            content_hash: SHA-256 hex digest computed by the client
+            max_size_bytes: Stricter size limit for this upload
+
+        Returns:
+            DirectUpload with the presigned request and the token to complete it
+
+        Raises:
+            FileTooLargeError: If the declared size exceeds the limit
+            ValueError: If file validation fails
+        """
+        pass
+
+    @abstractmethod
+    def complete_upload(self, upload_token: str) -> UploadedFile:
+        """Turn a finished direct upload into a blob.
+
+        Args:
+            upload_token: Token returned by prepare_upload
+
+        Returns:
+            UploadedFile with the blob's file_path, file_url and content_hash
+
+        Raises:
+            ValueError: If the token is invalid or the file was not uploaded as declared
+        """
+        pass
+
+    @abstractmethod
+    def get_blob(self, content_hash: str) -> Optional[StoredBlob]:
+        """Get a blob, with its extracted text and metadata, by content hash."""
+        pass
+
+    @abstractmethod
+    def save_text(self, content_hash: str, text_content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store extracted text and metadata once for the given content."""
+        pass
+
+    @abstractmethod
+    def add_reference(self, content_hash: str, owner_type: BlobOwnerType, owner_id: str) -> None:
+        """Register a record as a user of the blob, replacing its previous blob if any."""
+        pass
+
+    @abstractmethod
+    def release_reference(self, owner_type: BlobOwnerType, owner_id: str) -> None:
+        """Unregister a record; the blob is deleted once nothing references it."""
+        pass
+
+    @abstractmethod
+    def collect_garbage(self, limit: int = 1000) -> int:
+        """Delete unreferenced blobs older than the grace period.
+
+        Returns:
+            Number of blobs deleted
+        """
+        pass
@@ -0,0 +1,32 @@
+"""Public rendition repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from ..entities.rendered_response import RenderedResponse
+
+
+class PublicRenditionRepositoryInterface(ABC):
+    """Interface for the store of pre-rendered public responses.
+
+    Renditions are grouped in namespaces and, within a namespace, in scopes (the
+    company or entity a rendition is built from), each with a generation number.
+    Invalidating a scope, or the whole namespace, starts a new generation; a
+    rendition is only served while its generation is the current one, so a render
+    that was in flight during an invalidation can never be served afterwards.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, scope: str = "") -> Tuple[Optional[RenderedResponse], int]:
+        """Get the rendition of the current generation of its scope, if any, and that generation."""
+        pass
+
+    @abstractmethod
+    def save(self, namespace: str, key: str, generation: int, rendered: RenderedResponse, scope: str = "") -> None:
+        """Store a rendition of a scope built from the data of the given generation."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, namespace: str, *scopes: str) -> None:
+        """Start a new generation of the scopes, dropping their renditions; without scopes, of the whole namespace."""
+        pass
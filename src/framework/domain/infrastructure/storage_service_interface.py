@@ -4,11 +4,12 @@ This interface defines the contract for file storage operations.
 Implementations can be local filesystem, S3, or any other storage backend.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, Optional
 
 
 class StorageType(str, Enum):
@@ -17,6 +18,14 @@ class StorageType(str, Enum):
     COMPANY_LOGO = "company_logo"
     COMPANY_DOCUMENT = "company_document"
     INTERVIEW_ATTACHMENT = "interview_attachment"
+    COMPANY_EXPORT = "company_export"
+    BLOB = "blob"  # Content-addressed file shared by every reference (entity_id is the SHA-256)
+    BLOB_STAGING = "blob_staging"  # Upload in flight, before its hash is known
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a file exceeds the maximum allowed upload size."""
+    pass
 
 
 @dataclass
@@ -27,6 +36,17 @@ class UploadedFile:
     file_size: int
     content_type: str
     uploaded_at: datetime
+    content_hash: Optional[str] = None  # SHA-256 hex digest, computed by streaming uploads
+
+
+@dataclass
+class PresignedUpload:
+    """Request a client sends to upload a file straight to storage."""
+    url: str
+    method: str
+    headers: Dict[str, str]  # Must be sent as-is: they are part of the signature
+    file_path: str
+    expires_at: datetime
 
 
 @dataclass
@@ -48,6 +68,8 @@ class StorageServiceInterface(ABC):
     specific storage implementations (local, S3, etc.).
     """
 
+    config: StorageConfig
+
     @abstractmethod
     def upload_file(
             self,
@@ -77,6 +99,148 @@ class StorageServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upload_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> UploadedFile:
+        """Upload a file from an async iterator of chunks without buffering it whole.
+
+        The size limit is enforced while the chunks arrive and the SHA-256 of the
+        content is computed on the fly; a partially written file is removed if
+        the upload fails or exceeds the limit.
+
+        Args:
+            chunks: Async iterator yielding the file content
+            filename: Original filename with extension
+            content_type: MIME type (e.g., 'application/pdf')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (candidate_id, position_id, etc.)
+            company_id: ID of the company
+            max_size_bytes: Stricter size limit for this upload (defaults to the config limit)
+
+        Returns:
+            UploadedFile with file_path, file_url and content_hash
+
+        Raises:
+            FileTooLargeError: If the content exceeds the size limit
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        pass
+
+    @abstractmethod
+    def upload_local_file(
+            self,
+            source_path: str,
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+    ) -> UploadedFile:
+        """Upload a file that already exists on the local disk without loading it in memory.
+
+        Used for generated artifacts (exports, reports) that can be larger than
+        what should be held in a worker's memory.
+
+        Args:
+            source_path: Path of the file on the local filesystem
+            filename: Filename with extension to store the file under
+            content_type: MIME type (e.g., 'text/csv')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (job id, candidate_id, etc.)
+            company_id: ID of the company
+
+        Returns:
+            UploadedFile with file_path and file_url
+
+        Raises:
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        pass
+
+    @abstractmethod
+    def move_file(self, source_path: str, target_path: str) -> None:
+        """Move a stored file to another storage path without downloading it.
+
+        Args:
+            source_path: Current storage path of the file
+            target_path: New storage path of the file
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+        """
+        pass
+
+    @abstractmethod
+    def iter_file(self, file_path: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Read a stored file in chunks.
+
+        Args:
+            file_path: The storage path of the file
+            chunk_size: Maximum number of bytes per chunk
+
+        Returns:
+            Iterator over the file content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        pass
+
+    @abstractmethod
+    def create_upload_url(
+            self,
+            file_path: str,
+            content_type: str,
+            file_size: int,
+            content_hash: str,
+            expires_in: int = 900,
+    ) -> PresignedUpload:
+        """Create a signed request that lets a client upload a file without going through the API.
+
+        The storage accepts the upload only if its content matches content_hash,
+        so the hash recorded for the file can be trusted.
+
+        Args:
+            file_path: Storage path the file will be written to
+            content_type: MIME type the client must send
+            file_size: Declared size in bytes
+            content_hash: SHA-256 hex digest of the content
+            expires_in: Validity of the request in seconds
+
+        Returns:
+            PresignedUpload with the URL, method and headers to use
+        """
+        pass
+
+    @abstractmethod
+    def get_download_url(
+            self,
+            file_path: str,
+            expires_in: int = 3600,
+            download_name: Optional[str] = None,
+    ) -> str:
+        """Create a time-limited URL to download a private file straight from storage.
+
+        Args:
+            file_path: The storage path of the file
+            expires_in: URL validity in seconds
+            download_name: Filename for the Content-Disposition header
+
+        Returns:
+            Signed download URL
+        """
+        pass
+
     @abstractmethod
     def get_file_url(self, file_path: str) -> str:
         """Get the public URL for a file.
@@ -142,6 +306,7 @@ class StorageServiceInterface(ABC):
             config: Storage configuration (uses default if not provided)
 
         Raises:
+            FileTooLargeError: If the file exceeds the size limit
             ValueError: If validation fails
         """
         if config is None:
@@ -159,11 +324,51 @@ class StorageServiceInterface(ABC):
         # Check file size
         max_size_bytes = config.max_file_size_mb * 1024 * 1024
         if file_size > max_size_bytes:
-            raise ValueError(
+            raise FileTooLargeError(
                 f"File size {file_size / 1024 / 1024:.2f}MB exceeds "
                 f"maximum allowed {config.max_file_size_mb}MB"
             )
 
+    def get_max_upload_size(self, max_size_bytes: Optional[int] = None) -> int:
+        """Effective upload size limit in bytes: the configured limit, or a stricter per-upload one.
+
+        Args:
+            max_size_bytes: Optional per-upload limit
+
+        Returns:
+            Maximum number of bytes accepted
+        """
+        limit = self.config.max_file_size_mb * 1024 * 1024
+        return min(limit, max_size_bytes) if max_size_bytes is not None else limit
+
+    async def checked_chunks(
+            self,
+            chunks: AsyncIterator[bytes],
+            max_size_bytes: int,
+            digest: "hashlib._Hash",
+    ) -> AsyncIterator[bytes]:
+        """Pass chunks through while enforcing the size limit and updating the digest.
+
+        Args:
+            chunks: Async iterator yielding the file content
+            max_size_bytes: Maximum number of bytes accepted
+            digest: hashlib object updated with every chunk
+
+        Raises:
+            FileTooLargeError: As soon as the received bytes exceed the limit
+        """
+        total = 0
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            total += len(chunk)
+            if total > max_size_bytes:
+                raise FileTooLargeError(
+                    f"File size exceeds maximum allowed {max_size_bytes / 1024 / 1024:.2f}MB"
+                )
+            digest.update(chunk)
+            yield chunk
+
     def generate_file_path(
             self,
             storage_type: StorageType,
@@ -194,6 +399,12 @@ class StorageServiceInterface(ABC):
             return f"company/{company_id}/documents/{safe_filename}"
         elif storage_type == StorageType.INTERVIEW_ATTACHMENT:
             return f"company/{company_id}/interviews/{entity_id}/{safe_filename}"
+        elif storage_type == StorageType.COMPANY_EXPORT:
+            return f"company/{company_id}/exports/{entity_id}/{safe_filename}"
+        elif storage_type == StorageType.BLOB:
+            return f"blobs/{entity_id[:2]}/{entity_id[2:4]}/{entity_id}"
+        elif storage_type == StorageType.BLOB_STAGING:
+            return f"blobs/staging/{entity_id}/{safe_filename}"
 
         # All enum values are covered above
         raise ValueError(f"Unknown storage type: {storage_type}")
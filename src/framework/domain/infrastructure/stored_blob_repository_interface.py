@@ -0,0 +1,83 @@
+"""StoredBlob repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from ..entities.stored_blob import StoredBlob
+from ..enums.stored_blob import BlobOwnerType
+
+
+class StoredBlobRepositoryInterface(ABC):
+    """Interface for StoredBlob repository."""
+
+    @abstractmethod
+    def get(self, content_hash: str) -> Optional[StoredBlob]:
+        """Get a blob by its content hash."""
+        pass
+
+    @abstractmethod
+    def create_if_absent(self, blob: StoredBlob) -> bool:
+        """Insert a blob unless one with the same hash exists.
+
+        Returns:
+            True if the blob was inserted, False if it already existed
+        """
+        pass
+
+    @abstractmethod
+    def attach_file(self, content_hash: str, storage_path: str, size: int, content_type: Optional[str]) -> bool:
+        """Record the storage path of a blob that so far only had extracted text.
+
+        Returns:
+            True if the path was recorded, False if the blob already had a file
+        """
+        pass
+
+    @abstractmethod
+    def touch(self, content_hash: str) -> bool:
+        """Refresh updated_at so the blob is not collected while a reference is being added.
+
+        Returns:
+            True if the blob exists
+        """
+        pass
+
+    @abstractmethod
+    def save_text(self, content_hash: str, text_content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store the extracted text and metadata of a blob, creating a text-only blob if needed."""
+        pass
+
+    @abstractmethod
+    def add_reference(self, content_hash: str, owner_type: BlobOwnerType, owner_id: str) -> Optional[str]:
+        """Point an owner at a blob, incrementing its reference count.
+
+        An owner references at most one blob; if it referenced another one, that
+        reference is released.
+
+        Returns:
+            Hash of the previously referenced blob if it dropped to zero references
+        """
+        pass
+
+    @abstractmethod
+    def release_reference(self, owner_type: BlobOwnerType, owner_id: str) -> Optional[str]:
+        """Remove an owner's reference, decrementing the blob reference count.
+
+        Returns:
+            Hash of the released blob if it dropped to zero references
+        """
+        pass
+
+    @abstractmethod
+    def delete_if_unreferenced(self, content_hash: str, grace_seconds: int = 0) -> Optional[StoredBlob]:
+        """Delete a blob that has no references and was not touched within the grace period.
+
+        Returns:
+            The deleted blob, or None if it is still referenced or recent
+        """
+        pass
+
+    @abstractmethod
+    def list_unreferenced(self, grace_seconds: int, limit: int = 1000) -> List[str]:
+        """Hashes of blobs with no references older than the grace period."""
+        pass
@@ -0,0 +1,136 @@
+"""Dramatiq actor for large company candidate exports."""
+
+import logging
+import os
+import tempfile
+from datetime import datetime
+from typing import Any
+
+import dramatiq
+
+from core.config import settings
+from core.database import database
+from ..jobs.async_job_service import AsyncJobService
+from ..repositories.async_job_repository import AsyncJobRepository
+from ..services.export import ExportFormat, iter_export
+from ..storage.storage_factory import StorageFactory
+from ...domain.enums.async_job import AsyncJobStatus
+from ...domain.infrastructure.storage_service_interface import StorageConfig, StorageType
+
+logger = logging.getLogger(__name__)
+
+# Rows written between two progress updates of the job
+PROGRESS_EVERY_ROWS = 50_000
+
+
+@dramatiq.actor(max_retries=0)
+def export_company_candidates(job_id: str, company_id: str, export_format: str) -> None:
+    """
+    Stream all company candidates of a company to a CSV/XLSX file and upload it to storage.
+
+    The file is written to a temporary file chunk by chunk and uploaded from disk,
+    so the worker memory stays flat regardless of the number of rows.
+
+    Args:
+        job_id: ID of the async job
+        company_id: ID of the company to export
+        export_format: 'csv' or 'xlsx'
+    """
+    logger.info(f"Starting company candidates export for job {job_id}, company {company_id}")
+
+    async_job_service = AsyncJobService(AsyncJobRepository(database))
+    file_format = ExportFormat(export_format)
+    tmp_path = None
+
+    try:
+        async_job_service.update_job_status(
+            job_id=job_id,
+            status=AsyncJobStatus.PROCESSING,
+            progress=5,
+            message="Generando exportación..."
+        )
+
+        export = _get_export_handler().handle(_build_query(company_id))
+
+        row_count = 0
+
+        def counted_rows() -> Any:
+            nonlocal row_count
+            for row in export.rows:
+                row_count += 1
+                if row_count % PROGRESS_EVERY_ROWS == 0:
+                    async_job_service.update_job_status(
+                        job_id=job_id,
+                        status=AsyncJobStatus.PROCESSING,
+                        progress=50,
+                        message=f"{row_count} filas exportadas..."
+                    )
+                yield row
+
+        with tempfile.NamedTemporaryFile(suffix=file_format.extension, delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            for chunk in iter_export(file_format, export.header, counted_rows()):
+                tmp_file.write(chunk)
+
+        async_job_service.update_job_status(
+            job_id=job_id,
+            status=AsyncJobStatus.PROCESSING,
+            progress=90,
+            message="Subiendo archivo..."
+        )
+
+        storage = StorageFactory.create_storage_service(
+            storage_type=settings.STORAGE_TYPE,
+            config=StorageConfig(
+                max_file_size_mb=settings.EXPORT_MAX_FILE_SIZE_MB,
+                allowed_extensions=[ExportFormat.CSV.extension, ExportFormat.XLSX.extension]
+            )
+        )
+        filename = f"candidates_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{file_format.extension}"
+        uploaded_file = storage.upload_local_file(
+            source_path=tmp_path,
+            filename=filename,
+            content_type=file_format.content_type,
+            storage_type=StorageType.COMPANY_EXPORT,
+            entity_id=job_id,
+            company_id=company_id
+        )
+
+        # Exports contain personal data: only hand out a temporary link
+        file_url = storage.get_download_url(
+            uploaded_file.file_path,
+            expires_in=settings.EXPORT_DOWNLOAD_URL_EXPIRATION_SECONDS,
+            download_name=filename
+        )
+
+        async_job_service.complete_job(job_id, {
+            "file_url": file_url,
+            "file_path": uploaded_file.file_path,
+            "file_size": uploaded_file.file_size,
+            "filename": filename,
+            "format": file_format.value,
+            "rows": row_count,
+        })
+        logger.info(f"Company candidates export completed for job {job_id}: {row_count} rows")
+
+    except Exception as e:
+        logger.error(f"Company candidates export failed for job {job_id}: {str(e)}")
+        async_job_service.fail_job(job_id, f"Error en exportación: {str(e)}")
+        raise
+
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _build_query(company_id: str) -> Any:
+    from src.company_bc.company_candidate.application.queries.export_company_candidates_query import (
+        ExportCompanyCandidatesQuery
+    )
+    return ExportCompanyCandidatesQuery(company_id=company_id, batch_size=settings.EXPORT_BATCH_SIZE)
+
+
+def _get_export_handler() -> Any:
+    # Lazy import to avoid circular dependency
+    from core.containers import Container
+    return Container().export_company_candidates_query_handler()
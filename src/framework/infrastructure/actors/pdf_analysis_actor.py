@@ -118,7 +118,13 @@ def _get_user_asset_content(user_asset_id: str) -> Optional[str]:
         # Use direct SQL query to avoid repository dependencies
         with database.get_session() as session:
             result = session.execute(
-                text("SELECT text_content, content FROM user_assets WHERE id = :asset_id"),
+                # Text of assets backed by a shared blob is stored once on stored_blobs
+                text(
+                    "SELECT COALESCE(ua.text_content, sb.text_content), ua.content "
+                    "FROM user_assets ua "
+                    "LEFT JOIN stored_blobs sb ON sb.content_hash = ua.content_hash "
+                    "WHERE ua.id = :asset_id"
+                ),
                 {"asset_id": user_asset_id}
             ).fetchone()
 
@@ -0,0 +1,15 @@
+"""
+Application metrics exposed in the Prometheus text format
+"""
+
+from .handler_metrics import HandlerMetrics, handler_metrics
+from .pool_metrics import InstrumentedNullPool, InstrumentedQueuePool, PoolMetrics, pool_metrics
+
+__all__ = [
+    "HandlerMetrics",
+    "handler_metrics",
+    "InstrumentedNullPool",
+    "InstrumentedQueuePool",
+    "PoolMetrics",
+    "pool_metrics",
+]
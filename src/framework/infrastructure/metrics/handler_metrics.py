@@ -0,0 +1,148 @@
+"""
+Latency and error metrics of command and query handlers.
+
+Registered as a dispatch hook on the CommandBus and QueryBus, it keeps per
+handler type a latency histogram, an exception counter and the nested
+dispatches (handlers that call the bus again), and renders them in the
+Prometheus text exposition format.
+
+With a sample rate below 1 only that fraction of dispatches is timed into the
+histograms and nesting counters, which keeps the cost negligible under load;
+exceptions are always counted. Metrics are kept in memory per worker process.
+"""
+
+import bisect
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from src.framework.application.handler_registry import DispatchHook, current_dispatch_path
+
+# Upper bounds (seconds) of the latency buckets
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Non-cumulative bucket counts; rendered cumulative as Prometheus expects"""
+    bucket_counts: List[int]
+    total_seconds: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class HandlerMetricsSnapshot:
+    histograms: Dict[Tuple[str, str], LatencyHistogram] = field(default_factory=dict)
+    errors: Dict[Tuple[str, str, str], int] = field(default_factory=dict)
+    nested: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+
+class HandlerMetrics:
+    """Thread-safe, in-process aggregation of CQRS handler metrics"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, sample_rate: float = 1.0):
+        self.buckets = tuple(sorted(buckets))
+        self.sample_rate = sample_rate
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._nested: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def hook(self, kind: str) -> DispatchHook:
+        """Dispatch hook recording the handlers of one bus ("command" or "query")"""
+
+        def record(message_type: Type[Any], elapsed: float, error: Optional[BaseException]) -> None:
+            self.record(kind, message_type, elapsed, error)
+
+        return record
+
+    def record(self, kind: str, message_type: Type[Any], elapsed: float, error: Optional[BaseException]) -> None:
+        handler = message_type.__name__
+        if error is not None:
+            key = (kind, handler, type(error).__name__)
+            with self._lock:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+
+        # Inside the hook the dispatch path holds the handlers that called this one
+        path = current_dispatch_path()
+        bucket = bisect.bisect_left(self.buckets, elapsed)
+        with self._lock:
+            histogram = self._histograms.get((kind, handler))
+            if histogram is None:
+                histogram = LatencyHistogram(bucket_counts=[0] * (len(self.buckets) + 1))
+                self._histograms[(kind, handler)] = histogram
+            histogram.bucket_counts[bucket] += 1
+            histogram.total_seconds += elapsed
+            histogram.count += 1
+            if path:
+                edge = (path[-1].__name__, handler)
+                self._nested[edge] = self._nested.get(edge, 0) + 1
+
+    def snapshot(self) -> HandlerMetricsSnapshot:
+        with self._lock:
+            return HandlerMetricsSnapshot(
+                histograms={
+                    key: LatencyHistogram(list(h.bucket_counts), h.total_seconds, h.count)
+                    for key, h in self._histograms.items()
+                },
+                errors=dict(self._errors),
+                nested=dict(self._nested),
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._nested.clear()
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)"""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP cqrs_handler_duration_seconds Time spent in command and query handlers (sampled).",
+            "# TYPE cqrs_handler_duration_seconds histogram",
+        ]
+        for (kind, handler), histogram in sorted(snapshot.histograms.items()):
+            labels = f'kind="{kind}",handler="{_escape(handler)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'cqrs_handler_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'cqrs_handler_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"cqrs_handler_duration_seconds_sum{{{labels}}} {histogram.total_seconds}")
+            lines.append(f"cqrs_handler_duration_seconds_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            "# HELP cqrs_handler_errors_total Exceptions raised by command and query handlers.",
+            "# TYPE cqrs_handler_errors_total counter",
+        ]
+        for (kind, handler, exception), count in sorted(snapshot.errors.items()):
+            lines.append(
+                f'cqrs_handler_errors_total{{kind="{kind}",handler="{_escape(handler)}",'
+                f'exception="{_escape(exception)}"}} {count}'
+            )
+
+        lines += [
+            "# HELP cqrs_nested_dispatch_total Commands and queries dispatched from inside another handler (sampled).",
+            "# TYPE cqrs_nested_dispatch_total counter",
+        ]
+        for (parent, child), count in sorted(snapshot.nested.items()):
+            lines.append(f'cqrs_nested_dispatch_total{{parent="{_escape(parent)}",child="{_escape(child)}"}} {count}')
+
+        lines += [
+            "# HELP cqrs_metrics_sample_rate Fraction of dispatches timed into the sampled metrics.",
+            "# TYPE cqrs_metrics_sample_rate gauge",
+            f"cqrs_metrics_sample_rate {self.sample_rate}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+handler_metrics = HandlerMetrics()
@@ -0,0 +1,130 @@
+"""
+Database connection pool metrics.
+
+The engine is built with one of the instrumented pool classes below, which
+time every checkout: the wait for a free connection plus, when the pool grows,
+opening a new one. Pool size and connections in use are read from the pool
+when the metrics are rendered. Metrics are kept in memory per process.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool, QueuePool
+
+from .handler_metrics import LatencyHistogram
+
+# Upper bounds (seconds) of the checkout wait buckets
+CHECKOUT_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Thread-safe checkout wait histogram and pool gauges of the process engine"""
+
+    def __init__(self, buckets: Sequence[float] = CHECKOUT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.role = ""
+        self.max_connections: Optional[int] = None
+        self._engine: Any = None
+        self._histogram = LatencyHistogram(bucket_counts=[0] * (len(self.buckets) + 1))
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Any, role: str, max_connections: Optional[int]) -> None:
+        """Report the gauges of this engine's pool, labelled with the process role"""
+        self._engine = engine
+        self.role = role
+        self.max_connections = max_connections
+
+    def observe_checkout(self, elapsed: float, timed_out: bool = False) -> None:
+        bucket = bisect.bisect_left(self.buckets, elapsed)
+        with self._lock:
+            self._histogram.bucket_counts[bucket] += 1
+            self._histogram.total_seconds += elapsed
+            self._histogram.count += 1
+            if timed_out:
+                self._timeouts += 1
+
+    def snapshot(self) -> Tuple[LatencyHistogram, int]:
+        with self._lock:
+            histogram = self._histogram
+            return LatencyHistogram(list(histogram.bucket_counts), histogram.total_seconds, histogram.count), self._timeouts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histogram = LatencyHistogram(bucket_counts=[0] * (len(self.buckets) + 1))
+            self._timeouts = 0
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)"""
+        histogram, timeouts = self.snapshot()
+        labels = f'role="{self.role}"'
+        lines = [
+            "# HELP db_pool_checkout_wait_seconds Time to get a connection from the pool, including opening new ones.",
+            "# TYPE db_pool_checkout_wait_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(self.buckets, histogram.bucket_counts):
+            cumulative += count
+            lines.append(f'db_pool_checkout_wait_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'db_pool_checkout_wait_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"db_pool_checkout_wait_seconds_sum{{{labels}}} {histogram.total_seconds}")
+        lines.append(f"db_pool_checkout_wait_seconds_count{{{labels}}} {histogram.count}")
+        lines += [
+            "# HELP db_pool_checkout_timeouts_total Checkouts that gave up waiting for a free connection.",
+            "# TYPE db_pool_checkout_timeouts_total counter",
+            f"db_pool_checkout_timeouts_total{{{labels}}} {timeouts}",
+        ]
+
+        for name, help_text, value in self._gauges():
+            lines += [
+                f"# HELP {name} {help_text}",
+                f"# TYPE {name} gauge",
+                f"{name}{{{labels}}} {value}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def _gauges(self) -> List[Tuple[str, str, int]]:
+        gauges: List[Tuple[str, str, int]] = []
+        if self.max_connections is not None:
+            gauges.append(("db_pool_max_connections", "Connections this process may open (pool size + overflow).",
+                           self.max_connections))
+        pool = self._engine.pool if self._engine is not None else None
+        # Without a client-side pool (PgBouncer transaction mode) there is nothing to report
+        if isinstance(pool, QueuePool):
+            gauges += [
+                ("db_pool_size", "Connections kept open by the pool.", pool.size()),
+                ("db_pool_checked_out", "Connections currently in use.", pool.checkedout()),
+                ("db_pool_checked_in", "Idle connections in the pool.", pool.checkedin()),
+                ("db_pool_overflow", "Connections open beyond the pool size (negative while below it).",
+                 pool.overflow()),
+            ]
+        return gauges
+
+
+pool_metrics = PoolMetrics()
+
+
+class _TimedCheckout:
+    """Times every checkout of the pool into pool_metrics"""
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            pool_metrics.observe_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.observe_checkout(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedNullPool(_TimedCheckout, NullPool):
+    pass
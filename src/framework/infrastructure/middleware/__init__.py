@@ -3,7 +3,18 @@ Comprehensive middleware infrastructure
 """
 
 from .admin_auth_middleware import AdminAuthMiddleware
+from .compression_middleware import CompressionMiddleware
+from .sql_profiler_middleware import (
+    SqlProfilerMiddleware, QueryPerformanceRegistry, install_sql_profiler, profile_queries,
+    query_performance_registry
+)
 
 __all__ = [
-    "AdminAuthMiddleware"
+    "AdminAuthMiddleware",
+    "CompressionMiddleware",
+    "SqlProfilerMiddleware",
+    "QueryPerformanceRegistry",
+    "install_sql_profiler",
+    "profile_queries",
+    "query_performance_registry",
 ]
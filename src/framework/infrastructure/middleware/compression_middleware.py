@@ -0,0 +1,97 @@
+"""Response compression (brotli or gzip, negotiated with Accept-Encoding)
+
+Extends Starlette's GZipMiddleware, which already leaves alone small responses,
+responses that are already encoded (pre-rendered public pages) and event
+streams, with brotli and with media types that do not compress (images, PDFs,
+archives). Dynamic responses use fast levels: the goal is fewer bytes on the
+wire without making large responses CPU-bound.
+"""
+from typing import Iterable, Optional, Set, cast
+
+import brotli
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "image/", "video/", "audio/", "application/pdf", "application/zip", "application/gzip",
+    "application/octet-stream", "application/vnd.openxmlformats",
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """First available encoding (in preference order) that the Accept-Encoding header allows"""
+    accepted: Set[str] = set()
+    refused: Set[str] = set()
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = params.strip().removeprefix("q=")
+        if coding:
+            (refused if quality and quality.strip("0.") == "" else accepted).add(coding)
+    for encoding in available:
+        if encoding in accepted or ("*" in accepted and encoding not in refused):
+            return encoding
+    return None
+
+
+class _SkipIncompressibleMixin:
+    """Pass through media types that are already compressed"""
+
+    content_type_is_excluded: bool
+
+    async def send_with_compression(self, message: Message) -> None:
+        await super().send_with_compression(message)  # type: ignore[misc]
+        if message["type"] == "http.response.start" and not self.content_type_is_excluded:
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.content_type_is_excluded = content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+
+
+class _IdentityResponder(_SkipIncompressibleMixin, IdentityResponder):
+    pass
+
+
+class _GZipResponder(_SkipIncompressibleMixin, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_SkipIncompressibleMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        # Streamed chunks are flushed so the client can decode them as they arrive
+        return cast(bytes, compressed + (self.compressor.flush() if more_body else self.compressor.finish()))
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress responses with brotli when the client accepts it, gzip otherwise"""
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 4
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=gzip_level)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), ("br", "gzip"))
+        responder: ASGIApp
+        if encoding == "br":
+            responder = _BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif encoding == "gzip":
+            responder = _GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        else:
+            responder = _IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
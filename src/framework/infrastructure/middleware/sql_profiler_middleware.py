@@ -0,0 +1,216 @@
+"""
+SQL instrumentation for HTTP requests.
+
+Hooks SQLAlchemy cursor events to count the statements issued while a request is
+being served, measure the time spent in the database and flag statements that are
+executed repeatedly with the same shape (the classic N+1 pattern).
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Statements with the same shape executed at least this many times in one request are flagged
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:[^()]*)\)", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"\b\d+\b")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape so repeated executions can be grouped"""
+    shape = _STRING_RE.sub("?", statement)
+    shape = _IN_LIST_RE.sub("IN (?)", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements recorded while a request (or a test block) is running"""
+    query_count: int = 0
+    total_time_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    slowest_time_ms: float = 0.0
+    statement_counts: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        shape = normalize_statement(statement)
+        self.query_count += 1
+        self.total_time_ms += elapsed_ms
+        self.statement_counts[shape] = self.statement_counts.get(shape, 0) + 1
+        if elapsed_ms > self.slowest_time_ms:
+            self.slowest_time_ms = elapsed_ms
+            self.slowest_statement = shape
+
+    def repeated_statements(self, threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> Dict[str, int]:
+        """Statement shapes executed at least `threshold` times (likely N+1 queries)"""
+        return {shape: count for shape, count in self.statement_counts.items() if count >= threshold}
+
+
+@dataclass
+class RoutePerformance:
+    """Aggregated SQL metrics for a single route"""
+    route: str
+    requests: int = 0
+    total_queries: int = 0
+    max_queries: int = 0
+    total_db_time_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    slowest_time_ms: float = 0.0
+    n_plus_one_requests: int = 0
+    n_plus_one_statements: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "route": self.route,
+            "requests": self.requests,
+            "avg_queries": round(self.total_queries / self.requests, 2) if self.requests else 0,
+            "max_queries": self.max_queries,
+            "avg_db_time_ms": round(self.total_db_time_ms / self.requests, 2) if self.requests else 0,
+            "total_db_time_ms": round(self.total_db_time_ms, 2),
+            "slowest_statement": self.slowest_statement,
+            "slowest_time_ms": round(self.slowest_time_ms, 2),
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "n_plus_one_statements": self.n_plus_one_statements,
+        }
+
+
+class QueryPerformanceRegistry:
+    """Thread-safe, in-process aggregation of per-route SQL metrics"""
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._routes: Dict[str, RoutePerformance] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, stats: QueryStats) -> Dict[str, int]:
+        """Add the stats of one request to its route and return the repeated statements found"""
+        repeated = stats.repeated_statements(self.n_plus_one_threshold)
+        with self._lock:
+            perf = self._routes.get(route)
+            if perf is None:
+                perf = RoutePerformance(route=route)
+                self._routes[route] = perf
+
+            perf.requests += 1
+            perf.total_queries += stats.query_count
+            perf.max_queries = max(perf.max_queries, stats.query_count)
+            perf.total_db_time_ms += stats.total_time_ms
+            if stats.slowest_time_ms > perf.slowest_time_ms:
+                perf.slowest_time_ms = stats.slowest_time_ms
+                perf.slowest_statement = stats.slowest_statement
+            if repeated:
+                perf.n_plus_one_requests += 1
+                for shape, count in repeated.items():
+                    perf.n_plus_one_statements[shape] = max(perf.n_plus_one_statements.get(shape, 0), count)
+        return repeated
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Routes ordered by total database time, most expensive first"""
+        with self._lock:
+            routes = [perf.to_dict() for perf in self._routes.values()]
+        return sorted(routes, key=lambda r: r["total_db_time_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+query_performance_registry = QueryPerformanceRegistry()
+
+# Stats of the block currently being profiled (request or test), if any
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_profiler_stats", default=None)
+
+_install_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                           executemany: bool) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault("sql_profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                          executemany: bool) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("sql_profiler_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    stats.record(statement, elapsed_ms)
+
+
+def install_sql_profiler(engine: Engine) -> None:
+    """Register the cursor listeners on the engine (idempotent)"""
+    with _install_lock:
+        if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            return
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryStats]:
+    """Collect the statements executed inside the block on instrumented engines"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class SqlProfilerMiddleware(BaseHTTPMiddleware):
+    """
+    Records per-request SQL metrics into the QueryPerformanceRegistry.
+
+    When `expose_headers` is enabled (development), the metrics are also returned as
+    X-DB-* response headers so they can be inspected from the browser dev tools.
+    """
+
+    def __init__(
+            self,
+            app: Any,
+            registry: QueryPerformanceRegistry = query_performance_registry,
+            expose_headers: bool = False
+    ) -> None:
+        super().__init__(app)
+        self.registry = registry
+        self.expose_headers = expose_headers
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with profile_queries() as stats:
+            response: Response = await call_next(request)
+
+        route = request.scope.get("route")
+        # Use the route template so /positions/1 and /positions/2 share one entry
+        route_key = f"{request.method} {route.path if route is not None else '<unmatched>'}"
+        repeated = self.registry.record(route_key, stats)
+        if repeated:
+            logger.warning(
+                f"[SQL PROFILER] Possible N+1 on {route_key}: "
+                + "; ".join(f"{count}x {shape[:120]}" for shape, count in repeated.items())
+            )
+
+        if self.expose_headers:
+            response.headers["X-DB-Query-Count"] = str(stats.query_count)
+            response.headers["X-DB-Time-Ms"] = f"{stats.total_time_ms:.2f}"
+            response.headers["X-DB-N-Plus-One"] = str(len(repeated))
+        return response
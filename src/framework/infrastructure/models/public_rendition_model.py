@@ -0,0 +1,43 @@
+"""SQLAlchemy models for pre-rendered public responses."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Integer, DateTime, LargeBinary, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.base import Base
+
+
+@dataclass
+class PublicRenditionModel(Base):
+    """SQLAlchemy model for a rendered public response and its precompressed variants."""
+    __tablename__ = "public_renditions"
+    __table_args__ = (
+        Index("ix_public_renditions_namespace_scope", "namespace", "scope"),
+    )
+
+    namespace: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(String(512), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(255), nullable=False, default="", server_default="")
+    generation: Mapped[int] = mapped_column(Integer, nullable=False)
+    etag: Mapped[str] = mapped_column(String(64), nullable=False)
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    gzip_body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    br_body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    rendered_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+
+
+@dataclass
+class PublicRenditionNamespaceModel(Base):
+    """SQLAlchemy model for the current generation of a rendition scope.
+
+    The row with an empty scope holds the generation of the whole namespace.
+    """
+    __tablename__ = "public_rendition_namespaces"
+
+    namespace: Mapped[str] = mapped_column(String(64), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(255), primary_key=True, default="", server_default="")
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    invalidated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
@@ -0,0 +1,47 @@
+"""SQLAlchemy models for content-addressed blobs and their references."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from sqlalchemy import String, Integer, BigInteger, DateTime, Text, JSON, ForeignKey, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.base import Base
+from src.framework.domain.entities.base import generate_id
+
+
+@dataclass
+class StoredBlobModel(Base):
+    """SQLAlchemy model for stored blobs, keyed by the SHA-256 of their content."""
+    __tablename__ = "stored_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    storage_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    content_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    text_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    blob_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+
+@dataclass
+class BlobReferenceModel(Base):
+    """SQLAlchemy model for the records that point at a stored blob."""
+    __tablename__ = "blob_references"
+    __table_args__ = (
+        UniqueConstraint("owner_type", "owner_id", name="uq_blob_references_owner"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
+    content_hash: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("stored_blobs.content_hash"),
+        nullable=False,
+        index=True
+    )
+    owner_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    owner_id: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
@@ -0,0 +1,90 @@
+"""Public rendition repository implementation."""
+
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from core.database import DatabaseInterface
+from ..models.public_rendition_model import PublicRenditionModel, PublicRenditionNamespaceModel
+from ...domain.entities.rendered_response import RenderedResponse
+from ...domain.infrastructure.public_rendition_repository_interface import PublicRenditionRepositoryInterface
+
+
+class PublicRenditionRepository(PublicRenditionRepositoryInterface):
+    """Implementation of the public rendition store.
+
+    The generation of a scope is the sum of the generations of its row and of the
+    namespace row (empty scope), so invalidating either one moves it forward. A
+    scope without rows is at generation 0. Lookups are primary key reads.
+    """
+
+    def __init__(self, database: DatabaseInterface):
+        self._database = database
+
+    def get(self, namespace: str, key: str, scope: str = "") -> Tuple[Optional[RenderedResponse], int]:
+        """Get the rendition of the current generation of its scope, if any, and that generation."""
+        with self._database.get_session() as session:
+            generation = session.execute(
+                select(func.sum(PublicRenditionNamespaceModel.generation)).where(
+                    PublicRenditionNamespaceModel.namespace == namespace,
+                    PublicRenditionNamespaceModel.scope.in_(("", scope))
+                )
+            ).scalar() or 0
+            model = session.execute(
+                select(PublicRenditionModel).where(
+                    PublicRenditionModel.namespace == namespace,
+                    PublicRenditionModel.key == key,
+                    PublicRenditionModel.scope == scope,
+                    PublicRenditionModel.generation == generation
+                )
+            ).scalar()
+            if model is None:
+                return None, generation
+            return RenderedResponse(
+                body=model.body,
+                etag=model.etag,
+                gzip_body=model.gzip_body,
+                br_body=model.br_body
+            ), generation
+
+    def save(self, namespace: str, key: str, generation: int, rendered: RenderedResponse, scope: str = "") -> None:
+        """Store a rendition of a scope built from the data of the given generation."""
+        values = dict(
+            scope=scope,
+            generation=generation,
+            etag=rendered.etag,
+            body=rendered.body,
+            gzip_body=rendered.gzip_body,
+            br_body=rendered.br_body,
+            rendered_at=func.now()
+        )
+        stmt = insert(PublicRenditionModel).values(namespace=namespace, key=key, **values)
+        with self._database.get_session() as session:
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=[PublicRenditionModel.namespace, PublicRenditionModel.key],
+                set_=values,
+                # Never replace a rendition of a newer generation with an outdated render
+                where=PublicRenditionModel.generation <= stmt.excluded.generation
+            ))
+            session.commit()
+
+    def invalidate(self, namespace: str, *scopes: str) -> None:
+        """Start a new generation of the scopes, dropping their renditions; without scopes, of the whole namespace."""
+        stmt = insert(PublicRenditionNamespaceModel).values([
+            dict(namespace=namespace, scope=scope, generation=1, invalidated_at=func.now())
+            for scope in scopes or ("",)
+        ])
+        renditions = delete(PublicRenditionModel).where(PublicRenditionModel.namespace == namespace)
+        if scopes:
+            renditions = renditions.where(PublicRenditionModel.scope.in_(scopes))
+        with self._database.get_session() as session:
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=[PublicRenditionNamespaceModel.namespace, PublicRenditionNamespaceModel.scope],
+                set_=dict(
+                    generation=PublicRenditionNamespaceModel.generation + 1,
+                    invalidated_at=func.now()
+                )
+            ))
+            session.execute(renditions)
+            session.commit()
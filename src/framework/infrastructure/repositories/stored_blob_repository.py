@@ -0,0 +1,202 @@
+"""StoredBlob repository implementation."""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, cast
+
+from sqlalchemy import CursorResult, func, update
+from sqlalchemy.dialects.postgresql import insert
+
+from core.database import DatabaseInterface
+from ..models.stored_blob_model import BlobReferenceModel, StoredBlobModel
+from ...domain.entities.base import generate_id
+from ...domain.entities.stored_blob import StoredBlob
+from ...domain.enums.stored_blob import BlobOwnerType
+from ...domain.infrastructure.stored_blob_repository_interface import StoredBlobRepositoryInterface
+
+
+class StoredBlobRepository(StoredBlobRepositoryInterface):
+    """Implementation of StoredBlob repository.
+
+    Reference counts are changed with single UPDATE statements so concurrent
+    uploads of the same content never lose an increment.
+    """
+
+    def __init__(self, database: DatabaseInterface):
+        self._database = database
+
+    def get(self, content_hash: str) -> Optional[StoredBlob]:
+        """Get a blob by its content hash."""
+        with self._database.get_session() as session:
+            model = session.query(StoredBlobModel).filter(
+                StoredBlobModel.content_hash == content_hash
+            ).first()
+            return self._model_to_entity(model) if model else None
+
+    def create_if_absent(self, blob: StoredBlob) -> bool:
+        """Insert a blob unless one with the same hash exists."""
+        with self._database.get_session() as session:
+            stmt = insert(StoredBlobModel).values(
+                content_hash=blob.content_hash,
+                storage_path=blob.storage_path,
+                size=blob.size,
+                content_type=blob.content_type,
+                ref_count=0,
+                text_content=blob.text_content,
+                blob_metadata=blob.metadata or {},
+                created_at=func.now(),
+                updated_at=func.now()
+            ).on_conflict_do_nothing(index_elements=[StoredBlobModel.content_hash])
+            result = cast(CursorResult[Any], session.execute(stmt))
+            session.commit()
+            return bool(result.rowcount)
+
+    def attach_file(self, content_hash: str, storage_path: str, size: int, content_type: Optional[str]) -> bool:
+        """Record the storage path of a blob that so far only had extracted text."""
+        with self._database.get_session() as session:
+            result = cast(CursorResult[Any], session.execute(
+                update(StoredBlobModel)
+                .where(
+                    StoredBlobModel.content_hash == content_hash,
+                    StoredBlobModel.storage_path.is_(None)
+                )
+                .values(storage_path=storage_path, size=size, content_type=content_type, updated_at=func.now())
+            ))
+            session.commit()
+            return bool(result.rowcount)
+
+    def touch(self, content_hash: str) -> bool:
+        """Refresh updated_at so the blob is not collected while a reference is being added."""
+        with self._database.get_session() as session:
+            result = cast(CursorResult[Any], session.execute(
+                update(StoredBlobModel)
+                .where(StoredBlobModel.content_hash == content_hash)
+                .values(updated_at=func.now())
+            ))
+            session.commit()
+            return bool(result.rowcount)
+
+    def save_text(self, content_hash: str, text_content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store the extracted text and metadata of a blob, creating a text-only blob if needed."""
+        with self._database.get_session() as session:
+            stmt = insert(StoredBlobModel).values(
+                content_hash=content_hash,
+                storage_path=None,
+                size=0,
+                ref_count=0,
+                text_content=text_content,
+                blob_metadata=metadata or {},
+                created_at=func.now(),
+                updated_at=func.now()
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[StoredBlobModel.content_hash],
+                set_={
+                    "text_content": stmt.excluded.text_content,
+                    "blob_metadata": stmt.excluded.blob_metadata,
+                    "updated_at": func.now()
+                }
+            )
+            session.execute(stmt)
+            session.commit()
+
+    def add_reference(self, content_hash: str, owner_type: BlobOwnerType, owner_id: str) -> Optional[str]:
+        """Point an owner at a blob, incrementing its reference count."""
+        with self._database.get_session() as session:
+            reference = session.query(BlobReferenceModel).filter(
+                BlobReferenceModel.owner_type == owner_type.value,
+                BlobReferenceModel.owner_id == owner_id
+            ).with_for_update().first()
+
+            previous_hash = None
+            if reference:
+                if reference.content_hash == content_hash:
+                    return None
+                previous_hash = reference.content_hash
+                reference.content_hash = content_hash
+            else:
+                session.add(BlobReferenceModel(
+                    id=generate_id(),
+                    content_hash=content_hash,
+                    owner_type=owner_type.value,
+                    owner_id=owner_id
+                ))
+
+            session.execute(
+                update(StoredBlobModel)
+                .where(StoredBlobModel.content_hash == content_hash)
+                .values(ref_count=StoredBlobModel.ref_count + 1, updated_at=func.now())
+            )
+            released = self._decrement(session, previous_hash) if previous_hash else None
+            session.commit()
+            return released
+
+    def release_reference(self, owner_type: BlobOwnerType, owner_id: str) -> Optional[str]:
+        """Remove an owner's reference, decrementing the blob reference count."""
+        with self._database.get_session() as session:
+            reference = session.query(BlobReferenceModel).filter(
+                BlobReferenceModel.owner_type == owner_type.value,
+                BlobReferenceModel.owner_id == owner_id
+            ).with_for_update().first()
+            if not reference:
+                return None
+
+            content_hash = reference.content_hash
+            session.delete(reference)
+            released = self._decrement(session, content_hash)
+            session.commit()
+            return released
+
+    def delete_if_unreferenced(self, content_hash: str, grace_seconds: int = 0) -> Optional[StoredBlob]:
+        """Delete a blob that has no references and was not touched within the grace period."""
+        with self._database.get_session() as session:
+            model = session.query(StoredBlobModel).filter(
+                StoredBlobModel.content_hash == content_hash,
+                StoredBlobModel.ref_count <= 0,
+                StoredBlobModel.updated_at <= func.now() - timedelta(seconds=grace_seconds)
+            ).with_for_update(skip_locked=True).first()
+            if not model:
+                return None
+
+            blob = self._model_to_entity(model)
+            session.delete(model)
+            session.commit()
+            return blob
+
+    def list_unreferenced(self, grace_seconds: int, limit: int = 1000) -> List[str]:
+        """Hashes of blobs with no references older than the grace period."""
+        with self._database.get_session() as session:
+            rows = session.query(StoredBlobModel.content_hash).filter(
+                StoredBlobModel.ref_count <= 0,
+                StoredBlobModel.updated_at <= func.now() - timedelta(seconds=grace_seconds)
+            ).limit(limit).all()
+            return [row.content_hash for row in rows]
+
+    @staticmethod
+    def _decrement(session: Any, content_hash: str) -> Optional[str]:
+        """Decrement a blob's reference count; returns the hash if no references are left.
+
+        updated_at is kept as is (overriding the column's onupdate) so a blob
+        released long after its last upload can be collected right away.
+        """
+        remaining = session.execute(
+            update(StoredBlobModel)
+            .where(StoredBlobModel.content_hash == content_hash)
+            .values(ref_count=StoredBlobModel.ref_count - 1, updated_at=StoredBlobModel.updated_at)
+            .returning(StoredBlobModel.ref_count)
+        ).scalar()
+        return content_hash if remaining is not None and remaining <= 0 else None
+
+    @staticmethod
+    def _model_to_entity(model: StoredBlobModel) -> StoredBlob:
+        """Convert model to entity."""
+        return StoredBlob(
+            content_hash=model.content_hash,
+            storage_path=model.storage_path,
+            size=model.size,
+            content_type=model.content_type,
+            ref_count=model.ref_count,
+            text_content=model.text_content,
+            metadata=model.blob_metadata or {},
+            created_at=model.created_at,
+            updated_at=model.updated_at
+        )
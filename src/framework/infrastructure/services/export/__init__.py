@@ -0,0 +1,21 @@
+"""Streaming export writers (CSV / XLSX)."""
+
+from typing import Any, Iterable, Iterator, Sequence
+
+from .csv_writer import iter_csv
+from .export_format import ExportFormat, to_cell_text
+from .xlsx_writer import iter_xlsx
+
+
+def iter_export(
+        export_format: ExportFormat,
+        header: Sequence[str],
+        rows: Iterable[Sequence[Any]]
+) -> Iterator[bytes]:
+    """Encode rows with the writer of the requested format"""
+    if export_format == ExportFormat.XLSX:
+        return iter_xlsx(header, rows)
+    return iter_csv(header, rows)
+
+
+__all__ = ["ExportFormat", "to_cell_text", "iter_csv", "iter_xlsx", "iter_export"]
@@ -0,0 +1,38 @@
+"""Streaming CSV writer."""
+
+import csv
+import io
+from typing import Any, Iterable, Iterator, Sequence
+
+from .export_format import to_csv_cell_text
+
+# Emit a chunk once this many characters are buffered
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv(
+        header: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode rows as CSV, yielding UTF-8 chunks of roughly `chunk_size` bytes.
+
+    Rows are consumed lazily, so memory only depends on the chunk size. The output
+    starts with a BOM so spreadsheet applications detect the encoding, and text
+    cells that would be read as formulas are escaped.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+
+    for row in rows:
+        writer.writerow([to_csv_cell_text(value) for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
@@ -0,0 +1,57 @@
+"""Export formats and cell value formatting shared by the writers."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+# Leading characters that make spreadsheet applications read a CSV cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    XLSX = "xlsx"
+
+    @property
+    def content_type(self) -> str:
+        if self == ExportFormat.XLSX:
+            return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        return "text/csv; charset=utf-8"
+
+    @property
+    def extension(self) -> str:
+        return f".{self.value}"
+
+
+def to_cell_text(value: Any) -> str:
+    """Render a value as the text written to a single export cell"""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ", ".join(to_cell_text(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+def to_csv_cell_text(value: Any) -> str:
+    """Cell text for CSV, with text that would be read as a formula prefixed by a quote
+
+    Exported fields include candidate input (names, notes, custom fields), so a value such
+    as =HYPERLINK(...) must not run in the recruiter's spreadsheet. Numbers are left alone.
+    XLSX cells are written as inline strings, which are never evaluated.
+    """
+    text = to_cell_text(value)
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return text
+    if text.startswith(FORMULA_PREFIXES):
+        return f"'{text}"
+    return text
@@ -0,0 +1,168 @@
+"""
+Streaming XLSX writer.
+
+Writes a minimal SpreadsheetML package (inline strings, no shared string table)
+straight into a ZIP stream, so a workbook of any size is produced in constant memory.
+Sheets roll over before Excel's row limit is reached.
+"""
+
+import re
+import zipfile
+from typing import Any, Iterable, Iterator, List, Sequence
+from xml.sax.saxutils import escape
+
+from .export_format import to_cell_text
+
+# Excel allows 1,048,576 rows per sheet; keep a round margin for the header
+MAX_ROWS_PER_SHEET = 1_000_000
+# Rows encoded between two flushes of the compressed stream
+ROWS_PER_FLUSH = 500
+
+# Characters that are not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+class _ChunkSink:
+    """Unseekable, writable binary stream collecting the bytes written by ZipFile"""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        return iter(chunks)
+
+
+def _row_xml(values: Sequence[Any]) -> str:
+    cells = []
+    for value in values:
+        text = _ILLEGAL_XML_CHARS_RE.sub("", to_cell_text(value))
+        cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>')
+    return f'<row>{"".join(cells)}</row>'
+
+
+def iter_xlsx(
+        header: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        sheet_title: str = "Export",
+        max_rows_per_sheet: int = MAX_ROWS_PER_SHEET
+) -> Iterator[bytes]:
+    """Encode rows as an XLSX workbook, yielding the compressed package in chunks"""
+    sink = _ChunkSink()
+    header_xml = _row_xml(header)
+    sheet_count = 0
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as package:
+        rows_iter = iter(rows)
+        exhausted = False
+        while not exhausted:
+            sheet_count += 1
+            with package.open(f"xl/worksheets/sheet{sheet_count}.xml", mode="w", force_zip64=True) as sheet:
+                sheet.write((_SHEET_HEAD + header_xml).encode("utf-8"))
+                batch: List[str] = []
+                written = 0
+                while written < max_rows_per_sheet:
+                    row = next(rows_iter, None)
+                    if row is None:
+                        exhausted = True
+                        break
+                    batch.append(_row_xml(row))
+                    written += 1
+                    if len(batch) >= ROWS_PER_FLUSH:
+                        sheet.write("".join(batch).encode("utf-8"))
+                        batch.clear()
+                        yield from sink.drain()
+                if batch:
+                    sheet.write("".join(batch).encode("utf-8"))
+                sheet.write(_SHEET_TAIL.encode("utf-8"))
+            yield from sink.drain()
+
+            # Do not leave an empty trailing sheet when the rows end exactly at the limit
+            if not exhausted:
+                peeked = next(rows_iter, None)
+                if peeked is None:
+                    exhausted = True
+                else:
+                    rows_iter = _prepend(peeked, rows_iter)
+
+        sheet_names = [sheet_title if i == 1 else f"{sheet_title} {i}" for i in range(1, sheet_count + 1)]
+        package.writestr("xl/workbook.xml", _workbook_xml(sheet_names))
+        package.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(sheet_count))
+        package.writestr("_rels/.rels", _ROOT_RELS)
+        package.writestr("[Content_Types].xml", _content_types_xml(sheet_count))
+
+    yield from sink.drain()
+
+
+def _prepend(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def _workbook_xml(sheet_names: List[str]) -> str:
+    sheets = "".join(
+        f'<sheet name="{escape(name[:31], {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheet_names, start=1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets>{sheets}</sheets></workbook>'
+    )
+
+
+def _workbook_rels_xml(sheet_count: int) -> str:
+    relationships = "".join(
+        f'<Relationship Id="rId{i}" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        f'Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'{relationships}</Relationships>'
+    )
+
+
+def _content_types_xml(sheet_count: int) -> str:
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return f'{_CONTENT_TYPES_HEAD}{overrides}</Types>'
@@ -0,0 +1,254 @@
+"""Content-addressed blob store.
+
+Files are first written to a staging path while their SHA-256 is computed,
+then either moved to `blobs/<aa>/<bb>/<sha256>` or, when that content is
+already stored, discarded in favour of the existing blob.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+from src.framework.domain.entities.base import generate_id
+from src.framework.domain.entities.stored_blob import StoredBlob
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.blob_store_interface import BlobStoreInterface, DirectUpload
+from src.framework.domain.infrastructure.storage_service_interface import (
+    FileTooLargeError,
+    StorageServiceInterface,
+    StorageType,
+    UploadedFile,
+)
+from src.framework.domain.infrastructure.stored_blob_repository_interface import StoredBlobRepositoryInterface
+from src.framework.infrastructure.storage.url_signer import UrlSigner
+
+logger = logging.getLogger(__name__)
+
+SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobStore(BlobStoreInterface):
+    """BlobStoreInterface implementation on top of any StorageServiceInterface."""
+
+    def __init__(
+            self,
+            storage_service: StorageServiceInterface,
+            repository: StoredBlobRepositoryInterface,
+            grace_seconds: int = 3600,
+            signer: Optional[UrlSigner] = None,
+            upload_expiration_seconds: int = 900
+    ):
+        """Initialize the blob store.
+
+        Args:
+            storage_service: Storage backend holding the blob files
+            repository: Repository for blob rows and reference counts
+            grace_seconds: How long a blob without references is kept, so an
+                upload has time to register its reference before collection
+            signer: Signs the upload tokens of direct uploads (required for them)
+            upload_expiration_seconds: Validity of presigned upload requests
+        """
+        self._storage = storage_service
+        self._repository = repository
+        self._grace_seconds = grace_seconds
+        self._signer = signer
+        self._upload_expiration_seconds = upload_expiration_seconds
+
+    async def store_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            filename: str,
+            content_type: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> UploadedFile:
+        """Stream content to a staging path, then promote it to its blob path."""
+        staged = await self._storage.upload_stream(
+            chunks=chunks,
+            filename=filename,
+            content_type=content_type,
+            storage_type=StorageType.BLOB_STAGING,
+            entity_id=generate_id(),
+            company_id="",
+            max_size_bytes=max_size_bytes
+        )
+        assert staged.content_hash is not None, "upload_stream must compute the content hash"
+        return await asyncio.to_thread(self._promote, staged, staged.content_hash)
+
+    def store_bytes(self, file_content: bytes, filename: str, content_type: str) -> UploadedFile:
+        """Store in-memory content; nothing is written if the blob already exists."""
+        self._storage.validate_file(filename, len(file_content), self._storage.config)
+        content_hash = hashlib.sha256(file_content).hexdigest()
+
+        existing = self._reuse(content_hash)
+        if existing:
+            return existing
+
+        staged = self._storage.upload_file(
+            file_content=file_content,
+            filename=filename,
+            content_type=content_type,
+            storage_type=StorageType.BLOB_STAGING,
+            entity_id=generate_id(),
+            company_id=""
+        )
+        return self._promote(staged, content_hash)
+
+    def prepare_upload(
+            self,
+            filename: str,
+            content_type: str,
+            file_size: int,
+            content_hash: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> DirectUpload:
+        """Presign an upload to a staging path.
+
+        The bytes are always uploaded, even for known content: skipping the
+        upload would let anyone who knows a file's hash claim that file.
+        Duplicates are dropped when the upload is completed.
+        """
+        signer = self._require_signer()
+        content_hash = content_hash.lower()
+        if not SHA256_HEX.match(content_hash):
+            raise ValueError("content_hash must be a SHA-256 hex digest")
+        self._storage.validate_file(filename, 0, self._storage.config)
+        limit = self._storage.get_max_upload_size(max_size_bytes)
+        if file_size > limit:
+            raise FileTooLargeError(f"File size exceeds maximum allowed {limit / 1024 / 1024:.2f}MB")
+
+        payload = {"sha256": content_hash, "size": file_size, "ct": content_type}
+        # The token outlives the presigned request by the grace period, so a
+        # finished upload can still be completed before it is collected
+        token_expires_in = self._upload_expiration_seconds + self._grace_seconds
+
+        staging_path = self._storage.generate_file_path(
+            storage_type=StorageType.BLOB_STAGING,
+            company_id="",
+            entity_id=generate_id(),
+            filename=filename
+        )
+        upload = self._storage.create_upload_url(
+            file_path=staging_path,
+            content_type=content_type,
+            file_size=file_size,
+            content_hash=content_hash,
+            expires_in=self._upload_expiration_seconds
+        )
+        return DirectUpload(upload_token=signer.sign(dict(payload, path=staging_path), token_expires_in), upload=upload)
+
+    def complete_upload(self, upload_token: str) -> UploadedFile:
+        """Check the staged upload against its token and promote it to a blob."""
+        payload = self._require_signer().verify(upload_token)
+        content_hash: str = payload["sha256"]
+        staging_path: str = payload["path"]
+
+        if not self._storage.file_exists(staging_path):
+            raise ValueError("File was not uploaded")
+        size = self._storage.get_file_size(staging_path)
+        if size != payload["size"]:
+            self._storage.delete_file(staging_path)
+            raise ValueError(f"Uploaded {size} bytes, {payload['size']} were declared")
+
+        # The storage only accepted content matching the signed hash
+        staged = UploadedFile(
+            file_path=staging_path,
+            file_url=self._storage.get_file_url(staging_path),
+            file_size=size,
+            content_type=payload["ct"],
+            uploaded_at=datetime.utcnow(),
+            content_hash=content_hash
+        )
+        return self._promote(staged, content_hash)
+
+    def get_blob(self, content_hash: str) -> Optional[StoredBlob]:
+        """Get a blob, with its extracted text and metadata, by content hash."""
+        return self._repository.get(content_hash)
+
+    def save_text(self, content_hash: str, text_content: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store extracted text and metadata once for the given content."""
+        self._repository.save_text(content_hash, text_content, metadata)
+
+    def add_reference(self, content_hash: str, owner_type: BlobOwnerType, owner_id: str) -> None:
+        """Register a record as a user of the blob, replacing its previous blob if any."""
+        released = self._repository.add_reference(content_hash, owner_type, owner_id)
+        if released:
+            self._delete_if_unreferenced(released)
+
+    def release_reference(self, owner_type: BlobOwnerType, owner_id: str) -> None:
+        """Unregister a record; the blob is deleted once nothing references it."""
+        released = self._repository.release_reference(owner_type, owner_id)
+        if released:
+            self._delete_if_unreferenced(released)
+
+    def collect_garbage(self, limit: int = 1000) -> int:
+        """Delete unreferenced blobs older than the grace period."""
+        deleted = 0
+        for content_hash in self._repository.list_unreferenced(self._grace_seconds, limit):
+            if self._delete_if_unreferenced(content_hash):
+                deleted += 1
+        return deleted
+
+    def _require_signer(self) -> UrlSigner:
+        if self._signer is None:
+            raise ValueError("Direct uploads are not configured (missing signer)")
+        return self._signer
+
+    def _reuse(self, content_hash: str) -> Optional[UploadedFile]:
+        """Return the stored blob for this content, refreshing it so it survives until referenced."""
+        blob = self._repository.get(content_hash)
+        if not blob or not blob.has_file or not self._repository.touch(content_hash):
+            return None
+        return self._to_uploaded_file(blob)
+
+    def _promote(self, staged: UploadedFile, content_hash: str) -> UploadedFile:
+        """Move a staged file to its blob path, or drop it if the content is already stored."""
+        existing = self._reuse(content_hash)
+        if existing:
+            self._storage.delete_file(staged.file_path)
+            return existing
+
+        blob_path = self._storage.generate_file_path(
+            storage_type=StorageType.BLOB,
+            company_id="",
+            entity_id=content_hash,
+            filename=""
+        )
+        # Identical content: if a concurrent upload of the same file won the
+        # race, overwriting its object with the same bytes is harmless.
+        self._storage.move_file(staged.file_path, blob_path)
+
+        blob = StoredBlob(
+            content_hash=content_hash,
+            storage_path=blob_path,
+            size=staged.file_size,
+            content_type=staged.content_type
+        )
+        if not self._repository.create_if_absent(blob):
+            # Already known, possibly only by its extracted text
+            self._repository.attach_file(content_hash, blob_path, staged.file_size, staged.content_type)
+            self._repository.touch(content_hash)
+
+        return self._to_uploaded_file(blob)
+
+    def _delete_if_unreferenced(self, content_hash: str) -> bool:
+        """Delete a blob row and its file if it has no references past the grace period."""
+        blob = self._repository.delete_if_unreferenced(content_hash, self._grace_seconds)
+        if not blob:
+            return False
+        if blob.storage_path and not self._storage.delete_file(blob.storage_path):
+            logger.warning(f"Blob {content_hash} deleted but its file could not be removed: {blob.storage_path}")
+        return True
+
+    def _to_uploaded_file(self, blob: StoredBlob) -> UploadedFile:
+        assert blob.storage_path is not None
+        return UploadedFile(
+            file_path=blob.storage_path,
+            file_url=self._storage.get_file_url(blob.storage_path),
+            file_size=blob.size,
+            content_type=blob.content_type or "application/octet-stream",
+            uploaded_at=datetime.utcnow(),
+            content_hash=blob.content_hash
+        )
@@ -4,16 +4,25 @@ This implementation stores files in the local filesystem.
 Suitable for development and testing environments.
 """
 
-from datetime import datetime
+import contextlib
+import hashlib
+import shutil
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional, Tuple
+from urllib.parse import urlencode
+
+import aiofiles
+import aiofiles.os
 
 from src.framework.domain.infrastructure.storage_service_interface import (
+    PresignedUpload,
     StorageConfig,
     StorageServiceInterface,
     StorageType,
     UploadedFile,
 )
+from src.framework.infrastructure.storage.url_signer import UrlSigner
 
 
 class LocalStorageService(StorageServiceInterface):
@@ -23,7 +32,9 @@ class LocalStorageService(StorageServiceInterface):
             self,
             base_path: str = "uploads",
             base_url: str = "http://localhost:8000/uploads",
-            config: Optional[StorageConfig] = None
+            config: Optional[StorageConfig] = None,
+            signer: Optional[UrlSigner] = None,
+            signed_url_base: str = "http://localhost:8000/api/storage/files"
     ):
         """Initialize local storage service.
 
@@ -31,10 +42,14 @@ class LocalStorageService(StorageServiceInterface):
             base_path: Base directory for file storage (relative or absolute)
             base_url: Base URL for accessing files
             config: Storage configuration
+            signer: Signs direct upload/download URLs (required for them)
+            signed_url_base: URL of the endpoint serving signed URLs
         """
         self.base_path = Path(base_path)
         self.base_url = base_url.rstrip('/')
         self.config = config or StorageConfig()
+        self.signer = signer
+        self.signed_url_base = signed_url_base.rstrip('/')
 
         # Create base directory if it doesn't exist
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -101,6 +116,239 @@ class LocalStorageService(StorageServiceInterface):
             uploaded_at=datetime.utcnow()
         )
 
+    async def upload_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> UploadedFile:
+        """Write an upload to the local filesystem chunk by chunk.
+
+        Chunks are written to a temporary `.part` file that is moved into place
+        once the whole content has been received within the size limit.
+
+        Args:
+            chunks: Async iterator yielding the file content
+            filename: Original filename with extension
+            content_type: MIME type (e.g., 'application/pdf')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (candidate_id, position_id, etc.)
+            company_id: ID of the company
+            max_size_bytes: Stricter size limit for this upload (defaults to the config limit)
+
+        Returns:
+            UploadedFile with file_path, file_url and content_hash
+
+        Raises:
+            FileTooLargeError: If the content exceeds the size limit
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        # Extension check up front; the size is checked while streaming
+        self.validate_file(filename, 0, self.config)
+        limit = self.get_max_upload_size(max_size_bytes)
+
+        file_path = self.generate_file_path(
+            storage_type=storage_type,
+            company_id=company_id,
+            entity_id=entity_id,
+            filename=filename
+        )
+        file_size, content_hash = await self.write_stream(file_path, chunks, limit)
+
+        return UploadedFile(
+            file_path=file_path,
+            file_url=self.get_file_url(file_path),
+            file_size=file_size,
+            content_type=content_type,
+            uploaded_at=datetime.utcnow(),
+            content_hash=content_hash
+        )
+
+    async def write_stream(
+            self,
+            file_path: str,
+            chunks: AsyncIterator[bytes],
+            max_size_bytes: int
+    ) -> Tuple[int, str]:
+        """Write chunks to a storage path through a temporary `.part` file.
+
+        Args:
+            file_path: Storage path to write
+            chunks: Async iterator yielding the file content
+            max_size_bytes: Maximum number of bytes accepted
+
+        Returns:
+            Size in bytes and SHA-256 hex digest of the written content
+
+        Raises:
+            FileTooLargeError: If the content exceeds the size limit
+        """
+        full_path = self.base_path / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = full_path.with_name(full_path.name + ".part")
+
+        digest = hashlib.sha256()
+        file_size = 0
+        try:
+            async with aiofiles.open(partial_path, 'wb') as f:
+                async for chunk in self.checked_chunks(chunks, max_size_bytes, digest):
+                    await f.write(chunk)
+                    file_size += len(chunk)
+            await aiofiles.os.replace(partial_path, full_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                await aiofiles.os.remove(partial_path)
+            raise
+
+        return file_size, digest.hexdigest()
+
+    def upload_local_file(
+            self,
+            source_path: str,
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+    ) -> UploadedFile:
+        """Copy a file from the local disk into storage in fixed-size chunks.
+
+        Args:
+            source_path: Path of the file on the local filesystem
+            filename: Filename with extension to store the file under
+            content_type: MIME type (e.g., 'text/csv')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (job id, candidate_id, etc.)
+            company_id: ID of the company
+
+        Returns:
+            UploadedFile with file_path and file_url
+
+        Raises:
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        file_size = Path(source_path).stat().st_size
+        self.validate_file(filename, file_size, self.config)
+
+        file_path = self.generate_file_path(
+            storage_type=storage_type,
+            company_id=company_id,
+            entity_id=entity_id,
+            filename=filename
+        )
+        full_path = self.base_path / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(source_path, 'rb') as src, open(full_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+        except Exception as e:
+            raise Exception(f"Failed to write file to {full_path}: {str(e)}")
+
+        return UploadedFile(
+            file_path=file_path,
+            file_url=self.get_file_url(file_path),
+            file_size=file_size,
+            content_type=content_type,
+            uploaded_at=datetime.utcnow()
+        )
+
+    def move_file(self, source_path: str, target_path: str) -> None:
+        """Move a file within the storage directory.
+
+        Args:
+            source_path: Current storage path of the file
+            target_path: New storage path of the file
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+        """
+        source = self.base_path / source_path
+        target = self.base_path / target_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source.replace(target)
+
+    def iter_file(self, file_path: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Read a file from the local filesystem in chunks.
+
+        Args:
+            file_path: The storage path of the file
+            chunk_size: Maximum number of bytes per chunk
+
+        Returns:
+            Iterator over the file content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        with open(self.base_path / file_path, 'rb') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def create_upload_url(
+            self,
+            file_path: str,
+            content_type: str,
+            file_size: int,
+            content_hash: str,
+            expires_in: int = 900,
+    ) -> PresignedUpload:
+        """Create a signed PUT to the local signed-URL endpoint.
+
+        The endpoint checks the received size and SHA-256 against the signed values.
+
+        Args:
+            file_path: Storage path the file will be written to
+            content_type: MIME type the client must send
+            file_size: Declared size in bytes
+            content_hash: SHA-256 hex digest of the content
+            expires_in: Validity of the request in seconds
+
+        Returns:
+            PresignedUpload with the URL, method and headers to use
+        """
+        token = self._require_signer().sign(
+            {"op": "put", "path": file_path, "size": file_size, "sha256": content_hash, "ct": content_type},
+            expires_in
+        )
+        return PresignedUpload(
+            url=f"{self.signed_url_base}?{urlencode({'token': token})}",
+            method='PUT',
+            headers={'Content-Type': content_type},
+            file_path=file_path,
+            expires_at=datetime.utcnow() + timedelta(seconds=expires_in)
+        )
+
+    def get_download_url(
+            self,
+            file_path: str,
+            expires_in: int = 3600,
+            download_name: Optional[str] = None,
+    ) -> str:
+        """Create a signed GET served by the local signed-URL endpoint.
+
+        Args:
+            file_path: The storage path of the file
+            expires_in: URL validity in seconds
+            download_name: Filename for the Content-Disposition header
+
+        Returns:
+            Signed download URL
+        """
+        token = self._require_signer().sign({"op": "get", "path": file_path, "name": download_name}, expires_in)
+        return f"{self.signed_url_base}?{urlencode({'token': token})}"
+
+    def _require_signer(self) -> UrlSigner:
+        if self.signer is None:
+            raise ValueError("Signed URLs are not configured for local storage (missing SECRET_KEY)")
+        return self.signer
+
     def get_file_url(self, file_path: str) -> str:
         """Get the public URL for a file.
 
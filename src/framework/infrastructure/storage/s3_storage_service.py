@@ -4,19 +4,30 @@ This implementation stores files in Amazon S3.
 Suitable for production environments.
 """
 
-from datetime import datetime
-from typing import Optional
+import asyncio
+import base64
+import contextlib
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import boto3  # type: ignore[import-untyped]
+from boto3.exceptions import S3UploadFailedError
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 from src.framework.domain.infrastructure.storage_service_interface import (
+    PresignedUpload,
     StorageConfig,
     StorageServiceInterface,
     StorageType,
     UploadedFile,
 )
 
+# Size of the parts sent to S3 by streaming uploads (S3 requires at least 5 MiB per part)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3StorageService(StorageServiceInterface):
     """AWS S3 implementation of StorageServiceInterface."""
@@ -51,7 +62,8 @@ class S3StorageService(StorageServiceInterface):
             session_kwargs['aws_access_key_id'] = aws_access_key_id
             session_kwargs['aws_secret_access_key'] = aws_secret_access_key
 
-        self.s3_client = boto3.client('s3', **session_kwargs)
+        # SigV4 is required to sign the checksum and length headers of presigned uploads
+        self.s3_client = boto3.client('s3', config=BotoConfig(signature_version='s3v4'), **session_kwargs)
 
         # Verify bucket exists
         self._verify_bucket()
@@ -139,6 +151,244 @@ class S3StorageService(StorageServiceInterface):
             uploaded_at=datetime.utcnow()
         )
 
+    async def upload_stream(
+            self,
+            chunks: AsyncIterator[bytes],
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+            max_size_bytes: Optional[int] = None,
+    ) -> UploadedFile:
+        """Stream an upload to S3.
+
+        Content is buffered up to MULTIPART_PART_SIZE: smaller files are sent with a
+        single put_object, larger ones as a multipart upload (aborted on failure).
+        boto3 calls run in a worker thread so the event loop is never blocked.
+
+        Args:
+            chunks: Async iterator yielding the file content
+            filename: Original filename with extension
+            content_type: MIME type (e.g., 'application/pdf')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (candidate_id, position_id, etc.)
+            company_id: ID of the company
+            max_size_bytes: Stricter size limit for this upload (defaults to the config limit)
+
+        Returns:
+            UploadedFile with file_path, file_url and content_hash
+
+        Raises:
+            FileTooLargeError: If the content exceeds the size limit
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        # Extension check up front; the size is checked while streaming
+        self.validate_file(filename, 0, self.config)
+        limit = self.get_max_upload_size(max_size_bytes)
+
+        file_path = self.generate_file_path(
+            storage_type=storage_type,
+            company_id=company_id,
+            entity_id=entity_id,
+            filename=filename
+        )
+        metadata = {
+            'company_id': company_id,
+            'entity_id': entity_id,
+            'storage_type': storage_type.value,
+            'original_filename': filename
+        }
+
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        parts: List[Dict[str, Any]] = []
+        upload_id: Optional[str] = None
+        file_size = 0
+        try:
+            async for chunk in self.checked_chunks(chunks, limit, digest):
+                buffer += chunk
+                file_size += len(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            self.s3_client.create_multipart_upload,
+                            Bucket=self.bucket_name,
+                            Key=file_path,
+                            ContentType=content_type,
+                            Metadata=metadata
+                        )
+                        upload_id = response['UploadId']
+                    parts.append(await self._upload_part(file_path, upload_id, len(parts) + 1, bytes(buffer)))
+                    buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                    Metadata={**metadata, 'sha256': digest.hexdigest()}
+                )
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(file_path, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+        except BaseException as e:
+            if upload_id is not None:
+                with contextlib.suppress(ClientError):
+                    await asyncio.to_thread(
+                        self.s3_client.abort_multipart_upload,
+                        Bucket=self.bucket_name,
+                        Key=file_path,
+                        UploadId=upload_id
+                    )
+            if isinstance(e, ClientError):
+                raise Exception(f"Failed to upload file to S3: {str(e)}")
+            raise
+
+        return UploadedFile(
+            file_path=file_path,
+            file_url=self.get_file_url(file_path),
+            file_size=file_size,
+            content_type=content_type,
+            uploaded_at=datetime.utcnow(),
+            content_hash=digest.hexdigest()
+        )
+
+    async def _upload_part(self, file_path: str, upload_id: str, part_number: int, body: bytes) -> Dict[str, Any]:
+        """Upload one part of a multipart upload and return its completion entry"""
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket_name,
+            Key=file_path,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    def upload_local_file(
+            self,
+            source_path: str,
+            filename: str,
+            content_type: str,
+            storage_type: StorageType,
+            entity_id: str,
+            company_id: str,
+    ) -> UploadedFile:
+        """Upload a file from the local disk to S3.
+
+        Uses boto3's managed transfer, which switches to multipart uploads for
+        large files and never reads the whole file in memory.
+
+        Args:
+            source_path: Path of the file on the local filesystem
+            filename: Filename with extension to store the file under
+            content_type: MIME type (e.g., 'text/csv')
+            storage_type: Type of file being stored
+            entity_id: ID of the entity (job id, candidate_id, etc.)
+            company_id: ID of the company
+
+        Returns:
+            UploadedFile with file_path and file_url
+
+        Raises:
+            ValueError: If file validation fails
+            Exception: If upload fails
+        """
+        file_size = os.path.getsize(source_path)
+        self.validate_file(filename, file_size, self.config)
+
+        file_path = self.generate_file_path(
+            storage_type=storage_type,
+            company_id=company_id,
+            entity_id=entity_id,
+            filename=filename
+        )
+
+        try:
+            self.s3_client.upload_file(
+                source_path,
+                self.bucket_name,
+                file_path,
+                ExtraArgs={
+                    'ContentType': content_type,
+                    'Metadata': {
+                        'company_id': company_id,
+                        'entity_id': entity_id,
+                        'storage_type': storage_type.value,
+                        'original_filename': filename
+                    }
+                }
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            raise Exception(f"Failed to upload file to S3: {str(e)}")
+
+        return UploadedFile(
+            file_path=file_path,
+            file_url=self.get_file_url(file_path),
+            file_size=file_size,
+            content_type=content_type,
+            uploaded_at=datetime.utcnow()
+        )
+
+    def move_file(self, source_path: str, target_path: str) -> None:
+        """Move an object with a server-side copy followed by a delete.
+
+        Args:
+            source_path: Current S3 key of the file
+            target_path: New S3 key of the file
+
+        Raises:
+            FileNotFoundError: If the source object doesn't exist
+        """
+        try:
+            # Managed copy: switches to multipart copy for objects over 5GB
+            self.s3_client.copy(
+                CopySource={'Bucket': self.bucket_name, 'Key': source_path},
+                Bucket=self.bucket_name,
+                Key=target_path
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File not found in S3: {source_path}")
+            raise Exception(f"Failed to move file in S3: {str(e)}")
+        self.delete_file(source_path)
+
+    def iter_file(self, file_path: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream an object from S3 in chunks.
+
+        Args:
+            file_path: The S3 key of the file
+            chunk_size: Maximum number of bytes per chunk
+
+        Returns:
+            Iterator over the file content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File not found in S3: {file_path}")
+            raise Exception(f"Error reading file from S3: {str(e)}")
+        body = response['Body']
+        try:
+            yield from body.iter_chunks(chunk_size=chunk_size)
+        finally:
+            body.close()
+
     def get_file_url(self, file_path: str) -> str:
         """Get the public URL for a file in S3.
 
@@ -179,6 +429,83 @@ class S3StorageService(StorageServiceInterface):
         except ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+    def create_upload_url(
+            self,
+            file_path: str,
+            content_type: str,
+            file_size: int,
+            content_hash: str,
+            expires_in: int = 900,
+    ) -> PresignedUpload:
+        """Create a presigned PUT for a direct upload to S3.
+
+        Content-Type, Content-Length and x-amz-checksum-sha256 are signed, so
+        S3 rejects an upload whose size or content differs from the declared one.
+
+        Args:
+            file_path: The S3 key the file will be written to
+            content_type: MIME type the client must send
+            file_size: Declared size in bytes
+            content_hash: SHA-256 hex digest of the content
+            expires_in: Validity of the request in seconds
+
+        Returns:
+            PresignedUpload with the URL, method and headers to use
+        """
+        checksum = base64.b64encode(bytes.fromhex(content_hash)).decode('ascii')
+        try:
+            url: str = self.s3_client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': file_path,
+                    'ContentType': content_type,
+                    'ContentLength': file_size,
+                    'ChecksumSHA256': checksum
+                },
+                ExpiresIn=expires_in
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned upload URL: {str(e)}")
+
+        return PresignedUpload(
+            url=url,
+            method='PUT',
+            headers={
+                'Content-Type': content_type,
+                'Content-Length': str(file_size),
+                'x-amz-checksum-sha256': checksum
+            },
+            file_path=file_path,
+            expires_at=datetime.utcnow() + timedelta(seconds=expires_in)
+        )
+
+    def get_download_url(
+            self,
+            file_path: str,
+            expires_in: int = 3600,
+            download_name: Optional[str] = None,
+    ) -> str:
+        """Create a presigned GET so the client downloads straight from S3.
+
+        Args:
+            file_path: The S3 key of the file
+            expires_in: URL validity in seconds
+            download_name: Filename for the Content-Disposition header
+
+        Returns:
+            Presigned download URL
+        """
+        params = {'Bucket': self.bucket_name, 'Key': file_path}
+        if download_name:
+            safe_name = download_name.replace('"', '')
+            params['ResponseContentDisposition'] = f'attachment; filename="{safe_name}"'
+        try:
+            url: str = self.s3_client.generate_presigned_url('get_object', Params=params, ExpiresIn=expires_in)
+            return url
+        except ClientError as e:
+            raise Exception(f"Failed to generate presigned URL: {str(e)}")
+
     def delete_file(self, file_path: str) -> bool:
         """Delete a file from S3.
 
@@ -5,14 +5,17 @@ based on environment configuration.
 """
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.framework.domain.infrastructure.storage_service_interface import (
     StorageConfig,
     StorageServiceInterface,
 )
 from src.framework.infrastructure.storage.local_storage_service import LocalStorageService
-from src.framework.infrastructure.storage.s3_storage_service import S3StorageService
+from src.framework.infrastructure.storage.url_signer import UrlSigner
+
+if TYPE_CHECKING:
+    from src.framework.infrastructure.storage.s3_storage_service import S3StorageService
 
 
 class StorageFactory:
@@ -70,15 +73,22 @@ class StorageFactory:
             "LOCAL_STORAGE_URL",
             "http://localhost:8000/uploads"
         )
+        signed_url_base = os.getenv(
+            "LOCAL_STORAGE_SIGNED_URL",
+            "http://localhost:8000/api/storage/files"
+        )
+        secret = os.getenv("SECRET_KEY")
 
         return LocalStorageService(
             base_path=base_path,
             base_url=base_url,
-            config=config
+            config=config,
+            signer=UrlSigner(secret) if secret else None,
+            signed_url_base=signed_url_base
         )
 
     @staticmethod
-    def _create_s3_storage(config: StorageConfig) -> S3StorageService:
+    def _create_s3_storage(config: StorageConfig) -> "S3StorageService":
         """Create an S3 storage service instance.
 
         Args:
@@ -96,6 +106,9 @@ class StorageFactory:
                 "AWS_S3_BUCKET environment variable is required for S3 storage"
             )
 
+        # boto3 takes ~40ms to import: only pay for it when S3 is configured
+        from src.framework.infrastructure.storage.s3_storage_service import S3StorageService
+
         aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
         aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         region_name = os.getenv("AWS_REGION", "us-east-1")
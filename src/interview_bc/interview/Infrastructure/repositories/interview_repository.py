@@ -1,7 +1,7 @@
 """Interview repository implementation"""
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 from sqlalchemy import or_, func
 from sqlalchemy.dialects import postgresql
@@ -539,6 +539,26 @@ class SQLAlchemyInterviewRepository(InterviewRepositoryInterface):
             ).order_by(InterviewModel.created_at.desc()).all()
             return [self._to_domain(model) for model in models]
 
+    def count_pending_by_candidates(self, candidate_ids: List[str]) -> Dict[Tuple[str, str], int]:
+        """Count pending interviews for many candidates in a single query"""
+        if not candidate_ids:
+            return {}
+
+        with self.database.get_session() as session:
+            rows = session.query(
+                InterviewModel.candidate_id,
+                InterviewModel.workflow_stage_id,
+                func.count(InterviewModel.id)
+            ).filter(
+                InterviewModel.candidate_id.in_(candidate_ids),
+                InterviewModel.workflow_stage_id.isnot(None),
+                InterviewModel.status == InterviewStatusEnum.PENDING.value
+            ).group_by(
+                InterviewModel.candidate_id,
+                InterviewModel.workflow_stage_id
+            ).all()
+            return {(candidate_id, stage_id): count for candidate_id, stage_id, count in rows}
+
     def get_by_token(self, interview_id: str, token: str) -> Optional[Interview]:
         """Get interview by ID and token for secure link access"""
         import logging
@@ -1,7 +1,7 @@
 """Interview repository interface"""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 from src.company_bc.company.domain import CompanyId
 from src.interview_bc.interview.domain.entities.interview import Interview
@@ -100,6 +100,14 @@ class InterviewRepositoryInterface(ABC):
         """Get pending interviews for a candidate in a specific workflow stage"""
         pass
 
+    @abstractmethod
+    def count_pending_by_candidates(self, candidate_ids: List[str]) -> Dict[Tuple[str, str], int]:
+        """Count pending interviews for many candidates in a single query.
+
+        Returns a mapping of (candidate_id, workflow_stage_id) -> pending count.
+        """
+        pass
+
     @abstractmethod
     def get_by_token(self, interview_id: str, token: str) -> Optional[Interview]:
         """Get interview by ID and token for secure link access"""
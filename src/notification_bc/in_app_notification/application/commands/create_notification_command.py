@@ -10,6 +10,9 @@ from src.notification_bc.in_app_notification.domain.enums.notification_enums imp
     InAppNotificationType,
     InAppNotificationPriority
 )
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
 from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_repository_interface import (
     InAppNotificationRepositoryInterface
 )
@@ -32,8 +35,13 @@ class CreateNotificationCommand(Command):
 class CreateNotificationCommandHandler(CommandHandler[CreateNotificationCommand]):
     """Handler for CreateNotificationCommand"""
 
-    def __init__(self, repository: InAppNotificationRepositoryInterface):
+    def __init__(
+        self,
+        repository: InAppNotificationRepositoryInterface,
+        publisher: InAppNotificationPublisherInterface
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     def execute(self, command: CreateNotificationCommand) -> None:
         notification = InAppNotification.create(
@@ -49,3 +57,7 @@ class CreateNotificationCommandHandler(CommandHandler[CreateNotificationCommand]
         )
 
         self.repository.save(notification)
+        self.publisher.notification_created(
+            notification,
+            unread_count=self.repository.get_unread_count(command.user_id, command.company_id)
+        )
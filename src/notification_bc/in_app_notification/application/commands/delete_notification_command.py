@@ -2,6 +2,9 @@ from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
 from src.notification_bc.in_app_notification.domain.entities.in_app_notification import InAppNotificationId
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
 from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_repository_interface import (
     InAppNotificationRepositoryInterface
 )
@@ -21,8 +24,13 @@ class DeleteNotificationCommand(Command):
 class DeleteNotificationCommandHandler(CommandHandler[DeleteNotificationCommand]):
     """Handler for DeleteNotificationCommand"""
 
-    def __init__(self, repository: InAppNotificationRepositoryInterface):
+    def __init__(
+        self,
+        repository: InAppNotificationRepositoryInterface,
+        publisher: InAppNotificationPublisherInterface
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     def execute(self, command: DeleteNotificationCommand) -> None:
         notification = self.repository.get_by_id(command.notification_id)
@@ -35,3 +43,9 @@ class DeleteNotificationCommandHandler(CommandHandler[DeleteNotificationCommand]
             raise InAppNotificationNotFoundException(str(command.notification_id.value))
 
         self.repository.delete(command.notification_id)
+        if not notification.is_read:
+            self.publisher.unread_count_changed(
+                command.user_id,
+                command.company_id,
+                self.repository.get_unread_count(command.user_id, command.company_id)
+            )
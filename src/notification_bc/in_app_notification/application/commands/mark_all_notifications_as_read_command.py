@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
 from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_repository_interface import (
     InAppNotificationRepositoryInterface
 )
@@ -16,11 +19,17 @@ class MarkAllNotificationsAsReadCommand(Command):
 class MarkAllNotificationsAsReadCommandHandler(CommandHandler[MarkAllNotificationsAsReadCommand]):
     """Handler for MarkAllNotificationsAsReadCommand"""
 
-    def __init__(self, repository: InAppNotificationRepositoryInterface):
+    def __init__(
+        self,
+        repository: InAppNotificationRepositoryInterface,
+        publisher: InAppNotificationPublisherInterface
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     def execute(self, command: MarkAllNotificationsAsReadCommand) -> None:
         self.repository.mark_all_as_read(
             user_id=command.user_id,
             company_id=command.company_id
         )
+        self.publisher.unread_count_changed(command.user_id, command.company_id, 0)
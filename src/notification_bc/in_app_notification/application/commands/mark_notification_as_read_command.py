@@ -2,6 +2,9 @@ from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
 from src.notification_bc.in_app_notification.domain.entities.in_app_notification import InAppNotificationId
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
 from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_repository_interface import (
     InAppNotificationRepositoryInterface
 )
@@ -21,8 +24,13 @@ class MarkNotificationAsReadCommand(Command):
 class MarkNotificationAsReadCommandHandler(CommandHandler[MarkNotificationAsReadCommand]):
     """Handler for MarkNotificationAsReadCommand"""
 
-    def __init__(self, repository: InAppNotificationRepositoryInterface):
+    def __init__(
+        self,
+        repository: InAppNotificationRepositoryInterface,
+        publisher: InAppNotificationPublisherInterface
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     def execute(self, command: MarkNotificationAsReadCommand) -> None:
         notification = self.repository.get_by_id(command.notification_id)
@@ -34,5 +42,13 @@ class MarkNotificationAsReadCommandHandler(CommandHandler[MarkNotificationAsRead
         if notification.user_id != command.user_id or notification.company_id != command.company_id:
             raise InAppNotificationNotFoundException(str(command.notification_id.value))
 
+        if notification.is_read:
+            return
+
         notification.mark_as_read()
         self.repository.save(notification)
+        self.publisher.unread_count_changed(
+            command.user_id,
+            command.company_id,
+            self.repository.get_unread_count(command.user_id, command.company_id)
+        )
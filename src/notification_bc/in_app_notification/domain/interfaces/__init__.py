@@ -1,5 +1,8 @@
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
 from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_repository_interface import (
     InAppNotificationRepositoryInterface
 )
 
-__all__ = ['InAppNotificationRepositoryInterface']
+__all__ = ['InAppNotificationPublisherInterface', 'InAppNotificationRepositoryInterface']
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from src.notification_bc.in_app_notification.domain.entities.in_app_notification import InAppNotification
+
+
+class InAppNotificationPublisherInterface(ABC):
+    """Pushes notification changes to the connected clients of a user"""
+
+    @abstractmethod
+    def notification_created(self, notification: InAppNotification, unread_count: int) -> None:
+        """Push a new notification together with the new unread count"""
+        pass
+
+    @abstractmethod
+    def unread_count_changed(self, user_id: str, company_id: str, unread_count: int) -> None:
+        """Push the unread count after notifications were read or deleted"""
+        pass
@@ -1,5 +1,8 @@
 from src.notification_bc.in_app_notification.infrastructure.models.in_app_notification_model import (
     InAppNotificationModel
 )
+from src.notification_bc.in_app_notification.infrastructure.models.in_app_notification_unread_counter_model import (
+    InAppNotificationUnreadCounterModel
+)
 
-__all__ = ['InAppNotificationModel']
+__all__ = ['InAppNotificationModel', 'InAppNotificationUnreadCounterModel']
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from core.database import Base
+from datetime import datetime
+
+
+class InAppNotificationUnreadCounterModel(Base):
+    """Unread in-app notifications per (user, company), kept by the notification repository"""
+
+    __tablename__ = "in_app_notification_unread_counters"
+
+    user_id = Column(String(26), primary_key=True)
+    company_id = Column(String(26), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,6 @@
+from src.notification_bc.in_app_notification.infrastructure.push.redis_in_app_notification_push import (
+    RedisInAppNotificationPublisher,
+    RedisInAppNotificationStream
+)
+
+__all__ = ['RedisInAppNotificationPublisher', 'RedisInAppNotificationStream']
@@ -0,0 +1,95 @@
+"""Push of in-app notifications through Redis pub/sub
+
+Commands publish on a per-(user, company) channel from whichever process
+handles them (API or worker); every API process subscribes only to the channels
+of the streams it is serving. Messages are the JSON payloads sent to the client.
+"""
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+import redis
+import redis.asyncio as redis_async
+
+from src.notification_bc.in_app_notification.domain.entities.in_app_notification import InAppNotification
+from src.notification_bc.in_app_notification.domain.interfaces.in_app_notification_publisher_interface import (
+    InAppNotificationPublisherInterface
+)
+
+log = logging.getLogger(__name__)
+
+
+def channel_for(user_id: str, company_id: str) -> str:
+    return f"in_app_notifications:{company_id}:{user_id}"
+
+
+class RedisInAppNotificationPublisher(InAppNotificationPublisherInterface):
+    """Publishes notification events; a failed push never fails the command that caused it"""
+
+    def __init__(self, redis_url: str):
+        self._redis_url = redis_url
+        self._client: Optional[redis.Redis] = None
+
+    def notification_created(self, notification: InAppNotification, unread_count: int) -> None:
+        self._publish(notification.user_id, notification.company_id, {
+            "type": "notification",
+            "unread_count": unread_count,
+            "notification": {
+                "id": str(notification.id.value),
+                "notification_type": notification.notification_type.value,
+                "title": notification.title,
+                "message": notification.message,
+                "priority": notification.priority.value,
+                "is_read": notification.is_read,
+                "created_at": notification.created_at.isoformat(),
+                "link": notification.link,
+                "metadata": notification.metadata,
+            },
+        })
+
+    def unread_count_changed(self, user_id: str, company_id: str, unread_count: int) -> None:
+        self._publish(user_id, company_id, {"type": "unread_count", "unread_count": unread_count})
+
+    def _publish(self, user_id: str, company_id: str, payload: Dict[str, Any]) -> None:
+        if not self._redis_url:
+            return
+        try:
+            if self._client is None:
+                self._client = redis.Redis.from_url(self._redis_url, socket_timeout=1.0)
+            self._client.publish(channel_for(user_id, company_id), json.dumps(payload, default=str))
+        except redis.RedisError as e:
+            log.warning(f"Could not push in-app notification event to user {user_id}: {e}")
+
+
+class RedisInAppNotificationStream:
+    """Subscribes to the notification events of one user in one company"""
+
+    def __init__(self, redis_url: str, heartbeat_seconds: float = 15.0):
+        self._redis_url = redis_url
+        self.heartbeat_seconds = heartbeat_seconds
+        self._client: Optional[redis_async.Redis] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._redis_url)
+
+    async def listen(self, user_id: str, company_id: str) -> AsyncIterator[Optional[str]]:
+        """Yield each JSON payload as it arrives, or None after heartbeat_seconds without one"""
+        if self._client is None:
+            self._client = redis_async.Redis.from_url(self._redis_url)
+        channel = channel_for(user_id, company_id)
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.heartbeat_seconds
+                )
+                if message is None:
+                    yield None
+                else:
+                    data = message["data"]
+                    yield data.decode() if isinstance(data, bytes) else data
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
@@ -1,5 +1,7 @@
 from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from src.notification_bc.in_app_notification.domain.entities.in_app_notification import (
@@ -16,10 +18,18 @@ from src.notification_bc.in_app_notification.domain.interfaces.in_app_notificati
 from src.notification_bc.in_app_notification.infrastructure.models.in_app_notification_model import (
     InAppNotificationModel
 )
+from src.notification_bc.in_app_notification.infrastructure.models.in_app_notification_unread_counter_model import (
+    InAppNotificationUnreadCounterModel
+)
 
 
 class InAppNotificationRepository(InAppNotificationRepositoryInterface):
-    """SQLAlchemy implementation of InAppNotificationRepository"""
+    """SQLAlchemy implementation of InAppNotificationRepository
+
+    Unread counts live in in_app_notification_unread_counters and are adjusted in
+    the same transaction as the notification writes, so reading them is a
+    primary key lookup.
+    """
 
     def __init__(self, session: Session):
         self.session = session
@@ -48,7 +58,7 @@ class InAppNotificationRepository(InAppNotificationRepositoryInterface):
         )
 
         if unread_only:
-            query = query.filter(InAppNotificationModel.is_read == False)
+            query = query.filter(InAppNotificationModel.is_read.is_(False))
 
         # Get total count
         total_count = query.count()
@@ -61,54 +71,71 @@ class InAppNotificationRepository(InAppNotificationRepositoryInterface):
         return [self._to_entity(m) for m in models], total_count
 
     def get_unread_count(self, user_id: str, company_id: str) -> int:
-        return self.session.query(InAppNotificationModel).filter(
-            InAppNotificationModel.user_id == user_id,
-            InAppNotificationModel.company_id == company_id,
-            InAppNotificationModel.is_read == False
-        ).count()
+        unread_count = self.session.query(InAppNotificationUnreadCounterModel.unread_count).filter(
+            InAppNotificationUnreadCounterModel.user_id == user_id,
+            InAppNotificationUnreadCounterModel.company_id == company_id
+        ).scalar()
+        return int(unread_count or 0)
 
     def save(self, notification: InAppNotification) -> None:
         model = self._to_model(notification)
-
-        existing = self.session.query(InAppNotificationModel).filter(
-            InAppNotificationModel.id == str(notification.id.value)
+        table = InAppNotificationModel.__table__
+
+        # Flip is_read only if it differs, so of two concurrent saves only one adjusts the counter
+        flipped = self.session.execute(
+            update(table)
+            .where(table.c.id == model.id, table.c.is_read.is_distinct_from(model.is_read))
+            .values(is_read=model.is_read, read_at=model.read_at)
+            .returning(table.c.user_id, table.c.company_id)
         ).first()
-
-        if existing:
-            # Update existing
-            existing.is_read = model.is_read
-            existing.read_at = model.read_at
+        if flipped:
+            self._adjust_unread_count(flipped.user_id, flipped.company_id, -1 if model.is_read else 1)
         else:
-            # Insert new
-            self.session.add(model)
+            existing = self.session.execute(
+                update(table).where(table.c.id == model.id).values(read_at=model.read_at).returning(table.c.id)
+            ).first()
+            if not existing:
+                self.session.add(model)
+                if not model.is_read:
+                    self._adjust_unread_count(str(model.user_id), str(model.company_id), 1)
 
         self.session.commit()
 
     def mark_as_read(self, notification_id: InAppNotificationId) -> None:
-        self.session.query(InAppNotificationModel).filter(
-            InAppNotificationModel.id == str(notification_id.value)
-        ).update({
-            InAppNotificationModel.is_read: True,
-            InAppNotificationModel.read_at: datetime.utcnow()
-        })
+        table = InAppNotificationModel.__table__
+        # Only the request that flips is_read gets a row back and decrements the counter
+        marked = self.session.execute(
+            update(table)
+            .where(table.c.id == str(notification_id.value), table.c.is_read.is_(False))
+            .values(is_read=True, read_at=datetime.utcnow())
+            .returning(table.c.user_id, table.c.company_id)
+        ).first()
+        if marked:
+            self._adjust_unread_count(marked.user_id, marked.company_id, -1)
         self.session.commit()
 
     def mark_all_as_read(self, user_id: str, company_id: str) -> int:
         result = self.session.query(InAppNotificationModel).filter(
             InAppNotificationModel.user_id == user_id,
             InAppNotificationModel.company_id == company_id,
-            InAppNotificationModel.is_read == False
+            InAppNotificationModel.is_read.is_(False)
         ).update({
             InAppNotificationModel.is_read: True,
             InAppNotificationModel.read_at: datetime.utcnow()
         })
+        self._set_unread_count(user_id, company_id, 0)
         self.session.commit()
         return result
 
     def delete(self, notification_id: InAppNotificationId) -> None:
-        self.session.query(InAppNotificationModel).filter(
-            InAppNotificationModel.id == str(notification_id.value)
-        ).delete()
+        table = InAppNotificationModel.__table__
+        deleted = self.session.execute(
+            delete(table)
+            .where(table.c.id == str(notification_id.value))
+            .returning(table.c.user_id, table.c.company_id, table.c.is_read)
+        ).first()
+        if deleted and not deleted.is_read:
+            self._adjust_unread_count(deleted.user_id, deleted.company_id, -1)
         self.session.commit()
 
     def delete_old_notifications(self, user_id: str, company_id: str, days: int = 30) -> int:
@@ -118,9 +145,43 @@ class InAppNotificationRepository(InAppNotificationRepositoryInterface):
             InAppNotificationModel.company_id == company_id,
             InAppNotificationModel.created_at < cutoff_date
         ).delete()
+        if result:
+            unread = self.session.query(InAppNotificationModel).filter(
+                InAppNotificationModel.user_id == user_id,
+                InAppNotificationModel.company_id == company_id,
+                InAppNotificationModel.is_read.is_(False)
+            ).count()
+            self._set_unread_count(user_id, company_id, unread)
         self.session.commit()
         return result
 
+    def _adjust_unread_count(self, user_id: str, company_id: str, delta: int) -> None:
+        """Add delta to the unread counter atomically, never going below zero"""
+        table = InAppNotificationUnreadCounterModel.__table__
+        statement = insert(table).values(
+            user_id=user_id, company_id=company_id, unread_count=max(delta, 0), updated_at=datetime.utcnow()
+        )
+        self.session.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.company_id],
+            set_={
+                'unread_count': func.greatest(table.c.unread_count + delta, 0),
+                'updated_at': statement.excluded.updated_at
+            }
+        ))
+
+    def _set_unread_count(self, user_id: str, company_id: str, unread_count: int) -> None:
+        table = InAppNotificationUnreadCounterModel.__table__
+        statement = insert(table).values(
+            user_id=user_id, company_id=company_id, unread_count=unread_count, updated_at=datetime.utcnow()
+        )
+        self.session.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.company_id],
+            set_={
+                'unread_count': statement.excluded.unread_count,
+                'updated_at': statement.excluded.updated_at
+            }
+        ))
+
     def _to_entity(self, model: InAppNotificationModel) -> InAppNotification:
         """Convert SQLAlchemy model to domain entity"""
         # Cast to handle SQLAlchemy's Optional type hints
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import (
+    EntityCustomizationCache, entity_customization_cache
+)
 from src.shared_bc.customization.entity_customization.domain.exceptions.entity_customization_not_found import \
     EntityCustomizationNotFound
 from src.shared_bc.customization.entity_customization.domain.interfaces.entity_customization_repository_interface import \
@@ -20,8 +23,13 @@ class AddCustomFieldToEntityCommand(Command):
 class AddCustomFieldToEntityCommandHandler(CommandHandler[AddCustomFieldToEntityCommand]):
     """Handler for adding a custom field to an entity customization"""
 
-    def __init__(self, repository: EntityCustomizationRepositoryInterface):
+    def __init__(
+            self,
+            repository: EntityCustomizationRepositoryInterface,
+            cache: EntityCustomizationCache = entity_customization_cache
+    ):
         self._repository = repository
+        self._cache = cache
 
     def execute(self, command: AddCustomFieldToEntityCommand) -> None:
         """Handle the add custom field command"""
@@ -34,3 +42,4 @@ class AddCustomFieldToEntityCommandHandler(CommandHandler[AddCustomFieldToEntity
 
         entity_customization.add_field(command.field)
         self._repository.save(entity_customization)
+        self._cache.invalidate(entity_customization.entity_type, entity_customization.entity_id)
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import (
+    EntityCustomizationCache, entity_customization_cache
+)
 from src.shared_bc.customization.entity_customization.domain.entities.entity_customization import EntityCustomization
 from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
     EntityCustomizationTypeEnum
@@ -26,8 +29,13 @@ class CreateEntityCustomizationCommand(Command):
 class CreateEntityCustomizationCommandHandler(CommandHandler[CreateEntityCustomizationCommand]):
     """Handler for creating a new entity customization"""
 
-    def __init__(self, repository: EntityCustomizationRepositoryInterface):
+    def __init__(
+            self,
+            repository: EntityCustomizationRepositoryInterface,
+            cache: EntityCustomizationCache = entity_customization_cache
+    ):
         self._repository = repository
+        self._cache = cache
 
     def execute(self, command: CreateEntityCustomizationCommand) -> None:
         """Handle the create entity customization command
@@ -60,3 +68,5 @@ class CreateEntityCustomizationCommandHandler(CommandHandler[CreateEntityCustomi
                 metadata=command.metadata
             )
             self._repository.save(entity_customization)
+
+        self._cache.invalidate(command.entity_type, command.entity_id)
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import (
+    EntityCustomizationCache, entity_customization_cache
+)
 from src.shared_bc.customization.entity_customization.domain.exceptions.entity_customization_not_found import \
     EntityCustomizationNotFound
 from src.shared_bc.customization.entity_customization.domain.interfaces.entity_customization_repository_interface import \
@@ -18,8 +21,13 @@ class DeleteEntityCustomizationCommand(Command):
 class DeleteEntityCustomizationCommandHandler(CommandHandler[DeleteEntityCustomizationCommand]):
     """Handler for deleting an entity customization"""
 
-    def __init__(self, repository: EntityCustomizationRepositoryInterface):
+    def __init__(
+            self,
+            repository: EntityCustomizationRepositoryInterface,
+            cache: EntityCustomizationCache = entity_customization_cache
+    ):
         self._repository = repository
+        self._cache = cache
 
     def execute(self, command: DeleteEntityCustomizationCommand) -> None:
         """Handle the delete entity customization command"""
@@ -29,3 +37,4 @@ class DeleteEntityCustomizationCommandHandler(CommandHandler[DeleteEntityCustomi
             raise EntityCustomizationNotFound(f"Entity customization with ID '{command.id}' not found")
 
         self._repository.delete(command.id)
+        self._cache.invalidate(entity_customization.entity_type, entity_customization.entity_id)
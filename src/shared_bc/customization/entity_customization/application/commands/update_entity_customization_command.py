@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import (
+    EntityCustomizationCache, entity_customization_cache
+)
 from src.shared_bc.customization.entity_customization.domain.exceptions.entity_customization_not_found import \
     EntityCustomizationNotFound
 from src.shared_bc.customization.entity_customization.domain.interfaces.entity_customization_repository_interface import \
@@ -23,8 +26,13 @@ class UpdateEntityCustomizationCommand(Command):
 class UpdateEntityCustomizationCommandHandler(CommandHandler[UpdateEntityCustomizationCommand]):
     """Handler for updating an entity customization"""
 
-    def __init__(self, repository: EntityCustomizationRepositoryInterface):
+    def __init__(
+            self,
+            repository: EntityCustomizationRepositoryInterface,
+            cache: EntityCustomizationCache = entity_customization_cache
+    ):
         self._repository = repository
+        self._cache = cache
 
     def execute(self, command: UpdateEntityCustomizationCommand) -> None:
         """Handle the update entity customization command"""
@@ -40,3 +48,4 @@ class UpdateEntityCustomizationCommandHandler(CommandHandler[UpdateEntityCustomi
         )
 
         self._repository.save(entity_customization)
+        self._cache.invalidate(entity_customization.entity_type, entity_customization.entity_id)
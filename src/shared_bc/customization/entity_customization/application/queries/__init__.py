@@ -1,3 +1,7 @@
+from src.shared_bc.customization.entity_customization.application.queries.get_custom_field_values_by_entities_query import (
+    GetCustomFieldValuesByEntitiesQuery,
+    GetCustomFieldValuesByEntitiesQueryHandler
+)
 from src.shared_bc.customization.entity_customization.application.queries.get_custom_field_values_by_entity_query import (
     GetCustomFieldValuesByEntityQuery,
     GetCustomFieldValuesByEntityQueryHandler
@@ -24,4 +28,6 @@ __all__ = [
     "ListCustomFieldsByEntityQueryHandler",
     "GetCustomFieldValuesByEntityQuery",
     "GetCustomFieldValuesByEntityQueryHandler",
+    "GetCustomFieldValuesByEntitiesQuery",
+    "GetCustomFieldValuesByEntitiesQueryHandler",
 ]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Dict, Any, List
+
+from core.database import SQLAlchemyDatabase
+from src.framework.application.query_bus import Query, QueryHandler
+from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+    EntityCustomizationTypeEnum
+from src.shared_bc.customization.entity_customization.infrastructure.models.custom_field_value_model import \
+    CustomFieldValueModel
+
+
+@dataclass(frozen=True)
+class GetCustomFieldValuesByEntitiesQuery(Query):
+    """Query to get the custom field values of several entities of one type (e.g. a list page)"""
+    entity_type: EntityCustomizationTypeEnum
+    entity_ids: List[str]
+
+
+class GetCustomFieldValuesByEntitiesQueryHandler(
+    QueryHandler[GetCustomFieldValuesByEntitiesQuery, Dict[str, Dict[str, Any]]]
+):
+    """Handler for getting custom field values of several entities in one query"""
+
+    def __init__(self, database: SQLAlchemyDatabase):
+        self._database = database
+
+    def handle(self, query: GetCustomFieldValuesByEntitiesQuery) -> Dict[str, Dict[str, Any]]:
+        """Handle the query: entity ID -> {field_key: value}, {} for entities without values"""
+        values: Dict[str, Dict[str, Any]] = {entity_id: {} for entity_id in query.entity_ids}
+        if not values:
+            return values
+
+        with self._database.get_session() as session:
+            rows = session.query(CustomFieldValueModel.entity_id, CustomFieldValueModel.values).filter(
+                CustomFieldValueModel.entity_type == query.entity_type.value,
+                CustomFieldValueModel.entity_id.in_(list(values))
+            ).all()
+
+        for row in rows:
+            if row.values:
+                values[row.entity_id] = row.values
+        return values
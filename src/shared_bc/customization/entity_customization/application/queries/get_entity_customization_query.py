@@ -6,6 +6,9 @@ from src.shared_bc.customization.entity_customization.application.dtos.entity_cu
     EntityCustomizationDto
 from src.shared_bc.customization.entity_customization.application.mappers.entity_customization_mapper import \
     EntityCustomizationMapper
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import (
+    EntityCustomizationCache, entity_customization_cache
+)
 from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
     EntityCustomizationTypeEnum
 from src.shared_bc.customization.entity_customization.domain.interfaces.entity_customization_repository_interface import \
@@ -22,20 +25,28 @@ class GetEntityCustomizationQuery(Query):
 class GetEntityCustomizationQueryHandler(QueryHandler[GetEntityCustomizationQuery, Optional[EntityCustomizationDto]]):
     """Handler for getting an entity customization"""
 
-    def __init__(self, repository: EntityCustomizationRepositoryInterface):
+    def __init__(
+            self,
+            repository: EntityCustomizationRepositoryInterface,
+            cache: EntityCustomizationCache = entity_customization_cache
+    ):
         self._repository = repository
+        self._cache = cache
 
     def handle(self, query: GetEntityCustomizationQuery) -> Optional[EntityCustomizationDto]:
         """Handle the get entity customization query
         
         Returns None if entity customization is not found (instead of raising an exception)
         """
+        hit, dto = self._cache.get(query.entity_type, query.entity_id)
+        if hit:
+            return dto
+
         entity_customization = self._repository.get_by_entity(
             entity_type=query.entity_type,
             entity_id=query.entity_id
         )
 
-        if not entity_customization:
-            return None
-
-        return EntityCustomizationMapper.entity_to_dto(entity_customization)
+        dto = EntityCustomizationMapper.entity_to_dto(entity_customization) if entity_customization else None
+        self._cache.put(query.entity_type, query.entity_id, dto)
+        return dto
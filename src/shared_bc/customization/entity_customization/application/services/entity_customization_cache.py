@@ -0,0 +1,89 @@
+"""Cache of entity customizations (custom field definitions)
+
+Definitions are read on every view that shows custom fields and change rarely,
+so they are kept per worker keyed by (entity_type, entity_id). The customization
+commands invalidate the entry they change; a change handled by another worker
+is picked up when the entry expires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from core.config import settings
+from src.shared_bc.customization.entity_customization.application.dtos.entity_customization_dto import \
+    EntityCustomizationDto
+from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+    EntityCustomizationTypeEnum
+
+CacheKey = Tuple[str, str]
+
+
+class EntityCustomizationCache:
+    """LRU of customization DTOs (or None when the entity has none) with TTL"""
+
+    def __init__(
+            self,
+            max_entries: int = 1000,
+            ttl_seconds: float = 300.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[Optional[EntityCustomizationDto], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(
+            self,
+            entity_type: EntityCustomizationTypeEnum,
+            entity_id: str
+    ) -> Tuple[bool, Optional[EntityCustomizationDto]]:
+        """(hit, customization); a hit may hold None when the entity has no customization"""
+        if not self.enabled:
+            return False, None
+        key = (entity_type.value, entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            dto, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, dto
+
+    def put(
+            self,
+            entity_type: EntityCustomizationTypeEnum,
+            entity_id: str,
+            dto: Optional[EntityCustomizationDto]
+    ) -> None:
+        if not self.enabled:
+            return
+        key = (entity_type.value, entity_id)
+        with self._lock:
+            self._entries[key] = (dto, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, entity_type: EntityCustomizationTypeEnum, entity_id: str) -> None:
+        with self._lock:
+            self._entries.pop((entity_type.value, entity_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+entity_customization_cache = EntityCustomizationCache(
+    max_entries=settings.CUSTOM_FIELD_DEFINITIONS_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CUSTOM_FIELD_DEFINITIONS_CACHE_TTL_SECONDS
+)
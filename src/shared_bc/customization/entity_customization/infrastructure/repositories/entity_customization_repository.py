@@ -1,4 +1,4 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterable
 
 from src.shared_bc.customization.entity_customization.domain.entities.entity_customization import EntityCustomization
 from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
@@ -88,7 +88,7 @@ class EntityCustomizationRepository(EntityCustomizationRepositoryInterface):
         with self._database.get_session() as session:
             model = session.query(EntityCustomizationModel).filter_by(id=str(id)).first()
             if model:
-                return self._to_domain(session, model)
+                return self._to_domain(model, self._load_fields(session, [model.id]).get(model.id, []))
             return None
 
     def get_by_entity(
@@ -103,7 +103,7 @@ class EntityCustomizationRepository(EntityCustomizationRepositoryInterface):
                 entity_id=entity_id
             ).first()
             if model:
-                return self._to_domain(session, model)
+                return self._to_domain(model, self._load_fields(session, [model.id]).get(model.id, []))
             return None
 
     def list_by_entity_type(
@@ -115,7 +115,8 @@ class EntityCustomizationRepository(EntityCustomizationRepositoryInterface):
             models = session.query(EntityCustomizationModel).filter_by(
                 entity_type=entity_type.value
             ).all()
-            return [self._to_domain(session, model) for model in models]
+            fields_by_customization = self._load_fields(session, [model.id for model in models])
+            return [self._to_domain(model, fields_by_customization.get(model.id, [])) for model in models]
 
     def delete(self, id: EntityCustomizationId) -> None:
         """Delete an entity customization"""
@@ -123,27 +124,34 @@ class EntityCustomizationRepository(EntityCustomizationRepositoryInterface):
             session.query(EntityCustomizationModel).filter_by(id=str(id)).delete()
             session.commit()
 
-    def _to_domain(self, session: Any, model: EntityCustomizationModel) -> EntityCustomization:
-        """Convert model to domain entity"""
-        # Load custom fields for this entity customization
-        field_models = session.query(CustomFieldModel).filter_by(
-            entity_customization_id=str(model.id)
+    @staticmethod
+    def _load_fields(session: Any, customization_ids: Iterable[str]) -> Dict[str, List[CustomField]]:
+        """Load the custom fields of several entity customizations in one query"""
+        ids = [str(customization_id) for customization_id in customization_ids]
+        if not ids:
+            return {}
+        field_models = session.query(CustomFieldModel).filter(
+            CustomFieldModel.entity_customization_id.in_(ids)
         ).order_by(CustomFieldModel.order_index).all()
 
-        fields = [
-            CustomField(
-                id=CustomFieldId.from_string(field_model.id),
-                field_key=field_model.field_key,
-                field_name=field_model.field_name,
-                field_type=field_model.field_type,
-                field_config=field_model.field_config,
-                order_index=field_model.order_index,
-                created_at=field_model.created_at,
-                updated_at=field_model.updated_at
+        fields: Dict[str, List[CustomField]] = {}
+        for field_model in field_models:
+            fields.setdefault(field_model.entity_customization_id, []).append(
+                CustomField(
+                    id=CustomFieldId.from_string(field_model.id),
+                    field_key=field_model.field_key,
+                    field_name=field_model.field_name,
+                    field_type=field_model.field_type,
+                    field_config=field_model.field_config,
+                    order_index=field_model.order_index,
+                    created_at=field_model.created_at,
+                    updated_at=field_model.updated_at
+                )
             )
-            for field_model in field_models
-        ]
+        return fields
 
+    def _to_domain(self, model: EntityCustomizationModel, fields: List[CustomField]) -> EntityCustomization:
+        """Convert model and its custom fields to domain entity"""
         return EntityCustomization(
             id=EntityCustomizationId.from_string(model.id),
             entity_type=EntityCustomizationTypeEnum(model.entity_type),
@@ -1,5 +1,5 @@
 """Service for validating pending interviews in workflow stages"""
-from typing import List
+from typing import List, Dict, Tuple
 
 from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
 from src.interview_bc.interview.domain.infrastructure.interview_repository_interface import InterviewRepositoryInterface
@@ -76,3 +76,24 @@ class InterviewValidationService:
             candidate_id=str(candidate_id),
             workflow_stage_id=str(workflow_stage_id)
         )
+
+    def get_pending_interviews_counts(
+            self,
+            candidate_stages: List[Tuple[CandidateId, WorkflowStageId]]
+    ) -> Dict[str, int]:
+        """
+        Get the count of pending interviews for many candidates, each in its own stage.
+
+        Args:
+            candidate_stages: Pairs of (candidate ID, current workflow stage ID)
+
+        Returns:
+            Mapping of candidate ID -> number of pending interviews in that stage
+        """
+        counts = self.interview_repository.count_pending_by_candidates(
+            list({str(candidate_id) for candidate_id, _ in candidate_stages})
+        )
+        return {
+            str(candidate_id): counts.get((str(candidate_id), str(stage_id)), 0)
+            for candidate_id, stage_id in candidate_stages
+        }
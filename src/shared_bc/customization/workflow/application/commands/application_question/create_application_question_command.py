@@ -3,6 +3,9 @@ from typing import Optional, List, Dict, Any
 
 from src.company_bc.company.domain.value_objects import CompanyId
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_APPLICATION_QUESTIONS, PublicResponseCache, public_response_cache
+)
 from src.shared_bc.customization.workflow.domain.entities.application_question import (
     ApplicationQuestion
 )
@@ -37,8 +40,13 @@ class CreateApplicationQuestionCommand(Command):
 class CreateApplicationQuestionCommandHandler(CommandHandler[CreateApplicationQuestionCommand]):
     """Handler for CreateApplicationQuestionCommand."""
 
-    def __init__(self, repository: ApplicationQuestionRepositoryInterface):
+    def __init__(
+            self,
+            repository: ApplicationQuestionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: CreateApplicationQuestionCommand) -> None:
         """Execute the command."""
@@ -64,3 +72,5 @@ class CreateApplicationQuestionCommandHandler(CommandHandler[CreateApplicationQu
         )
 
         self.repository.save(question)
+        # Every position of the workflow serves this question; they are not known here
+        self.response_cache.invalidate(PUBLIC_APPLICATION_QUESTIONS)
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_APPLICATION_QUESTIONS, PublicResponseCache, public_response_cache
+)
 from src.shared_bc.customization.workflow.domain.interfaces.application_question_repository_interface import (
     ApplicationQuestionRepositoryInterface
 )
@@ -18,8 +21,13 @@ class DeleteApplicationQuestionCommand(Command):
 class DeleteApplicationQuestionCommandHandler(CommandHandler[DeleteApplicationQuestionCommand]):
     """Handler for DeleteApplicationQuestionCommand."""
 
-    def __init__(self, repository: ApplicationQuestionRepositoryInterface):
+    def __init__(
+            self,
+            repository: ApplicationQuestionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: DeleteApplicationQuestionCommand) -> None:
         """Execute the command."""
@@ -30,3 +38,5 @@ class DeleteApplicationQuestionCommandHandler(CommandHandler[DeleteApplicationQu
             raise ValueError(f"Application question not found: {command.id}")
 
         self.repository.delete(question_id)
+        # Every position of the workflow serves this question; they are not known here
+        self.response_cache.invalidate(PUBLIC_APPLICATION_QUESTIONS)
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
 from src.framework.application.command_bus import Command, CommandHandler
+from src.framework.application.public_response_cache import (
+    PUBLIC_APPLICATION_QUESTIONS, PublicResponseCache, public_response_cache
+)
 from src.shared_bc.customization.workflow.domain.interfaces.application_question_repository_interface import (
     ApplicationQuestionRepositoryInterface
 )
@@ -25,8 +28,13 @@ class UpdateApplicationQuestionCommand(Command):
 class UpdateApplicationQuestionCommandHandler(CommandHandler[UpdateApplicationQuestionCommand]):
     """Handler for UpdateApplicationQuestionCommand."""
 
-    def __init__(self, repository: ApplicationQuestionRepositoryInterface):
+    def __init__(
+            self,
+            repository: ApplicationQuestionRepositoryInterface,
+            response_cache: PublicResponseCache = public_response_cache
+    ):
         self.repository = repository
+        self.response_cache = response_cache
 
     def execute(self, command: UpdateApplicationQuestionCommand) -> None:
         """Execute the command."""
@@ -46,3 +54,5 @@ class UpdateApplicationQuestionCommandHandler(CommandHandler[UpdateApplicationQu
         )
 
         self.repository.save(question)
+        # Every position of the workflow serves this question; they are not known here
+        self.response_cache.invalidate(PUBLIC_APPLICATION_QUESTIONS)
@@ -0,0 +1,7 @@
+from src.shared_bc.customization.workflow.infrastructure.cache.workflow_definition_cache import (
+    WorkflowDefinitionCache,
+    WorkflowGraph,
+    workflow_definition_cache
+)
+
+__all__ = ['WorkflowDefinitionCache', 'WorkflowGraph', 'workflow_definition_cache']
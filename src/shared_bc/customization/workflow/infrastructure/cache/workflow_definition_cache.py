@@ -0,0 +1,195 @@
+"""Cache of workflow definitions (workflow graphs)
+
+Workflows and their stages are read by stage moves, permission checks,
+analytics, public positions and stage emails, and change rarely. Each worker
+keeps the graph of a workflow (the workflow, its stages in order and their phase
+links) stamped with the workflow's `updated_at`, which every workflow or stage
+write bumps in the same transaction.
+
+Writes made by this worker invalidate the graph at once. Writes made by other
+processes are detected by re-reading that version (a primary key lookup) at most
+every `version_check_seconds`, so a stale graph is never served for longer than
+that; the TTL only bounds how long an unused graph is kept.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from core.config import settings
+from src.shared_bc.customization.workflow.domain.entities.workflow import Workflow
+from src.shared_bc.customization.workflow.domain.entities.workflow_stage import WorkflowStage
+
+
+@dataclass(frozen=True)
+class WorkflowGraph:
+    """A workflow with its stages ordered by `order`, as of `version`"""
+    workflow: Workflow
+    stages: Tuple[WorkflowStage, ...]
+    version: datetime
+
+    def stage(self, stage_id: str) -> Optional[WorkflowStage]:
+        return next((stage for stage in self.stages if str(stage.id) == stage_id), None)
+
+
+@dataclass
+class _Entry:
+    graph: WorkflowGraph
+    checked_at: float
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class WorkflowDefinitionCacheStats:
+    hits: int
+    misses: int
+    stale: int
+    version_checks: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WorkflowDefinitionCache:
+    """LRU of workflow graphs with TTL, version checks and hit-rate counters"""
+
+    def __init__(
+            self,
+            max_entries: int = 1000,
+            ttl_seconds: float = 600.0,
+            version_check_seconds: float = 5.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._stage_workflows: Dict[str, str] = {}
+        self._invalidations = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._version_checks = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(
+            self,
+            workflow_id: str,
+            load: Callable[[], Optional[WorkflowGraph]],
+            current_version: Callable[[], Optional[datetime]]
+    ) -> Optional[WorkflowGraph]:
+        """
+        The cached graph of a workflow, or `load()` on a miss. The cached graph is
+        shared: callers must copy whatever they hand out.
+        """
+        if not self.enabled:
+            return load()
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(workflow_id)
+            if entry is not None and entry.expires_at <= now:
+                self._drop(workflow_id)
+                entry = None
+            if entry is not None and now - entry.checked_at < self.version_check_seconds:
+                self._entries.move_to_end(workflow_id)
+                self._hits += 1
+                return entry.graph
+            invalidations = self._invalidations
+
+        if entry is not None:
+            version = current_version()
+            with self._lock:
+                self._version_checks += 1
+                if version == entry.graph.version and self._entries.get(workflow_id) is entry:
+                    entry.checked_at = now
+                    self._entries.move_to_end(workflow_id)
+                    self._hits += 1
+                    return entry.graph
+                self._stale += 1
+                if self._entries.get(workflow_id) is entry:
+                    self._drop(workflow_id)
+
+        graph = load()
+        with self._lock:
+            self._misses += 1
+            # A write invalidating while this graph was loading may not be in it
+            if graph is not None and invalidations == self._invalidations:
+                self._put(workflow_id, graph, now)
+        return graph
+
+    def workflow_of_stage(self, stage_id: str) -> Optional[str]:
+        """Workflow id of a stage whose graph is cached"""
+        with self._lock:
+            return self._stage_workflows.get(stage_id)
+
+    def invalidate(self, workflow_id: str) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._drop(workflow_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+            self._stage_workflows.clear()
+
+    def stats(self) -> WorkflowDefinitionCacheStats:
+        with self._lock:
+            return WorkflowDefinitionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale=self._stale,
+                version_checks=self._version_checks,
+                entries=len(self._entries)
+            )
+
+    def render_prometheus(self) -> str:
+        """Counters in the Prometheus text exposition format (version 0.0.4)"""
+        stats = self.stats()
+        lines = []
+        for name, kind, help_text, value in (
+                ("workflow_definition_cache_hits_total", "counter", "Workflow graph lookups served from the cache.",
+                 stats.hits),
+                ("workflow_definition_cache_misses_total", "counter", "Workflow graph lookups loaded from the database.",
+                 stats.misses),
+                ("workflow_definition_cache_stale_total", "counter",
+                 "Cached workflow graphs reloaded after a write by another process.", stats.stale),
+                ("workflow_definition_cache_version_checks_total", "counter",
+                 "Version reads made to validate a cached workflow graph.", stats.version_checks),
+                ("workflow_definition_cache_entries", "gauge", "Workflow graphs currently cached.", stats.entries),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def _put(self, workflow_id: str, graph: WorkflowGraph, now: float) -> None:
+        self._drop(workflow_id)
+        self._entries[workflow_id] = _Entry(graph=graph, checked_at=now, expires_at=now + self.ttl_seconds)
+        for stage in graph.stages:
+            self._stage_workflows[str(stage.id)] = workflow_id
+        if len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, workflow_id: str) -> None:
+        entry = self._entries.pop(workflow_id, None)
+        if entry is not None:
+            for stage in entry.graph.stages:
+                self._stage_workflows.pop(str(stage.id), None)
+
+
+workflow_definition_cache = WorkflowDefinitionCache(
+    max_entries=settings.WORKFLOW_DEFINITION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.WORKFLOW_DEFINITION_CACHE_TTL_SECONDS,
+    version_check_seconds=settings.WORKFLOW_DEFINITION_CACHE_VERSION_CHECK_SECONDS
+)
@@ -1,3 +1,4 @@
+import copy
 from typing import Optional, List, Any
 
 from src.company_bc.company.domain.value_objects import CompanyId
@@ -9,14 +10,21 @@ from src.shared_bc.customization.workflow.domain.enums.workflow_type import Work
 from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
     WorkflowRepositoryInterface
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_id import WorkflowId
+from src.shared_bc.customization.workflow.infrastructure.cache.workflow_definition_cache import (
+    WorkflowDefinitionCache, workflow_definition_cache
+)
 from src.shared_bc.customization.workflow.infrastructure.models.workflow_model import WorkflowModel
 
 
 class WorkflowRepository(WorkflowRepositoryInterface):
-    """Repository implementation for company workflow operations"""
+    """Repository implementation for company workflow operations
 
-    def __init__(self, database: Any) -> None:
+    get_by_id is served from the workflow definition cache; writes invalidate it.
+    """
+
+    def __init__(self, database: Any, cache: WorkflowDefinitionCache = workflow_definition_cache) -> None:
         self._database = database
+        self._cache = cache
 
     def save(self, workflow: Workflow) -> None:
         """Save a workflow"""
@@ -28,14 +36,16 @@ class WorkflowRepository(WorkflowRepositoryInterface):
             else:
                 session.add(model)
             session.commit()
+        # updated_at changes with every update (onupdate), which other processes check
+        self._cache.invalidate(str(workflow.id))
 
     def get_by_id(self, workflow_id: WorkflowId) -> Optional[Workflow]:
         """Get workflow by ID"""
-        with self._database.get_session() as session:
-            model = session.query(WorkflowModel).filter_by(id=str(workflow_id)).first()
-            if model:
-                return self._to_domain(model)
-            return None
+        # The graph (workflow + stages) is loaded by the stage repository, which maps both
+        from src.shared_bc.customization.workflow.infrastructure.repositories.workflow_stage_repository import \
+            WorkflowStageRepository
+        graph = WorkflowStageRepository(self._database, self._cache).get_graph(str(workflow_id))
+        return copy.deepcopy(graph.workflow) if graph else None
 
     def list_by_company(self, company_id: CompanyId, workflow_type: Optional[WorkflowTypeEnum] = None) -> List[
         Workflow]:
@@ -67,6 +77,7 @@ class WorkflowRepository(WorkflowRepositoryInterface):
         with self._database.get_session() as session:
             session.query(WorkflowModel).filter_by(id=str(workflow_id)).delete()
             session.commit()
+        self._cache.invalidate(str(workflow_id))
 
     def list_by_phase_id(self, phase_id: PhaseId, workflow_type: Optional[WorkflowTypeEnum] = None,
                          status: Optional[str] = None) -> List[Workflow]:
@@ -80,7 +91,8 @@ class WorkflowRepository(WorkflowRepositoryInterface):
             models = query.all()
             return [self._to_domain(model) for model in models]
 
-    def _to_domain(self, model: WorkflowModel) -> Workflow:
+    @staticmethod
+    def _to_domain(model: WorkflowModel) -> Workflow:
         """Convert model to domain entity"""
         return Workflow(
             id=WorkflowId.from_string(model.id),
@@ -1,4 +1,6 @@
-from typing import Optional, List, Any
+import copy
+from datetime import datetime
+from typing import Optional, List, Any, cast
 
 from src.interview_bc.interview.domain.value_objects.interview_configuration import InterviewConfiguration
 from src.shared_bc.customization.phase.domain.value_objects.phase_id import PhaseId
@@ -11,14 +13,25 @@ from src.shared_bc.customization.workflow.domain.interfaces.workflow_stage_repos
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_id import WorkflowId
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
 from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_style import WorkflowStageStyle
+from src.shared_bc.customization.workflow.infrastructure.cache.workflow_definition_cache import (
+    WorkflowDefinitionCache, WorkflowGraph, workflow_definition_cache
+)
+from src.shared_bc.customization.workflow.infrastructure.models.workflow_model import WorkflowModel
 from src.shared_bc.customization.workflow.infrastructure.models.workflow_stage_model import WorkflowStageModel
+from src.shared_bc.customization.workflow.infrastructure.repositories.workflow_repository import WorkflowRepository
 
 
 class WorkflowStageRepository(WorkflowStageRepositoryInterface):
-    """Repository implementation for workflow stage operations"""
+    """Repository implementation for workflow stage operations
 
-    def __init__(self, database: Any) -> None:
+    Reads by workflow or stage id are served from the workflow definition cache.
+    Every write also bumps the workflow's updated_at, the version other processes
+    check their cached graph against.
+    """
+
+    def __init__(self, database: Any, cache: WorkflowDefinitionCache = workflow_definition_cache) -> None:
         self._database = database
+        self._cache = cache
 
     def save(self, stage: WorkflowStage) -> None:
         """Save a workflow stage"""
@@ -32,56 +45,66 @@ class WorkflowStageRepository(WorkflowStageRepositoryInterface):
                         setattr(existing, key, value)
             else:
                 session.add(model)
+            self._touch_workflow(session, str(stage.workflow_id))
             session.commit()
+        self._cache.invalidate(str(stage.workflow_id))
 
     def get_by_id(self, stage_id: WorkflowStageId) -> Optional[WorkflowStage]:
         """Get stage by ID"""
-        with self._database.get_session() as session:
-            model = session.query(WorkflowStageModel).filter_by(id=str(stage_id)).first()
-            if model:
-                return self._to_domain(model)
-            return None
+        workflow_id = self._cache.workflow_of_stage(str(stage_id))
+        if workflow_id is None:
+            with self._database.get_session() as session:
+                workflow_id = session.query(WorkflowStageModel.workflow_id).filter_by(id=str(stage_id)).scalar()
+            if workflow_id is None:
+                return None
+        graph = self.get_graph(workflow_id)
+        stage = graph.stage(str(stage_id)) if graph else None
+        return copy.deepcopy(stage) if stage else None
 
     def list_by_workflow(self, workflow_id: WorkflowId) -> List[WorkflowStage]:
         """List all stages for a workflow, ordered by order field"""
-        with self._database.get_session() as session:
-            models = session.query(WorkflowStageModel).filter_by(
-                workflow_id=str(workflow_id)
-            ).order_by(WorkflowStageModel.order).all()
-            return [self._to_domain(model) for model in models]
+        graph = self.get_graph(str(workflow_id))
+        return copy.deepcopy(list(graph.stages)) if graph else []
 
     def delete(self, stage_id: WorkflowStageId) -> None:
         """Delete a stage"""
         with self._database.get_session() as session:
+            workflow_id = session.query(WorkflowStageModel.workflow_id).filter_by(id=str(stage_id)).scalar()
             session.query(WorkflowStageModel).filter_by(id=str(stage_id)).delete()
+            if workflow_id:
+                self._touch_workflow(session, workflow_id)
             session.commit()
+        if workflow_id:
+            self._cache.invalidate(workflow_id)
 
     def get_initial_stage(self, workflow_id: WorkflowId) -> Optional[WorkflowStage]:
         """Get the initial stage of a workflow"""
-        with self._database.get_session() as session:
-            model = session.query(WorkflowStageModel).filter_by(
-                workflow_id=str(workflow_id),
-                stage_type=WorkflowStageTypeEnum.INITIAL.value
-            ).first()
-            if model:
-                return self._to_domain(model)
-            return None
+        graph = self.get_graph(str(workflow_id))
+        stages = graph.stages if graph else ()
+        stage = next((stage for stage in stages if stage.stage_type == WorkflowStageTypeEnum.INITIAL), None)
+        return copy.deepcopy(stage) if stage else None
 
     def get_final_stages(self, workflow_id: WorkflowId) -> List[WorkflowStage]:
         """Get all final stages of a workflow (SUCCESS and FAIL stages)"""
-        with self._database.get_session() as session:
-            models = session.query(WorkflowStageModel).filter(
-                WorkflowStageModel.workflow_id == str(workflow_id),
-                WorkflowStageModel.stage_type.in_(
-                    [WorkflowStageTypeEnum.SUCCESS.value, WorkflowStageTypeEnum.FAIL.value])
-            ).all()
-            return [self._to_domain(model) for model in models]
+        graph = self.get_graph(str(workflow_id))
+        stages = graph.stages if graph else ()
+        return copy.deepcopy([
+            stage for stage in stages
+            if stage.stage_type in (WorkflowStageTypeEnum.SUCCESS, WorkflowStageTypeEnum.FAIL)
+        ])
+
+    def get_graph(self, workflow_id: str) -> Optional[WorkflowGraph]:
+        """The workflow with its ordered stages, shared with the cache: copy before handing out"""
+        return self._cache.get(
+            workflow_id,
+            load=lambda: self._load_graph(workflow_id),
+            current_version=lambda: self._workflow_version(workflow_id)
+        )
 
     def list_by_phase(self, phase_id: PhaseId, workflow_type: WorkflowTypeEnum) -> List[WorkflowStage]:
         """List all stages for a phase, filtered by workflow_type, ordered by order field"""
         with self._database.get_session() as session:
             # First get the workflow for this phase and workflow_type
-            from src.shared_bc.customization.workflow.infrastructure.models.workflow_model import WorkflowModel
             workflow = session.query(WorkflowModel).filter_by(
                 phase_id=str(phase_id),
                 workflow_type=workflow_type.value
@@ -89,12 +112,35 @@ class WorkflowStageRepository(WorkflowStageRepositoryInterface):
 
             if not workflow:
                 return []
+            workflow_id = workflow.id
+
+        # Then get all stages for that workflow
+        return self.list_by_workflow(WorkflowId.from_string(workflow_id))
 
-            # Then get all stages for that workflow
+    def _load_graph(self, workflow_id: str) -> Optional[WorkflowGraph]:
+        with self._database.get_session() as session:
+            workflow = session.query(WorkflowModel).filter_by(id=workflow_id).first()
+            if workflow is None:
+                return None
             models = session.query(WorkflowStageModel).filter_by(
-                workflow_id=str(workflow.id)
+                workflow_id=workflow_id
             ).order_by(WorkflowStageModel.order).all()
-            return [self._to_domain(model) for model in models]
+            return WorkflowGraph(
+                workflow=WorkflowRepository._to_domain(workflow),
+                stages=tuple(self._to_domain(model) for model in models),
+                version=workflow.updated_at
+            )
+
+    def _workflow_version(self, workflow_id: str) -> Optional[datetime]:
+        with self._database.get_session() as session:
+            return cast(Optional[datetime], session.query(WorkflowModel.updated_at).filter_by(id=workflow_id).scalar())
+
+    @staticmethod
+    def _touch_workflow(session: Any, workflow_id: str) -> None:
+        """Bump the workflow version so other processes reload its cached graph"""
+        session.query(WorkflowModel).filter_by(id=workflow_id).update(
+            {WorkflowModel.updated_at: datetime.utcnow()}, synchronize_session=False
+        )
 
     def _to_domain(self, model: WorkflowStageModel) -> WorkflowStage:
         """Convert model to domain entity"""
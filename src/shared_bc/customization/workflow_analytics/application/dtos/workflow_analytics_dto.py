@@ -28,6 +28,7 @@ class StageAnalyticsDto:
     max_time_hours: Optional[float]
     conversion_rate_to_next: Optional[float]  # Percentage (0-100)
     dropout_rate: Optional[float]  # Percentage (0-100)
+    p90_time_hours: Optional[float] = None
 
 
 @dataclass
@@ -3,10 +3,13 @@ Get Stage Bottlenecks Query
 Phase 9: Query for identifying workflow stage bottlenecks
 """
 
+import statistics
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING, Dict, Any, cast
 
+from src.company_bc.candidate_application_stage.domain.infrastructure.stage_dwell_time_repository_interface import \
+    StageDwellTimeRepositoryInterface
 from src.framework.application.query_bus import Query, QueryHandler
 from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
     WorkflowRepositoryInterface
@@ -24,8 +27,9 @@ class GetStageBottlenecksQuery(Query):
     """
     Query to identify bottlenecks in a workflow's stages.
 
-    Returns only stages that are identified as bottlenecks
-    based on conversion rates and application flow.
+    Returns only stages that are identified as bottlenecks based on conversion
+    rates, application flow and the time applications spend in each stage
+    (dwell times of the visits completed in the date range).
     """
     workflow_id: str
     date_range_start: Optional[datetime] = None
@@ -40,11 +44,13 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
             self,
             database: "SQLAlchemyDatabase",
             workflow_repository: WorkflowRepositoryInterface,
-            stage_repository: WorkflowStageRepositoryInterface
+            stage_repository: WorkflowStageRepositoryInterface,
+            dwell_time_repository: StageDwellTimeRepositoryInterface
     ):
         self._database = database
         self._workflow_repository = workflow_repository
         self._stage_repository = stage_repository
+        self._dwell_time_repository = dwell_time_repository
 
     def handle(self, query: GetStageBottlenecksQuery) -> List[StageBottleneckDto]:
         """Execute the query and return bottlenecks"""
@@ -62,6 +68,18 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
 
         bottlenecks: List[StageBottleneckDto] = []
 
+        # Time in stage from the aggregated stage history
+        stage_ids = [str(stage.id) for stage in stages]
+        dwell_times = self._dwell_time_repository.get_histograms(
+            stage_ids,
+            completed_from=query.date_range_start.date() if query.date_range_start else None,
+            completed_to=query.date_range_end.date() if query.date_range_end else None
+        )
+        open_visits = self._dwell_time_repository.get_open_visits(stage_ids)
+        medians = [h.p50_hours for h in dwell_times.values() if h.p50_hours is not None]
+        # Stages without an estimated duration are compared with the typical stage of the workflow
+        baseline_hours = statistics.median(medians) if medians else None
+
         with self._database.get_session() as session:
             from src.company_bc.company_candidate.infrastructure.models.company_candidate_model import \
                 CompanyCandidateModel
@@ -130,6 +148,7 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
             expected_conversion = avg_conversion
 
             # Identify bottlenecks
+            now = datetime.utcnow()
             for metric in stage_metrics:
                 if cast(int, metric['total_count']) == 0:
                     continue
@@ -147,6 +166,17 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
                             (conversion_rate - expected_conversion) / expected_conversion * 100
                     )
 
+                # Time in stage against the stage estimate, or the typical stage of the workflow
+                dwell_time = dwell_times.get(cast(str, metric['stage_id']))
+                median_hours = dwell_time.p50_hours if dwell_time else None
+                p90_hours = dwell_time.p90_hours if dwell_time else None
+                expected_hours = (
+                    stage.estimated_duration_days * 24 if stage.estimated_duration_days else baseline_hours
+                )
+                time_variance = 0.0
+                if median_hours is not None and expected_hours:
+                    time_variance = (median_hours - expected_hours) / expected_hours * 100
+
                 # Calculate bottleneck score
                 score = 0.0
                 reasons = []
@@ -180,6 +210,25 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
                     score += 10
                     reasons.append(f"Large volume of applications affected ({current_count} applications)")
 
+                # 5. Slow stage: median time in stage well above the expected time (30 points max)
+                if time_variance > 50:
+                    score += min(time_variance / 100 * 20, 30)
+                    reasons.append(
+                        f"Slow stage (median {median_hours:.1f}h, p90 {p90_hours:.1f}h "
+                        f"vs expected {expected_hours:.1f}h)"
+                    )
+
+                # 6. Applications waiting longer than 90% of the past visits took (10 points)
+                waiting = open_visits.get(cast(str, metric['stage_id']))
+                if waiting and p90_hours is not None:
+                    oldest_hours = (now - waiting.oldest_started_at).total_seconds() / 3600
+                    if oldest_hours > p90_hours:
+                        score += 10
+                        reasons.append(
+                            f"Applications waiting longer than usual (oldest of {waiting.count} "
+                            f"for {oldest_hours:.1f}h, p90 is {p90_hours:.1f}h)"
+                        )
+
                 # Only include if meets minimum score threshold
                 if score >= query.min_bottleneck_score and reasons:
                     bottlenecks.append(StageBottleneckDto(
@@ -187,9 +236,9 @@ class GetStageBottlenecksQueryHandler(QueryHandler[GetStageBottlenecksQuery, Lis
                         stage_name=stage.name,
                         stage_order=stage.order,
                         current_applications=current_count,
-                        average_time_hours=0.0,  # Would need timestamp tracking
-                        expected_time_hours=0.0,
-                        time_variance_percentage=0.0,
+                        average_time_hours=(dwell_time.mean_hours if dwell_time else None) or 0.0,
+                        expected_time_hours=expected_hours or 0.0,
+                        time_variance_percentage=time_variance,
                         conversion_rate=conversion_rate,
                         expected_conversion_rate=expected_conversion,
                         conversion_variance_percentage=conversion_variance,
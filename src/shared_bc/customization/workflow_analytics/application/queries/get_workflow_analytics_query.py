@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from typing import TYPE_CHECKING
 
+from src.company_bc.candidate_application_stage.domain.infrastructure.stage_dwell_time_repository_interface import \
+    StageDwellTimeRepositoryInterface
 from src.framework.application.query_bus import Query, QueryHandler
 from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
     WorkflowRepositoryInterface
@@ -45,11 +47,13 @@ class GetWorkflowAnalyticsQueryHandler(QueryHandler[GetWorkflowAnalyticsQuery, W
             self,
             database: "SQLAlchemyDatabase",
             workflow_repository: WorkflowRepositoryInterface,
-            stage_repository: WorkflowStageRepositoryInterface
+            stage_repository: WorkflowStageRepositoryInterface,
+            dwell_time_repository: StageDwellTimeRepositoryInterface
     ):
         self._database = database
         self._workflow_repository = workflow_repository
         self._stage_repository = stage_repository
+        self._dwell_time_repository = dwell_time_repository
 
     def handle(self, query: GetWorkflowAnalyticsQuery) -> WorkflowAnalyticsDto:
         """Execute the query and return analytics"""
@@ -65,6 +69,13 @@ class GetWorkflowAnalyticsQueryHandler(QueryHandler[GetWorkflowAnalyticsQuery, W
         if not stages:
             raise ValueError(f"No stages found for workflow {query.workflow_id}")
 
+        # Time in stage from the aggregated stage history (visits completed in the date range)
+        dwell_times = self._dwell_time_repository.get_histograms(
+            [str(stage.id) for stage in stages],
+            completed_from=query.date_range_start.date() if query.date_range_start else None,
+            completed_to=query.date_range_end.date() if query.date_range_end else None
+        )
+
         # Calculate analytics using raw SQL for performance
         with self._database.get_session() as session:
             # Import models inline to avoid circular dependencies
@@ -128,9 +139,8 @@ class GetWorkflowAnalyticsQueryHandler(QueryHandler[GetWorkflowAnalyticsQuery, W
                 # Count applications in this stage
                 current_in_stage = applications_per_stage.get(stage_id, 0)
 
-                # For completed and rejected, we need to look at history
-                # For now, we'll use simplified metrics based on current_stage_id
-                # In a production system, you'd track stage history
+                # Rejected applications would need the outcome of each stage visit
+                dwell_time = dwell_times.get(stage_id)
 
                 # Total that passed through this stage (current + moved on)
                 total_in_stage = current_in_stage
@@ -158,14 +168,15 @@ class GetWorkflowAnalyticsQueryHandler(QueryHandler[GetWorkflowAnalyticsQuery, W
                     stage_order=stage.order,
                     total_applications=total_in_stage,
                     current_applications=current_in_stage,
-                    completed_applications=0,  # Would need stage history
-                    rejected_applications=0,  # Would need stage history
-                    average_time_hours=None,  # Would need timestamp tracking
-                    median_time_hours=None,
-                    min_time_hours=None,
-                    max_time_hours=None,
+                    completed_applications=dwell_time.count if dwell_time else 0,
+                    rejected_applications=0,
+                    average_time_hours=dwell_time.mean_hours if dwell_time else None,
+                    median_time_hours=dwell_time.p50_hours if dwell_time else None,
+                    min_time_hours=dwell_time.min_hours if dwell_time else None,
+                    max_time_hours=dwell_time.max_hours if dwell_time else None,
                     conversion_rate_to_next=conversion_rate,
-                    dropout_rate=dropout_rate
+                    dropout_rate=dropout_rate,
+                    p90_time_hours=dwell_time.p90_hours if dwell_time else None
                 ))
 
             # Create performance DTO
@@ -196,6 +207,16 @@ class GetWorkflowAnalyticsQueryHandler(QueryHandler[GetWorkflowAnalyticsQuery, W
             lowest_conversion = None
 
             if stage_analytics_list:
+                # Compare stage speed by median time in stage
+                stages_with_time = [
+                    s for s in stage_analytics_list
+                    if s.median_time_hours is not None
+                ]
+
+                if stages_with_time:
+                    fastest_stage = min(stages_with_time, key=lambda s: s.median_time_hours or 0).stage_name
+                    slowest_stage = max(stages_with_time, key=lambda s: s.median_time_hours or 0).stage_name
+
                 # Find stages with conversion data
                 stages_with_conversion = [
                     s for s in stage_analytics_list
@@ -0,0 +1,45 @@
+"""
+Query budget fixture
+
+Usage:
+    def test_list_positions(query_budget, authenticated_client):
+        with query_budget(max_queries=5):
+            authenticated_client.get("/positions")
+"""
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator, Optional
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from core.database import engine as default_engine
+from src.framework.infrastructure.middleware.sql_profiler_middleware import (
+    QueryStats, install_sql_profiler, profile_queries
+)
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[QueryStats]]:
+    """Assert that a block issues at most `max_queries` statements and no N+1 patterns"""
+
+    @contextmanager
+    def _budget(
+            max_queries: int,
+            engine: Optional[Engine] = None,
+            n_plus_one_threshold: Optional[int] = None
+    ) -> Iterator[QueryStats]:
+        install_sql_profiler(engine or default_engine)
+        with profile_queries() as stats:
+            yield stats
+
+        assert stats.query_count <= max_queries, (
+            f"Query budget exceeded: {stats.query_count} queries (budget {max_queries})\n"
+            + "\n".join(f"{count}x {shape}" for shape, count in stats.statement_counts.items())
+        )
+        if n_plus_one_threshold is not None:
+            repeated = stats.repeated_statements(n_plus_one_threshold)
+            assert not repeated, "Possible N+1 queries:\n" + "\n".join(
+                f"{count}x {shape}" for shape, count in repeated.items()
+            )
+
+    return _budget
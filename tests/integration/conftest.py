@@ -8,6 +8,7 @@ from typing import Generator
 # Import fixtures to make them available
 from tests.fixtures.database import test_database, db_session
 from tests.fixtures.auth import authenticated_client
+from tests.fixtures.query_budget import query_budget
 
 
 @pytest.fixture(scope="session")
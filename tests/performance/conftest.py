@@ -0,0 +1,119 @@
+"""
+Fixtures for the endpoint benchmark suite
+
+The suite runs against a tenant generated with scripts/generate_large_tenant.py and is
+skipped unless BENCHMARK_TENANT is set (e.g. BENCHMARK_TENANT=1 for bench-1.example.com):
+
+    python scripts/generate_large_tenant.py --candidates 1000000
+    BENCHMARK_TENANT=1 pytest tests/performance --benchmark-autosave
+    BENCHMARK_TENANT=1 pytest tests/performance --benchmark-compare
+"""
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.dependencies.utils import get_flat_dependant
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from starlette.routing import Match
+
+from core.database import engine
+from src.framework.infrastructure.middleware.sql_profiler_middleware import install_sql_profiler, profile_queries
+
+
+@dataclass
+class BenchmarkTenant:
+    """Ids of the generated tenant used to build the request URLs"""
+    company_id: str
+    company_slug: str
+    company_user_id: str
+    application_workflow_id: str
+
+
+@pytest.fixture(scope="session")
+def bench_tenant() -> BenchmarkTenant:
+    domain = f"bench-{os.environ['BENCHMARK_TENANT']}.example.com"
+    with engine.connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT c.id, c.slug, cu.id AS company_user_id, w.id AS workflow_id "
+                "FROM companies c "
+                "JOIN company_users cu ON cu.company_id = c.id "
+                "JOIN users u ON u.id = cu.user_id AND u.email = :email "
+                "JOIN workflows w ON w.company_id = c.id AND w.workflow_type = 'CA' "
+                "WHERE c.domain = :domain "
+                "ORDER BY w.is_default DESC LIMIT 1"
+            ),
+            {"domain": domain, "email": f"admin@{domain}"}
+        ).first()
+    if row is None:
+        pytest.skip(f"Tenant {domain} not found, run scripts/generate_large_tenant.py first")
+    return BenchmarkTenant(
+        company_id=row.id,
+        company_slug=row.slug,
+        company_user_id=row.company_user_id,
+        application_workflow_id=row.workflow_id,
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_client(bench_tenant: BenchmarkTenant) -> TestClient:
+    from main import app
+
+    client = TestClient(app)
+    domain = f"bench-{os.environ['BENCHMARK_TENANT']}.example.com"
+    response = client.post(
+        "/companies/auth/login",
+        data={"username": f"admin@{domain}", "password": "Admin123!"}
+    )
+    assert response.status_code == 200, response.text
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    return client
+
+
+def _declared_query_params(app: FastAPI, url: str) -> Optional[set]:
+    """Query parameters the GET route serving url accepts, or None if no route matches"""
+    scope = {"type": "http", "method": "GET", "path": url}
+    for route in app.router.routes:
+        if isinstance(route, APIRoute) and route.matches(scope)[0] == Match.FULL:
+            return {param.alias for param in get_flat_dependant(route.dependant).query_params}
+    return None
+
+
+@pytest.fixture
+def bench_endpoint(benchmark: Any, bench_client: TestClient) -> Callable[..., Any]:
+    """
+    Benchmark a GET request and record its SQL statement count in the benchmark report.
+
+    The statement count is stored in extra_info, so it is saved with --benchmark-autosave and
+    shows up next to the latency when comparing runs.
+    """
+    install_sql_profiler(engine)
+
+    def _run(url: str, params: Optional[Dict[str, Any]] = None, max_queries: Optional[int] = None) -> Any:
+        # An unknown parameter is silently ignored by FastAPI: the benchmark would measure something else
+        declared = _declared_query_params(bench_client.app, url)
+        unknown = set(params or {}) - (declared or set())
+        assert declared is not None and not unknown, f"{url} does not accept query parameters {unknown}"
+
+        with profile_queries() as stats:
+            response = bench_client.get(url, params=params)
+        assert response.status_code == 200, response.text
+
+        benchmark.extra_info["url"] = url
+        benchmark.extra_info["queries"] = stats.query_count
+        benchmark.extra_info["db_time_ms"] = round(stats.total_time_ms, 2)
+        benchmark.extra_info["n_plus_one"] = stats.repeated_statements()
+        if max_queries is not None:
+            assert stats.query_count <= max_queries, (
+                f"{url} issued {stats.query_count} queries (budget {max_queries})"
+            )
+
+        return benchmark.pedantic(
+            lambda: bench_client.get(url, params=params), rounds=5, iterations=1, warmup_rounds=1
+        )
+
+    return _run
@@ -0,0 +1,69 @@
+"""
+Latency and query-count benchmarks for the hot endpoints on a large tenant
+"""
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(not os.getenv("BENCHMARK_TENANT"), reason="BENCHMARK_TENANT is not set"),
+]
+
+
+class TestCandidateEndpoints:
+
+    def test_list_company_candidates(self, bench_endpoint, bench_tenant):
+        bench_endpoint(f"/{bench_tenant.company_slug}/admin/candidates")
+
+    def test_list_company_candidates_with_custom_fields(self, bench_endpoint, bench_tenant):
+        # Custom columns add one query for the whole list, not one per candidate
+        bench_endpoint(
+            f"/{bench_tenant.company_slug}/admin/candidates", params={"include_custom_fields": True}
+        )
+
+
+class TestPositionEndpoints:
+
+    # Auth and company context, the page, its total and the pending comments of the whole page
+    POSITION_LIST_QUERY_BUDGET = 8
+
+    def test_list_positions(self, bench_endpoint, bench_tenant):
+        bench_endpoint(
+            f"/{bench_tenant.company_slug}/admin/positions", params={"page_size": 100},
+            max_queries=self.POSITION_LIST_QUERY_BUDGET
+        )
+
+    def test_list_positions_summary(self, bench_endpoint, bench_tenant):
+        bench_endpoint(
+            f"/{bench_tenant.company_slug}/admin/positions", params={"page_size": 100, "view": "summary"},
+            max_queries=self.POSITION_LIST_QUERY_BUDGET
+        )
+
+    def test_list_public_positions(self, bench_endpoint):
+        bench_endpoint("/public/positions", params={"page_size": 12})
+
+    def test_list_company_public_positions(self, bench_endpoint, bench_tenant):
+        bench_endpoint(f"/{bench_tenant.company_slug}/positions", params={"page_size": 12})
+
+
+class TestAnalyticsEndpoints:
+
+    def test_workflow_analytics(self, bench_endpoint, bench_tenant):
+        bench_endpoint(f"/api/company/workflows/{bench_tenant.application_workflow_id}/analytics")
+
+
+class TestTaskEndpoints:
+
+    def test_my_tasks(self, bench_endpoint, bench_tenant):
+        bench_endpoint(
+            "/api/company/tasks/my-tasks", params={"user_id": bench_tenant.company_user_id, "limit": 50}
+        )
+
+
+class TestInterviewEndpoints:
+
+    def test_list_interviews(self, bench_endpoint, bench_tenant):
+        bench_endpoint(f"/{bench_tenant.company_slug}/admin/interviews", params={"limit": 50})
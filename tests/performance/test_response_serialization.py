@@ -0,0 +1,76 @@
+"""
+Serialization and compression benchmarks for large list responses
+
+Needs no tenant: builds 10k candidate rows in memory and serves them through the same default
+response class and compression middleware as the application. Bytes on the wire are recorded
+in extra_info for each encoding.
+"""
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from adapters.http.company_app.company_candidate.schemas.company_candidate_response import CompanyCandidateResponse
+from adapters.http.shared.responses import FastJSONResponse, model_json_response
+from src.framework.infrastructure.middleware.compression_middleware import CompressionMiddleware
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.performance
+
+ROW_COUNT = 10_000
+
+
+def _candidate(i: int) -> CompanyCandidateResponse:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return CompanyCandidateResponse(
+        id=f"01HZX{i:021d}", company_id="01HZXCOMPANY000000000000000", candidate_id=f"01HZY{i:021d}",
+        status="ACTIVE", ownership_status="COMPANY_OWNED", created_by_user_id="01HZXUSER00000000000000000",
+        workflow_id="01HZXWORKFLOW0000000000000", current_stage_id="01HZXSTAGE000000000000000",
+        phase_id=None, invited_at=now, confirmed_at=now, rejected_at=None, archived_at=None,
+        visibility_settings={"cv": True, "phone": False}, tags=["backend", "remote"],
+        position="Backend Engineer", department="Engineering", priority="MEDIUM",
+        created_at=now, updated_at=now, candidate_name=f"Candidate {i}",
+        candidate_email=f"candidate{i}@example.com", stage_name="Screening", workflow_name="Hiring",
+        stage_style={"icon": "user", "color": "#1f2937", "background_color": "#f3f4f6"},
+    )
+
+
+ROWS = [_candidate(i) for i in range(ROW_COUNT)]
+
+app = FastAPI(default_response_class=FastJSONResponse)
+app.add_middleware(CompressionMiddleware)
+
+
+@app.get("/default", response_model=List[CompanyCandidateResponse])
+def default_path() -> List[CompanyCandidateResponse]:
+    return ROWS
+
+
+@app.get("/single-pass", response_model=List[CompanyCandidateResponse])
+def single_pass() -> Response:
+    return model_json_response(ROWS, List[CompanyCandidateResponse])
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/default", "/single-pass"])
+def test_serialize_10k_candidates(benchmark, path: str):
+    benchmark.extra_info["rows"] = ROW_COUNT
+    benchmark.pedantic(
+        lambda: client.get(path, headers={"Accept-Encoding": "identity"}), rounds=5, iterations=1, warmup_rounds=1
+    )
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip", "br"])
+def test_compress_10k_candidates(benchmark, encoding: str):
+    def _get() -> int:
+        with client.stream("GET", "/single-pass", headers={"Accept-Encoding": encoding}) as response:
+            return sum(len(chunk) for chunk in response.iter_raw())
+
+    benchmark.extra_info["rows"] = ROW_COUNT
+    benchmark.extra_info["bytes"] = _get()
+    benchmark.pedantic(_get, rounds=5, iterations=1, warmup_rounds=1)
@@ -0,0 +1,39 @@
+"""
+Unit tests for UserController error handling
+"""
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+
+from adapters.http.auth.controllers.user import UserController
+from adapters.http.auth.schemas.token import PasswordResetConfirm
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
+from src.framework.application.command_bus import CommandBus
+from src.framework.application.query_bus import QueryBus
+
+
+class TestResetPassword:
+    """Test cases for UserController.reset_password"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.command_bus = Mock(spec=CommandBus)
+        self.controller = UserController(Mock(spec=QueryBus), self.command_bus)
+        self.request = PasswordResetConfirm(reset_token="token", new_password="new-password")
+
+    def test_busy_hashing_pool_is_not_turned_into_a_500(self):
+        """Test PasswordHashingBusyError reaches the app handler that serves it as 503"""
+        self.command_bus.dispatch.side_effect = PasswordHashingBusyError("busy")
+
+        with pytest.raises(PasswordHashingBusyError):
+            self.controller.reset_password(self.request)
+
+    def test_other_errors_are_a_500(self):
+        """Test unexpected errors are still reported as a server error"""
+        self.command_bus.dispatch.side_effect = RuntimeError("boom")
+
+        with pytest.raises(HTTPException) as error:
+            self.controller.reset_password(self.request)
+
+        assert error.value.status_code == 500
@@ -0,0 +1,62 @@
+"""
+Unit tests for UserRegistrationRepository
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.auth_bc.user_registration.domain.entities import UserRegistration
+from src.auth_bc.user_registration.domain.value_objects import UserRegistrationId
+from src.auth_bc.user_registration.infrastructure.models import UserRegistrationModel
+from src.auth_bc.user_registration.infrastructure.repositories.user_registration_repository import \
+    UserRegistrationRepository
+# The ORM configures every mapper at once: register the whole model graph
+import models  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_answer_model import InterviewAnswerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_interviewer_model import \
+    InterviewInterviewerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_model import InterviewModel  # noqa: F401
+
+
+class TestUserRegistrationRepository:
+    """Round trips through an in-memory database"""
+
+    @pytest.fixture
+    def repository(self):
+        engine = create_engine("sqlite:///:memory:")
+        UserRegistrationModel.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield UserRegistrationRepository(session)
+        session.close()
+
+    def test_round_trip_keeps_extracted_content_and_hash(self, repository):
+        registration = UserRegistration.create(
+            id=UserRegistrationId.generate(),
+            email="candidate@example.com",
+            file_name="cv.pdf",
+            file_size=1024,
+            content_type="application/pdf",
+            wants_cv_help=True
+        )
+        registration.set_extracted_content("CV text", {"name": "Ada"}, "a" * 64)
+
+        repository.save(registration)
+        loaded = repository.get_by_verification_token(registration.verification_token)
+
+        assert loaded is not None
+        assert loaded.id == registration.id
+        assert loaded.content_hash == "a" * 64
+        assert loaded.text_content == "CV text"
+        assert loaded.extracted_data == {"name": "Ada"}
+        assert loaded.file_name == "cv.pdf"
+        assert loaded.wants_cv_help is True
+
+    def test_round_trip_without_pdf(self, repository):
+        registration = UserRegistration.create(id=UserRegistrationId.generate(), email="user@example.com")
+
+        repository.save(registration)
+        loaded = repository.get_by_id(registration.id)
+
+        assert loaded is not None
+        assert loaded.content_hash is None
+        assert loaded.email == "user@example.com"
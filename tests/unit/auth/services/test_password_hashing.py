@@ -0,0 +1,100 @@
+"""
+Unit tests for pooled password hashing and rehash-on-login
+"""
+from unittest.mock import Mock, patch
+
+import bcrypt
+import pytest
+
+from src.auth_bc.user.application.queries.authenticate_user_query import (
+    AuthenticateUserQuery,
+    AuthenticateUserQueryHandler,
+)
+from src.auth_bc.user.domain.entities.user import User
+from src.auth_bc.user.domain.exceptions import PasswordHashingBusyError
+from src.auth_bc.user.domain.repositories.user_repository_interface import UserRepositoryInterface
+from src.auth_bc.user.domain.services import password_service
+from src.auth_bc.user.domain.services.password_service import PasswordService
+from src.auth_bc.user.domain.value_objects.UserId import UserId
+from src.auth_bc.user.domain.services.password_hashing_executor_interface import InlinePasswordHashingExecutor
+from src.auth_bc.user.infrastructure.services.password_hashing_pool import PasswordHashingPool
+
+ROUNDS = 4  # bcrypt minimum, keeps the tests fast
+
+
+@pytest.fixture(autouse=True)
+def inline_hashing():
+    with patch.object(PasswordService, "_executor", InlinePasswordHashingExecutor()), \
+            patch.object(password_service.settings, "BCRYPT_ROUNDS", ROUNDS):
+        yield
+
+
+def _user(hashed_password: str) -> User:
+    return User(id=UserId.generate(), email="ana@example.com", hashed_password=hashed_password)
+
+
+class TestPasswordHashingPool:
+
+    def test_worker_process_hashes_password(self):
+        pool = PasswordHashingPool(workers=1, max_pending=2, queue_timeout_seconds=30)
+
+        hashed = pool.run(password_service._hash_password, b"secret", ROUNDS)
+
+        assert bcrypt.checkpw(b"secret", hashed)
+
+    def test_saturated_pool_rejects_instead_of_queueing(self):
+        pool = PasswordHashingPool(workers=1, max_pending=1, queue_timeout_seconds=0.01)
+        pool._slots.acquire()  # one call already in flight
+
+        with pytest.raises(PasswordHashingBusyError):
+            pool.run(password_service._hash_password, b"secret", ROUNDS)
+
+
+class TestPasswordService:
+
+    def test_bcrypt_runs_in_the_configured_executor(self):
+        pool = PasswordHashingPool(workers=1, max_pending=1, queue_timeout_seconds=0.01)
+        pool._slots.acquire()  # saturated
+        PasswordService.set_executor(pool)
+
+        with pytest.raises(PasswordHashingBusyError):
+            PasswordService.hash_password("secret")
+
+    def test_hash_uses_configured_cost(self):
+        hashed = PasswordService.hash_password("secret")
+
+        assert hashed.startswith(f"$2b$0{ROUNDS}$")
+        assert PasswordService.verify_password("secret", hashed)
+        assert not PasswordService.verify_password("other", hashed)
+        assert not PasswordService.needs_rehash(hashed)
+
+    def test_hash_with_other_cost_needs_rehash(self):
+        hashed = bcrypt.hashpw(b"secret", bcrypt.gensalt(5)).decode()
+
+        assert PasswordService.needs_rehash(hashed)
+        assert PasswordService.needs_rehash("not-a-bcrypt-hash")
+
+
+class TestRehashOnLogin:
+
+    def test_outdated_hash_is_upgraded(self):
+        user = _user(bcrypt.hashpw(b"secret", bcrypt.gensalt(5)).decode())
+        repository = Mock(spec=UserRepositoryInterface)
+        repository.get_user_auth_data_by_email.return_value = user
+
+        result = AuthenticateUserQueryHandler(repository).handle(AuthenticateUserQuery("ana@example.com", "secret"))
+
+        assert result is not None
+        user_id, data = repository.update.call_args.args
+        assert user_id == user.id
+        assert data["hashed_password"].startswith(f"$2b$0{ROUNDS}$")
+
+    def test_current_hash_and_wrong_password_are_left_alone(self):
+        user = _user(PasswordService.hash_password("secret"))
+        repository = Mock(spec=UserRepositoryInterface)
+        repository.get_user_auth_data_by_email.return_value = user
+        handler = AuthenticateUserQueryHandler(repository)
+
+        assert handler.handle(AuthenticateUserQuery("ana@example.com", "secret")) is not None
+        assert handler.handle(AuthenticateUserQuery("ana@example.com", "wrong")) is None
+        repository.update.assert_not_called()
@@ -0,0 +1,84 @@
+"""
+Unit tests for ProfileSnapshotService
+"""
+from unittest.mock import Mock, patch
+
+from src.candidate_bc.candidate.domain.repositories.candiadate_experience_repository_interface import \
+    CandidateExperienceRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_education_repository_interface import \
+    CandidateEducationRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_project_repository_interface import \
+    CandidateProjectRepositoryInterface
+from src.candidate_bc.candidate.domain.repositories.candidate_repository_interface import CandidateRepositoryInterface
+from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.company_bc.candidate_application.application.services.profile_snapshot_service import \
+    ProfileSnapshotService
+from src.company_bc.candidate_application.domain.repositories.profile_snapshot_repository_interface import \
+    ProfileSnapshotRepositoryInterface
+from tests.unit.candidate.mothers.candidate_mother import CandidateMother
+
+CANDIDATE_ID = CandidateId.from_string("01HQ7K8NZFT7QK3SR3VEF05S08")
+RENDER_PATH = "src.company_bc.candidate_application.application.services.profile_snapshot_service." \
+              "ProfileMarkdownService.render"
+
+
+class TestProfileSnapshotService:
+    """Test cases for ProfileSnapshotService"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.snapshot_repository = Mock(spec=ProfileSnapshotRepositoryInterface)
+        self.candidate_repository = Mock(spec=CandidateRepositoryInterface)
+        self.candidate_repository.get_by_id.return_value = CandidateMother.create_candidate_entity(CANDIDATE_ID)
+        experience_repository = Mock(spec=CandidateExperienceRepositoryInterface)
+        education_repository = Mock(spec=CandidateEducationRepositoryInterface)
+        project_repository = Mock(spec=CandidateProjectRepositoryInterface)
+        for repository in (experience_repository, education_repository, project_repository):
+            repository.get_by_candidate_id.return_value = []
+        self.service = ProfileSnapshotService(
+            self.snapshot_repository,
+            self.candidate_repository,
+            experience_repository,
+            education_repository,
+            project_repository
+        )
+
+    def test_new_profile_is_rendered_and_stored(self):
+        """Test the markdown is rendered when no snapshot exists for the profile"""
+        self.snapshot_repository.exists.return_value = False
+
+        snapshot_id = self.service.get_or_create_snapshot_id(CANDIDATE_ID, "en")
+
+        snapshot = self.snapshot_repository.create_if_absent.call_args[0][0]
+        assert snapshot.id == snapshot_id
+        assert snapshot.language == "en"
+        assert snapshot.profile_markdown
+        assert snapshot.profile_json["email"] == self.candidate_repository.get_by_id.return_value.email
+
+    def test_unchanged_profile_reuses_snapshot_without_rendering(self):
+        """Test applying twice with the same profile renders the markdown once"""
+        self.snapshot_repository.exists.return_value = False
+        first_id = self.service.get_or_create_snapshot_id(CANDIDATE_ID)
+        self.snapshot_repository.exists.return_value = True
+
+        with patch(RENDER_PATH) as render:
+            second_id = self.service.get_or_create_snapshot_id(CANDIDATE_ID)
+
+        assert second_id == first_id
+        render.assert_not_called()
+        self.snapshot_repository.create_if_absent.assert_called_once()
+
+    def test_changed_profile_gets_a_new_snapshot(self):
+        """Test a profile change produces a different snapshot ID"""
+        self.snapshot_repository.exists.return_value = False
+        first_id = self.service.get_or_create_snapshot_id(CANDIDATE_ID)
+        self.candidate_repository.get_by_id.return_value.city = "Elsewhere"
+
+        assert self.service.get_or_create_snapshot_id(CANDIDATE_ID) != first_id
+
+    def test_missing_candidate_has_no_snapshot(self):
+        """Test no snapshot is created for an unknown candidate"""
+        self.candidate_repository.get_by_id.return_value = None
+
+        assert self.service.get_or_create_snapshot_id(CANDIDATE_ID) is None
+        self.snapshot_repository.create_if_absent.assert_not_called()
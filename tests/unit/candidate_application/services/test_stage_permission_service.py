@@ -0,0 +1,95 @@
+"""
+Unit tests for StagePermissionService and its permission decision cache
+"""
+from unittest.mock import Mock
+
+# The position_stage_assignment package imports the HTTP adapters, which import the service
+# back: load it first so the service module is not partially initialized
+from src.company_bc.position_stage_assignment.application.commands.add_user_to_stage import (
+    AddUserToStageCommand, AddUserToStageCommandHandler
+)
+from src.company_bc.position_stage_assignment.domain import (
+    PositionStageAssignment, PositionStageAssignmentId, PositionStageAssignmentRepositoryInterface
+)
+from src.company_bc.candidate_application.application.services.permission_decision_cache import \
+    PermissionDecisionCache
+from src.company_bc.candidate_application.application.services.stage_permission_service import \
+    StagePermissionService
+from src.company_bc.company.domain.infrastructure.company_user_repository_interface import \
+    CompanyUserRepositoryInterface
+
+COMPANY_ID = "01HQ7K8NZFT7QK3SR3VEF05S01"
+USER_ID = "01HQ7K8NZFT7QK3SR3VEF05S02"
+OTHER_USER_ID = "01HQ7K8NZFT7QK3SR3VEF05S06"
+POSITION_ID = "01HQ7K8NZFT7QK3SR3VEF05S03"
+OTHER_POSITION_ID = "01HQ7K8NZFT7QK3SR3VEF05S04"
+STAGE_ID = "01HQ7K8NZFT7QK3SR3VEF05S05"
+
+
+def _assignment(*user_ids: str) -> PositionStageAssignment:
+    return PositionStageAssignment.create(
+        id=PositionStageAssignmentId.generate(),
+        position_id=POSITION_ID,
+        stage_id=STAGE_ID,
+        assigned_user_ids=list(user_ids)
+    )
+
+
+class TestStagePermissionService:
+    """Test cases for StagePermissionService"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.now = 0.0
+        self.cache = PermissionDecisionCache(ttl_seconds=30.0, clock=lambda: self.now)
+        self.assignment_repository = Mock(spec=PositionStageAssignmentRepositoryInterface)
+        self.assignment_repository.get_by_position_and_stage.return_value = _assignment(USER_ID)
+        self.company_user_repository = Mock(spec=CompanyUserRepositoryInterface)
+        self.company_user_repository.get_by_company_and_user.return_value = None
+        self.service = StagePermissionService(
+            self.assignment_repository, self.company_user_repository, decision_cache=self.cache
+        )
+
+    def test_repeated_checks_are_answered_from_the_cache(self):
+        for _ in range(3):
+            assert self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+
+        self.assignment_repository.get_by_position_and_stage.assert_called_once_with(POSITION_ID, STAGE_ID)
+        self.company_user_repository.get_by_company_and_user.assert_called_once()
+
+    def test_assignment_change_invalidates_decisions_of_the_position(self):
+        assert self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+        self.assignment_repository.get_by_position_and_stage.return_value = None
+        AddUserToStageCommandHandler(self.assignment_repository, permission_cache=self.cache).execute(
+            AddUserToStageCommand(position_id=POSITION_ID, stage_id=STAGE_ID, user_id=OTHER_USER_ID)
+        )
+        self.assignment_repository.get_by_position_and_stage.return_value = _assignment(OTHER_USER_ID)
+
+        assert not self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+
+    def test_role_change_invalidates_decisions_of_the_company(self):
+        assert self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+        self.assignment_repository.get_by_position_and_stage.return_value = _assignment()
+
+        self.cache.invalidate_company(COMPANY_ID)
+
+        assert not self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+
+    def test_decisions_expire_after_the_ttl(self):
+        self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+        self.now = 31.0
+
+        self.service.can_user_process_position_stage(USER_ID, COMPANY_ID, POSITION_ID, STAGE_ID)
+
+        assert self.assignment_repository.get_by_position_and_stage.call_count == 2
+
+    def test_batch_check_uses_a_single_assignment_query(self):
+        self.assignment_repository.list_assigned_position_stages.return_value = {(POSITION_ID, STAGE_ID)}
+        pairs = [(POSITION_ID, STAGE_ID), (OTHER_POSITION_ID, STAGE_ID), (POSITION_ID, STAGE_ID)]
+
+        allowed = self.service.processable_position_stages(USER_ID, COMPANY_ID, pairs)
+        again = self.service.processable_position_stages(USER_ID, COMPANY_ID, pairs)
+
+        assert allowed == again == {(POSITION_ID, STAGE_ID)}
+        self.assignment_repository.list_assigned_position_stages.assert_called_once()
+        self.assignment_repository.get_by_position_and_stage.assert_not_called()
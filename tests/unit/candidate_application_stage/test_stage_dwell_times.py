@@ -0,0 +1,87 @@
+"""
+Unit tests for the stage dwell time histograms and their aggregation command
+"""
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from src.company_bc.candidate_application_stage.application.commands.aggregate_stage_dwell_times_command import (
+    AggregateStageDwellTimesCommand,
+    AggregateStageDwellTimesCommandHandler,
+)
+from src.company_bc.candidate_application_stage.domain.infrastructure.stage_dwell_time_repository_interface import \
+    StageDwellTimeRepositoryInterface
+from src.company_bc.candidate_application_stage.domain.value_objects.dwell_time_histogram import DwellTimeHistogram
+
+
+class TestDwellTimeHistogram:
+    """Test cases for DwellTimeHistogram"""
+
+    def test_empty_histogram_has_no_statistics(self):
+        histogram = DwellTimeHistogram()
+
+        assert histogram.count == 0
+        assert histogram.mean_hours is None
+        assert histogram.p50_hours is None
+        assert histogram.p90_hours is None
+
+    def test_percentiles_are_close_to_exact_values(self):
+        rng = random.Random(42)
+        hours = [rng.lognormvariate(3, 1.2) for _ in range(5000)]
+        histogram = DwellTimeHistogram()
+        for value in hours:
+            histogram.add(value)
+
+        ordered = sorted(hours)
+        assert histogram.count == 5000
+        assert histogram.mean_hours == pytest.approx(sum(hours) / len(hours))
+        assert histogram.min_hours == ordered[0]
+        assert histogram.max_hours == ordered[-1]
+        assert histogram.p50_hours == pytest.approx(ordered[2499], rel=0.1)
+        assert histogram.p90_hours == pytest.approx(ordered[4499], rel=0.1)
+
+    def test_merge_equals_adding_everything_to_one_histogram(self):
+        monday, tuesday, both = DwellTimeHistogram(), DwellTimeHistogram(), DwellTimeHistogram()
+        for value in (1.0, 5.0, 30.0):
+            monday.add(value)
+            both.add(value)
+        for value in (0.1, 200.0):
+            tuesday.add(value)
+            both.add(value)
+
+        monday.merge(tuesday)
+
+        assert monday == both
+
+    def test_merge_into_empty_histogram(self):
+        histogram, other = DwellTimeHistogram(), DwellTimeHistogram()
+        other.add(12.0)
+
+        histogram.merge(other)
+
+        assert histogram.count == 1
+        assert histogram.min_hours == 12.0
+        assert histogram.p50_hours == pytest.approx(12.0, rel=0.1)
+
+
+class TestAggregateStageDwellTimesCommand:
+    """Test cases for AggregateStageDwellTimesCommandHandler"""
+
+    def setup_method(self):
+        self.repository = Mock(spec=StageDwellTimeRepositoryInterface)
+        self.handler = AggregateStageDwellTimesCommandHandler(self.repository, settle_seconds=0)
+
+    def test_stops_when_caught_up(self):
+        self.repository.aggregate_completed_visits.side_effect = [100, 100, 40]
+
+        self.handler.execute(AggregateStageDwellTimesCommand(batch_size=100, max_batches=10))
+
+        assert self.repository.aggregate_completed_visits.call_count == 3
+
+    def test_stops_after_max_batches(self):
+        self.repository.aggregate_completed_visits.return_value = 100
+
+        self.handler.execute(AggregateStageDwellTimesCommand(batch_size=100, max_batches=2))
+
+        assert self.repository.aggregate_completed_visits.call_count == 2
@@ -0,0 +1,171 @@
+"""
+Unit tests for BulkChangeStageCommand
+"""
+import pytest
+from unittest.mock import Mock
+
+from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.company_bc.candidate_application.domain.repositories.candidate_application_repository_interface import \
+    CandidateApplicationRepositoryInterface
+from src.company_bc.company.domain.value_objects import CompanyId, CompanyUserId
+from src.company_bc.company_candidate.application.commands.bulk_change_stage_command import (
+    BulkChangeStageCommand,
+    BulkChangeStageCommandHandler,
+)
+from src.company_bc.company_candidate.domain.entities.company_candidate import CompanyCandidate
+from src.company_bc.company_candidate.domain.infrastructure.company_candidate_repository_interface import \
+    CompanyCandidateRepositoryInterface
+from src.company_bc.company_candidate.domain.value_objects import CompanyCandidateId
+from src.interview_bc.interview_template.domain.infrastructure.interview_template_repository_interface import \
+    InterviewTemplateRepositoryInterface
+from src.shared_bc.customization.field_validation.application.services.interview_validation_service import \
+    InterviewValidationService
+from src.shared_bc.customization.phase.domain.value_objects.phase_id import PhaseId
+from src.shared_bc.customization.workflow.domain.enums.workflow_stage_type_enum import WorkflowStageTypeEnum
+from src.shared_bc.customization.workflow.domain.interfaces.workflow_repository_interface import \
+    WorkflowRepositoryInterface
+from src.shared_bc.customization.workflow.domain.interfaces.workflow_stage_repository_interface import \
+    WorkflowStageRepositoryInterface
+from src.shared_bc.customization.workflow.domain.services.stage_phase_validation_service import \
+    StagePhaseValidationService
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_id import WorkflowId
+from src.shared_bc.customization.workflow.domain.value_objects.workflow_stage_id import WorkflowStageId
+
+
+class TestBulkChangeStageCommand:
+    """Test cases for BulkChangeStageCommand and its handler"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.company_id = CompanyId.generate()
+        self.phase_id = PhaseId.generate()
+        self.workflow_id = WorkflowId.generate()
+        self.stage_id = WorkflowStageId.generate()
+
+        self.target_stage = Mock()
+        self.target_stage.id = self.stage_id
+        self.target_stage.workflow_id = self.workflow_id
+        self.target_stage.stage_type = WorkflowStageTypeEnum.PROGRESS
+        self.target_stage.next_phase_id = None
+        self.target_stage.interview_configurations = []
+
+        self.repository = Mock(spec=CompanyCandidateRepositoryInterface)
+        self.workflow_stage_repository = Mock(spec=WorkflowStageRepositoryInterface)
+        self.workflow_stage_repository.get_by_id.return_value = self.target_stage
+        self.validation_service = Mock(spec=StagePhaseValidationService)
+        self.validation_service.validate_workflow_has_phase.return_value = self.phase_id
+        self.interview_validation_service = Mock(spec=InterviewValidationService)
+        self.interview_validation_service.get_pending_interviews_counts.return_value = {}
+
+        self.handler = BulkChangeStageCommandHandler(
+            repository=self.repository,
+            workflow_stage_repository=self.workflow_stage_repository,
+            workflow_repository=Mock(spec=WorkflowRepositoryInterface),
+            validation_service=self.validation_service,
+            interview_validation_service=self.interview_validation_service,
+            candidate_application_repository=Mock(spec=CandidateApplicationRepositoryInterface),
+            interview_template_repository=Mock(spec=InterviewTemplateRepositoryInterface),
+            command_bus=Mock()
+        )
+
+    def _company_candidate(self, with_workflow: bool = True) -> CompanyCandidate:
+        company_candidate = CompanyCandidate.create(
+            id=CompanyCandidateId.generate(),
+            company_id=self.company_id,
+            candidate_id=CandidateId.generate(),
+            created_by_user_id=CompanyUserId.generate(),
+            source="manual_import",
+            phase_id=self.phase_id,
+        )
+        if with_workflow:
+            company_candidate = company_candidate.assign_workflow(
+                workflow_id=self.workflow_id,
+                initial_stage_id=WorkflowStageId.generate()
+            )
+        return company_candidate
+
+    def test_moves_all_candidates_with_a_single_update(self):
+        """Eligible candidates are moved together and the stage is looked up once"""
+        # Arrange
+        candidates = [self._company_candidate() for _ in range(3)]
+        self.repository.list_by_ids.return_value = candidates
+        command = BulkChangeStageCommand(
+            company_id=self.company_id,
+            company_candidate_ids=[cc.id for cc in candidates],
+            new_stage_id=self.stage_id
+        )
+
+        # Act
+        self.handler.execute(command)
+
+        # Assert
+        self.workflow_stage_repository.get_by_id.assert_called_once_with(self.stage_id)
+        self.repository.list_by_ids.assert_called_once()
+        self.repository.bulk_change_stage.assert_called_once()
+        kwargs = self.repository.bulk_change_stage.call_args.kwargs
+        assert kwargs["company_candidate_ids"] == [cc.id for cc in candidates]
+        assert kwargs["stage_id"] == self.stage_id
+        assert kwargs["phase_id"] == self.phase_id.value
+        self.repository.save.assert_not_called()
+        assert [r.success for r in command.results] == [True, True, True]
+
+    def test_reports_per_item_failures(self):
+        """Missing candidates, pending interviews and missing workflows fail individually"""
+        # Arrange
+        movable = self._company_candidate()
+        with_pending = self._company_candidate()
+        without_workflow = self._company_candidate(with_workflow=False)
+        missing_id = CompanyCandidateId.generate()
+        self.repository.list_by_ids.return_value = [movable, with_pending, without_workflow]
+        self.interview_validation_service.get_pending_interviews_counts.return_value = {
+            str(with_pending.candidate_id): 2
+        }
+        command = BulkChangeStageCommand(
+            company_id=self.company_id,
+            company_candidate_ids=[movable.id, with_pending.id, without_workflow.id, missing_id],
+            new_stage_id=self.stage_id
+        )
+
+        # Act
+        self.handler.execute(command)
+
+        # Assert
+        kwargs = self.repository.bulk_change_stage.call_args.kwargs
+        assert kwargs["company_candidate_ids"] == [movable.id]
+        results = {r.company_candidate_id: r for r in command.results}
+        assert results[str(movable.id)].success is True
+        assert "2 pending interview(s)" in results[str(with_pending.id)].error
+        assert "without an assigned workflow" in results[str(without_workflow.id)].error
+        assert "not found" in results[str(missing_id)].error
+
+    def test_duplicate_ids_are_processed_once(self):
+        """Repeated IDs produce a single result"""
+        # Arrange
+        company_candidate = self._company_candidate()
+        self.repository.list_by_ids.return_value = [company_candidate]
+        command = BulkChangeStageCommand(
+            company_id=self.company_id,
+            company_candidate_ids=[company_candidate.id, company_candidate.id],
+            new_stage_id=self.stage_id
+        )
+
+        # Act
+        self.handler.execute(command)
+
+        # Assert
+        assert len(command.results) == 1
+
+    def test_unknown_stage_raises(self):
+        """The whole batch fails when the target stage does not exist"""
+        # Arrange
+        self.workflow_stage_repository.get_by_id.return_value = None
+        command = BulkChangeStageCommand(
+            company_id=self.company_id,
+            company_candidate_ids=[CompanyCandidateId.generate()],
+            new_stage_id=self.stage_id
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="not found"):
+            self.handler.execute(command)
+        self.repository.bulk_change_stage.assert_not_called()
@@ -0,0 +1,75 @@
+"""
+Unit tests for ExportCompanyCandidatesQuery
+"""
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.company_candidate.application.queries.export_company_candidates_query import (
+    EXPORT_COLUMNS,
+    ExportCompanyCandidatesQuery,
+    ExportCompanyCandidatesQueryHandler,
+)
+from src.company_bc.company_candidate.domain.infrastructure.company_candidate_repository_interface import \
+    CompanyCandidateRepositoryInterface
+from src.company_bc.company_candidate.domain.read_models.company_candidate_export_read_model import \
+    CompanyCandidateExportReadModel
+
+
+def _export_row(cc_id: str, custom_field_values: dict) -> CompanyCandidateExportReadModel:
+    return CompanyCandidateExportReadModel(
+        id=cc_id,
+        candidate_id=f"candidate-{cc_id}",
+        candidate_name="Jane Doe",
+        candidate_email="jane@example.com",
+        candidate_phone=None,
+        status="active",
+        priority="MEDIUM",
+        source="manual",
+        tags=["python"],
+        position=None,
+        department=None,
+        workflow_name="Hiring",
+        stage_name="Screening",
+        job_position_id=None,
+        job_position_title=None,
+        application_status=None,
+        invited_at=datetime(2024, 1, 1),
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+        custom_field_values=custom_field_values,
+    )
+
+
+class TestExportCompanyCandidatesQuery:
+    """Test cases for ExportCompanyCandidatesQueryHandler"""
+
+    def setup_method(self):
+        self.company_id = CompanyId.generate()
+        self.repository = Mock(spec=CompanyCandidateRepositoryInterface)
+        self.handler = ExportCompanyCandidatesQueryHandler(repository=self.repository)
+
+    def test_appends_custom_field_columns_and_renames_collisions(self):
+        self.repository.list_export_custom_field_keys.return_value = ["salary", "status"]
+        self.repository.iter_for_export.return_value = iter([
+            _export_row("cc-1", {"salary": 50000, "status": "remote"}),
+            _export_row("cc-2", {}),
+        ])
+
+        export = self.handler.handle(ExportCompanyCandidatesQuery(company_id=str(self.company_id), batch_size=10))
+
+        assert export.header == EXPORT_COLUMNS + ["salary", "custom_field.status"]
+        rows = list(export.rows)
+        assert rows[0][0] == "cc-1"
+        assert rows[0][-2:] == [50000, "remote"]
+        assert rows[1][-2:] == [None, None]
+        self.repository.iter_for_export.assert_called_once_with(self.company_id, batch_size=10)
+
+    def test_rows_are_not_fetched_until_consumed(self):
+        self.repository.list_export_custom_field_keys.return_value = []
+
+        export = self.handler.handle(ExportCompanyCandidatesQuery(company_id=str(self.company_id)))
+
+        self.repository.iter_for_export.assert_not_called()
+        self.repository.iter_for_export.return_value = iter([])
+        assert list(export.rows) == []
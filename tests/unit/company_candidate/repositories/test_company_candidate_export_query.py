@@ -0,0 +1,54 @@
+"""
+Unit tests for the export query of CompanyCandidateRepository
+"""
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from core.database import SQLAlchemyDatabase
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.company_candidate.infrastructure.repositories.company_candidate_repository import \
+    CompanyCandidateRepository
+# The ORM configures every mapper at once: register the whole model graph
+import models  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_answer_model import InterviewAnswerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_interviewer_model import \
+    InterviewInterviewerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_model import InterviewModel  # noqa: F401
+
+
+class _Captured(Exception):
+    pass
+
+
+class TestIterForExport:
+    """The export query is compiled for PostgreSQL (company_candidates uses ARRAY columns)"""
+
+    @pytest.fixture
+    def export_sql(self):
+        session = Session(bind=create_engine("sqlite://"))
+        statements = []
+
+        @event.listens_for(session, "do_orm_execute")
+        def capture(orm_execute_state):
+            statements.append(orm_execute_state.statement)
+            raise _Captured()
+
+        database = Mock(spec=SQLAlchemyDatabase)
+        database.new_session.return_value = session
+        repository = CompanyCandidateRepository(database)
+
+        with pytest.raises(_Captured):
+            list(repository.iter_for_export(CompanyId("comp-1")))
+
+        return str(statements[0].compile(dialect=postgresql.dialect())).lower()
+
+    def test_applications_are_scoped_to_the_company_positions(self, export_sql):
+        assert "job_positions.company_id = %(company_id_1)s" in export_sql
+
+    def test_one_application_per_candidate(self, export_sql):
+        assert "row_number() over (partition by candidate_applications.candidate_id" in export_sql
+        assert ".rank = %(rank_1)s" in export_sql
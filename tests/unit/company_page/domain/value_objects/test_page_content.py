@@ -23,6 +23,16 @@ class TestPageContent:
         assert content.word_count == 9
         assert content.word_count == len(content.plain_text.split())
     
+    def test_hydration_does_not_reparse_content(self):
+        """Test que construir PageContent desde la base de datos no valida ni recorre el HTML"""
+        # Arrange & Act
+        content = PageContent(html_content="<p>Uno dos tres</p>", plain_text="Uno dos tres", word_count=30)
+
+        # Assert
+        assert content.word_count == 30
+        with pytest.raises(ValueError, match="Plain text content cannot be empty"):
+            PageContent(html_content="<p></p>", plain_text="", word_count=0).validate()
+
     def test_create_page_content_with_empty_html_fails(self):
         """Test que falla al crear PageContent con HTML vacío"""
         # Act & Assert
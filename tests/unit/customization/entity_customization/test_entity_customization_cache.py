@@ -0,0 +1,62 @@
+"""
+Unit tests for the cached entity customization lookup
+"""
+from unittest.mock import Mock
+
+from src.shared_bc.customization.entity_customization.application.commands.update_entity_customization_command import (
+    UpdateEntityCustomizationCommand, UpdateEntityCustomizationCommandHandler
+)
+from src.shared_bc.customization.entity_customization.application.queries.get_entity_customization_query import (
+    GetEntityCustomizationQuery, GetEntityCustomizationQueryHandler
+)
+from src.shared_bc.customization.entity_customization.application.services.entity_customization_cache import \
+    EntityCustomizationCache
+from src.shared_bc.customization.entity_customization.domain.entities.entity_customization import EntityCustomization
+from src.shared_bc.customization.entity_customization.domain.enums.entity_customization_type_enum import \
+    EntityCustomizationTypeEnum
+from src.shared_bc.customization.entity_customization.domain.interfaces.entity_customization_repository_interface import \
+    EntityCustomizationRepositoryInterface
+
+COMPANY_ID = "01HQ7K8NZFT7QK3SR3VEF05S01"
+QUERY = GetEntityCustomizationQuery(entity_type=EntityCustomizationTypeEnum.CANDIDATE, entity_id=COMPANY_ID)
+
+
+class TestEntityCustomizationCache:
+    """Test cases for the entity customization cache"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.customization = EntityCustomization.create(
+            entity_type=EntityCustomizationTypeEnum.CANDIDATE, entity_id=COMPANY_ID, fields=[]
+        )
+        self.repository = Mock(spec=EntityCustomizationRepositoryInterface)
+        self.repository.get_by_entity.return_value = self.customization
+        self.repository.get_by_id.return_value = self.customization
+        self.cache = EntityCustomizationCache()
+        self.handler = GetEntityCustomizationQueryHandler(self.repository, cache=self.cache)
+
+    def test_definitions_are_loaded_once(self):
+        first = self.handler.handle(QUERY)
+        second = self.handler.handle(QUERY)
+
+        assert first is second
+        assert first.entity_id == COMPANY_ID
+        self.repository.get_by_entity.assert_called_once()
+
+    def test_missing_customization_is_cached_too(self):
+        self.repository.get_by_entity.return_value = None
+
+        assert self.handler.handle(QUERY) is None
+        assert self.handler.handle(QUERY) is None
+        self.repository.get_by_entity.assert_called_once()
+
+    def test_customization_commands_invalidate_the_entry(self):
+        self.handler.handle(QUERY)
+
+        UpdateEntityCustomizationCommandHandler(self.repository, cache=self.cache).execute(
+            UpdateEntityCustomizationCommand(id=self.customization.id, validation="{}")
+        )
+        refreshed = self.handler.handle(QUERY)
+
+        assert refreshed.validation == "{}"
+        assert self.repository.get_by_entity.call_count == 2
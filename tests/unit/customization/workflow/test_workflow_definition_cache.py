@@ -0,0 +1,92 @@
+"""
+Unit tests for the workflow definition cache
+"""
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.shared_bc.customization.workflow.domain.entities.workflow import Workflow
+from src.shared_bc.customization.workflow.domain.entities.workflow_stage import WorkflowStage
+from src.shared_bc.customization.workflow.infrastructure.cache.workflow_definition_cache import (
+    WorkflowDefinitionCache, WorkflowGraph
+)
+
+WORKFLOW_ID = "01HQ7K8NZFT7QK3SR3VEF05W01"
+STAGE_ID = "01HQ7K8NZFT7QK3SR3VEF05S01"
+VERSION = datetime(2026, 1, 1)
+
+
+def _graph(version: datetime = VERSION) -> WorkflowGraph:
+    stage = Mock(spec=WorkflowStage)
+    stage.id = STAGE_ID
+    return WorkflowGraph(workflow=Mock(spec=Workflow), stages=(stage,), version=version)
+
+
+class TestWorkflowDefinitionCache:
+    """Test cases for WorkflowDefinitionCache"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.now = 0.0
+        self.cache = WorkflowDefinitionCache(ttl_seconds=600, version_check_seconds=5, clock=lambda: self.now)
+        self.load = Mock(side_effect=lambda: _graph(self.version.return_value))
+        self.version = Mock(return_value=VERSION)
+
+    def _get(self):
+        return self.cache.get(WORKFLOW_ID, load=self.load, current_version=self.version)
+
+    def test_graph_is_loaded_once_and_indexed_by_stage(self):
+        first = self._get()
+
+        assert self._get() is first
+        self.load.assert_called_once()
+        self.version.assert_not_called()
+        assert self.cache.workflow_of_stage(STAGE_ID) == WORKFLOW_ID
+        assert first.stage(STAGE_ID) is first.stages[0]
+
+    def test_version_is_checked_once_the_interval_has_passed(self):
+        first = self._get()
+        self.now = 6
+
+        assert self._get() is first
+        self.version.assert_called_once()
+        self.load.assert_called_once()
+
+    def test_write_by_another_process_reloads_the_graph(self):
+        first = self._get()
+        self.now = 6
+        self.version.return_value = datetime(2026, 1, 2)
+
+        refreshed = self._get()
+
+        assert refreshed is not first
+        assert refreshed.version == datetime(2026, 1, 2)
+        assert self.cache.stats().stale == 1
+
+    def test_invalidation_drops_the_graph_and_its_stages(self):
+        self._get()
+
+        self.cache.invalidate(WORKFLOW_ID)
+
+        assert self.cache.workflow_of_stage(STAGE_ID) is None
+        self._get()
+        assert self.load.call_count == 2
+
+    def test_graph_loaded_during_an_invalidation_is_not_kept(self):
+        def load_while_invalidated():
+            self.cache.invalidate(WORKFLOW_ID)
+            return _graph()
+
+        self.cache.get(WORKFLOW_ID, load=load_while_invalidated, current_version=self.version)
+        self._get()
+
+        self.load.assert_called_once()
+
+    def test_stats_report_the_hit_rate(self):
+        self._get()
+        self._get()
+        self._get()
+
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+        assert stats.hit_rate == 2 / 3
+        assert "workflow_definition_cache_hits_total 2" in self.cache.render_prometheus()
@@ -0,0 +1,133 @@
+"""
+Unit tests for the command/query handler registry and bus dispatch hooks
+"""
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from dependency_injector import containers, providers
+
+from src.framework.application.command_bus import Command, CommandBus, CommandHandler
+from src.framework.application.handler_registry import HandlerRegistry, MissingHandlerError
+from src.framework.application.query_bus import Query, QueryBus, QueryHandler
+
+
+class Database:
+    session = "session"
+
+
+class Repository:
+    def __init__(self, database: Database):
+        self.database = database
+
+
+@dataclass(frozen=True)
+class PingQuery(Query):
+    value: int
+
+
+class PingQueryHandler(QueryHandler[PingQuery, int]):
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+    def handle(self, query: PingQuery) -> int:
+        return query.value
+
+
+@dataclass(frozen=True)
+class SessionBoundQuery(Query):
+    pass
+
+
+class SessionBoundQueryHandler(QueryHandler[SessionBoundQuery, str]):
+    def __init__(self, session: str):
+        self.session = session
+
+    def handle(self, query: SessionBoundQuery) -> str:
+        return self.session
+
+
+@dataclass
+class FailingCommand(Command):
+    pass
+
+
+class FailingCommandHandler(CommandHandler[FailingCommand]):
+    def execute(self, command: FailingCommand) -> None:
+        raise ValueError("boom")
+
+
+@dataclass(frozen=True)
+class UnhandledQuery(Query):
+    pass
+
+
+class BoundedContextContainer(containers.DeclarativeContainer):
+    database = providers.Singleton(Database)
+    failing_command_handler = providers.Factory(FailingCommandHandler)
+    session_bound_query_handler = providers.Factory(SessionBoundQueryHandler, session=database.provided.session)
+
+
+class MainContainer(containers.DeclarativeContainer):
+    context = providers.Container(BoundedContextContainer)
+    repository = providers.Factory(Repository, database=context.database)
+    ping_query_handler = providers.Factory(PingQueryHandler, repository=repository)
+
+
+@pytest.fixture
+def registry():
+    return HandlerRegistry.build(MainContainer(), [Command, Query])
+
+
+class TestHandlerRegistry:
+
+    def test_stateless_handler_is_built_once(self, registry):
+        assert registry.resolve(PingQuery) is registry.resolve(PingQuery)
+
+    def test_handler_capturing_a_session_is_built_per_dispatch(self, registry):
+        assert registry.resolve(SessionBoundQuery) is not registry.resolve(SessionBoundQuery)
+
+    def test_handler_of_bounded_context_container_is_found(self, registry):
+        assert isinstance(registry.resolve(FailingCommand), FailingCommandHandler)
+
+    def test_missing_handler_fails_with_provider_name(self, registry):
+        with pytest.raises(MissingHandlerError, match="unhandled_query_handler"):
+            registry.resolve(UnhandledQuery)
+
+    def test_strict_validation_fails_fast(self, registry):
+        with pytest.raises(MissingHandlerError, match="UnhandledQuery"):
+            registry.validate([Query], strict=True)
+
+    def test_validation_reports_handlers_that_cannot_be_built(self):
+        container = MainContainer()
+        container.ping_query_handler.override(providers.Factory(PingQueryHandler, unknown=1))
+        registry = HandlerRegistry.build(container, [Command, Query])
+
+        with pytest.raises(MissingHandlerError, match="ping_query_handler"):
+            registry.validate([PingQuery], strict=True)
+
+
+class TestDispatchHooks:
+
+    def test_hooks_receive_type_time_and_error(self, registry):
+        calls: List[tuple] = []
+        query_bus = QueryBus(container=None, registry=registry)
+        command_bus = CommandBus(container=None, registry=registry)
+        for bus in (query_bus, command_bus):
+            bus.add_hook(lambda message_type, elapsed, error: calls.append((message_type, elapsed, error)))
+
+        assert query_bus.query(PingQuery(value=3)) == 3
+        with pytest.raises(ValueError):
+            command_bus.dispatch(FailingCommand())
+
+        (ping_type, ping_elapsed, ping_error), (failing_type, _, failing_error) = calls
+        assert (ping_type, ping_error) == (PingQuery, None)
+        assert ping_elapsed >= 0
+        assert failing_type is FailingCommand
+        assert isinstance(failing_error, ValueError)
+
+    def test_failing_hook_does_not_fail_dispatch(self, registry):
+        query_bus = QueryBus(container=None, registry=registry)
+        query_bus.add_hook(lambda *args: 1 / 0)
+
+        assert query_bus.query(PingQuery(value=7)) == 7
@@ -0,0 +1,181 @@
+"""
+Unit tests for the public response cache and the ETag/304 handling of public endpoints
+"""
+import gzip
+from unittest.mock import Mock
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from adapters.http.shared.http_caching import cached_json_response, etag_matches, negotiate_encoding
+from src.company_bc.company_page.application.commands.delete_company_page_command import DeleteCompanyPageCommand
+from src.company_bc.company_page.application.commands.delete_company_page_command_handler import \
+    DeleteCompanyPageCommandHandler
+from src.company_bc.company_page.domain.infrastructure.company_page_repository_interface import \
+    CompanyPageRepositoryInterface
+from src.framework.application.public_response_cache import (
+    PUBLIC_COMPANY_PAGES, PUBLIC_POSITIONS, PublicResponseCache, RenderedResponse
+)
+from src.framework.domain.infrastructure.public_rendition_repository_interface import \
+    PublicRenditionRepositoryInterface
+
+
+class Page(BaseModel):
+    title: str
+
+
+def _request(if_none_match: str = "", accept_encoding: str = "") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestPublicResponseCache:
+    """Test cases for PublicResponseCache and cached_json_response"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.now = 0.0
+        self.cache = PublicResponseCache(ttl_seconds=60.0, clock=lambda: self.now)
+        self.build = Mock(return_value=Page(title="Careers"))
+
+    def _get(self, if_none_match: str = ""):
+        return cached_json_response(
+            _request(if_none_match), self.build, namespace=PUBLIC_COMPANY_PAGES, key="acme:home",
+            max_age=60, stale_while_revalidate=300, cache=self.cache
+        )
+
+    def test_hits_are_served_without_rebuilding(self):
+        first = self._get()
+        second = self._get()
+
+        assert first.body == second.body == b'{"title":"Careers"}'
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=60, stale-while-revalidate=300"
+        self.build.assert_called_once()
+
+    def test_matching_if_none_match_answers_304(self):
+        etag = self._get().headers["etag"]
+
+        response = self._get(f'"other", W/{etag}')
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    def _get_for(self, company_id: str):
+        return cached_json_response(
+            _request(), self.build, namespace=PUBLIC_COMPANY_PAGES, key=f"{company_id}:home",
+            max_age=60, stale_while_revalidate=300, cache=self.cache, scope=company_id
+        )
+
+    def test_invalidation_drops_only_the_company(self):
+        self.cache.put(PUBLIC_POSITIONS, "detail:dev", RenderedResponse.from_body(b"{}"), (0, 0))
+        self._get_for("acme")
+        self._get_for("globex")
+        page = Mock()
+        page.company_id.value = "acme"
+        repository = Mock(spec=CompanyPageRepositoryInterface)
+        repository.get_by_id.return_value = page
+
+        DeleteCompanyPageCommandHandler(repository, response_cache=self.cache).execute(
+            DeleteCompanyPageCommand(page_id="6f1c2e9a-4b7d-4c1e-9a3f-2d8b5e7c1a40")
+        )
+        self._get_for("acme")
+        self._get_for("globex")
+
+        assert self.build.call_count == 3
+        assert self.cache.get(PUBLIC_POSITIONS, "detail:dev") is not None
+
+    def test_namespace_invalidation_drops_every_scope(self):
+        self._get_for("acme")
+        self._get_for("globex")
+
+        self.cache.invalidate(PUBLIC_COMPANY_PAGES)
+        self._get_for("acme")
+        self._get_for("globex")
+
+        assert self.build.call_count == 4
+
+    def test_response_built_during_an_invalidation_is_not_cached(self):
+        def build_while_publishing() -> Page:
+            self.cache.invalidate(PUBLIC_COMPANY_PAGES)  # a publish lands mid-render
+            return Page(title="Careers")
+        self.build.side_effect = build_while_publishing
+
+        self._get()
+        self._get()
+
+        assert self.build.call_count == 2
+
+    def test_entries_expire_after_the_ttl(self):
+        self._get()
+        self.now = 61.0
+
+        self._get()
+
+        assert self.build.call_count == 2
+
+    def test_etag_comparison(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches(None, '"b"')
+        assert not etag_matches('"a"', '"b"')
+
+
+class TestPrerenderedResponses:
+    """Test cases for pre-rendered responses served from the rendition store"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.store = Mock(spec=PublicRenditionRepositoryInterface)
+        self.store.get.return_value = (None, 3)
+        self.build = Mock(return_value=Page(title="Careers " * 100))
+
+    def _get(self, cache: PublicResponseCache, accept_encoding: str = "", if_none_match: str = ""):
+        return cached_json_response(
+            _request(if_none_match, accept_encoding), self.build, namespace=PUBLIC_COMPANY_PAGES,
+            key="acme:home", scope="acme", prerendered=True, cache=cache
+        )
+
+    def test_rendition_is_stored_once_and_served_precompressed(self):
+        response = self._get(PublicResponseCache(store=self.store), accept_encoding="gzip, deflate")
+
+        namespace, key, generation, rendered, scope = self.store.save.call_args.args
+        assert (namespace, key, generation, scope) == (PUBLIC_COMPANY_PAGES, "acme:home", 3, "acme")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == f'{rendered.etag[:-1]}-gzip"'
+        assert gzip.decompress(response.body) == rendered.body
+
+        # Another worker serves the stored rendition without rendering it again
+        self.store.get.return_value = (rendered, 3)
+        other = self._get(PublicResponseCache(store=self.store), accept_encoding="br;q=1.0, gzip;q=0.5")
+        again = self._get(
+            PublicResponseCache(store=self.store), accept_encoding="br", if_none_match=other.headers["etag"]
+        )
+
+        assert other.headers["content-encoding"] == "br"
+        assert again.status_code == 304
+        self.build.assert_called_once()
+
+    def test_store_errors_fall_back_to_rendering(self):
+        self.store.get.side_effect = RuntimeError("database unavailable")
+
+        response = self._get(PublicResponseCache(store=self.store))
+
+        assert "content-encoding" not in response.headers
+        assert response.body == self.build.return_value.model_dump_json().encode()
+        self.store.save.assert_not_called()
+
+    def test_invalidation_starts_a_new_store_generation(self):
+        PublicResponseCache(store=self.store).invalidate(PUBLIC_POSITIONS, "list", "dev")
+
+        self.store.invalidate.assert_called_once_with(PUBLIC_POSITIONS, "list", "dev")
+
+    def test_encoding_negotiation(self):
+        assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+        assert negotiate_encoding("br;q=0, *", ("br", "gzip")) == "gzip"
+        assert negotiate_encoding("identity", ("br", "gzip")) is None
+        assert negotiate_encoding(None, ("br", "gzip")) is None
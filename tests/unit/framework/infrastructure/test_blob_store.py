@@ -0,0 +1,156 @@
+"""
+Unit tests for the content-addressed BlobStore
+"""
+import hashlib
+from typing import AsyncIterator, List
+from unittest.mock import Mock
+
+import pytest
+
+from src.framework.domain.entities.stored_blob import StoredBlob
+from src.framework.domain.enums.stored_blob import BlobOwnerType
+from src.framework.domain.infrastructure.stored_blob_repository_interface import StoredBlobRepositoryInterface
+from src.framework.infrastructure.storage.blob_store import BlobStore
+from src.framework.infrastructure.storage.local_storage_service import LocalStorageService
+from src.framework.infrastructure.storage.url_signer import InvalidSignatureError, UrlSigner
+
+CONTENT = b"%PDF-1.4 the same CV sent to many companies"
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+BLOB_PATH = f"blobs/{CONTENT_HASH[:2]}/{CONTENT_HASH[2:4]}/{CONTENT_HASH}"
+
+
+async def _chunks(parts: List[bytes]) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+def _files(root) -> List[str]:
+    return sorted(str(p.relative_to(root)) for p in root.rglob("*") if p.is_file())
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(base_path=str(tmp_path), base_url="http://files")
+
+
+@pytest.fixture
+def repository():
+    repository = Mock(spec=StoredBlobRepositoryInterface)
+    repository.get.return_value = None
+    repository.create_if_absent.return_value = True
+    return repository
+
+
+class TestBlobStoreStore:
+
+    @pytest.mark.asyncio
+    async def test_new_content_is_moved_to_its_blob_path(self, tmp_path, storage, repository):
+        store = BlobStore(storage, repository)
+
+        uploaded = await store.store_stream(_chunks([CONTENT[:10], CONTENT[10:]]), "cv.pdf", "application/pdf")
+
+        assert uploaded.file_path == BLOB_PATH
+        assert uploaded.content_hash == CONTENT_HASH
+        assert _files(tmp_path) == [BLOB_PATH]
+        blob = repository.create_if_absent.call_args.args[0]
+        assert (blob.content_hash, blob.storage_path, blob.size) == (CONTENT_HASH, BLOB_PATH, len(CONTENT))
+
+    @pytest.mark.asyncio
+    async def test_known_content_reuses_existing_blob(self, tmp_path, storage, repository):
+        (tmp_path / BLOB_PATH).parent.mkdir(parents=True)
+        (tmp_path / BLOB_PATH).write_bytes(CONTENT)
+        repository.get.return_value = StoredBlob(CONTENT_HASH, BLOB_PATH, len(CONTENT), "application/pdf", ref_count=3)
+        repository.touch.return_value = True
+        store = BlobStore(storage, repository)
+
+        uploaded = await store.store_stream(_chunks([CONTENT]), "other-name.pdf", "application/pdf")
+
+        assert uploaded.file_path == BLOB_PATH
+        assert _files(tmp_path) == [BLOB_PATH]  # staged copy discarded
+        repository.touch.assert_called_once_with(CONTENT_HASH)
+        repository.create_if_absent.assert_not_called()
+
+    def test_store_bytes_writes_nothing_for_known_content(self, tmp_path, storage, repository):
+        repository.get.return_value = StoredBlob(CONTENT_HASH, BLOB_PATH, len(CONTENT), "application/pdf", ref_count=1)
+        repository.touch.return_value = True
+        store = BlobStore(storage, repository)
+
+        uploaded = store.store_bytes(CONTENT, "cv.pdf", "application/pdf")
+
+        assert uploaded.file_path == BLOB_PATH
+        assert _files(tmp_path) == []
+
+    def test_text_only_blob_gets_its_file_attached(self, tmp_path, storage, repository):
+        repository.get.return_value = StoredBlob(CONTENT_HASH, None, 0, None, text_content="extracted")
+        repository.create_if_absent.return_value = False
+        store = BlobStore(storage, repository)
+
+        store.store_bytes(CONTENT, "cv.pdf", "application/pdf")
+
+        assert _files(tmp_path) == [BLOB_PATH]
+        repository.attach_file.assert_called_once_with(CONTENT_HASH, BLOB_PATH, len(CONTENT), "application/pdf")
+
+
+class TestBlobStoreReferences:
+
+    def test_releasing_last_reference_deletes_file(self, tmp_path, storage, repository):
+        (tmp_path / BLOB_PATH).parent.mkdir(parents=True)
+        (tmp_path / BLOB_PATH).write_bytes(CONTENT)
+        repository.release_reference.return_value = CONTENT_HASH
+        repository.delete_if_unreferenced.return_value = StoredBlob(CONTENT_HASH, BLOB_PATH, len(CONTENT), None)
+        store = BlobStore(storage, repository, grace_seconds=60)
+
+        store.release_reference(BlobOwnerType.FILE_ATTACHMENT, "att-1")
+
+        repository.delete_if_unreferenced.assert_called_once_with(CONTENT_HASH, 60)
+        assert _files(tmp_path) == []
+
+    def test_releasing_shared_blob_keeps_file(self, tmp_path, storage, repository):
+        (tmp_path / BLOB_PATH).parent.mkdir(parents=True)
+        (tmp_path / BLOB_PATH).write_bytes(CONTENT)
+        repository.release_reference.return_value = None
+        store = BlobStore(storage, repository)
+
+        store.release_reference(BlobOwnerType.FILE_ATTACHMENT, "att-1")
+
+        repository.delete_if_unreferenced.assert_not_called()
+        assert _files(tmp_path) == [BLOB_PATH]
+
+
+class TestBlobStoreDirectUpload:
+
+    @pytest.fixture
+    def signed_storage(self, tmp_path):
+        return LocalStorageService(
+            base_path=str(tmp_path), base_url="http://files", signer=UrlSigner("secret"),
+            signed_url_base="http://api/storage/files"
+        )
+
+    @pytest.mark.asyncio
+    async def test_completed_upload_is_promoted_to_its_blob(self, tmp_path, signed_storage, repository):
+        store = BlobStore(signed_storage, repository, signer=UrlSigner("secret", purpose="blob-upload"))
+
+        direct_upload = store.prepare_upload("cv.pdf", "application/pdf", len(CONTENT), CONTENT_HASH)
+        assert direct_upload.upload.method == "PUT"
+        assert direct_upload.upload.url.startswith("http://api/storage/files?token=")
+        await signed_storage.write_stream(direct_upload.upload.file_path, _chunks([CONTENT]), len(CONTENT))
+        uploaded = store.complete_upload(direct_upload.upload_token)
+
+        assert uploaded.file_path == BLOB_PATH
+        assert uploaded.content_hash == CONTENT_HASH
+        assert _files(tmp_path) == [BLOB_PATH]
+
+    def test_complete_without_upload_is_rejected(self, signed_storage, repository):
+        store = BlobStore(signed_storage, repository, signer=UrlSigner("secret"))
+        direct_upload = store.prepare_upload("cv.pdf", "application/pdf", len(CONTENT), CONTENT_HASH)
+
+        with pytest.raises(ValueError, match="not uploaded"):
+            store.complete_upload(direct_upload.upload_token)
+        repository.create_if_absent.assert_not_called()
+
+    def test_tampered_token_is_rejected(self, signed_storage, repository):
+        store = BlobStore(signed_storage, repository, signer=UrlSigner("secret"))
+        direct_upload = store.prepare_upload("cv.pdf", "application/pdf", len(CONTENT), CONTENT_HASH)
+
+        with pytest.raises(InvalidSignatureError):
+            BlobStore(signed_storage, repository, signer=UrlSigner("other")).complete_upload(direct_upload.upload_token)
@@ -0,0 +1,85 @@
+"""
+Unit tests for CompressionMiddleware and the pydantic-core JSON responses
+"""
+import gzip
+import json
+from datetime import datetime
+from typing import List
+
+import brotli
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from adapters.http.shared.responses import FastJSONResponse, model_json_response
+from src.framework.infrastructure.middleware.compression_middleware import CompressionMiddleware
+
+
+class Row(BaseModel):
+    id: str
+    created_at: datetime
+
+
+ROWS = [Row(id=f"row-{i}", created_at=datetime(2026, 1, 1)) for i in range(200)]
+
+app = FastAPI(default_response_class=FastJSONResponse)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/rows", response_model=List[Row])
+def rows() -> List[Row]:
+    return ROWS
+
+
+@app.get("/rows/fast", response_model=List[Row])
+def fast_rows() -> Response:
+    return model_json_response(ROWS, List[Row])
+
+
+@app.get("/small")
+def small() -> dict:
+    return {"ok": True}
+
+
+@app.get("/stream")
+def stream() -> StreamingResponse:
+    return StreamingResponse(iter([b"data: x\n\n" * 200]), media_type="text/event-stream")
+
+
+@app.get("/report")
+def report() -> Response:
+    return Response(content=b"%PDF" * 1000, media_type="application/pdf")
+
+
+client = TestClient(app)
+
+
+def _raw(path: str, accept_encoding: str):
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCompressionMiddleware:
+    """Test cases for CompressionMiddleware"""
+
+    def test_brotli_is_preferred_when_accepted(self):
+        response, raw = _raw("/rows", "gzip, br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert json.loads(brotli.decompress(raw))[0]["id"] == "row-0"
+
+    def test_gzip_is_used_when_brotli_is_not_accepted(self):
+        response, raw = _raw("/rows", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(raw))) == 200
+
+    def test_small_streamed_and_incompressible_responses_are_left_alone(self):
+        for path in ("/small", "/stream", "/report"):
+            response, _ = _raw(path, "br, gzip")
+
+            assert "content-encoding" not in response.headers, path
+
+    def test_single_pass_serialization_matches_the_default_path(self):
+        assert client.get("/rows/fast").json() == client.get("/rows").json()
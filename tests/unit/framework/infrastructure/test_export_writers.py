@@ -0,0 +1,74 @@
+"""
+Unit tests for the streaming CSV / XLSX export writers
+"""
+import csv
+import io
+import zipfile
+from datetime import datetime
+
+from src.framework.infrastructure.services.export import ExportFormat, iter_csv, iter_export, iter_xlsx
+
+
+class TestIterCsv:
+
+    def test_encodes_values_in_several_chunks(self):
+        rows = [(i, None, datetime(2024, 1, 1), ["a", "b"], "x,y") for i in range(100)]
+
+        chunks = list(iter_csv(["n", "empty", "date", "tags", "text"], iter(rows), chunk_size=256))
+
+        assert len(chunks) > 1
+        content = b"".join(chunks).decode("utf-8-sig")
+        parsed = list(csv.reader(io.StringIO(content)))
+        assert parsed[0] == ["n", "empty", "date", "tags", "text"]
+        assert parsed[1] == ["0", "", "2024-01-01T00:00:00", "a, b", "x,y"]
+        assert len(parsed) == 101
+
+    def test_escapes_cells_read_as_formulas(self):
+        rows = [("=HYPERLINK(\"http://evil\")", "+1", "-x", "@SUM(A1)", "\tcmd", "safe", -5)]
+
+        content = b"".join(iter_csv(["a", "b", "c", "d", "e", "f", "n"], iter(rows))).decode("utf-8-sig")
+
+        parsed = list(csv.reader(io.StringIO(content)))
+        assert parsed[1] == ["'=HYPERLINK(\"http://evil\")", "'+1", "'-x", "'@SUM(A1)", "'\tcmd", "safe", "-5"]
+
+
+class TestIterXlsx:
+
+    def test_writes_a_valid_package_and_rolls_over_sheets(self):
+        rows = [(i, "<tag> & \x01control") for i in range(5)]
+
+        data = b"".join(iter_xlsx(["n", "text"], iter(rows), sheet_title="Candidates", max_rows_per_sheet=2))
+
+        package = zipfile.ZipFile(io.BytesIO(data))
+        assert package.testzip() is None
+        names = package.namelist()
+        assert {"[Content_Types].xml", "_rels/.rels", "xl/workbook.xml", "xl/_rels/workbook.xml.rels"} <= set(names)
+        assert [n for n in names if n.startswith("xl/worksheets/")] == [
+            "xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml", "xl/worksheets/sheet3.xml"
+        ]
+        workbook = package.read("xl/workbook.xml").decode()
+        assert 'name="Candidates"' in workbook and 'name="Candidates 3"' in workbook
+
+        sheet = package.read("xl/worksheets/sheet1.xml").decode()
+        assert sheet.count("<row>") == 3  # header + 2 rows
+        assert "&lt;tag&gt; &amp; control" in sheet
+
+    def test_formulas_are_written_as_plain_strings(self):
+        data = b"".join(iter_xlsx(["text"], iter([("=1+1",)])))
+
+        sheet = zipfile.ZipFile(io.BytesIO(data)).read("xl/worksheets/sheet1.xml").decode()
+        assert '<c t="inlineStr"><is><t xml:space="preserve">=1+1</t></is></c>' in sheet
+        assert "<f>" not in sheet
+
+    def test_no_empty_sheet_when_rows_end_at_the_limit(self):
+        data = b"".join(iter_xlsx(["n"], iter([(1,), (2,)]), max_rows_per_sheet=2))
+
+        package = zipfile.ZipFile(io.BytesIO(data))
+        assert [n for n in package.namelist() if n.startswith("xl/worksheets/")] == ["xl/worksheets/sheet1.xml"]
+
+
+class TestIterExport:
+
+    def test_dispatches_on_format(self):
+        assert b"".join(iter_export(ExportFormat.CSV, ["n"], iter([(1,)]))).startswith(b"\xef\xbb\xbfn")
+        assert b"".join(iter_export(ExportFormat.XLSX, ["n"], iter([(1,)]))).startswith(b"PK")
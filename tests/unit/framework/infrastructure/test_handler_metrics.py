@@ -0,0 +1,96 @@
+"""
+Unit tests for the CQRS handler metrics
+"""
+from dataclasses import dataclass
+
+import pytest
+from dependency_injector import containers, providers
+
+from src.framework.application.command_bus import Command, CommandBus, CommandHandler
+from src.framework.application.handler_registry import HandlerRegistry
+from src.framework.application.query_bus import Query, QueryBus, QueryHandler
+from src.framework.infrastructure.metrics.handler_metrics import HandlerMetrics
+
+
+@dataclass(frozen=True)
+class CountItemsQuery(Query):
+    pass
+
+
+class CountItemsQueryHandler(QueryHandler[CountItemsQuery, int]):
+    def handle(self, query: CountItemsQuery) -> int:
+        return 3
+
+
+@dataclass
+class SeedItemsCommand(Command):
+    fail: bool = False
+
+
+class SeedItemsCommandHandler(CommandHandler[SeedItemsCommand]):
+    def __init__(self, query_bus: QueryBus):
+        self.query_bus = query_bus
+
+    def execute(self, command: SeedItemsCommand) -> None:
+        self.query_bus.query(CountItemsQuery())
+        if command.fail:
+            raise KeyError("missing item")
+
+
+class MetricsContainer(containers.DeclarativeContainer):
+    query_bus = providers.Object(None)
+    count_items_query_handler = providers.Factory(CountItemsQueryHandler)
+    seed_items_command_handler = providers.Factory(SeedItemsCommandHandler, query_bus=query_bus)
+
+
+def _buses(metrics: HandlerMetrics):
+    container = MetricsContainer()
+    registry = HandlerRegistry(container)
+    query_bus = QueryBus(container, registry=registry)
+    command_bus = CommandBus(container, registry=registry)
+    container.query_bus.override(providers.Object(query_bus))
+    query_bus.add_hook(metrics.hook("query"))
+    command_bus.add_hook(metrics.hook("command"))
+    return command_bus, query_bus
+
+
+class TestHandlerMetrics:
+
+    def test_latency_errors_and_nested_dispatches_are_recorded(self):
+        metrics = HandlerMetrics()
+        command_bus, _ = _buses(metrics)
+
+        command_bus.dispatch(SeedItemsCommand())
+        with pytest.raises(KeyError):
+            command_bus.dispatch(SeedItemsCommand(fail=True))
+
+        snapshot = metrics.snapshot()
+        assert snapshot.histograms[("command", "SeedItemsCommand")].count == 2
+        assert snapshot.histograms[("query", "CountItemsQuery")].count == 2
+        assert snapshot.errors == {("command", "SeedItemsCommand", "KeyError"): 1}
+        assert snapshot.nested == {("SeedItemsCommand", "CountItemsQuery"): 2}
+
+    def test_sampling_skips_latency_but_counts_errors(self):
+        metrics = HandlerMetrics(sample_rate=0.0)
+        command_bus, query_bus = _buses(metrics)
+
+        query_bus.query(CountItemsQuery())
+        with pytest.raises(KeyError):
+            command_bus.dispatch(SeedItemsCommand(fail=True))
+
+        snapshot = metrics.snapshot()
+        assert snapshot.histograms == {}
+        assert snapshot.errors == {("command", "SeedItemsCommand", "KeyError"): 1}
+
+    def test_prometheus_histogram_is_cumulative(self):
+        metrics = HandlerMetrics(buckets=(0.01, 0.1))
+        for elapsed in (0.005, 0.05, 0.5):
+            metrics.record("query", CountItemsQuery, elapsed, None)
+
+        text = metrics.render_prometheus()
+
+        labels = 'kind="query",handler="CountItemsQuery"'
+        assert f'cqrs_handler_duration_seconds_bucket{{{labels},le="0.01"}} 1' in text
+        assert f'cqrs_handler_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+        assert f'cqrs_handler_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"cqrs_handler_duration_seconds_count{{{labels}}} 3" in text
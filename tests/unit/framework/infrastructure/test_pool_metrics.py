@@ -0,0 +1,77 @@
+"""
+Unit tests for the per-role engine configuration and the connection pool metrics
+"""
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from core.config import Settings
+from core.database import dramatiq_threads, engine_options, resolve_process_role
+from src.framework.infrastructure.metrics.pool_metrics import (
+    InstrumentedNullPool, InstrumentedQueuePool, PoolMetrics, pool_metrics
+)
+
+
+class TestEngineOptions:
+
+    def test_role_is_detected_from_the_dramatiq_cli(self):
+        assert resolve_process_role("", ["/usr/local/bin/dramatiq", "tasks"]) == "worker"
+        assert resolve_process_role("", ["/usr/local/bin/uvicorn", "main:app"]) == "api"
+        assert resolve_process_role("script", ["/usr/local/bin/dramatiq"]) == "script"
+        assert resolve_process_role("", []) == "api"
+        with pytest.raises(ValueError):
+            resolve_process_role("cron")
+
+    def test_role_is_detected_from_python_m_dramatiq(self):
+        argv = ["/app/.venv/lib/python3.13/site-packages/dramatiq/__main__.py", "tasks"]
+
+        assert resolve_process_role("", argv) == "worker"
+        assert resolve_process_role("", ["/app/.venv/lib/python3.13/site-packages/uvicorn/__main__.py"]) == "api"
+
+    def test_worker_threads_are_read_from_the_dramatiq_cli(self):
+        assert dramatiq_threads(["dramatiq", "tasks"]) == 8
+        assert dramatiq_threads(["dramatiq", "tasks", "--threads", "4"]) == 4
+        assert dramatiq_threads(["dramatiq", "tasks", "--threads=16"]) == 16
+        assert dramatiq_threads(["dramatiq", "-t", "2", "tasks"]) == 2
+        assert dramatiq_threads(["dramatiq", "-t3", "tasks"]) == 3
+
+    def test_worker_pool_has_one_connection_per_thread_by_default(self):
+        options = engine_options(Settings(), "worker", worker_threads=12)
+
+        assert options["pool_size"] == 12
+
+    def test_pool_is_sized_per_role_without_pre_ping(self):
+        config = Settings(DB_POOL_SIZE_WORKER=3, DB_MAX_OVERFLOW_WORKER=1)
+
+        options = engine_options(config, "worker")
+
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert (options["pool_size"], options["max_overflow"]) == (3, 1)
+        assert options["pool_pre_ping"] is False
+
+    def test_pgbouncer_transaction_mode_keeps_no_client_pool(self):
+        options = engine_options(Settings(DB_PGBOUNCER_TRANSACTION_MODE=True), "api")
+
+        assert options["poolclass"] is InstrumentedNullPool
+        assert "pool_size" not in options
+
+
+class TestPoolMetrics:
+
+    def test_checkouts_timeouts_and_gauges_are_reported(self):
+        engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool,
+                               pool_size=1, max_overflow=0, pool_timeout=0.01)
+        metrics = PoolMetrics()
+        metrics.instrument(engine, role="worker", max_connections=1)
+        pool_metrics.reset()
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            text_format = metrics.render_prometheus()
+
+        histogram, timeouts = pool_metrics.snapshot()
+        assert histogram.count == 2
+        assert timeouts == 1
+        assert 'db_pool_checked_out{role="worker"} 1' in text_format
+        assert 'db_pool_max_connections{role="worker"} 1' in text_format
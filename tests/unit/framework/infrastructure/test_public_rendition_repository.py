@@ -0,0 +1,41 @@
+"""
+Unit tests for PublicRenditionRepository (statements compiled for PostgreSQL)
+"""
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.framework.infrastructure.repositories.public_rendition_repository import PublicRenditionRepository
+
+
+class TestPublicRenditionRepository:
+    """Test cases for the scoped invalidation of the rendition store"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.session = MagicMock()
+        database = MagicMock()
+        database.get_session.return_value.__enter__.return_value = self.session
+        self.repository = PublicRenditionRepository(database)
+
+    def _statements(self):
+        return [
+            str(call.args[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            for call in self.session.execute.call_args_list
+        ]
+
+    def test_invalidating_a_scope_only_drops_its_renditions(self):
+        self.repository.invalidate("public_company_pages", "acme")
+
+        generations, renditions = self._statements()
+        assert "'acme'" in generations
+        assert "ON CONFLICT (namespace, scope)" in generations
+        assert "public_renditions.scope IN ('acme')" in renditions
+        self.session.commit.assert_called_once()
+
+    def test_invalidating_the_namespace_drops_every_scope(self):
+        self.repository.invalidate("public_company_pages")
+
+        generations, renditions = self._statements()
+        assert "'public_company_pages', ''" in generations
+        assert "scope" not in renditions
@@ -0,0 +1,51 @@
+"""
+Unit tests for PublicStaticFiles (the /uploads mount of local storage)
+"""
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from adapters.http.shared.storage.public_static_files import PublicStaticFiles
+
+
+def _client(tmp_path) -> TestClient:
+    app = Starlette(routes=[Mount("/uploads", PublicStaticFiles(directory=str(tmp_path)))])
+    return TestClient(app)
+
+
+def _write(tmp_path, relative_path: str) -> None:
+    path = tmp_path / relative_path
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"content")
+
+
+class TestPublicStaticFiles:
+
+    def test_serves_company_logos(self, tmp_path):
+        _write(tmp_path, "company/comp-1/logo/logo.png")
+
+        response = _client(tmp_path).get("/uploads/company/comp-1/logo/logo.png")
+
+        assert response.status_code == 200
+        assert response.content == b"content"
+
+    def test_hides_private_files(self, tmp_path):
+        private_paths = [
+            "company/comp-1/candidates/cand-1/resume/cv.pdf",
+            "company/comp-1/exports/job-1/export.csv",
+            "blobs/ab/cd/abcd",
+        ]
+        for relative_path in private_paths:
+            _write(tmp_path, relative_path)
+
+        client = _client(tmp_path)
+
+        for relative_path in private_paths:
+            assert client.get(f"/uploads/{relative_path}").status_code == 404
+
+    def test_dot_segments_cannot_escape_the_logo_prefix(self, tmp_path):
+        _write(tmp_path, "company/comp-1/documents/contract.pdf")
+
+        response = _client(tmp_path).get("/uploads/company/comp-1/logo/..%2Fdocuments/contract.pdf")
+
+        assert response.status_code == 404
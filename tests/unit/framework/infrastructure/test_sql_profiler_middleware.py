@@ -0,0 +1,67 @@
+"""
+Unit tests for the SQL profiler - statement counting and N+1 detection
+"""
+from sqlalchemy import create_engine, text
+
+from src.framework.infrastructure.middleware.sql_profiler_middleware import (
+    QueryPerformanceRegistry,
+    install_sql_profiler,
+    normalize_statement,
+    profile_queries
+)
+
+
+class TestNormalizeStatement:
+
+    def test_literals_and_in_lists_share_the_same_shape(self):
+        first = normalize_statement("SELECT * FROM t WHERE id = 1 AND name = 'a' AND x IN (1, 2, 3)")
+        second = normalize_statement("SELECT *   FROM t\nWHERE id = 42 AND name = 'b' AND x IN (7)")
+
+        assert first == second
+
+
+class TestProfileQueries:
+
+    def test_counts_statements_only_inside_the_block(self):
+        engine = create_engine("sqlite:///:memory:")
+        install_sql_profiler(engine)
+        install_sql_profiler(engine)  # idempotent
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with profile_queries() as stats:
+                for i in range(3):
+                    conn.execute(text(f"SELECT {i}"))
+
+        assert stats.query_count == 3
+        assert stats.statement_counts == {"SELECT ?": 3}
+        assert stats.repeated_statements(threshold=3) == {"SELECT ?": 3}
+        assert stats.repeated_statements(threshold=4) == {}
+
+
+class TestQueryPerformanceRegistry:
+
+    def test_aggregates_per_route_and_flags_n_plus_one(self):
+        engine = create_engine("sqlite:///:memory:")
+        install_sql_profiler(engine)
+        registry = QueryPerformanceRegistry(n_plus_one_threshold=2)
+
+        with engine.connect() as conn:
+            with profile_queries() as stats:
+                conn.execute(text("SELECT 1"))
+            assert registry.record("GET /positions", stats) == {}
+
+            with profile_queries() as stats:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            assert registry.record("GET /positions", stats) == {"SELECT ?": 2}
+
+        [route] = registry.snapshot()
+        assert route["route"] == "GET /positions"
+        assert route["requests"] == 2
+        assert route["max_queries"] == 2
+        assert route["avg_queries"] == 1.5
+        assert route["n_plus_one_requests"] == 1
+
+        registry.reset()
+        assert registry.snapshot() == []
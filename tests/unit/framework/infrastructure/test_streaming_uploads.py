@@ -0,0 +1,115 @@
+"""
+Unit tests for streaming uploads (StorageServiceInterface.upload_stream)
+"""
+import hashlib
+from typing import AsyncIterator, List
+
+import pytest
+
+from src.framework.domain.infrastructure.storage_service_interface import (
+    FileTooLargeError,
+    StorageConfig,
+    StorageType,
+)
+from src.framework.infrastructure.storage.local_storage_service import LocalStorageService
+
+
+async def _chunks(parts: List[bytes]) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+class TestLocalStreamingUpload:
+
+    @pytest.mark.asyncio
+    async def test_writes_file_and_hashes_content(self, tmp_path):
+        storage = LocalStorageService(base_path=str(tmp_path), base_url="http://files")
+        parts = [b"a" * 1000, b"b" * 1000, b"c"]
+
+        uploaded = await storage.upload_stream(
+            _chunks(parts), "cv.pdf", "application/pdf", StorageType.CANDIDATE_RESUME, "cand-1", "comp-1"
+        )
+
+        content = b"".join(parts)
+        assert uploaded.file_size == len(content)
+        assert uploaded.content_hash == hashlib.sha256(content).hexdigest()
+        assert (tmp_path / uploaded.file_path).read_bytes() == content
+        assert list(tmp_path.rglob("*.part")) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload_and_removes_partial_file(self, tmp_path):
+        storage = LocalStorageService(base_path=str(tmp_path), base_url="http://files")
+
+        with pytest.raises(FileTooLargeError):
+            await storage.upload_stream(
+                _chunks([b"x" * 600, b"x" * 600]), "cv.pdf", "application/pdf",
+                StorageType.CANDIDATE_RESUME, "cand-1", "comp-1", max_size_bytes=1000
+            )
+
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_disallowed_extension_before_reading(self, tmp_path):
+        storage = LocalStorageService(base_path=str(tmp_path), base_url="http://files")
+
+        with pytest.raises(ValueError):
+            await storage.upload_stream(
+                _chunks([b"x"]), "script.exe", "application/octet-stream",
+                StorageType.CANDIDATE_RESUME, "cand-1", "comp-1"
+            )
+
+
+class TestS3StreamingUpload:
+    """Runs against moto's in-process S3 stand-in"""
+
+    @pytest.fixture
+    def s3_storage(self, monkeypatch):
+        moto = pytest.importorskip("moto")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        with moto.mock_aws():
+            import boto3
+            from src.framework.infrastructure.storage.s3_storage_service import S3StorageService
+
+            boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="uploads")
+            yield S3StorageService(
+                bucket_name="uploads",
+                config=StorageConfig(max_file_size_mb=20, allowed_extensions=[".pdf"])
+            )
+
+    @pytest.mark.asyncio
+    async def test_small_file_uses_single_put(self, s3_storage):
+        uploaded = await s3_storage.upload_stream(
+            _chunks([b"%PDF-", b"1.4"]), "cv.pdf", "application/pdf", StorageType.CANDIDATE_RESUME, "c", "co"
+        )
+
+        obj = s3_storage.s3_client.get_object(Bucket="uploads", Key=uploaded.file_path)
+        assert obj["Body"].read() == b"%PDF-1.4"
+        assert obj["Metadata"]["sha256"] == uploaded.content_hash
+
+    @pytest.mark.asyncio
+    async def test_large_file_uses_multipart_upload(self, s3_storage):
+        chunk = b"z" * (1024 * 1024)
+        parts = [chunk] * 12
+
+        uploaded = await s3_storage.upload_stream(
+            _chunks(parts), "cv.pdf", "application/pdf", StorageType.CANDIDATE_RESUME, "c", "co"
+        )
+
+        obj = s3_storage.s3_client.get_object(Bucket="uploads", Key=uploaded.file_path)
+        assert obj["ContentLength"] == 12 * len(chunk)
+        assert obj["ETag"].strip('"').endswith("-2")  # two parts
+        assert uploaded.content_hash == hashlib.sha256(b"".join(parts)).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_oversized_multipart_upload_is_aborted(self, s3_storage):
+        parts = [b"z" * (1024 * 1024)] * 10
+
+        with pytest.raises(FileTooLargeError):
+            await s3_storage.upload_stream(
+                _chunks(parts), "cv.pdf", "application/pdf", StorageType.CANDIDATE_RESUME, "c", "co",
+                max_size_bytes=9 * 1024 * 1024
+            )
+
+        assert s3_storage.s3_client.list_multipart_uploads(Bucket="uploads").get("Uploads", []) == []
+        assert s3_storage.s3_client.list_objects_v2(Bucket="uploads").get("KeyCount") == 0
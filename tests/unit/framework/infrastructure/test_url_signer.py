@@ -0,0 +1,37 @@
+"""
+Unit tests for UrlSigner
+"""
+import pytest
+
+from src.framework.infrastructure.storage.url_signer import InvalidSignatureError, UrlSigner
+
+
+class TestUrlSigner:
+
+    def test_verify_returns_signed_payload(self):
+        signer = UrlSigner("secret")
+
+        payload = signer.verify(signer.sign({"op": "get", "path": "blobs/ab/cd/abcd"}, expires_in=60))
+
+        assert payload["op"] == "get"
+        assert payload["path"] == "blobs/ab/cd/abcd"
+
+    def test_modified_payload_is_rejected(self):
+        signer = UrlSigner("secret")
+        token = signer.sign({"path": "a"}, expires_in=60)
+        forged = UrlSigner("secret").sign({"path": "b"}, expires_in=60)
+
+        with pytest.raises(InvalidSignatureError):
+            signer.verify(forged.split(".")[0] + "." + token.split(".")[1])
+
+    def test_tokens_are_bound_to_their_purpose(self):
+        token = UrlSigner("secret", purpose="storage").sign({"path": "a"}, expires_in=60)
+
+        with pytest.raises(InvalidSignatureError):
+            UrlSigner("secret", purpose="blob-upload").verify(token)
+
+    def test_expired_token_is_rejected(self):
+        signer = UrlSigner("secret")
+
+        with pytest.raises(InvalidSignatureError, match="expired"):
+            signer.verify(signer.sign({"path": "a"}, expires_in=-1))
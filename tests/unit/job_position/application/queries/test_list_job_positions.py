@@ -0,0 +1,71 @@
+"""
+Unit tests for the job position listing queries
+"""
+from unittest.mock import Mock
+
+from src.company_bc.company.domain.value_objects import CompanyId
+from src.company_bc.job_position.application.queries.count_job_positions import (
+    CountJobPositionsQuery, CountJobPositionsQueryHandler
+)
+from src.company_bc.job_position.application.queries.list_job_positions import (
+    ListJobPositionsQuery, ListJobPositionsQueryHandler
+)
+from src.company_bc.job_position.domain.entities.job_position import JobPosition
+from src.company_bc.job_position.domain.enums import JobPositionStatusEnum
+from src.company_bc.job_position.domain.infrastructure.job_position_comment_repository_interface import (
+    JobPositionCommentRepositoryInterface
+)
+from src.company_bc.job_position.domain.repositories.job_position_repository_interface import \
+    JobPositionRepositoryInterface
+from src.company_bc.job_position.domain.value_objects import JobPositionId
+
+
+def _position(title: str) -> JobPosition:
+    return JobPosition.create(id=JobPositionId.generate(), title=title, company_id=CompanyId.generate())
+
+
+class TestListJobPositionsQueryHandler:
+
+    def setup_method(self):
+        self.positions = [_position("Backend Engineer"), _position("Designer")]
+        self.job_position_repository = Mock(spec=JobPositionRepositoryInterface)
+        self.job_position_repository.find_by_filters.return_value = self.positions
+        self.comment_repository = Mock(spec=JobPositionCommentRepositoryInterface)
+        self.handler = ListJobPositionsQueryHandler(self.job_position_repository, self.comment_repository)
+
+    def test_pending_comments_are_counted_once_for_the_whole_page(self):
+        self.comment_repository.count_pending_by_job_positions.return_value = {self.positions[0].id.value: 3}
+
+        dtos = self.handler.handle(ListJobPositionsQuery(current_user_id="user-1"))
+
+        assert [dto.pending_comments_count for dto in dtos] == [3, 0]
+        self.comment_repository.count_pending_by_job_positions.assert_called_once_with(
+            job_position_ids=[position.id for position in self.positions],
+            current_user_id="user-1"
+        )
+        self.comment_repository.list_by_job_position.assert_not_called()
+
+    def test_pending_comments_are_not_counted_without_a_user(self):
+        self.handler.handle(ListJobPositionsQuery())
+
+        self.comment_repository.count_pending_by_job_positions.assert_not_called()
+
+
+class TestCountJobPositionsQueryHandler:
+
+    def test_counts_with_the_status_filter_of_the_list(self):
+        repository = Mock(spec=JobPositionRepositoryInterface)
+        repository.count_by_filters.return_value = 4
+
+        total = CountJobPositionsQueryHandler(repository).handle(
+            CountJobPositionsQuery(company_id="company-1", status=JobPositionStatusEnum.PUBLISHED)
+        )
+
+        assert total == 4
+        repository.count_by_filters.assert_called_once_with(
+            company_id="company-1",
+            job_category=None,
+            search_term=None,
+            visibility=None,
+            status=JobPositionStatusEnum.PUBLISHED
+        )
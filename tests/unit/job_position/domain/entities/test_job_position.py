@@ -20,8 +20,11 @@ from src.company_bc.job_position.domain.exceptions import (
     JobPositionBudgetExceededError
 )
 from src.company_bc.job_position.domain.value_objects import JobPositionId
+from src.company_bc.job_position.domain.value_objects.job_position_workflow_id import JobPositionWorkflowId
+from src.company_bc.job_position.domain.value_objects.stage_id import StageId
 from src.company_bc.job_position.domain.value_objects.custom_field_definition import CustomFieldDefinition
 from src.framework.domain.enums.job_category import JobCategoryEnum
+from src.shared_bc.customization.workflow.domain.enums.workflow_stage_type_enum import WorkflowStageTypeEnum
 
 
 class JobPositionMother:
@@ -295,6 +298,88 @@ class TestStatusTransitionsInvalidPaths:
             position.publish()
 
 
+# ==================== STATUS FOLLOWS STAGE ====================
+
+class TestStatusFollowsStage:
+    """Status is derived from the stage type on every stage move"""
+
+    def _position_in_workflow(self, position: Optional[JobPosition] = None) -> JobPosition:
+        position = position or JobPositionMother.create_draft_position()
+        position.job_position_workflow_id = JobPositionWorkflowId.generate()
+        return position
+
+    def test_success_stage_publishes(self):
+        position = self._position_in_workflow()
+        position.move_to_stage(StageId.generate(), stage_type=WorkflowStageTypeEnum.SUCCESS)
+        assert position.status == JobPositionStatusEnum.PUBLISHED
+
+    def test_progress_stage_keeps_review_status(self):
+        position = self._position_in_workflow()
+        position.move_to_stage(StageId.generate(), stage_type=WorkflowStageTypeEnum.PROGRESS)
+        assert position.status == JobPositionStatusEnum.PENDING_APPROVAL
+
+        position.status = JobPositionStatusEnum.APPROVED
+        position.move_to_stage(StageId.generate(), stage_type=WorkflowStageTypeEnum.PROGRESS)
+        assert position.status == JobPositionStatusEnum.APPROVED
+
+    def test_move_without_stage_type_keeps_status(self):
+        position = self._position_in_workflow()
+        position.move_to_stage(StageId.generate())
+        assert position.status == JobPositionStatusEnum.DRAFT
+
+    def test_published_position_moved_to_progress_stage_stays_published(self):
+        position = self._position_in_workflow(JobPositionMother.create_published_position())
+        position.move_to_stage(StageId.generate(), stage_type=WorkflowStageTypeEnum.PROGRESS)
+        assert position.status == JobPositionStatusEnum.PUBLISHED
+
+    def test_live_and_archived_positions_are_never_downgraded(self):
+        cases = [
+            (JobPositionMother.create_published_position(), WorkflowStageTypeEnum.INITIAL),
+            (JobPositionMother.create_on_hold_position(), WorkflowStageTypeEnum.PROGRESS),
+            (JobPositionMother.create_published_position(), WorkflowStageTypeEnum.FAIL),
+        ]
+        for position, stage_type in cases:
+            status = position.status
+            self._position_in_workflow(position).move_to_stage(StageId.generate(), stage_type=stage_type)
+            assert position.status == status
+
+        archived = JobPositionMother.create_closed_position()
+        archived.archive()
+        for stage_type in (WorkflowStageTypeEnum.ARCHIVED, WorkflowStageTypeEnum.FAIL):
+            self._position_in_workflow(archived).move_to_stage(StageId.generate(), stage_type=stage_type)
+            assert archived.status == JobPositionStatusEnum.ARCHIVED
+
+    def test_invalid_transition_keeps_status(self):
+        position = self._position_in_workflow(JobPositionMother.create_pending_approval_position())
+        position.move_to_stage(StageId.generate(), stage_type=WorkflowStageTypeEnum.SUCCESS)
+        assert position.status == JobPositionStatusEnum.PENDING_APPROVAL
+
+    def test_update_details_with_stage_follows_the_same_rule(self):
+        position = JobPositionMother.create_published_position()
+        position.update_details(
+            title=position.title,
+            description=position.description,
+            job_category=position.job_category,
+            open_at=None,
+            application_deadline=None,
+            stage_id=StageId.generate(),
+            stage_type=WorkflowStageTypeEnum.PROGRESS,
+        )
+        assert position.status == JobPositionStatusEnum.PUBLISHED
+
+        draft = JobPositionMother.create_draft_position()
+        draft.update_details(
+            title=draft.title,
+            description=draft.description,
+            job_category=draft.job_category,
+            open_at=None,
+            application_deadline=None,
+            stage_id=StageId.generate(),
+            stage_type=WorkflowStageTypeEnum.PROGRESS,
+        )
+        assert draft.status == JobPositionStatusEnum.PENDING_APPROVAL
+
+
 # ==================== 8.1.3 FIELD LOCKING PER STATUS ====================
 
 class TestFieldLockingPerStatus:
@@ -0,0 +1,87 @@
+"""
+Unit tests for the unread counter bookkeeping of InAppNotificationRepository
+
+The counter upsert is PostgreSQL-only, so it is patched and the tests check
+which writes adjust it.
+"""
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.notification_bc.in_app_notification.domain.entities.in_app_notification import (
+    InAppNotification,
+    InAppNotificationId
+)
+from src.notification_bc.in_app_notification.domain.enums.notification_enums import InAppNotificationType
+from src.notification_bc.in_app_notification.infrastructure.models.in_app_notification_model import (
+    InAppNotificationModel
+)
+from src.notification_bc.in_app_notification.infrastructure.repositories.in_app_notification_repository import (
+    InAppNotificationRepository
+)
+# The ORM configures every mapper at once: register the whole model graph
+import models  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_answer_model import InterviewAnswerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_interviewer_model import \
+    InterviewInterviewerModel  # noqa: F401
+from src.interview_bc.interview.Infrastructure.models.interview_model import InterviewModel  # noqa: F401
+
+
+def _notification(title: str = "Title") -> InAppNotification:
+    return InAppNotification.create(
+        id=InAppNotificationId.generate(),
+        user_id="user-1",
+        company_id="company-1",
+        notification_type=InAppNotificationType.NEW_APPLICATION,
+        title=title,
+        message="Message"
+    )
+
+
+class TestUnreadCounter:
+
+    @pytest.fixture
+    def adjust_unread_count(self):
+        with patch.object(InAppNotificationRepository, "_adjust_unread_count") as adjust_unread_count:
+            yield adjust_unread_count
+
+    @pytest.fixture
+    def repository(self, adjust_unread_count):
+        engine = create_engine("sqlite:///:memory:")
+        InAppNotificationModel.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        yield InAppNotificationRepository(session)
+        session.close()
+
+    @pytest.fixture
+    def notification(self, repository, adjust_unread_count) -> InAppNotification:
+        notification = _notification()
+        repository.save(notification)
+        adjust_unread_count.reset_mock()
+        return notification
+
+    def test_marking_as_read_twice_decrements_once(self, repository, notification, adjust_unread_count):
+        repository.mark_as_read(notification.id)
+        repository.mark_as_read(notification.id)
+
+        adjust_unread_count.assert_called_once_with("user-1", "company-1", -1)
+        assert repository.get_by_id(notification.id).is_read is True
+
+    def test_deleting_twice_decrements_once(self, repository, notification, adjust_unread_count):
+        repository.delete(notification.id)
+        repository.delete(notification.id)
+
+        adjust_unread_count.assert_called_once_with("user-1", "company-1", -1)
+        assert repository.get_by_id(notification.id) is None
+
+    def test_saving_an_unchanged_read_flag_does_not_adjust(self, repository, notification, adjust_unread_count):
+        repository.save(notification)
+
+        adjust_unread_count.assert_not_called()
+
+    def test_saving_a_new_unread_notification_increments(self, repository, adjust_unread_count):
+        repository.save(_notification())
+
+        adjust_unread_count.assert_called_once_with("user-1", "company-1", 1)
@@ -0,0 +1,88 @@
+"""
+Unit tests for the push of in-app notification changes from the command handlers
+"""
+import json
+from unittest.mock import Mock
+
+from src.notification_bc.in_app_notification.application.commands.create_notification_command import (
+    CreateNotificationCommand, CreateNotificationCommandHandler
+)
+from src.notification_bc.in_app_notification.application.commands.mark_all_notifications_as_read_command import (
+    MarkAllNotificationsAsReadCommand, MarkAllNotificationsAsReadCommandHandler
+)
+from src.notification_bc.in_app_notification.application.commands.mark_notification_as_read_command import (
+    MarkNotificationAsReadCommand, MarkNotificationAsReadCommandHandler
+)
+from src.notification_bc.in_app_notification.domain.entities.in_app_notification import (
+    InAppNotification, InAppNotificationId
+)
+from src.notification_bc.in_app_notification.domain.enums.notification_enums import InAppNotificationType
+from src.notification_bc.in_app_notification.domain.interfaces import (
+    InAppNotificationPublisherInterface, InAppNotificationRepositoryInterface
+)
+from src.notification_bc.in_app_notification.infrastructure.push.redis_in_app_notification_push import (
+    RedisInAppNotificationPublisher, channel_for
+)
+
+USER_ID = "01HQ7K8NZFT7QK3SR3VEF05S01"
+COMPANY_ID = "01HQ7K8NZFT7QK3SR3VEF05S02"
+NOTIFICATION_ID = InAppNotificationId("01HQ7K8NZFT7QK3SR3VEF05S03")
+
+
+def _notification() -> InAppNotification:
+    return InAppNotification.create(
+        id=NOTIFICATION_ID, user_id=USER_ID, company_id=COMPANY_ID,
+        notification_type=InAppNotificationType.NEW_APPLICATION, title="New application", message="Ada applied"
+    )
+
+
+class TestNotificationPush:
+    """Test cases for the notification push"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.repository = Mock(spec=InAppNotificationRepositoryInterface)
+        self.repository.get_unread_count.return_value = 3
+        self.publisher = Mock(spec=InAppNotificationPublisherInterface)
+
+    def test_created_notification_is_pushed_with_the_unread_count(self):
+        CreateNotificationCommandHandler(self.repository, self.publisher).execute(CreateNotificationCommand(
+            id=NOTIFICATION_ID, user_id=USER_ID, company_id=COMPANY_ID,
+            notification_type=InAppNotificationType.NEW_APPLICATION, title="New application", message="Ada applied"
+        ))
+
+        self.repository.save.assert_called_once()
+        notification = self.publisher.notification_created.call_args.args[0]
+        assert notification.id == NOTIFICATION_ID
+        assert self.publisher.notification_created.call_args.kwargs["unread_count"] == 3
+
+    def test_reading_pushes_the_new_unread_count_once(self):
+        notification = _notification()
+        self.repository.get_by_id.return_value = notification
+        handler = MarkNotificationAsReadCommandHandler(self.repository, self.publisher)
+        command = MarkNotificationAsReadCommand(notification_id=NOTIFICATION_ID, user_id=USER_ID, company_id=COMPANY_ID)
+
+        handler.execute(command)
+        handler.execute(command)
+
+        self.repository.save.assert_called_once()
+        self.publisher.unread_count_changed.assert_called_once_with(USER_ID, COMPANY_ID, 3)
+
+    def test_read_all_pushes_zero_without_counting(self):
+        MarkAllNotificationsAsReadCommandHandler(self.repository, self.publisher).execute(
+            MarkAllNotificationsAsReadCommand(user_id=USER_ID, company_id=COMPANY_ID)
+        )
+
+        self.publisher.unread_count_changed.assert_called_once_with(USER_ID, COMPANY_ID, 0)
+        self.repository.get_unread_count.assert_not_called()
+
+    def test_redis_publisher_sends_the_client_payload_on_the_user_channel(self):
+        publisher = RedisInAppNotificationPublisher("redis://localhost:6379/0")
+        publisher._client = Mock()
+
+        publisher.notification_created(_notification(), unread_count=1)
+
+        channel, payload = publisher._client.publish.call_args.args
+        assert channel == channel_for(USER_ID, COMPANY_ID)
+        assert json.loads(payload)["notification"]["title"] == "New application"
+        assert json.loads(payload)["unread_count"] == 1
@@ -0,0 +1,40 @@
+"""
+Unit tests for the notification stream token (EventSource cannot send headers)
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from adapters.http.company_app.notification.controllers.notification_controller import NotificationController
+
+
+class TestNotificationStreamToken:
+
+    def setup_method(self):
+        self.controller = NotificationController(query_bus=Mock(), command_bus=Mock())
+
+    def test_token_identifies_the_user_for_its_company(self):
+        response = self.controller.create_stream_token(user_id="user-1", company_id="company-1")
+
+        assert self.controller.verify_stream_token(response.token, company_id="company-1") == "user-1"
+
+    def test_token_is_rejected_for_another_company(self):
+        response = self.controller.create_stream_token(user_id="user-1", company_id="company-1")
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.verify_stream_token(response.token, company_id="company-2")
+        assert exc_info.value.status_code == 401
+
+    def test_expired_or_tampered_token_is_rejected(self):
+        with patch(
+            "adapters.http.company_app.notification.controllers.notification_controller.settings"
+            ".NOTIFICATION_STREAM_TOKEN_EXPIRATION_SECONDS", -1
+        ):
+            expired = self.controller.create_stream_token(user_id="user-1", company_id="company-1")
+        valid = self.controller.create_stream_token(user_id="user-1", company_id="company-1")
+
+        for token in (expired.token, valid.token + "x"):
+            with pytest.raises(HTTPException) as exc_info:
+                self.controller.verify_stream_token(token, company_id="company-1")
+            assert exc_info.value.status_code == 401
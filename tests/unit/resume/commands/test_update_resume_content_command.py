@@ -0,0 +1,50 @@
+"""
+Unit tests for UpdateResumeContentCommand (legacy markdown fields)
+"""
+from unittest.mock import Mock, patch
+
+from src.candidate_bc.candidate.domain.value_objects.candidate_id import CandidateId
+from src.candidate_bc.resume.application.commands.update_resume_content_command import (
+    UpdateResumeContentCommand,
+    UpdateResumeContentCommandHandler,
+)
+from src.candidate_bc.resume.domain.entities.resume import Resume
+from src.candidate_bc.resume.domain.repositories.resume_repository_interface import ResumeRepositoryInterface
+from src.candidate_bc.resume.domain.value_objects.resume_id import ResumeId
+
+
+class TestUpdateResumeContentLegacyFields:
+    """Test cases for the legacy markdown fields of UpdateResumeContentCommand"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.resume = Resume.create_general_resume(
+            id=ResumeId.create(), candidate_id=CandidateId.generate(), name="CV"
+        )
+        self.resume_repository = Mock(spec=ResumeRepositoryInterface)
+        self.resume_repository.get_by_id.return_value = self.resume
+        self.handler = UpdateResumeContentCommandHandler(self.resume_repository)
+
+    def test_stores_markdown_source(self):
+        """Test the editor gets back the markdown it sent, not rendered HTML"""
+        markdown = "### Senior Dev\n**ACME**\n*2020 - Presente*"
+
+        self.handler.execute(UpdateResumeContentCommand(
+            resume_id=self.resume.id, experiencia_profesional=markdown
+        ))
+
+        assert self.resume.content.experiencia_profesional == markdown
+        self.resume_repository.update.assert_called_once_with(self.resume)
+
+    def test_unchanged_section_is_not_touched(self):
+        """Test resending the same markdown leaves the section alone"""
+        markdown = "- Python"
+        self.resume.update_variable_section("experience", markdown)
+
+        with patch.object(self.resume, "update_variable_section") as update_variable_section:
+            self.handler.execute(UpdateResumeContentCommand(
+                resume_id=self.resume.id, experiencia_profesional=markdown
+            ))
+
+        update_variable_section.assert_not_called()
+        assert self.resume.content.experiencia_profesional == markdown
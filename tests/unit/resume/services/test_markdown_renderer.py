@@ -0,0 +1,85 @@
+"""
+Unit tests for MarkdownRenderer
+"""
+from unittest.mock import patch
+
+from src.candidate_bc.resume.application.services.markdown_renderer import MarkdownRenderer
+
+
+class TestMarkdownRenderer:
+    """Test cases for MarkdownRenderer"""
+
+    def setup_method(self):
+        """Setup test dependencies"""
+        self.renderer = MarkdownRenderer()
+
+    def test_experience_entry(self):
+        """Test a generated experience entry renders headers, bold and italic"""
+        html = self.renderer.render("### Senior Dev\n**ACME**\n*2020 - Presente*\n\nBuilt things")
+
+        assert html == (
+            "<h3>Senior Dev</h3>\n"
+            "<p><strong>ACME</strong><br>\n<em>2020 - Presente</em></p>\n"
+            "<p>Built things</p>"
+        )
+
+    def test_lists(self):
+        """Test unordered and ordered lists are grouped"""
+        html = self.renderer.render("- Python\n- **SQL**\n1. First\n2. Second")
+
+        assert html == (
+            "<ul>\n<li>Python</li>\n<li><strong>SQL</strong></li>\n</ul>\n"
+            "<ol>\n<li>First</li>\n<li>Second</li>\n</ol>"
+        )
+
+    def test_nested_and_code_spans(self):
+        """Test nested emphasis and markers inside code are left alone"""
+        html = self.renderer.render("**fast _and_ safe** with `a**b`")
+
+        assert html == "<p><strong>fast <em>and</em> safe</strong> with <code>a**b</code></p>"
+
+    def test_text_is_escaped(self):
+        """Test user text cannot inject markup"""
+        html = self.renderer.render("<script>alert(1)</script> & [x](javascript:alert(1))")
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "javascript:" not in html
+
+    def test_header_keeps_trailing_hash_of_words(self):
+        """Test only a closing run of '#' after whitespace is stripped from headers"""
+        html = self.renderer.render("### Lenguajes: C#\n## F# ##")
+
+        assert html == "<h3>Lenguajes: C#</h3>\n<h2>F#</h2>"
+
+    def test_unsafe_link_with_parens_is_dropped_whole(self):
+        """Test a link URL with balanced parentheses is matched up to its closing parenthesis"""
+        html = self.renderer.render("[x](javascript:alert(1))")
+
+        assert html == "<p>x</p>"
+
+    def test_safe_link_with_parens(self):
+        """Test parentheses inside a safe URL stay part of the href"""
+        html = self.renderer.render("[Wiki](https://en.wikipedia.org/wiki/C_(lenguaje))")
+
+        assert html == (
+            '<p><a href="https://en.wikipedia.org/wiki/C_(lenguaje)" target="_blank" rel="noopener">Wiki</a></p>'
+        )
+
+    def test_safe_links(self):
+        """Test http links are rendered"""
+        html = self.renderer.render("[Portfolio](https://example.com/a?b=1&c=2)")
+
+        assert html == (
+            '<p><a href="https://example.com/a?b=1&amp;c=2" target="_blank" rel="noopener">Portfolio</a></p>'
+        )
+
+    def test_unchanged_section_is_not_rendered_again(self):
+        """Test identical content is served from the memo"""
+        first = self.renderer.render("### Title\n- item")
+
+        with patch.object(MarkdownRenderer, "iter_html") as iter_html:
+            second = self.renderer.render("### Title\n- item")
+
+        assert second == first
+        iter_html.assert_not_called()